@@ -71,9 +71,7 @@ class ActorsController(QObject):
         """
         self.project_id = int(project_data['id'])
         self.view.delete_rows(clear_all=True)
-        actors = self.model.get_actors_data()
-        for actor in actors:
-            self.view.update_actors_table(actor, update_rows=False)
+        self.view.load_actors_table(self.model.get_actors_data())
         actors_count, total_actors, actors_UAW, total_UAW, weights = self.model.get_summary_data()
 
         actors_UAW = {key: (int(value) if value.is_integer() else value) for key, value in actors_UAW.items()}
@@ -2,9 +2,11 @@
 # controller/dashboard_controller.py
 
 import config
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QThreadPool, QTimer
 from Dialog.percentage_dialog import PercentageDialog
 from Dialog.cf_dialog import CFDialog
+from Estimation.effort_simulator import EffortSimulator
+from Utils.worker import Worker
 
 class DashboardController(QObject):
     """
@@ -16,11 +18,28 @@ class DashboardController(QObject):
     ----------
     report_generation_request : Signal
         Signal to request report generation from the main application.
+    simulation_finished : Signal
+        Signal emitted with the project ID and the summary of a completed effort simulation.
+    simulation_failed : Signal
+        Signal emitted with the project ID and the error message of a failed effort simulation.
 
     Methods
     -------
     """
     report_generation_request = Signal(int)
+    simulation_finished = Signal(int, dict)
+    simulation_failed = Signal(int, str)
+
+    # Metrics recomputed when each metric changes, and the order in which they are recomputed
+    METRIC_DEPENDENTS = {
+        'UUCP': ['UCP'],
+        'TCF': ['UCP'],
+        'ECF': ['UCP'],
+        'UCP': ['E'],
+        'E': ['effort'],
+        'effort': []
+    }
+    METRIC_ORDER = ['UUCP', 'TCF', 'ECF', 'UCP', 'E', 'effort']
 
     def __init__(self, view, model):
         """
@@ -37,6 +56,14 @@ class DashboardController(QObject):
         self.view = view
         self.model = model
         self.project_id = None  # Id of the selected project
+        self.simulation_workers = {}  # Running simulations by project ID
+        self.dirty_metrics = set()
+        self.pending_inputs = {}  # Latest inputs of the dirty UUCP, TCF and ECF
+        self.recompute_counters = {'requested': 0, 'performed': 0, 'batches': 0}
+        self.recompute_timer = QTimer(self)
+        self.recompute_timer.setSingleShot(True)
+        self.recompute_timer.setInterval(0)  # Run once the current event-loop turn is over
+        self.recompute_timer.timeout.connect(self.recompute)
         self.connect_signals()
 
     def connect_signals(self):
@@ -49,6 +76,9 @@ class DashboardController(QObject):
         self.view.TCF_updated.connect(self.update_TCF)
         self.view.ECF_updated.connect(self.update_ECF)
         self.view.report_generation.connect(self.report_request)
+        self.view.simulation_request.connect(self.request_simulation)
+        self.simulation_finished.connect(self.display_simulation)
+        self.simulation_failed.connect(self.display_simulation_error)
 
     def open_cf_dialog(self, cf):
         """
@@ -77,8 +107,7 @@ class DashboardController(QObject):
             self.cf_Dialog.accept()
             if cf_saved.is_integer(): cf_saved = int(cf_saved)
             self.view.update_cf(cf_saved)
-            self.update_E()
-            self.update_effort()
+            self.mark_dirty('E')
             self.view.display_message("Successful Operation", "The operation was completed successfully.", config.INFORMATION_IMG)
         elif result == config.FAILURE:
             self.cf_Dialog.accept()
@@ -99,6 +128,16 @@ class DashboardController(QObject):
         adjusted_percentages = {key: (int(value) if value.is_integer() else value) for key, value in percentages.items()}
         self.view.update_effort_distribution(percentages=adjusted_percentages)
         self.view.update_cf(cf)
+        self.view.set_simulation_running(self.project_id in self.simulation_workers)
+
+        # The tables of the project are loaded first and schedule a recomputation from their rows;
+        # the metrics read from project_metrics when the project was opened replace it
+        self.recompute_timer.stop()
+        self.dirty_metrics.clear()
+        self.pending_inputs.clear()
+        metrics = self.model.get_metrics()
+        metrics['total_effort'] = metrics.pop('total_hours')
+        self.view.update_metrics(self.format_metrics(metrics))
 
     def open_percentage_dialog(self, percentages):
         """
@@ -127,7 +166,7 @@ class DashboardController(QObject):
             self.percentage_Dialog.accept()
             adjusted_percentages = {key: (int(value) if value.is_integer() else value) for key, value in percentages_saved.items()}
             self.view.update_effort_distribution(percentages=adjusted_percentages)
-            self.update_effort()
+            self.mark_dirty('effort')
             self.view.display_message("Successful Operation", "The operation was completed successfully.", config.INFORMATION_IMG)
         elif result == config.FAILURE:
             self.percentage_Dialog.accept()
@@ -135,7 +174,7 @@ class DashboardController(QObject):
 
     def update_UUCP(self, UAW, UUCW):
         """
-        Update the UUCP (Unadjusted Use Case Points).
+        Schedule the update of the UUCP (Unadjusted Use Case Points).
 
         Parameters
         ----------
@@ -144,75 +183,224 @@ class DashboardController(QObject):
         UUCW : float
             Unadjusted Use Case Weight.
         """
-        UUCP = self.model.calculate_UUCP(UAW, UUCW)
-        if UUCP.is_integer(): UUCP = int(UUCP)
-        self.view.set_UUCP(str(UUCP))
-        self.update_UCP()
-        self.update_E()
-        self.update_effort()
+        self.pending_inputs['UUCP'] = (UAW, UUCW)
+        self.mark_dirty('UUCP')
 
     def update_TCF(self, TFactor):
         """
-        Update the TCF (Technical Complexity Factor).
+        Schedule the update of the TCF (Technical Complexity Factor).
 
         Parameters
         ----------
         TFactor : float
             The TFactor value.
         """
-        TCF = self.model.calculate_TCF(TFactor)
-        if TCF.is_integer(): TCF = int(TCF)
-        self.view.set_TCF(str(TCF))
-        self.update_UCP()
-        self.update_E()
-        self.update_effort()
+        self.pending_inputs['TCF'] = (TFactor,)
+        self.mark_dirty('TCF')
 
     def update_ECF(self, EFactor):
         """
-        Update the ECF (Environmental Complexity Factor).
+        Schedule the update of the ECF (Environmental Complexity Factor).
 
         Parameters
         ----------
         EFactor : float
             The EFactor value.
         """
-        ECF = self.model.calculate_ECF(EFactor)
-        if ECF.is_integer(): ECF = int(ECF)
-        self.view.set_ECF(str(ECF))
-        self.update_UCP()
-        self.update_E()
-        self.update_effort()
+        self.pending_inputs['ECF'] = (EFactor,)
+        self.mark_dirty('ECF')
 
-    def update_UCP(self):
+    def mark_dirty(self, metric):
         """
-        Update the UCP (Use Case Points).
+        Mark a metric and every metric derived from it as dirty, and schedule their recomputation.
+
+        Successive changes within the same event-loop turn are coalesced, so each derived metric is recomputed at most once.
+
+        Parameters
+        ----------
+        metric : str
+            The metric whose inputs changed: 'UUCP', 'TCF', 'ECF', 'UCP', 'E' or 'effort'.
+        """
+        pending = [metric]
+        while pending:
+            current = pending.pop()
+            self.recompute_counters['requested'] += 1
+            self.dirty_metrics.add(current)
+            pending.extend(self.METRIC_DEPENDENTS[current])
+
+        if not self.recompute_timer.isActive():
+            self.recompute_timer.start()
+
+    def recompute(self):
+        """
+        Recompute the dirty metrics in dependency order and push them to the view in one batched update.
+        """
+        self.recompute_timer.stop()
+        if not self.dirty_metrics:
+            return
+
+        metrics = {}
+        for metric in self.METRIC_ORDER:
+            if metric not in self.dirty_metrics:
+                continue
+            if metric == 'UUCP':
+                metrics['UUCP'] = self.model.calculate_UUCP(*self.pending_inputs.pop('UUCP'))
+            elif metric == 'TCF':
+                metrics['TCF'] = self.model.calculate_TCF(*self.pending_inputs.pop('TCF'))
+            elif metric == 'ECF':
+                metrics['ECF'] = self.model.calculate_ECF(*self.pending_inputs.pop('ECF'))
+            elif metric == 'UCP':
+                metrics['UCP'] = self.model.calculate_UCP()
+            elif metric == 'E':
+                metrics['E'] = self.model.calculate_E()
+            elif metric == 'effort':
+                metrics['person_hours'], metrics['total_effort'] = self.model.calculate_effort()
+            self.recompute_counters['performed'] += 1
+        self.recompute_counters['batches'] += 1
+        self.dirty_metrics.clear()
+        self.view.update_metrics(self.format_metrics(metrics))
+
+    def get_recompute_stats(self):
+        """
+        Get the counters of the recompute scheduler.
+
+        Recomputations dropped when a project is opened, because its metrics are read from project_metrics, are counted as saved.
+
+        Returns
+        -------
+        dict
+            Number of metric recomputations requested and performed, number of batched view updates, and number of recomputations saved by coalescing.
+        """
+        stats = dict(self.recompute_counters)
+        stats['saved'] = stats['requested'] - stats['performed']
+        return stats
+
+    def format_metrics(self, metrics):
+        """
+        Format the metrics for the view, showing whole numbers without decimals.
+
+        Parameters
+        ----------
+        metrics : dict
+            The metrics to format. It may contain 'UUCP', 'TCF', 'ECF', 'UCP' and 'E', and 'person_hours' together with 'total_effort'.
+
+        Returns
+        -------
+        dict
+            The formatted metrics.
+        """
+        formatted = {}
+        for key in ['UUCP', 'TCF', 'ECF', 'UCP', 'E']:
+            if key in metrics:
+                value = metrics[key]
+                formatted[key] = str(int(value) if value.is_integer() else value)
+        if 'person_hours' in metrics:
+            formatted['person_hours'] = {key: (int(value) if value.is_integer() else value) for key, value in metrics['person_hours'].items()}
+            total_effort = metrics['total_effort']
+            formatted['total_effort'] = int(total_effort) if total_effort.is_integer() else total_effort
+        return formatted
+
+    def report_request(self):
         """
-        UCP = self.model.calculate_UCP()
-        if UCP.is_integer(): UCP = int(UCP)
-        self.view.set_UCP(str(UCP))
+        Request the generation of a report.
+        """
+        self.recompute()  # The report reads the metrics from the model
+        self.report_generation_request.emit(self.project_id)
 
-    def update_E(self):
+    def request_simulation(self, settings=None, trials=config.SIMULATION_TRIALS):
         """
-        Update the E (Effort) value.
+        Start the effort simulation of the current project without blocking the interface.
+
+        The inputs are read on the main thread and the trials run in the global thread pool. The result is delivered through simulation_finished or simulation_failed.
+
+        Parameters
+        ----------
+        settings : dict, optional
+            Distributions of the sampled inputs, by default config.SIMULATION_SETTINGS.
+        trials : int, optional
+            Number of trials, by default config.SIMULATION_TRIALS.
+
+        Returns
+        -------
+        bool
+            True if the simulation was started, False otherwise.
         """
-        E = self.model.calculate_E()
-        if E.is_integer(): E = int(E)
-        self.view.set_E(str(E))
+        project_id = self.project_id
+        if project_id is None or project_id in self.simulation_workers:
+            return False
+
+        result, inputs = self.model.get_simulation_inputs(project_id)
+        if result != config.SUCCESS:
+            self.simulation_failed.emit(project_id, "The simulation data could not be loaded.")
+            return False
 
-    def update_effort(self):
+        worker = Worker(EffortSimulator.simulate, inputs, settings, trials)
+        worker.signals.finished.connect(lambda summary: self.handle_simulation_finished(project_id, summary))
+        worker.signals.failed.connect(lambda error: self.handle_simulation_failed(project_id, error))
+        self.simulation_workers[project_id] = worker
+        QThreadPool.globalInstance().start(worker)
+        self.view.set_simulation_running(True)
+        return True
+
+    def handle_simulation_finished(self, project_id, summary):
         """
-        Update the effort distribution and total effort.
+        Handle the summary of a completed effort simulation.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the simulated project.
+        summary : dict
+            The percentiles of the simulated effort.
         """
-        person_hours, total_hours = self.model.calculate_effort()
-        if total_hours.is_integer(): total_hours = int(total_hours)
-        adjusted_person_hours = {key: (int(value) if value.is_integer() else value) for key, value in person_hours.items()}
-        self.view.update_effort_distribution(person_hours=adjusted_person_hours, total_effort=total_hours)
+        self.simulation_workers.pop(project_id, None)
+        if project_id == self.project_id:
+            self.view.set_simulation_running(False)
+        self.simulation_finished.emit(project_id, summary)
 
-    def report_request(self):
+    def handle_simulation_failed(self, project_id, error):
         """
-        Request the generation of a report.
+        Handle the error of a failed effort simulation.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the simulated project.
+        error : str
+            The error message.
         """
-        self.report_generation_request.emit(self.project_id)
+        self.simulation_workers.pop(project_id, None)
+        if project_id == self.project_id:
+            self.view.set_simulation_running(False)
+        self.simulation_failed.emit(project_id, error)
+
+    def display_simulation(self, project_id, summary):
+        """
+        Display the summary of a completed effort simulation, if its project is still open.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the simulated project.
+        summary : dict
+            The percentiles of the simulated effort.
+        """
+        if project_id == self.project_id:
+            self.view.display_simulation(summary)
+
+    def display_simulation_error(self, project_id, error):
+        """
+        Display the failure of an effort simulation, if its project is still open.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the simulated project.
+        error : str
+            The error message.
+        """
+        if project_id == self.project_id:
+            self.view.display_message("Failed Operation", "The effort simulation could not be completed.", config.CRITICAL_IMG)
 
     def set_actors_data(self, actors_count, total_actors, UAW):
         """
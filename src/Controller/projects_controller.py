@@ -2,15 +2,14 @@
 # controller/projects_controller.py
 
 import config
-import os
-import zipfile
-import pandas as pd
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
 from datetime import datetime
 from Dialog.project_dialog import ProjectDialog
-from PySide6.QtWidgets import QFileDialog
-from PySide6.QtCore import QObject, Signal, QDir, QFile, QFileInfo, QUrl
+from Utils.excel_report_writer import ExcelReportWriter
+from Utils.project_exporter import ProjectExporter
+from Utils.report_generator import ReportGenerator
+from Utils.worker import Worker
+from PySide6.QtWidgets import QFileDialog, QProgressDialog
+from PySide6.QtCore import Qt, QObject, Signal, QDir, QFile, QFileInfo, QThreadPool, QUrl
 from PySide6.QtGui import QDesktopServices
 
 class ProjectsController(QObject):
@@ -65,6 +64,12 @@ class ProjectsController(QObject):
         self.technicalFactors_model = technicalFactors_model
         self.environmentalFactors_model = environmentalFactors_model
         self.dashboard_model = dashboard_model
+        self.exporter = None
+        self.export_progress_dialog = None
+        self.importer = None
+        self.import_progress_dialog = None
+        self.report_generator = ReportGenerator()
+        self.report_progress_dialog = None
         self.connect_signals()
         self.load_projects()
 
@@ -81,6 +86,10 @@ class ProjectsController(QObject):
         self.view.project_downloaded.connect(self.download_project)
         self.view.projects_exported.connect(self.export_projects)
         self.view.report_request.connect(self.generate_excel_report)
+        self.report_generator.started.connect(self.handle_report_started)
+        self.report_generator.progress.connect(self.update_report_progress)
+        self.report_generator.finished.connect(self.handle_report_finished)
+        self.report_generator.failed.connect(self.handle_report_failed)
 
     def open_project(self, project_data, row):
         """
@@ -303,61 +312,152 @@ class ProjectsController(QObject):
             self.view.display_message("Warning", "The operation could not be completed: missing extension '.zip'.", config.WARNING_IMG)
             return
 
-        return_value, projects = self.projects_model.get_projects()
+        self.start_export(zip_file_path)
+
+    def export_changed_projects(self):
+        """
+        Export to a ZIP file only the projects changed since a previous export.
+        """
+        base_file_path, _ = QFileDialog.getOpenFileName(None, "Select the previous export", "", "ZIP files (*.zip);; All files (*)")
+        if not base_file_path:
+            return
+
+        return_value, base_index = self.projects_model.read_export_index(base_file_path)
         if return_value != config.SUCCESS:
-            self.view.display_message("Failed Operation", "Projects couldn't be exported.", config.CRITICAL_IMG)
+            self.view.display_message("Warning", "The selected file is not a QuickEst export with change tracking. Please, export all projects first.", config.WARNING_IMG)
             return
 
-        temp_directory = os.path.join(os.path.dirname(zip_file_path), "quickest_temp_export_directory")
-        if not os.path.exists(temp_directory):
-            os.makedirs(temp_directory)
+        zip_file_path, _  = QFileDialog.getSaveFileName(None, "Save changed QuickEst projects", "quickest_changes.zip", "ZIP files (*.zip);; All files (*)")
+        if not zip_file_path:
+            return
 
-        self.projects_model.start_transaction()
-        project_directories = []
+        if not zip_file_path.endswith('.zip'):
+            self.view.display_message("Warning", "The operation could not be completed: missing extension '.zip'.", config.WARNING_IMG)
+            return
 
-        try:
-            for project in projects:
-                project_directory = self.download_project(project['id'], project['name'], temp_directory, transaction_active=False)
-                if project_directory == config.FAILURE:
-                    raise Exception(f"Failed to export project {project['name']}")
-                project_directories.append(project_directory)
-
-            with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
-                for project_directory in project_directories:
-                    for folder_name, subfolders, filenames in os.walk(project_directory):
-                        for filename in filenames:
-                            file_path = os.path.join(folder_name, filename)
-                            zip_file.write(file_path, os.path.relpath(file_path, temp_directory))
+        self.start_export(zip_file_path, base_index)
 
-            self.projects_model.commit()
+    def start_export(self, zip_file_path, base_index=None):
+        """
+        Start the background export of the projects to a ZIP file.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive to create.
+        base_index : dict, optional
+            The index of a previous archive, to export only the projects changed since then.
+        """
+        if self.exporter is not None:
+            self.view.display_message("Warning", "An export is already in progress.", config.WARNING_IMG)
+            return
+
+        self.exporter = ProjectExporter(self.projects_model, self.projects_model.db_instance.databaseName(), zip_file_path, base_index=base_index)
+        self.export_progress_dialog = QProgressDialog("Exporting projects...", "Cancel", 0, 0, self.view)
+        self.export_progress_dialog.setWindowTitle("Export Projects")
+        self.export_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.export_progress_dialog.setMinimumDuration(0)
+        self.export_progress_dialog.canceled.connect(self.exporter.cancel)
+
+        self.exporter.progress.connect(self.update_export_progress)
+        self.exporter.finished.connect(self.handle_export_finished)
+        self.exporter.failed.connect(self.handle_export_failed)
+        self.exporter.cancelled.connect(self.handle_export_cancelled)
+        self.exporter.start()
+
+    def update_export_progress(self, exported, total):
+        """
+        Update the progress dialog of the export.
+
+        Parameters
+        ----------
+        exported : int
+            Number of exported projects.
+        total : int
+            Total number of projects.
+        """
+        if self.export_progress_dialog is not None and not self.export_progress_dialog.wasCanceled():
+            self.export_progress_dialog.setMaximum(total)
+            self.export_progress_dialog.setValue(exported)
 
-            for project_directory in project_directories:
-                if QDir(project_directory).exists():
-                    self.delete_directory(project_directory)
+    def finish_export(self):
+        """
+        Release the exporter and close the progress dialog.
+        """
+        self.exporter = None
+        if self.export_progress_dialog is not None:
+            self.export_progress_dialog.canceled.disconnect()
+            self.export_progress_dialog.close()
+            self.export_progress_dialog = None
 
-            if os.path.exists(temp_directory):
-                self.delete_directory(temp_directory)
+    def handle_export_finished(self, zip_file_path):
+        """
+        Handle the completion of the export.
 
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the created archive.
+        """
+        incremental = self.exporter.base_index is not None
+        self.finish_export()
+        if incremental:
+            self.view.display_message("Successful Operation", f"The projects changed since the previous export have been successfully exported to {zip_file_path}.", config.INFORMATION_IMG)
+        else:
             self.view.display_message("Successful Operation", f"All projects have been successfully exported to {zip_file_path}.", config.INFORMATION_IMG)
 
-        except Exception:
-            self.projects_model.rollback()
+    def merge_exports(self):
+        """
+        Merge a full export and an export of the changed projects into a new full export.
+        """
+        base_file_path, _ = QFileDialog.getOpenFileName(None, "Select the full export", "", "ZIP files (*.zip);; All files (*)")
+        if not base_file_path:
+            return
 
-            for project_directory in project_directories:
-                if QDir(project_directory).exists():
-                    self.delete_directory(project_directory)
+        changes_file_path, _ = QFileDialog.getOpenFileName(None, "Select the export of the changed projects", "", "ZIP files (*.zip);; All files (*)")
+        if not changes_file_path:
+            return
 
-            if zip_file_path and os.path.exists(zip_file_path):
-                os.remove(zip_file_path)
+        zip_file_path, _  = QFileDialog.getSaveFileName(None, "Save merged QuickEst projects", "quickest_projects.zip", "ZIP files (*.zip);; All files (*)")
+        if not zip_file_path:
+            return
 
-            if temp_directory and os.path.exists(temp_directory):
-                self.delete_directory(temp_directory)
+        if not zip_file_path.endswith('.zip'):
+            self.view.display_message("Warning", "The operation could not be completed: missing extension '.zip'.", config.WARNING_IMG)
+            return
 
-            self.view.display_message("Failed Operation", "The operation could not be completed.", config.CRITICAL_IMG)
+        if zip_file_path in (base_file_path, changes_file_path):
+            self.view.display_message("Warning", "The merged export must be saved to a new file.", config.WARNING_IMG)
+            return
+
+        return_value, project_count = self.projects_model.merge_exports(base_file_path, changes_file_path, zip_file_path)
+        if return_value == config.SUCCESS:
+            self.view.display_message("Successful Operation", f"The {project_count} projects have been successfully merged into {zip_file_path}.", config.INFORMATION_IMG)
+        else:
+            self.view.display_message("Failed Operation", "The exports could not be merged. Please, check that the changes were exported from the selected full export.", config.CRITICAL_IMG)
+
+    def handle_export_failed(self, error):
+        """
+        Handle the failure of the export.
+
+        Parameters
+        ----------
+        error : str
+            The error message.
+        """
+        self.finish_export()
+        self.view.display_message("Failed Operation", "The operation could not be completed.", config.CRITICAL_IMG)
+
+    def handle_export_cancelled(self):
+        """
+        Handle the cancellation of the export.
+        """
+        self.finish_export()
+        self.view.display_message("Cancelled Operation", "The export was cancelled.", config.WARNING_IMG)
 
     def download_project(self, project_id, project_name, directory=None, transaction_active=True):
         """
-        Download a project to a specified directory.
+        Download a project to a single-file project package.
 
         Parameters
         ----------
@@ -373,57 +473,50 @@ class ProjectsController(QObject):
         Returns
         -------
         str or int
-            The directory where the project is downloaded or a status code indicating failure.
+            The path of the package or a status code indicating failure.
         """
         if directory is None:
-            file_path, _  = QFileDialog.getSaveFileName(None, "Save Project", project_name, "All files (*)")
+            file_path, _  = QFileDialog.getSaveFileName(None, "Save Project", f"{project_name}{config.PACKAGE_FILE_EXTENSION}", f"QuickEst projects (*{config.PACKAGE_FILE_EXTENSION});; All files (*)")
             if not file_path:
                 return config.FAILURE
 
-            directory = os.path.dirname(file_path)
-
-        project_directory = QDir(directory).filePath(project_name)
-        QDir().mkpath(project_directory)
+            if not file_path.endswith(config.PACKAGE_FILE_EXTENSION):
+                self.view.display_message("Warning", f"The operation could not be completed: missing extension '{config.PACKAGE_FILE_EXTENSION}'.", config.WARNING_IMG)
+                return config.FAILURE
+        else:
+            file_path = QDir(directory).filePath(f"{project_name}{config.PACKAGE_FILE_EXTENSION}")
 
         if transaction_active:
             self.projects_model.start_transaction()
 
         try:
-            if self.export_project_data(project_id, project_name, project_directory) == config.FAILURE:
-                raise Exception("Failed to export project data")
+            package = self.projects_model.serialize_package(self.get_project_export_data(project_id))
+            if self.projects_model.write_file(file_path, package) == config.FAILURE:
+                raise Exception("Failed to write the project package")
 
             if transaction_active:
                 self.projects_model.commit()
-                self.view.display_message("Successful Operation", f"The project '{project_name}' has been successfully exported to {project_directory}.", config.INFORMATION_IMG)
-            return project_directory
+                self.view.display_message("Successful Operation", f"The project '{project_name}' has been successfully exported to {file_path}.", config.INFORMATION_IMG)
+            return file_path
         except Exception:
             if transaction_active:
                 self.projects_model.rollback()
-            if QDir(project_directory).exists():
-                self.delete_directory(project_directory)
+            if QFile.exists(file_path):
+                QFile.remove(file_path)
             if transaction_active:
                 self.view.display_message("Failed Operation", "The operation could not be completed.", config.CRITICAL_IMG)
             return config.FAILURE
 
-    def export_project_data(self, project_id, project_name, project_directory):
+    def get_project_exports(self):
         """
-        Export project data to the specified directory.
-
-        Parameters
-        ----------
-        project_id : int
-            The ID of the project to export.
-        project_name : str
-            The name of the project.
-        project_directory : str
-            The directory to save the project data.
+        Get the tables that make up an exported project.
 
         Returns
         -------
-        int
-            Status code indicating success or failure.
+        list of tuple
+            The model, its export method, the file name and the table name of each exported table.
         """
-        exports = [
+        return [
             (self.projects_model, 'export_project_data', config.PROJECT_FILE, 'project'),
             (self.projects_model, 'export_parameters_data', config.PARAMETERS_FILE, 'parameters'),
             (self.actors_model, 'export_actors_data', config.ACTORS_FILE, 'actors'),
@@ -432,44 +525,32 @@ class ProjectsController(QObject):
             (self.environmentalFactors_model, 'export_environmental_factors_data', config.ENVIRONMENTAL_FACTORS_FILE, 'environmental_factors')
         ]
 
-        project_manifest = {}
-
-        try:
-            for model, method, file_name, table in exports:
-                destination_file = QDir(project_directory).filePath(file_name)
-                result = getattr(model, method)(project_id)
-                if result != config.FAILURE:
-                    if self.projects_model.write_data_to_binary_file(result, destination_file) == config.FAILURE:
-                        raise Exception(f"Failed to write data to binary file: {file_name}")
-                    else:
-                        file_hash = self.projects_model.calculate_file_hash(destination_file)
-                        project_manifest[table] = {"file_name": file_name, "hash": file_hash}
-                else:
-                    raise Exception(f"Failed to export data for {table}")
-            file_path = f"{project_name}{config.PROJECT_FILE_EXTENSION}"
-            if self.projects_model.write_project_manifest(file_path, project_directory, project_manifest) == config.FAILURE:
-                raise Exception("Failed to write project manifest")
-
-            return config.SUCCESS
-        except Exception:
-            return config.FAILURE
-
-    def delete_directory(self, directory_path):
+    def get_project_export_data(self, project_id):
         """
-        Delete a directory and its contents.
+        Get the rows of every exported table of a project.
 
         Parameters
         ----------
-        directory_path : str
-            The path of the directory to delete.
+        project_id : int
+            The ID of the project to export.
+
+        Returns
+        -------
+        list of tuple
+            The table name, the file name and the rows of each exported table.
+
+        Raises
+        ------
+        Exception
+            If the data of a table could not be exported.
         """
-        dir = QDir(directory_path)
-        for file_info in dir.entryInfoList(QDir.Files | QDir.Dirs | QDir.NoDotAndDotDot, QDir.NoSort):
-            if file_info.isDir():
-                self.delete_directory(file_info.absoluteFilePath())
-            else:
-                QFile.remove(file_info.absoluteFilePath())
-        QDir().rmdir(directory_path)
+        project_data = []
+        for model, method, file_name, table in self.get_project_exports():
+            result = getattr(model, method)(project_id)
+            if result == config.FAILURE:
+                raise Exception(f"Failed to export data for {table}")
+            project_data.append((table, file_name, result))
+        return project_data
 
     def set_favorite_project(self, project_id, table_row, is_favorite):
         """
@@ -489,7 +570,7 @@ class ProjectsController(QObject):
         else:
             result = self.projects_model.update_favorite_project(project_id, True)
         if result == config.SUCCESS:
-            self.view.update_favorite_button(table_row, is_favorite)
+            self.view.update_favorite(table_row, is_favorite)
         elif result == config.NOT_EXIST:
             self.view.display_message("Warning", "The project does not exist.", config.WARNING_IMG)
         elif result == config.FAILURE:
@@ -508,42 +589,222 @@ class ProjectsController(QObject):
 
     def import_project(self):
         """
-        Import a project from a directory.
+        Import a project from a project package or from the manifest of a project directory, or all the projects of a ZIP archive.
         """
-        directory = QFileDialog.getExistingDirectory(self.view, "Select directory", "", QFileDialog.ShowDirsOnly)
-        if not directory:
+        file_path, _ = QFileDialog.getOpenFileName(self.view, "Select project", "", f"QuickEst projects (*{config.PACKAGE_FILE_EXTENSION} *{config.PROJECT_FILE_EXTENSION} *.zip);; All files (*)")
+        if not file_path:
             return
 
-        manifest_file = self.projects_model.find_manifest(directory)
-        if manifest_file == config.FAILURE:
-            self.view.display_message("Warning", "No QuickEst project found in the selected directory. Please, select a valid project.", config.WARNING_IMG)
+        if file_path.endswith('.zip'):
+            self.import_projects(file_path)
             return
 
         try:
-            project_manifest = self.projects_model.load_json(manifest_file)
-            if project_manifest == config.FAILURE:
-                raise Exception("Failed to add project")
+            if file_path.endswith(config.PACKAGE_FILE_EXTENSION):
+                project_name = QFileInfo(file_path).completeBaseName()
+                loaded_data = self.projects_model.load_package(file_path)
+            else:
+                directory = QFileInfo(file_path).absolutePath()
+                manifest_file = self.projects_model.find_manifest(directory)
+                if manifest_file == config.FAILURE:
+                    self.view.display_message("Warning", "No QuickEst project found in the selected directory. Please, select a valid project.", config.WARNING_IMG)
+                    return
+
+                project_name = QFileInfo(directory).fileName()
+                project_manifest = self.projects_model.load_json(manifest_file)
+                if project_manifest == config.FAILURE:
+                    raise Exception("Failed to add project")
+                loaded_data = self.projects_model.load_project_data(project_manifest, directory)
 
-            loaded_data = self.projects_model.load_project_data(project_manifest, directory)
             if loaded_data == config.FAILURE:
                 raise Exception("Failed to add project")
-            return_value = self.add_project_to_database(directory, loaded_data)
+            return_value = self.add_project_to_database(project_name, loaded_data)
             if return_value != config.FAILURE:
                 project_data = return_value
                 self.view.update_projects_table(project_data, None)
                 self.view.display_message("Successful Operation", "The operation was completed successfully.", config.INFORMATION_IMG, ok_callback=lambda: self.view.open_project(project_id=project_data['id']))
 
         except Exception:
-            self.view.display_message("Failed Operation", "No QuickEst project found in the selected directory. Please, select a valid project.", config.WARNING_IMG)
+            self.view.display_message("Failed Operation", "No QuickEst project found in the selected file. Please, select a valid project.", config.WARNING_IMG)
+
+    def import_projects(self, zip_file_path):
+        """
+        Import all the projects of a ZIP archive created by the export of all projects.
+
+        The projects are read and verified in a background thread, then inserted by insert_imported_projects.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive.
+        """
+        if self.importer is not None:
+            self.view.display_message("Warning", "An import is already in progress.", config.WARNING_IMG)
+            return
+
+        self.import_progress_dialog = QProgressDialog("Verifying projects...", None, 0, 0, self.view)
+        self.import_progress_dialog.setWindowTitle("Import Projects")
+        self.import_progress_dialog.setWindowModality(Qt.WindowModal)
+        self.import_progress_dialog.setMinimumDuration(0)
+        self.import_progress_dialog.show()
+
+        self.importer = Worker(self.projects_model.read_archive, zip_file_path)
+        self.importer.signals.finished.connect(self.insert_imported_projects)
+        self.importer.signals.failed.connect(self.handle_import_failed)
+        QThreadPool.globalInstance().start(self.importer)
+
+    def insert_imported_projects(self, projects):
+        """
+        Insert the projects read from an archive in batched transactions, and report the projects that could not be imported.
+
+        A project with invalid files, a name that is too long or already used, or that exceeds the project limit is skipped without stopping the import.
+
+        Parameters
+        ----------
+        projects : list of tuple
+            The name of each project and its loaded data, or failure code.
+        """
+        self.import_progress_dialog.setLabelText("Importing projects...")
+        self.import_progress_dialog.setMaximum(len(projects))
+
+        return_value, existing_projects = self.projects_model.get_projects()
+        if return_value == config.FAILURE:
+            self.handle_import_failed("Projects couldn't be loaded.")
+            return
+        project_names = {project['name'] for project in existing_projects}
+        project_count = len(existing_projects)
+
+        imported = []
+        conflicts = []
+        for start in range(0, len(projects), config.IMPORT_BATCH_SIZE):
+            batch = []
+            self.projects_model.start_transaction()
+            for project_name, loaded_data in projects[start:start + config.IMPORT_BATCH_SIZE]:
+                project_name = project_name.strip()
+                if loaded_data == config.FAILURE:
+                    conflicts.append((project_name, "missing or corrupted files"))
+                elif len(project_name) > 20:
+                    conflicts.append((project_name, "the name exceeds 20 characters"))
+                elif project_name in project_names:
+                    conflicts.append((project_name, "a project with that name already exists"))
+                elif project_count >= config.PROJECT_LIMIT:
+                    conflicts.append((project_name, f"the maximum number of projects ({config.PROJECT_LIMIT}) was reached"))
+                else:
+                    self.projects_model.savepoint("import_project")
+                    return_value, project_data = self.insert_imported_project(project_name, loaded_data)
+                    if return_value == config.SUCCESS:
+                        self.projects_model.release_savepoint("import_project")
+                        batch.append(project_data)
+                        project_names.add(project_name)
+                        project_count += 1
+                    else:
+                        self.projects_model.rollback_to_savepoint("import_project")
+                        conflicts.append((project_name, "the project data could not be inserted"))
+
+            if self.projects_model.commit():
+                imported.extend(batch)
+            else:
+                self.projects_model.rollback()
+                conflicts.extend((project_data['name'], "the project data could not be saved") for project_data in batch)
+                project_names.difference_update(project_data['name'] for project_data in batch)
+                project_count -= len(batch)
+            self.import_progress_dialog.setValue(min(start + config.IMPORT_BATCH_SIZE, len(projects)))
+
+        for project_data in imported:
+            self.view.update_projects_table(project_data, None)
+        self.finish_import()
+        self.report_imported_projects(len(imported), len(projects), conflicts)
+
+    def insert_imported_project(self, project_name, loaded_data):
+        """
+        Insert an imported project in the current transaction, without displaying messages.
+
+        Parameters
+        ----------
+        project_name : str
+            The name of the project.
+        loaded_data : dict
+            The loaded project data.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and the project data if successful, None otherwise.
+        """
+        project = loaded_data['project'][0] if loaded_data['project'] else {}
+        project_data = {
+            "favorite": 0,
+            "name": project_name,
+            "description": project.get('description') or '',
+            "created_at": datetime.now().strftime("%Y/%m/%d %H:%M:%S"),
+            "last_access": "––"
+        }
+        return_value, project_id = self.projects_model.add_project(project_data)
+        if return_value != config.SUCCESS:
+            return return_value, None
+
+        if (self.projects_model.insert_parameters(project_id) != config.SUCCESS
+                or self.technicalFactors_model.insert_technical_factors_default(project_id) != config.SUCCESS
+                or self.environmentalFactors_model.insert_environmental_factors_default(project_id) != config.SUCCESS
+                or not self.insert_project_data(loaded_data, project_id)):
+            return config.FAILURE, None
+
+        project_data['id'] = project_id
+        return config.SUCCESS, project_data
+
+    def report_imported_projects(self, imported, total, conflicts):
+        """
+        Display the result of a bulk import.
+
+        Parameters
+        ----------
+        imported : int
+            Number of imported projects.
+        total : int
+            Number of projects in the archive.
+        conflicts : list of tuple
+            The name of each project that was not imported and the reason.
+        """
+        message = f"{imported} of {total} projects were imported."
+        if not conflicts:
+            self.view.display_message("Successful Operation", message, config.INFORMATION_IMG)
+            return
+
+        lines = [f"- {project_name}: {reason}" for project_name, reason in conflicts[:config.IMPORT_REPORT_LIMIT]]
+        if len(conflicts) > config.IMPORT_REPORT_LIMIT:
+            lines.append(f"... and {len(conflicts) - config.IMPORT_REPORT_LIMIT} more.")
+        message += "\n\nThe following projects were not imported:\n" + "\n".join(lines)
+        self.view.display_message("Warning", message, config.WARNING_IMG)
+
+    def handle_import_failed(self, error):
+        """
+        Handle an archive that could not be read.
+
+        Parameters
+        ----------
+        error : str
+            The error message.
+        """
+        self.finish_import()
+        self.view.display_message("Failed Operation", "The selected archive could not be read. Please, select a valid QuickEst export.", config.CRITICAL_IMG)
+
+    def finish_import(self):
+        """
+        Release the import task and close the progress dialog.
+        """
+        self.importer = None
+        if self.import_progress_dialog is not None:
+            self.import_progress_dialog.close()
+            self.import_progress_dialog = None
 
-    def add_project_to_database(self, directory, loaded_data):
+    def add_project_to_database(self, project_name, loaded_data):
         """
         Add a project to the database.
 
         Parameters
         ----------
-        directory : str
-            The directory of the project.
+        project_name : str
+            The name of the imported project, taken from its directory or package file.
         loaded_data : dict
             The loaded project data.
 
@@ -556,13 +817,13 @@ class ProjectsController(QObject):
             self.projects_model.start_transaction()
 
             for project in loaded_data['project']:
-                project_name = QFileInfo(directory).fileName().strip()
+                project_name = project_name.strip()
                 if len(project_name) > 20:
                     raise ValueError("Project name cannot exceed 20 characters.")
                 project_data = {
                     "favorite": 0,
                     "name": project_name,
-                    "description": project.get('description'),
+                    "description": project.get('description') or '',
                     "created_at": datetime.now().strftime("%Y/%m/%d %H:%M:%S"),
                     "last_access": "––"
                 }
@@ -603,80 +864,20 @@ class ProjectsController(QObject):
         """
         try:
             for parameter in loaded_data["parameters"]:
-                if self.dashboard_model.update_cf(
-                    parameter.get('cf'),
-                    project_id
-                ) != config.SUCCESS:
+                if self.projects_model.update_parameters(parameter, project_id) != config.SUCCESS:
                     return False
 
-                percentages = {
-                    'analysis': parameter.get('analysis_percentage'),
-                    'design': parameter.get('design_percentage'),
-                    'programming': parameter.get('programming_percentage'),
-                    'testing': parameter.get('testing_percentage'),
-                    'overloading': parameter.get('overloading_percentage')
-                }
-                if self.dashboard_model.update_percentages(percentages, project_id) != config.SUCCESS:
-                    return False
+            if self.actors_model.create_actors(loaded_data["actors"], project_id) != config.SUCCESS:
+                return False
 
-                actors_weights = {
-                    'simple_weight': parameter.get('actors_simple_weight'),
-                    'average_weight': parameter.get('actors_average_weight'),
-                    'complex_weight': parameter.get('actors_complex_weight')
-                }
-                if self.actors_model.update_actors_weights(actors_weights, project_id) != config.SUCCESS:
-                    return False
+            if self.useCases_model.create_use_cases(loaded_data["use_cases"], project_id) != config.SUCCESS:
+                return False
 
-                use_cases_weights = {
-                    'simple_weight': parameter.get('use_cases_simple_weight'),
-                    'average_weight': parameter.get('use_cases_average_weight'),
-                    'complex_weight': parameter.get('use_cases_complex_weight')
-                }
-                if self.useCases_model.update_use_cases_weights(use_cases_weights,project_id) != config.SUCCESS:
-                    return False
+            if self.technicalFactors_model.update_technical_factors(loaded_data["technical_factors"], project_id) != config.SUCCESS:
+                return False
 
-            for actor in loaded_data["actors"]:
-                actor_data = {
-                    'code': actor.get('code'),
-                    'name': actor.get('name'),
-                    'complexity': actor.get('complexity'),
-                    'comment': actor.get('comment')
-                }
-                return_value, actor_id = self.actors_model.create_actor(actor_data, project_id)
-                if return_value != config.SUCCESS:
-                    return False
-
-            for use_case in loaded_data["use_cases"]:
-                use_case_data = {
-                    'code': use_case.get('code'),
-                    'name': use_case.get('name'),
-                    'complexity': use_case.get('complexity'),
-                    'transactions': use_case.get('transactions'),
-                    'comment': use_case.get('comment')
-                }
-                return_value, useCase_id = self.useCases_model.create_use_case(use_case_data, project_id)
-                if return_value != config.SUCCESS:
-                    return False
-
-            for t_factor in loaded_data["technical_factors"]:
-                t_factor_data = {
-                    'factor' :  t_factor.get('factor'),
-                    'weight' :  t_factor.get('weight'),
-                    'influence' :  t_factor.get('influence'),
-                    'comment' :  t_factor.get('comment'),
-                }
-                if self.technicalFactors_model.update_technical_factor(t_factor_data, project_id) != config.SUCCESS:
-                    return False
-
-            for e_factor in loaded_data["environmental_factors"]:
-                e_factor_data = {
-                    'factor' :  e_factor.get('factor'),
-                    'weight' :  e_factor.get('weight'),
-                    'influence' :  e_factor.get('influence'),
-                    'comment' :  e_factor.get('comment'),
-                }
-                if self.environmentalFactors_model.update_environmental_factor(e_factor_data, project_id) != config.SUCCESS:
-                    return False
+            if self.environmentalFactors_model.update_environmental_factors(loaded_data["environmental_factors"], project_id) != config.SUCCESS:
+                return False
 
             return True
 
@@ -687,6 +888,8 @@ class ProjectsController(QObject):
         """
         Generate an Excel report for a project.
 
+        The project data is captured on the main thread inside a short transaction, and the report is queued to be written in the background.
+
         Parameters
         ----------
         project_id : int
@@ -716,143 +919,174 @@ class ProjectsController(QObject):
             if environmentalFactors_data == config.FAILURE:
                 raise Exception("Failed to retrieve environmental factors data")
 
-            project_name = project_data['project_data']['Project Name'].iloc[0]
-            file_name = f"{project_name}.xlsx"
-
-            excel_file_path, _  = QFileDialog.getSaveFileName(None, "Save Project Report", file_name, "Excel files (*.xlsx);; All files (*)")
-
-            if not excel_file_path:
-                return
-
-            if not excel_file_path.endswith('.xlsx'):
-                raise Exception("missing extension '.xlsx'")
-
-            with pd.ExcelWriter(excel_file_path, engine='openpyxl') as writer:
-                project_data['project_data'].to_excel(writer, sheet_name='Results', index=False, startrow=1)
-                project_data['report_date'].to_excel(writer, sheet_name='Results', index=False, startrow=4)
-                metrics_data['total_effort'].to_excel(writer, sheet_name='Results', index=False, startrow=7)
-                sheet = writer.sheets['Results']
-                sheet.merge_cells(start_row=5, start_column=1, end_row=5, end_column=2)
-                sheet.merge_cells(start_row=6, start_column=1, end_row=6, end_column=2)
-                sheet.merge_cells(start_row=8, start_column=1, end_row=8, end_column=2)
-                sheet.merge_cells(start_row=9, start_column=1, end_row=9, end_column=2)
-                max_column = project_data['project_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Results'], "RESULTS", 1, 1, max_column, "FFFF00")
-
-                metrics_data['metrics_data'].to_excel(writer, sheet_name='Estimation Metrics', index=False, startrow=1)
-                max_column = metrics_data['metrics_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Estimation Metrics'], "ESTIMATION METRICS", 1, 1, max_column, "FFFF00")
-
-                effort_distribution_data.to_excel(writer, sheet_name='Effort Distribution', index=False, startrow=1)
-                max_column = effort_distribution_data.shape[1]
-                self.add_formatted_title(writer.sheets['Effort Distribution'], "EFFORT DISTRIBUTION", 1, 1, max_column, "FFFF00")
-
-                actors_data['actors_data'].to_excel(writer, sheet_name='Actors', index=False, startrow=1)
-                max_column_actors = actors_data['actors_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Actors'], "ACTORS DATA", 1, 1, max_column_actors, "FFCCFFFF")
-
-                start_col_summary = max_column_actors + 1
-                actors_data['actors_summary'].to_excel(writer, sheet_name='Actors', index=False, startcol=start_col_summary, startrow=1)
-                max_column_summary = start_col_summary + actors_data['actors_summary'].shape[1]
-                self.add_formatted_title(writer.sheets['Actors'], "ACTORS SUMMARY", 1, start_col_summary + 1, max_column_summary, "FFCCFFCC")
-
-                useCases_data['useCases_data'].to_excel(writer, sheet_name='Use Cases', index=False, startrow=1)
-                max_column_useCases = useCases_data['useCases_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Use Cases'], "USE CASES DATA", 1, 1, max_column_useCases, "FFCCFFFF")
-
-                start_col_summary = max_column_useCases + 1
-                useCases_data['useCases_summary'].to_excel(writer, sheet_name='Use Cases', index=False, startcol=start_col_summary, startrow=1)
-                max_column_summary = start_col_summary + useCases_data['useCases_summary'].shape[1]
-                self.add_formatted_title(writer.sheets['Use Cases'], "USE CASES SUMMARY", 1, start_col_summary + 1, max_column_summary, "FFCCFFCC")
-
-                technicalFactors_data['technicalFactors_data'].to_excel(writer, sheet_name='Technical Factors', index=False, startrow=1)
-                max_column_technicalFactors = technicalFactors_data['technicalFactors_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Technical Factors'], "TECHNICAL FACTORS DATA", 1, 1, max_column_technicalFactors, "FFCCFFFF")
-
-                start_col_summary = max_column_technicalFactors + 1
-                technicalFactors_data['technicalFactors_summary'].to_excel(writer, sheet_name='Technical Factors', index=False, startcol=start_col_summary, startrow=1)
-                max_column_summary = start_col_summary + technicalFactors_data['technicalFactors_summary'].shape[1]
-                self.add_formatted_title(writer.sheets['Technical Factors'], "TECHNICAL FACTORS SUMMARY", 1, start_col_summary + 1, max_column_summary, "FFCCFFCC")
-
-                environmentalFactors_data['environmentalFactors_data'].to_excel(writer, sheet_name='Environmental Factors', index=False, startrow=1)
-                max_column_environmentalFactors = environmentalFactors_data['environmentalFactors_data'].shape[1]
-                self.add_formatted_title(writer.sheets['Environmental Factors'], "ENVIRONMENTAL FACTORS DATA", 1, 1, max_column_environmentalFactors, "FFCCFFFF")
-
-                start_col_summary = max_column_environmentalFactors + 1
-                environmentalFactors_data['environmentalFactors_summary'].to_excel(writer, sheet_name='Environmental Factors', index=False, startcol=start_col_summary, startrow=1)
-                max_column_summary = start_col_summary + environmentalFactors_data['environmentalFactors_summary'].shape[1]
-                self.add_formatted_title(writer.sheets['Environmental Factors'], "ENVIRONMENTAL FACTORS SUMMARY", 1, start_col_summary + 1, max_column_summary, "FFCCFFCC")
-
-                for sheet_name in writer.sheets:
-                    worksheet = writer.sheets[sheet_name]
-                    max_column = len(worksheet['1'])
-                    self.auto_adjust_column_width(worksheet, [(1, max_column)])
-
             self.projects_model.commit()
-            success = QDesktopServices.openUrl(QUrl.fromLocalFile(excel_file_path))
-            if not success:
-                return
+        except Exception as e:
+            self.projects_model.rollback()
+            self.view.display_message("Failed Operation", f"An error occurred while downloading the report: {e}. Please try again.", config.CRITICAL_IMG)
+            return
+
+        project_name = project_data['project_data']['Project Name'].iloc[0]
+        file_name = f"{project_name}.xlsx"
+
+        excel_file_path, _  = QFileDialog.getSaveFileName(None, "Save Project Report", file_name, "Excel files (*.xlsx);; All files (*)")
+
+        if not excel_file_path:
+            return
+
+        if not excel_file_path.endswith('.xlsx'):
+            self.view.display_message("Warning", "The operation could not be completed: missing extension '.xlsx'. Please try again.", config.WARNING_IMG)
+            return
+
+        writer = ExcelReportWriter(excel_file_path)
+        writer.add_table('Results', project_data['project_data'], 2, 1, "RESULTS", "FFFF00")
+        writer.add_table('Results', project_data['report_date'], 5, 1)
+        writer.add_table('Results', metrics_data['total_effort'], 8, 1)
+        for row in (5, 6, 8, 9):
+            writer.merge_cells('Results', row, 1, row, 2)
+
+        writer.add_table('Estimation Metrics', metrics_data['metrics_data'], 2, 1, "ESTIMATION METRICS", "FFFF00")
+        writer.add_table('Effort Distribution', effort_distribution_data, 2, 1, "EFFORT DISTRIBUTION", "FFFF00")
+
+        tables = [
+            ('Actors', actors_data['actors_data'], actors_data['actors_summary'], "ACTORS"),
+            ('Use Cases', useCases_data['useCases_data'], useCases_data['useCases_summary'], "USE CASES"),
+            ('Technical Factors', technicalFactors_data['technicalFactors_data'], technicalFactors_data['technicalFactors_summary'], "TECHNICAL FACTORS"),
+            ('Environmental Factors', environmentalFactors_data['environmentalFactors_data'], environmentalFactors_data['environmentalFactors_summary'], "ENVIRONMENTAL FACTORS")
+        ]
+        for sheet_name, data, summary, title in tables:
+            writer.add_table(sheet_name, data, 2, 1, f"{title} DATA", "FFCCFFFF")
+            writer.add_table(sheet_name, summary, 2, data.shape[1] + 2, f"{title} SUMMARY", "FFCCFFCC")
+
+        self.report_generator.add_job(writer)
+
+    def generate_portfolio_report(self):
+        """
+        Generate an Excel report with the estimate of every project.
+
+        The estimates are calculated for all the projects at once, and the actors, use cases and factors of the optional detail sheets are read with one query per table. The report is queued to be written in the background.
+        """
+        include_details = self.view.display_message("Portfolio Report", "Do you want to add a sheet with the actors, use cases and factors of every project?", config.CONFIRMATION_IMG, "confirmation_message")
+
+        try:
+            self.projects_model.start_transaction()
+            result, summary = self.projects_model.get_portfolio_summary()
+            if result != config.SUCCESS:
+                raise Exception("Failed to retrieve the estimates of the projects")
+
+            details = None
+            if include_details:
+                result, details = self.projects_model.get_portfolio_details()
+                if result != config.SUCCESS:
+                    raise Exception("Failed to retrieve the data of the projects")
 
+            self.projects_model.commit()
         except Exception as e:
             self.projects_model.rollback()
-            if "missing extension" in str(e):
-                self.view.display_message("Warning", f"The operation could not be completed: {e}. Please try again.", config.WARNING_IMG)
-            else:
-                self.view.display_message("Failed Operation", f"An error occurred while downloading the report: {e}. Please try again.", config.CRITICAL_IMG)
+            self.view.display_message("Failed Operation", f"An error occurred while downloading the report: {e}. Please try again.", config.CRITICAL_IMG)
+            return
+
+        excel_file_path, _  = QFileDialog.getSaveFileName(None, "Save Portfolio Report", "quickest_portfolio.xlsx", "Excel files (*.xlsx);; All files (*)")
+
+        if not excel_file_path:
+            return
+
+        if not excel_file_path.endswith('.xlsx'):
+            self.view.display_message("Warning", "The operation could not be completed: missing extension '.xlsx'. Please try again.", config.WARNING_IMG)
+            return
+
+        writer = ExcelReportWriter(excel_file_path)
+        writer.add_table('Portfolio', summary, 2, 1, "PORTFOLIO SUMMARY", "FFFF00")
+
+        if details is not None:
+            tables = [
+                ('actors', "ACTORS DATA"),
+                ('use_cases', "USE CASES DATA"),
+                ('technical_factors', "TECHNICAL FACTORS DATA"),
+                ('environmental_factors', "ENVIRONMENTAL FACTORS DATA")
+            ]
+            projects_data = {table: dict(tuple(data.drop(columns='project_id').groupby(data['project_id'], sort=False))) for table, data in details.items()}
+            for project_id, project_name in zip(summary['ID'].iloc[:-1], summary['Project Name'].iloc[:-1]):
+                sheet_name = writer.get_sheet_name(project_name)
+                row = 2
+                for table, title in tables:
+                    data = projects_data[table].get(project_id, details[table].iloc[0:0, 1:])
+                    writer.add_table(sheet_name, data, row, 1, title, "FFCCFFFF")
+                    row += len(data) + 3  # Leave an empty row before the title of the next table
+
+        self.report_generator.add_job(writer)
+
+    def handle_report_started(self, excel_file_path, queued):
+        """
+        Show the progress of the report being written.
+
+        Parameters
+        ----------
+        excel_file_path : str
+            The path of the report.
+        queued : int
+            The number of reports waiting after this one.
+        """
+        if self.report_progress_dialog is None:
+            self.report_progress_dialog = QProgressDialog("", None, 0, 0, self.view)
+            self.report_progress_dialog.setWindowTitle("Project Report")
+            self.report_progress_dialog.setMinimumDuration(0)
+
+        label = f"Writing {QFileInfo(excel_file_path).fileName()}..."
+        if queued:
+            label += f"\n{queued} more report(s) queued."
+        self.report_progress_dialog.setLabelText(label)
+        self.report_progress_dialog.setMaximum(0)
+        self.report_progress_dialog.setValue(0)
+        self.report_progress_dialog.show()
+
+    def update_report_progress(self, written, total):
+        """
+        Update the progress dialog of the report being written.
 
-    def add_formatted_title(self, worksheet, title, start_row, start_column, end_column, bg_color):
+        Parameters
+        ----------
+        written : int
+            Number of written sheets.
+        total : int
+            Total number of sheets.
+        """
+        if self.report_progress_dialog is not None:
+            self.report_progress_dialog.setMaximum(total)
+            self.report_progress_dialog.setValue(written)
+
+    def finish_report(self):
+        """
+        Close the progress dialog once no report is being written.
         """
-        Add a formatted title to an Excel sheet.
+        if self.report_progress_dialog is not None and not self.report_generator.is_busy():
+            self.report_progress_dialog.close()
+            self.report_progress_dialog = None
+
+    def handle_report_finished(self, excel_file_path):
+        """
+        Open a report once it has been written.
 
         Parameters
         ----------
-        worksheet : Worksheet
-            The worksheet to add the title to.
-        title : str
-            The text of the title.
-        start_row : int
-            The row where the title starts.
-        start_column : int
-            The column where the title starts.
-        end_column : int
-            The column where the title ends.
-        bg_color : str
-            Background color of the title in hexadecimal format.
-        """
-        title_cell = worksheet.cell(row=start_row, column=start_column)
-        title_cell.value = title
-        title_cell.font = Font(bold=True, size=12)
-        title_cell.fill = PatternFill(start_color=bg_color, end_color=bg_color, fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center")
-        worksheet.merge_cells(start_row=start_row, start_column=start_column, end_row=start_row, end_column=end_column)
-
-    def auto_adjust_column_width(self, worksheet, column_ranges, extra_width=4, max_width=50):
-        """
-        Automatically adjust the width of specified columns in an Excel worksheet based on their content.
+        excel_file_path : str
+            The path of the report.
+        """
+        self.finish_report()
+        QDesktopServices.openUrl(QUrl.fromLocalFile(excel_file_path))
+
+    def handle_report_failed(self, excel_file_path, error):
+        """
+        Handle the error of a report that could not be written.
 
         Parameters
         ----------
-        worksheet : Worksheet
-            The worksheet to adjust.
-        column_ranges : list of tuple
-            List of tuples specifying the start and end columns to adjust.
-        extra_width : int, optional
-            Additional width to add to the calculated column width, by default 4.
-        max_width : int, optional
-            Maximum column width, by default 50.
-        """
-        for start_col, end_col in column_ranges:
-            for col_idx in range(start_col, end_col + 1):
-                column_letter = get_column_letter(col_idx)
-                max_length = 0
-                for cell in worksheet[column_letter]:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        max_length = max(max_length, min(cell_length, max_width))
-                adjusted_width = min(max_length + extra_width, max_width)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-                for cell in worksheet[column_letter]:
-                    cell.alignment = Alignment(horizontal='center', vertical='center', wrapText=True)
+        excel_file_path : str
+            The path of the report.
+        error : str
+            The error message.
+        """
+        self.finish_report()
+        self.view.display_message("Failed Operation", f"An error occurred while writing the report {excel_file_path}: {error}. Please try again.", config.CRITICAL_IMG)
 
     def close_project(self, confirmation=True):
         """
@@ -71,9 +71,7 @@ class UseCasesController(QObject):
         """
         self.project_id = int(project_data['id'])
         self.view.delete_rows(clear_all=True)
-        useCases = self.model.get_use_cases_data()
-        for useCase in useCases:
-            self.view.update_use_cases_table(useCase, update_rows=False)
+        self.view.load_use_cases_table(self.model.get_use_cases_data())
         useCases_count, total_useCases, useCases_UUCW, total_UUCW, weights = self.model.get_summary_data()
 
         useCases_UUCW = {key: (int(value) if value.is_integer() else value) for key, value in useCases_UUCW.items()}
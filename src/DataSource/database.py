@@ -3,7 +3,10 @@
 
 import sys
 import os
+import config
+from PySide6.QtCore import QSettings
 from PySide6.QtSql import QSqlDatabase, QSqlQuery
+from DataSource.statement_cache import StatementCache
 
 class DataBase:
     """
@@ -22,6 +25,351 @@ class DataBase:
 
     _instance = None  # Class attribute to store the Singleton instance
 
+    # Aggregates of the rows of a new project, inserted once its parameters exist. Only the
+    # rows of this project are read, instead of materializing every project through the view
+    PARAMETERS_METRICS_INSERT_TRIGGER = """
+        CREATE TRIGGER parameters_metrics_insert AFTER INSERT ON parameters
+        BEGIN
+            INSERT OR REPLACE INTO project_metrics
+            SELECT NEW.project_id,
+                COALESCE(a.simple, 0), COALESCE(a.average, 0), COALESCE(a.complex, 0),
+                COALESCE(u.simple, 0), COALESCE(u.average, 0), COALESCE(u.complex, 0),
+                COALESCE(t.irrelevant, 0), COALESCE(t.medium, 0), COALESCE(t.essential, 0), COALESCE(t.total, 0.0),
+                COALESCE(e.irrelevant, 0), COALESCE(e.medium, 0), COALESCE(e.essential, 0), COALESCE(e.total, 0.0)
+            FROM (
+                SELECT SUM(complexity = 'Simple') AS simple, SUM(complexity = 'Average') AS average, SUM(complexity = 'Complex') AS complex
+                FROM actors WHERE project_id = NEW.project_id
+            ) a, (
+                SELECT SUM(complexity = 'Simple') AS simple, SUM(complexity = 'Average') AS average, SUM(complexity = 'Complex') AS complex
+                FROM use_cases WHERE project_id = NEW.project_id
+            ) u, (
+                SELECT SUM(influence BETWEEN 0 AND 2) AS irrelevant, SUM(influence BETWEEN 3 AND 4) AS medium, SUM(influence = 5) AS essential, SUM(ROUND(weight * influence, 4)) AS total
+                FROM technical_factors WHERE project_id = NEW.project_id
+            ) t, (
+                SELECT SUM(influence BETWEEN 0 AND 2) AS irrelevant, SUM(influence BETWEEN 3 AND 4) AS medium, SUM(influence = 5) AS essential, SUM(ROUND(weight * influence, 4)) AS total
+                FROM environmental_factors WHERE project_id = NEW.project_id
+            ) e;
+        END
+    """
+
+    # Ordered schema migrations, keyed on PRAGMA user_version. Each entry upgrades the
+    # database to the given version; new migrations must be appended with the next version.
+    MIGRATIONS = [
+        (1, [
+            "CREATE INDEX IF NOT EXISTS idx_actors_project ON actors(project_id, code)",
+            "CREATE INDEX IF NOT EXISTS idx_use_cases_project ON use_cases(project_id, code)",
+            "CREATE INDEX IF NOT EXISTS idx_technical_factors_project ON technical_factors(project_id, factor)",
+            "CREATE INDEX IF NOT EXISTS idx_environmental_factors_project ON environmental_factors(project_id, factor)"
+        ]),
+        # Per-project aggregates kept up to date by triggers, so the dashboard and the
+        # portfolio views read one row instead of rescanning the child tables
+        (2, [
+            """
+                CREATE TABLE IF NOT EXISTS project_metrics (
+                    project_id INTEGER PRIMARY KEY NOT NULL,
+                    actors_simple INTEGER NOT NULL DEFAULT 0,
+                    actors_average INTEGER NOT NULL DEFAULT 0,
+                    actors_complex INTEGER NOT NULL DEFAULT 0,
+                    use_cases_simple INTEGER NOT NULL DEFAULT 0,
+                    use_cases_average INTEGER NOT NULL DEFAULT 0,
+                    use_cases_complex INTEGER NOT NULL DEFAULT 0,
+                    technical_irrelevant INTEGER NOT NULL DEFAULT 0,
+                    technical_medium INTEGER NOT NULL DEFAULT 0,
+                    technical_essential INTEGER NOT NULL DEFAULT 0,
+                    tfactor REAL NOT NULL DEFAULT 0.0,
+                    environmental_irrelevant INTEGER NOT NULL DEFAULT 0,
+                    environmental_medium INTEGER NOT NULL DEFAULT 0,
+                    environmental_essential INTEGER NOT NULL DEFAULT 0,
+                    efactor REAL NOT NULL DEFAULT 0.0,
+                    FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE ON UPDATE NO ACTION
+                )
+            """,
+            """
+                CREATE VIEW IF NOT EXISTS project_metrics_source AS
+                SELECT p.project_id,
+                    COALESCE(a.simple, 0) AS actors_simple,
+                    COALESCE(a.average, 0) AS actors_average,
+                    COALESCE(a.complex, 0) AS actors_complex,
+                    COALESCE(u.simple, 0) AS use_cases_simple,
+                    COALESCE(u.average, 0) AS use_cases_average,
+                    COALESCE(u.complex, 0) AS use_cases_complex,
+                    COALESCE(t.irrelevant, 0) AS technical_irrelevant,
+                    COALESCE(t.medium, 0) AS technical_medium,
+                    COALESCE(t.essential, 0) AS technical_essential,
+                    COALESCE(t.total, 0.0) AS tfactor,
+                    COALESCE(e.irrelevant, 0) AS environmental_irrelevant,
+                    COALESCE(e.medium, 0) AS environmental_medium,
+                    COALESCE(e.essential, 0) AS environmental_essential,
+                    COALESCE(e.total, 0.0) AS efactor
+                FROM parameters p
+                LEFT JOIN (
+                    SELECT project_id, SUM(complexity = 'Simple') AS simple, SUM(complexity = 'Average') AS average, SUM(complexity = 'Complex') AS complex
+                    FROM actors GROUP BY project_id
+                ) a ON a.project_id = p.project_id
+                LEFT JOIN (
+                    SELECT project_id, SUM(complexity = 'Simple') AS simple, SUM(complexity = 'Average') AS average, SUM(complexity = 'Complex') AS complex
+                    FROM use_cases GROUP BY project_id
+                ) u ON u.project_id = p.project_id
+                LEFT JOIN (
+                    SELECT project_id, SUM(influence BETWEEN 0 AND 2) AS irrelevant, SUM(influence BETWEEN 3 AND 4) AS medium, SUM(influence = 5) AS essential, SUM(ROUND(weight * influence, 4)) AS total
+                    FROM technical_factors GROUP BY project_id
+                ) t ON t.project_id = p.project_id
+                LEFT JOIN (
+                    SELECT project_id, SUM(influence BETWEEN 0 AND 2) AS irrelevant, SUM(influence BETWEEN 3 AND 4) AS medium, SUM(influence = 5) AS essential, SUM(ROUND(weight * influence, 4)) AS total
+                    FROM environmental_factors GROUP BY project_id
+                ) e ON e.project_id = p.project_id
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS actors_metrics_insert AFTER INSERT ON actors
+                BEGIN
+                    UPDATE project_metrics SET
+                        actors_simple = actors_simple + (NEW.complexity = 'Simple'),
+                        actors_average = actors_average + (NEW.complexity = 'Average'),
+                        actors_complex = actors_complex + (NEW.complexity = 'Complex')
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS actors_metrics_delete AFTER DELETE ON actors
+                BEGIN
+                    UPDATE project_metrics SET
+                        actors_simple = actors_simple - (OLD.complexity = 'Simple'),
+                        actors_average = actors_average - (OLD.complexity = 'Average'),
+                        actors_complex = actors_complex - (OLD.complexity = 'Complex')
+                    WHERE project_id = OLD.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS actors_metrics_update AFTER UPDATE OF complexity, project_id ON actors
+                BEGIN
+                    UPDATE project_metrics SET
+                        actors_simple = actors_simple - (OLD.complexity = 'Simple'),
+                        actors_average = actors_average - (OLD.complexity = 'Average'),
+                        actors_complex = actors_complex - (OLD.complexity = 'Complex')
+                    WHERE project_id = OLD.project_id;
+                    UPDATE project_metrics SET
+                        actors_simple = actors_simple + (NEW.complexity = 'Simple'),
+                        actors_average = actors_average + (NEW.complexity = 'Average'),
+                        actors_complex = actors_complex + (NEW.complexity = 'Complex')
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS use_cases_metrics_insert AFTER INSERT ON use_cases
+                BEGIN
+                    UPDATE project_metrics SET
+                        use_cases_simple = use_cases_simple + (NEW.complexity = 'Simple'),
+                        use_cases_average = use_cases_average + (NEW.complexity = 'Average'),
+                        use_cases_complex = use_cases_complex + (NEW.complexity = 'Complex')
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS use_cases_metrics_delete AFTER DELETE ON use_cases
+                BEGIN
+                    UPDATE project_metrics SET
+                        use_cases_simple = use_cases_simple - (OLD.complexity = 'Simple'),
+                        use_cases_average = use_cases_average - (OLD.complexity = 'Average'),
+                        use_cases_complex = use_cases_complex - (OLD.complexity = 'Complex')
+                    WHERE project_id = OLD.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS use_cases_metrics_update AFTER UPDATE OF complexity, project_id ON use_cases
+                BEGIN
+                    UPDATE project_metrics SET
+                        use_cases_simple = use_cases_simple - (OLD.complexity = 'Simple'),
+                        use_cases_average = use_cases_average - (OLD.complexity = 'Average'),
+                        use_cases_complex = use_cases_complex - (OLD.complexity = 'Complex')
+                    WHERE project_id = OLD.project_id;
+                    UPDATE project_metrics SET
+                        use_cases_simple = use_cases_simple + (NEW.complexity = 'Simple'),
+                        use_cases_average = use_cases_average + (NEW.complexity = 'Average'),
+                        use_cases_complex = use_cases_complex + (NEW.complexity = 'Complex')
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS technical_factors_metrics_insert AFTER INSERT ON technical_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        technical_irrelevant = technical_irrelevant + (NEW.influence BETWEEN 0 AND 2),
+                        technical_medium = technical_medium + (NEW.influence BETWEEN 3 AND 4),
+                        technical_essential = technical_essential + (NEW.influence = 5),
+                        tfactor = tfactor + ROUND(NEW.weight * NEW.influence, 4)
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS technical_factors_metrics_delete AFTER DELETE ON technical_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        technical_irrelevant = technical_irrelevant - (OLD.influence BETWEEN 0 AND 2),
+                        technical_medium = technical_medium - (OLD.influence BETWEEN 3 AND 4),
+                        technical_essential = technical_essential - (OLD.influence = 5),
+                        tfactor = tfactor - ROUND(OLD.weight * OLD.influence, 4)
+                    WHERE project_id = OLD.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS technical_factors_metrics_update AFTER UPDATE OF weight, influence, project_id ON technical_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        technical_irrelevant = technical_irrelevant - (OLD.influence BETWEEN 0 AND 2),
+                        technical_medium = technical_medium - (OLD.influence BETWEEN 3 AND 4),
+                        technical_essential = technical_essential - (OLD.influence = 5),
+                        tfactor = tfactor - ROUND(OLD.weight * OLD.influence, 4)
+                    WHERE project_id = OLD.project_id;
+                    UPDATE project_metrics SET
+                        technical_irrelevant = technical_irrelevant + (NEW.influence BETWEEN 0 AND 2),
+                        technical_medium = technical_medium + (NEW.influence BETWEEN 3 AND 4),
+                        technical_essential = technical_essential + (NEW.influence = 5),
+                        tfactor = tfactor + ROUND(NEW.weight * NEW.influence, 4)
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS environmental_factors_metrics_insert AFTER INSERT ON environmental_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        environmental_irrelevant = environmental_irrelevant + (NEW.influence BETWEEN 0 AND 2),
+                        environmental_medium = environmental_medium + (NEW.influence BETWEEN 3 AND 4),
+                        environmental_essential = environmental_essential + (NEW.influence = 5),
+                        efactor = efactor + ROUND(NEW.weight * NEW.influence, 4)
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS environmental_factors_metrics_delete AFTER DELETE ON environmental_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        environmental_irrelevant = environmental_irrelevant - (OLD.influence BETWEEN 0 AND 2),
+                        environmental_medium = environmental_medium - (OLD.influence BETWEEN 3 AND 4),
+                        environmental_essential = environmental_essential - (OLD.influence = 5),
+                        efactor = efactor - ROUND(OLD.weight * OLD.influence, 4)
+                    WHERE project_id = OLD.project_id;
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS environmental_factors_metrics_update AFTER UPDATE OF weight, influence, project_id ON environmental_factors
+                BEGIN
+                    UPDATE project_metrics SET
+                        environmental_irrelevant = environmental_irrelevant - (OLD.influence BETWEEN 0 AND 2),
+                        environmental_medium = environmental_medium - (OLD.influence BETWEEN 3 AND 4),
+                        environmental_essential = environmental_essential - (OLD.influence = 5),
+                        efactor = efactor - ROUND(OLD.weight * OLD.influence, 4)
+                    WHERE project_id = OLD.project_id;
+                    UPDATE project_metrics SET
+                        environmental_irrelevant = environmental_irrelevant + (NEW.influence BETWEEN 0 AND 2),
+                        environmental_medium = environmental_medium + (NEW.influence BETWEEN 3 AND 4),
+                        environmental_essential = environmental_essential + (NEW.influence = 5),
+                        efactor = efactor + ROUND(NEW.weight * NEW.influence, 4)
+                    WHERE project_id = NEW.project_id;
+                END
+            """,
+            PARAMETERS_METRICS_INSERT_TRIGGER,
+            "INSERT OR REPLACE INTO project_metrics SELECT * FROM project_metrics_source",
+            """
+                CREATE VIEW IF NOT EXISTS project_estimates AS
+                SELECT *,
+                    CASE WHEN programming_percentage != 0 THEN ROUND(e * analysis_percentage / programming_percentage, 4) ELSE 0.0 END AS analysis_hours,
+                    CASE WHEN programming_percentage != 0 THEN ROUND(e * design_percentage / programming_percentage, 4) ELSE 0.0 END AS design_hours,
+                    CASE WHEN programming_percentage != 0 THEN ROUND(e, 4) ELSE 0.0 END AS programming_hours,
+                    CASE WHEN programming_percentage != 0 THEN ROUND(e * testing_percentage / programming_percentage, 4) ELSE 0.0 END AS testing_hours,
+                    CASE WHEN programming_percentage != 0 THEN ROUND(e * overloading_percentage / programming_percentage, 4) ELSE 0.0 END AS overloading_hours
+                FROM (
+                    SELECT *, ROUND(ucp * cf, 4) AS e FROM (
+                        SELECT *, ROUND(uucp * ecf * tcf, 4) AS ucp FROM (
+                            SELECT *, ROUND(uaw + uucw, 4) AS uucp FROM (
+                                SELECT m.*, p.cf,
+                                    p.analysis_percentage, p.design_percentage, p.programming_percentage, p.testing_percentage, p.overloading_percentage,
+                                    ROUND(ROUND(m.actors_simple * p.actors_simple_weight, 4) + ROUND(m.actors_average * p.actors_average_weight, 4) + ROUND(m.actors_complex * p.actors_complex_weight, 4), 4) AS uaw,
+                                    ROUND(ROUND(m.use_cases_simple * p.useCases_simple_weight, 4) + ROUND(m.use_cases_average * p.useCases_average_weight, 4) + ROUND(m.use_cases_complex * p.useCases_complex_weight, 4), 4) AS uucw,
+                                    ROUND(0.6 + (0.01 * m.tfactor), 4) AS tcf,
+                                    ROUND(1.4 + (-0.03 * m.efactor), 4) AS ecf
+                                FROM project_metrics m
+                                JOIN parameters p ON p.project_id = m.project_id
+                            )
+                        )
+                    )
+                )
+            """
+        ]),
+        # Replace the parameters_metrics_insert trigger of the databases upgraded to version 2
+        # while it still aggregated every project through project_metrics_source
+        (3, [
+            "DROP TRIGGER IF EXISTS parameters_metrics_insert",
+            PARAMETERS_METRICS_INSERT_TRIGGER
+        ]),
+        # Revision of every project, increased by any write to the project or its child tables,
+        # so an export can include only the projects changed since a previous archive
+        (4, [
+            """
+                CREATE TABLE IF NOT EXISTS project_changes (
+                    project_id INTEGER PRIMARY KEY NOT NULL,
+                    revision INTEGER NOT NULL DEFAULT 1,
+                    modified_at TEXT NOT NULL,
+                    FOREIGN KEY(project_id) REFERENCES projects(id) ON DELETE CASCADE ON UPDATE NO ACTION
+                )
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS projects_changes_insert AFTER INSERT ON projects
+                BEGIN
+                    INSERT OR REPLACE INTO project_changes (project_id, revision, modified_at)
+                    VALUES (NEW.id, 1, strftime('%Y/%m/%d %H:%M:%S', 'now', 'localtime'));
+                END
+            """,
+            """
+                CREATE TRIGGER IF NOT EXISTS projects_changes_update AFTER UPDATE ON projects
+                BEGIN
+                    UPDATE project_changes SET revision = revision + 1, modified_at = strftime('%Y/%m/%d %H:%M:%S', 'now', 'localtime')
+                    WHERE project_id = NEW.id;
+                END
+            """,
+            *[
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_changes_{event.lower()} AFTER {event} ON {table}
+                BEGIN
+                    UPDATE project_changes SET revision = revision + 1, modified_at = strftime('%Y/%m/%d %H:%M:%S', 'now', 'localtime')
+                    WHERE project_id IN ({rows});
+                END
+                """
+                for table in ("parameters", "actors", "use_cases", "technical_factors", "environmental_factors")
+                for event, rows in (("INSERT", "NEW.project_id"), ("UPDATE", "OLD.project_id, NEW.project_id"), ("DELETE", "OLD.project_id"))
+            ],
+            """
+                INSERT OR IGNORE INTO project_changes (project_id, revision, modified_at)
+                SELECT id, 1, strftime('%Y/%m/%d %H:%M:%S', 'now', 'localtime') FROM projects
+            """
+        ]),
+        # Index the child tables on project_id alone, so the rows of a project are read in
+        # insertion order instead of in the text order of their code or factor
+        (5, [
+            query
+            for table in ("actors", "use_cases", "technical_factors", "environmental_factors")
+            for query in (
+                f"DROP INDEX IF EXISTS idx_{table}_project",
+                f"CREATE INDEX idx_{table}_project ON {table}(project_id)"
+            )
+        ]),
+        # Replace the project_estimates view, which computed the estimate with SQLite's ROUND,
+        # by the inputs of Estimator, so every estimate is rounded the same way as the dashboard
+        (6, [
+            "DROP VIEW IF EXISTS project_estimates",
+            """
+                CREATE VIEW IF NOT EXISTS project_estimate_inputs AS
+                SELECT m.*, p.cf, p.analysis_percentage, p.design_percentage, p.programming_percentage,
+                    p.testing_percentage, p.overloading_percentage, p.actors_simple_weight,
+                    p.actors_average_weight, p.actors_complex_weight,
+                    p.useCases_simple_weight AS use_cases_simple_weight,
+                    p.useCases_average_weight AS use_cases_average_weight,
+                    p.useCases_complex_weight AS use_cases_complex_weight
+                FROM project_metrics m
+                JOIN parameters p ON p.project_id = m.project_id
+            """
+        ])
+    ]
+
     @classmethod
     def get_instance(cls):
         """
@@ -39,6 +387,18 @@ class DataBase:
             cls._instance = result
         return cls._instance
 
+    @classmethod
+    def close_instance(cls):
+        """
+        Close the singleton database connection, if it is open.
+
+        The cached prepared queries are released first, so none of them outlives the connection.
+        """
+        StatementCache.clear()
+        if cls._instance is not None:
+            cls._instance.close()
+            cls._instance = None
+
     @staticmethod
     def _init_db():
         """
@@ -62,6 +422,11 @@ class DataBase:
         if not query.exec("PRAGMA foreign_keys = ON"):
             return f"Failed to enable foreign keys: {query.lastError().text()}"
 
+        # Apply the connection performance profile (journal mode, sync level, caches)
+        result = DataBase._apply_profile(db, DataBase._get_profile_name(script_dir))
+        if result is not None:
+            return result
+
         # Check if tables exist before creating them
         existing_tables = db.tables()
         if not existing_tables:
@@ -69,8 +434,70 @@ class DataBase:
             result = DataBase._setup_database(db)
             if result is not None:
                 return result
+
+        # Upgrade existing databases to the current schema version
+        result = DataBase._migrate_database(db)
+        if result is not None:
+            return result
+
+        # Rebuild the per-project aggregates that no longer match the rows of their project
+        result = DataBase._check_project_metrics(db)
+        if result is not None:
+            return result
         return db
 
+    @staticmethod
+    def _get_profile_name(script_dir):
+        """
+        Get the name of the database performance profile to use.
+
+        The ``QUICKEST_DB_PROFILE`` environment variable takes precedence over the ``database/profile`` key of the settings file stored next to the database. Unknown names fall back to the default profile.
+
+        Parameters
+        ----------
+        script_dir : str
+            The directory containing the database and the settings file.
+
+        Returns
+        -------
+        str
+            The name of the selected profile.
+        """
+        profile_name = os.environ.get(config.DB_PROFILE_ENV_VAR)
+        if not profile_name:
+            settings = QSettings(os.path.join(script_dir, config.SETTINGS_FILE), QSettings.IniFormat)
+            profile_name = settings.value(config.DB_PROFILE_SETTING, config.DEFAULT_DB_PROFILE)
+
+        profile_name = str(profile_name).strip().lower()
+        if profile_name not in config.DB_PROFILES:
+            profile_name = config.DEFAULT_DB_PROFILE
+        return profile_name
+
+    @staticmethod
+    def _apply_profile(db, profile_name):
+        """
+        Apply a performance profile to the database connection.
+
+        Parameters
+        ----------
+        db : QSqlDatabase
+            The database connection to configure.
+        profile_name : str
+            The name of the profile, as defined in ``config.DB_PROFILES``.
+
+        Returns
+        -------
+        None or str
+            None if the profile is applied successfully, or an error message if any pragma fails.
+        """
+        profile = config.DB_PROFILES[profile_name]
+        for pragma in ["journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store"]:
+            query = QSqlQuery(db)
+            if not query.exec(f"PRAGMA {pragma} = {profile[pragma]}"):
+                return f"Failed to set {pragma}: {query.lastError().text()}"
+            query.finish()
+        return None
+
     @staticmethod
     def _setup_database(db):
         """
@@ -167,3 +594,103 @@ class DataBase:
             if not q.exec():
                 return f"Failed to execute query: {query_text} - {q.lastError().text()}"
         return None
+
+    @staticmethod
+    def _migrate_database(db):
+        """
+        Apply the pending schema migrations to the database.
+
+        The current schema version is stored in ``PRAGMA user_version``. Every migration with a higher version is applied in order inside its own transaction, so an existing database is upgraded in place and a failed migration leaves it at the last consistent version.
+
+        Parameters
+        ----------
+        db : QSqlDatabase
+            The database connection to use.
+
+        Returns
+        -------
+        None or str
+            None if the database is up to date, or an error message if any migration fails.
+        """
+        q_version = QSqlQuery(db)
+        if not q_version.exec("PRAGMA user_version") or not q_version.next():
+            return f"Failed to read schema version: {q_version.lastError().text()}"
+        current_version = q_version.value(0)
+        q_version.finish()
+
+        for version, migration_queries in DataBase.MIGRATIONS:
+            if version <= current_version:
+                continue
+
+            if not db.transaction():
+                return f"Failed to start migration {version}: {db.lastError().text()}"
+
+            for query_text in migration_queries + [f"PRAGMA user_version = {version}"]:
+                q = QSqlQuery(db)
+                if not q.exec(query_text):
+                    error = q.lastError().text()
+                    db.rollback()
+                    return f"Failed to apply migration {version}: {query_text} - {error}"
+
+            if not db.commit():
+                return f"Failed to commit migration {version}: {db.lastError().text()}"
+            current_version = version
+        return None
+
+    @staticmethod
+    def _check_project_metrics(db):
+        """
+        Check the aggregates of the project_metrics table against the child tables and rebuild the stale ones.
+
+        The triggers keep project_metrics current on every change, but they add and subtract the factor results as floating-point values, so tfactor and efactor can drift from the sum of the rows after many edits. Changes made outside of the application are also caught here.
+
+        Parameters
+        ----------
+        db : QSqlDatabase
+            The database connection to use.
+
+        Returns
+        -------
+        None or str
+            None if every aggregate is current, or an error message if the check or a rebuild fails.
+        """
+        q_check = QSqlQuery(db)
+        q_check.setForwardOnly(True)
+        if not q_check.exec(
+            """
+            SELECT project_id FROM (
+                SELECT * FROM project_metrics_source
+                EXCEPT
+                SELECT * FROM project_metrics
+            )
+            """
+        ):
+            return f"Failed to check project metrics: {q_check.lastError().text()}"
+        stale_ids = []
+        while q_check.next():
+            stale_ids.append(q_check.value(0))
+        q_check.finish()
+        if not stale_ids:
+            return None
+
+        if not db.transaction():
+            return f"Failed to rebuild project metrics: {db.lastError().text()}"
+        chunk_size = config.SQL_VARIABLE_LIMIT
+        for start in range(0, len(stale_ids), chunk_size):
+            chunk = stale_ids[start:start + chunk_size]
+            q_rebuild = QSqlQuery(db)
+            q_rebuild.prepare(
+                f"""
+                INSERT OR REPLACE INTO project_metrics
+                SELECT * FROM project_metrics_source WHERE project_id IN ({', '.join('?' * len(chunk))})
+                """
+            )
+            for project_id in chunk:
+                q_rebuild.addBindValue(project_id)
+            if not q_rebuild.exec():
+                error = q_rebuild.lastError().text()
+                db.rollback()
+                return f"Failed to rebuild project metrics: {error}"
+        if not db.commit():
+            return f"Failed to rebuild project metrics: {db.lastError().text()}"
+        return None
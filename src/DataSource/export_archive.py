@@ -0,0 +1,233 @@
+# This Python file uses the following encoding: utf-8
+# DataSource/export_archive.py
+
+import json
+import os
+import time
+import zipfile
+from datetime import datetime
+
+class ExportArchive:
+    """
+    Index of the ZIP archives created by the export of all projects, and merge of incremental archives.
+
+    Every archive has one directory per project and an index at its root with the ID and revision of every project of the database at the time of the export. A full archive contains all those projects; an incremental archive only contains the projects whose revision differs from a base archive, so the unchanged projects have to be taken from the base. Projects missing from the index were deleted.
+
+    The index has the following keys:
+
+    - ``version``: the version of the index.
+    - ``incremental``: whether the archive only contains the changed projects.
+    - ``created_at``: the date of the export.
+    - ``projects``: list of dictionaries with the ``id``, ``name`` and ``revision`` of every project.
+
+    Attributes
+    ----------
+    INDEX_FILE : str
+        The name of the index entry.
+    INDEX_VERSION : int
+        The version of the index written by this class.
+
+    Methods
+    -------
+    """
+
+    INDEX_FILE = "quickest_export.json"
+    INDEX_VERSION = 1
+
+    @staticmethod
+    def create_index(projects, incremental):
+        """
+        Create the index of an archive.
+
+        Parameters
+        ----------
+        projects : list of dict
+            The 'id', 'name' and 'revision' of every project of the database.
+        incremental : bool
+            Whether the archive only contains the changed projects.
+
+        Returns
+        -------
+        bytes
+            The index as JSON.
+        """
+        index = {
+            "version": ExportArchive.INDEX_VERSION,
+            "incremental": incremental,
+            "created_at": datetime.now().strftime("%Y/%m/%d %H:%M:%S"),
+            "projects": [{"id": project['id'], "name": project['name'], "revision": project['revision']} for project in projects]
+        }
+        return json.dumps(index, indent=4).encode("utf-8")
+
+    @staticmethod
+    def read_index(zip_file_path):
+        """
+        Read the index of an archive.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive.
+
+        Returns
+        -------
+        dict or None
+            The index, or None if the archive was created without one.
+
+        Raises
+        ------
+        OSError, ValueError, zipfile.BadZipFile
+            If the archive or its index cannot be read.
+        """
+        with zipfile.ZipFile(zip_file_path) as zip_file:
+            return ExportArchive._load_index(zip_file)
+
+    @staticmethod
+    def get_changed_projects(projects, base_index):
+        """
+        Select the projects whose revision differs from the one recorded in a base archive.
+
+        Parameters
+        ----------
+        projects : list of dict
+            The 'id' and 'revision' of every project of the database.
+        base_index : dict or None
+            The index of the base archive. Without an index every project is considered changed.
+
+        Returns
+        -------
+        list of dict
+            The changed projects, in their original order.
+        """
+        if base_index is None:
+            return list(projects)
+        revisions = {(project['id'], project['revision']) for project in base_index['projects']}
+        return [project for project in projects if (project['id'], project['revision']) not in revisions]
+
+    @staticmethod
+    def merge(base_path, delta_path, output_path):
+        """
+        Merge a base archive and an incremental archive into a full archive.
+
+        The projects of the incremental archive replace those of the base, the unchanged projects are copied from the base and the deleted projects are left out. The entries are copied without being decoded.
+
+        Parameters
+        ----------
+        base_path : str
+            The path of the base archive, full or already merged.
+        delta_path : str
+            The path of the incremental archive created from the base.
+        output_path : str
+            The path of the merged archive.
+
+        Returns
+        -------
+        int
+            The number of projects of the merged archive.
+
+        Raises
+        ------
+        ValueError
+            If the incremental archive has no index, or a project is in neither archive.
+        OSError, zipfile.BadZipFile
+            If an archive cannot be read or written.
+        """
+        with zipfile.ZipFile(base_path) as base, zipfile.ZipFile(delta_path) as delta:
+            delta_index = ExportArchive._load_index(delta)
+            if delta_index is None:
+                raise ValueError("The incremental archive has no index")
+            base_index = ExportArchive._load_index(base)
+            base_names = {project['id']: project['name'] for project in base_index['projects']} if base_index else {}
+
+            base_entries = ExportArchive._group_entries(base)
+            delta_entries = ExportArchive._group_entries(delta)
+
+            try:
+                with zipfile.ZipFile(output_path, "w") as output:
+                    for project in delta_index['projects']:
+                        if project['name'] in delta_entries:
+                            source, entries = delta, delta_entries[project['name']]
+                        else:
+                            base_name = base_names.get(project['id'], project['name'])
+                            if base_name not in base_entries:
+                                raise ValueError(f"Project '{project['name']}' is not in the base archive")
+                            source, entries = base, base_entries[base_name]
+
+                        for entry in entries:
+                            file_name = entry.filename.partition("/")[2]
+                            zip_info = zipfile.ZipInfo(f"{project['name']}/{file_name}", date_time=entry.date_time)
+                            zip_info.external_attr = entry.external_attr
+                            output.writestr(zip_info, source.read(entry))
+
+                    index = dict(delta_index, incremental=False)
+                    zip_info = zipfile.ZipInfo(ExportArchive.INDEX_FILE, date_time=time.localtime()[:6])
+                    zip_info.external_attr = 0o100644 << 16
+                    output.writestr(zip_info, json.dumps(index, indent=4).encode("utf-8"))
+            except Exception:
+                ExportArchive._remove(output_path)
+                raise
+        return len(delta_index['projects'])
+
+    @staticmethod
+    def _load_index(zip_file):
+        """
+        Load the index of an open archive.
+
+        Parameters
+        ----------
+        zip_file : ZipFile
+            The archive.
+
+        Returns
+        -------
+        dict or None
+            The index, or None if the archive has no index.
+
+        Raises
+        ------
+        ValueError
+            If the index is not valid.
+        """
+        try:
+            data = zip_file.read(ExportArchive.INDEX_FILE)
+        except KeyError:
+            return None
+        index = json.loads(data)
+        if not isinstance(index, dict) or index.get("version", 0) > ExportArchive.INDEX_VERSION or not isinstance(index.get("projects"), list):
+            raise ValueError("Unsupported archive index")
+        return index
+
+    @staticmethod
+    def _group_entries(zip_file):
+        """
+        Group the entries of an archive by project directory.
+
+        Parameters
+        ----------
+        zip_file : ZipFile
+            The archive.
+
+        Returns
+        -------
+        dict
+            The entries of each project directory.
+        """
+        entries = {}
+        for entry in zip_file.infolist():
+            directory, separator, file_name = entry.filename.partition("/")
+            if separator and file_name:
+                entries.setdefault(directory, []).append(entry)
+        return entries
+
+    @staticmethod
+    def _remove(file_path):
+        """
+        Remove a partially written archive.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the archive.
+        """
+        if os.path.exists(file_path):
+            os.remove(file_path)
@@ -0,0 +1,215 @@
+# This Python file uses the following encoding: utf-8
+# DataSource/project_package.py
+
+import config
+import hashlib
+import mmap
+import struct
+import numpy as np
+
+class ProjectPackage:
+    """
+    Single-file, column-oriented format of an exported project.
+
+    Version 1 of the export format is a directory with one QDataStream file per table and a JSON manifest. This format (version 2) stores the same tables in one file:
+
+    - A header with the magic bytes, the format version and the number of tables.
+    - A table of contents with the name, row count, offset, length and SHA-256 hash of each table block.
+    - One block per table, with the fixed-width numeric columns first, then the length in characters of every string (-1 for NULL) and a UTF-8 string heap with all the strings of the table.
+
+    All numbers are little-endian. The reader memory-maps the file and decodes each numeric column with a single NumPy call, and each string heap with a single UTF-8 decoding.
+
+    Attributes
+    ----------
+    MAGIC : bytes
+        The bytes at the start of every project package.
+    FORMAT_VERSION : int
+        The version of the format written by this class.
+    HEADER : Struct
+        Magic bytes, format version, reserved field and number of tables.
+    TOC_ENTRY : Struct
+        Table name, row count, offset, length and SHA-256 digest of a block.
+    COLUMN_TYPES : dict
+        NumPy data type of each numeric column type.
+    TABLES : dict
+        The columns of each table, as (name, type) tuples in the order of the exported rows. The type is 'i' for 32-bit integers, 'd' for doubles and 's' for strings.
+
+    Methods
+    -------
+    """
+
+    MAGIC = b"QCKP"
+    FORMAT_VERSION = 2
+    HEADER = struct.Struct("<4sHHI")
+    TOC_ENTRY = struct.Struct("<32sIQQ32s")
+    COLUMN_TYPES = {'i': np.dtype("<i4"), 'd': np.dtype("<f8")}
+
+    TABLES = {
+        'project': [
+            ('id', 'i'), ('favorite', 'i'), ('name', 's'), ('description', 's'), ('created_at', 's'), ('last_access', 's')
+        ],
+        'parameters': [
+            ('id', 'i'), ('cf', 'd'), ('analysis_percentage', 'd'), ('design_percentage', 'd'),
+            ('programming_percentage', 'd'), ('testing_percentage', 'd'), ('overloading_percentage', 'd'),
+            ('actors_simple_weight', 'd'), ('actors_average_weight', 'd'), ('actors_complex_weight', 'd'),
+            ('use_cases_simple_weight', 'd'), ('use_cases_average_weight', 'd'), ('use_cases_complex_weight', 'd'),
+            ('project_id', 'i')
+        ],
+        'actors': [
+            ('id', 'i'), ('code', 's'), ('name', 's'), ('complexity', 's'), ('comment', 's'), ('project_id', 'i')
+        ],
+        'use_cases': [
+            ('id', 'i'), ('code', 's'), ('name', 's'), ('complexity', 's'), ('transactions', 'i'), ('comment', 's'), ('project_id', 'i')
+        ],
+        'technical_factors': [
+            ('id', 'i'), ('factor', 's'), ('description', 's'), ('weight', 'd'), ('influence', 'i'), ('comment', 's'), ('project_id', 'i')
+        ],
+        'environmental_factors': [
+            ('id', 'i'), ('factor', 's'), ('description', 's'), ('weight', 'd'), ('influence', 'i'), ('comment', 's'), ('project_id', 'i')
+        ]
+    }
+
+    @staticmethod
+    def serialize(project_data):
+        """
+        Serialize the tables of a project to a project package.
+
+        Parameters
+        ----------
+        project_data : list of tuple
+            The table name, the file name and the rows of each exported table. The file name is ignored.
+
+        Returns
+        -------
+        bytes
+            The content of the package.
+        """
+        blocks = [(table, len(rows), ProjectPackage._encode_table(table, rows)) for table, file_name, rows in project_data]
+
+        offset = ProjectPackage.HEADER.size + ProjectPackage.TOC_ENTRY.size * len(blocks)
+        parts = [ProjectPackage.HEADER.pack(ProjectPackage.MAGIC, ProjectPackage.FORMAT_VERSION, 0, len(blocks))]
+        for table, row_count, block in blocks:
+            digest = hashlib.sha256(block).digest()
+            parts.append(ProjectPackage.TOC_ENTRY.pack(table.encode("ascii"), row_count, offset, len(block), digest))
+            offset += len(block)
+        parts.extend(block for table, row_count, block in blocks)
+        return b"".join(parts)
+
+    @staticmethod
+    def read(file_path):
+        """
+        Read a project package, verifying the hash of every table block.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the package.
+
+        Returns
+        -------
+        dict or int
+            The rows of each table as lists of dictionaries, with the same keys as the directory format, or failure code.
+        """
+        try:
+            with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                magic, version, reserved, table_count = ProjectPackage.HEADER.unpack_from(buffer, 0)
+                if magic != ProjectPackage.MAGIC or version > ProjectPackage.FORMAT_VERSION:
+                    return config.FAILURE
+
+                loaded_data = {}
+                for index in range(table_count):
+                    position = ProjectPackage.HEADER.size + ProjectPackage.TOC_ENTRY.size * index
+                    name, row_count, offset, length, digest = ProjectPackage.TOC_ENTRY.unpack_from(buffer, position)
+                    table = name.rstrip(b"\0").decode("ascii")
+                    if table not in ProjectPackage.TABLES or offset + length > len(buffer):
+                        return config.FAILURE
+                    if hashlib.sha256(buffer[offset:offset + length]).digest() != digest:
+                        return config.FAILURE
+                    loaded_data[table] = ProjectPackage._decode_table(table, buffer, offset, row_count, length)
+        except (OSError, ValueError, struct.error):
+            return config.FAILURE
+
+        if any(table not in loaded_data for table in ProjectPackage.TABLES):
+            return config.FAILURE
+        return loaded_data
+
+    @staticmethod
+    def _encode_table(table, rows):
+        """
+        Encode the rows of a table as a column-oriented block.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+        rows : list
+            The rows of the table, with their values in the order of the table columns.
+
+        Returns
+        -------
+        bytes
+            The encoded block.
+        """
+        columns = ProjectPackage.TABLES[table]
+        numbers = []
+        lengths = []
+        strings = []
+        for index, (column, column_type) in enumerate(columns):
+            values = [row[index] for row in rows]
+            if column_type == 's':
+                values = [None if value is None else str(value) for value in values]
+                lengths.extend(-1 if value is None else len(value) for value in values)
+                strings.extend(value for value in values if value is not None)
+            else:
+                numbers.append(np.array(values, dtype=ProjectPackage.COLUMN_TYPES[column_type]).tobytes())
+
+        heap = "".join(strings).encode("utf-8", "surrogatepass")
+        return b"".join(numbers) + np.array(lengths, dtype="<i4").tobytes() + heap
+
+    @staticmethod
+    def _decode_table(table, buffer, offset, row_count, length):
+        """
+        Decode a column-oriented block.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+        buffer : mmap
+            The mapped package.
+        offset : int
+            The offset of the block.
+        row_count : int
+            The number of rows of the table.
+        length : int
+            The length of the block in bytes.
+
+        Returns
+        -------
+        list of dict
+            The rows of the table.
+        """
+        columns = ProjectPackage.TABLES[table]
+        values = {}
+        position = offset
+        for column, column_type in columns:
+            if column_type != 's':
+                dtype = ProjectPackage.COLUMN_TYPES[column_type]
+                values[column] = np.frombuffer(buffer, dtype, row_count, position).tolist()
+                position += dtype.itemsize * row_count
+
+        string_columns = [column for column, column_type in columns if column_type == 's']
+        lengths = np.frombuffer(buffer, "<i4", row_count * len(string_columns), position)
+        position += lengths.nbytes
+        text = buffer[position:offset + length].decode("utf-8", "surrogatepass")
+
+        ends = np.cumsum(np.maximum(lengths, 0)).tolist()
+        starts = [0] + ends[:-1]
+        nulls = (lengths < 0).tolist()
+        del lengths  # Release the view of the mapped file before it is closed
+        for index, column in enumerate(string_columns):
+            rows = range(index * row_count, (index + 1) * row_count)
+            values[column] = [None if nulls[i] else text[starts[i]:ends[i]] for i in rows]
+
+        names = [column for column, column_type in columns]
+        return [dict(zip(names, row)) for row in zip(*(values[column] for column in names))]
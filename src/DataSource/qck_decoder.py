@@ -0,0 +1,293 @@
+# This Python file uses the following encoding: utf-8
+# DataSource/qck_decoder.py
+
+import codecs
+import config
+import hashlib
+import json
+import os
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from DataSource.project_package import ProjectPackage
+
+class QckDecoder:
+    """
+    Pure-Python reader of the QDataStream files of an exported project.
+
+    The files serialized by ``ProjectsModel.serialize_data`` are a sequence of rows, each one a sequence of big-endian fields: 32-bit integers, doubles and QStrings (a 32-bit byte length followed by UTF-16BE text, 0xFFFFFFFF for a null string). This class decodes that layout with the ``struct`` module, so exports can be validated and read by processes that do not load PySide6.
+
+    Consecutive numeric fields of a row are unpacked with a single precompiled ``Struct``, and the rows are produced by generators, so a file is never turned into a full list of dictionaries unless the caller asks for it.
+
+    Attributes
+    ----------
+    FILE_TABLES : dict
+        The table stored in each file name of an exported project.
+    STRING_LENGTH : Struct
+        The length prefix of a QString.
+    NULL_STRING : int
+        The length prefix of a null QString.
+    LAYOUTS : dict
+        The decoding steps and field names of each table, built from ``ProjectPackage.TABLES``. Each step is either None, for a string, or the unpack function and size of a run of numeric fields.
+
+    Methods
+    -------
+    """
+
+    FILE_TABLES = {
+        config.PROJECT_FILE: 'project',
+        config.PARAMETERS_FILE: 'parameters',
+        config.ACTORS_FILE: 'actors',
+        config.USE_CASES_FILE: 'use_cases',
+        config.TECHNICAL_FACTORS_FILE: 'technical_factors',
+        config.ENVIRONMENTAL_FACTORS_FILE: 'environmental_factors'
+    }
+    STRING_LENGTH = struct.Struct(">I")
+    NULL_STRING = 0xFFFFFFFF
+    LAYOUTS = {}
+
+    @staticmethod
+    def get_layout(table):
+        """
+        Get the decoding steps of a table, grouping its consecutive numeric fields into a single Struct.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table.
+
+        Returns
+        -------
+        tuple
+            The decoding steps of a row, and the names of its fields.
+        """
+        layout = QckDecoder.LAYOUTS.get(table)
+        if layout is None:
+            steps = []
+            formats = ""
+            for column, column_type in ProjectPackage.TABLES[table] + [(None, 's')]:
+                if column_type != 's':
+                    formats += column_type
+                    continue
+                if formats:
+                    fields = struct.Struct(f">{formats}")
+                    steps.append((fields.unpack_from, fields.size))
+                    formats = ""
+                if column is not None:
+                    steps.append(None)
+            names = tuple(column for column, column_type in ProjectPackage.TABLES[table])
+            layout = QckDecoder.LAYOUTS[table] = (tuple(steps), names)
+        return layout
+
+    @staticmethod
+    def iter_rows(data, table):
+        """
+        Decode the rows of a table file one at a time.
+
+        Parameters
+        ----------
+        data : bytes
+            The content of the file.
+        table : str
+            The name of the table.
+
+        Yields
+        ------
+        dict
+            The next row, with the same keys as ``ProjectsModel.read_data_from_binary_file``.
+
+        Raises
+        ------
+        ValueError
+            If the content is truncated.
+        """
+        steps, names = QckDecoder.get_layout(table)
+        unpack_length = QckDecoder.STRING_LENGTH.unpack_from
+        decode = codecs.utf_16_be_decode
+        size = len(data)
+        position = 0
+        try:
+            while position < size:
+                values = []
+                append = values.append
+                for step in steps:
+                    if step is not None:
+                        unpack, step_size = step
+                        values.extend(unpack(data, position))
+                        position += step_size
+                        continue
+                    length, = unpack_length(data, position)
+                    position += 4
+                    if length == QckDecoder.NULL_STRING:
+                        append("")
+                        continue
+                    end = position + length
+                    if end > size:
+                        raise ValueError(f"Truncated string in the {table} data")
+                    append(decode(data[position:end], "surrogatepass", True)[0])
+                    position = end
+                yield dict(zip(names, values))
+        except struct.error:
+            raise ValueError(f"Truncated row in the {table} data") from None
+
+    @staticmethod
+    def iter_file(file_path, expected_hash=None):
+        """
+        Read a table file once and decode its rows one at a time.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the file. Its name determines the table.
+        expected_hash : str, optional
+            The SHA-256 hash the content must match, as a hexadecimal string.
+
+        Yields
+        ------
+        dict
+            The next row.
+
+        Raises
+        ------
+        ValueError
+            If the file name is unknown, the hash does not match or the content is truncated.
+        """
+        table = QckDecoder.FILE_TABLES.get(os.path.basename(file_path))
+        if table is None:
+            raise ValueError(f"Unknown project file: {file_path}")
+        with open(file_path, "rb") as file:
+            data = file.read()
+        if expected_hash is not None and hashlib.sha256(data).hexdigest() != expected_hash:
+            raise ValueError(f"Hash mismatch: {file_path}")
+        yield from QckDecoder.iter_rows(data, table)
+
+    @staticmethod
+    def decode_project(manifest_data, read_file):
+        """
+        Verify and decode every table of an exported project from its manifest.
+
+        Parameters
+        ----------
+        manifest_data : bytes
+            The content of the project manifest.
+        read_file : callable
+            Function returning the content of a file of the project from its file name.
+
+        Returns
+        -------
+        dict or int
+            The rows of each table as lists of dictionaries, or failure code.
+        """
+        try:
+            project_manifest = json.loads(manifest_data)
+            loaded_data = {}
+            for table, info in project_manifest.items():
+                file_table = QckDecoder.FILE_TABLES.get(info["file_name"])
+                if file_table is None:
+                    return config.FAILURE
+                data = read_file(info["file_name"])
+                if hashlib.sha256(data).hexdigest() != info["hash"]:
+                    return config.FAILURE
+                loaded_data[table] = list(QckDecoder.iter_rows(data, file_table))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, zipfile.BadZipFile):
+            return config.FAILURE
+
+        if any(table not in loaded_data for table in ProjectPackage.TABLES):
+            return config.FAILURE
+        return loaded_data
+
+    @staticmethod
+    def read_project(directory):
+        """
+        Read and verify every table of an exported project directory.
+
+        Parameters
+        ----------
+        directory : str
+            The project directory.
+
+        Returns
+        -------
+        dict or int
+            The rows of each table as lists of dictionaries, or failure code.
+        """
+        try:
+            manifests = sorted(name for name in os.listdir(directory) if name.endswith(config.PROJECT_FILE_EXTENSION))
+            if not manifests:
+                return config.FAILURE
+            with open(os.path.join(directory, manifests[0]), "rb") as file:
+                manifest_data = file.read()
+        except OSError:
+            return config.FAILURE
+
+        def read_file(file_name):
+            with open(os.path.join(directory, file_name), "rb") as file:
+                return file.read()
+
+        return QckDecoder.decode_project(manifest_data, read_file)
+
+    @staticmethod
+    def read_archive(zip_file_path, workers=0):
+        """
+        Read and verify every project of a ZIP archive without extracting it.
+
+        The archive has one directory per project, as written by the export of all projects. The projects are verified and decoded concurrently by a pool of threads.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive.
+        workers : int, optional
+            The number of threads, 0 for one per CPU core.
+
+        Returns
+        -------
+        list of tuple
+            The name of each project directory, in archive order, and its data or failure code.
+
+        Raises
+        ------
+        OSError, zipfile.BadZipFile
+            If the archive cannot be opened.
+        """
+        with zipfile.ZipFile(zip_file_path) as zip_file:
+            manifests = {}
+            for entry_name in zip_file.namelist():
+                directory, separator, file_name = entry_name.partition("/")
+                if not separator or not file_name or "/" in file_name:
+                    continue
+                manifests.setdefault(directory, None)
+                if file_name.endswith(config.PROJECT_FILE_EXTENSION) and manifests[directory] is None:
+                    manifests[directory] = entry_name
+
+            def read_directory(directory):
+                if manifests[directory] is None:
+                    return config.FAILURE
+                try:
+                    manifest_data = zip_file.read(manifests[directory])
+                except (OSError, zipfile.BadZipFile):
+                    return config.FAILURE
+                return QckDecoder.decode_project(manifest_data, lambda file_name: zip_file.read(f"{directory}/{file_name}"))
+
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                return list(zip(manifests, pool.map(read_directory, manifests)))
+
+    @staticmethod
+    def iter_projects(root):
+        """
+        Read the exported project directories found in a directory, one at a time.
+
+        Parameters
+        ----------
+        root : str
+            The directory containing the project directories, such as an extracted export of all projects.
+
+        Yields
+        ------
+        tuple
+            The name of the project directory, and its data or failure code.
+        """
+        with os.scandir(root) as entries:
+            directories = sorted(entry.name for entry in entries if entry.is_dir())
+        for name in directories:
+            yield name, QckDecoder.read_project(os.path.join(root, name))
@@ -0,0 +1,144 @@
+# This Python file uses the following encoding: utf-8
+# DataSource/snapshot_reader.py
+
+import config
+from PySide6.QtSql import QSqlDatabase, QSqlQuery
+
+class SnapshotReader:
+    """
+    Read-only access to a consistent snapshot of the projects from a background thread.
+
+    A QSqlDatabase connection can only be used by the thread that created it, so this class opens its own named connection to the database file. All the reads happen inside one transaction, which gives a consistent view of the data while the main thread keeps working with the default connection.
+
+    The rows are read with the same queries as the export methods of the models, so they are returned in the same order and with the same types.
+
+    Attributes
+    ----------
+    EXPORT_TABLES : list of tuple
+        The table name, the exported file name and the query of each table of an exported project.
+    connection_name : str
+        The name of the connection.
+    database_path : str
+        The path of the database file.
+    queries : dict
+        The prepared queries of the snapshot connection, indexed by table name.
+
+    Methods
+    -------
+    """
+
+    EXPORT_TABLES = [
+        ('project', config.PROJECT_FILE, "SELECT * FROM projects WHERE id = ?"),
+        ('parameters', config.PARAMETERS_FILE, "SELECT * FROM parameters WHERE project_id = ?"),
+        ('actors', config.ACTORS_FILE, "SELECT * FROM actors WHERE project_id = ? ORDER BY id"),
+        ('use_cases', config.USE_CASES_FILE, "SELECT * FROM use_cases WHERE project_id = ? ORDER BY id"),
+        ('technical_factors', config.TECHNICAL_FACTORS_FILE, "SELECT * FROM technical_factors WHERE project_id = ? ORDER BY id"),
+        ('environmental_factors', config.ENVIRONMENTAL_FACTORS_FILE, "SELECT * FROM environmental_factors WHERE project_id = ? ORDER BY id")
+    ]
+
+    def __init__(self, database_path, connection_name):
+        """
+        Initialize the SnapshotReader.
+
+        Parameters
+        ----------
+        database_path : str
+            The path of the database file.
+        connection_name : str
+            A name for the connection, unique among the open connections.
+        """
+        self.database_path = database_path
+        self.connection_name = connection_name
+        self.queries = {}
+
+    def open(self):
+        """
+        Open the connection and start the snapshot transaction. Must be called from the thread that reads.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        db = QSqlDatabase.addDatabase("QSQLITE", self.connection_name)
+        db.setDatabaseName(self.database_path)
+        db.setConnectOptions("QSQLITE_OPEN_READONLY")
+        if not db.open() or not db.transaction():
+            return config.FAILURE
+
+        for table, file_name, sql in self.EXPORT_TABLES:
+            query = QSqlQuery(db)
+            query.setForwardOnly(True)
+            if not query.prepare(sql):
+                return config.FAILURE
+            self.queries[table] = query
+        return config.SUCCESS
+
+    def get_projects(self):
+        """
+        Get the ID, name and revision of every project in the snapshot.
+
+        Returns
+        -------
+        list or int
+            List of dictionaries with the 'id', 'name' and 'revision' of each project, or failure code.
+        """
+        query = QSqlQuery(QSqlDatabase.database(self.connection_name, False))
+        query.setForwardOnly(True)
+        if not query.exec(
+            """
+            SELECT p.id, p.name, COALESCE(c.revision, 0) FROM projects p
+            LEFT JOIN project_changes c ON c.project_id = p.id
+            ORDER BY p.id
+            """
+        ):
+            return config.FAILURE
+
+        projects = []
+        while query.next():
+            projects.append({'id': query.value(0), 'name': query.value(1), 'revision': query.value(2)})
+        query.finish()
+        return projects
+
+    def read_project(self, project_id):
+        """
+        Read the rows of every exported table of a project.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        list of tuple or int
+            The table name, the exported file name and the rows of each table, or failure code.
+        """
+        project_data = []
+        for table, file_name, sql in self.EXPORT_TABLES:
+            query = self.queries[table]
+            query.addBindValue(project_id)
+            if not query.exec():
+                return config.FAILURE
+
+            rows = []
+            while query.next():
+                rows.append([query.value(i) for i in range(query.record().count())])
+            query.finish()
+            project_data.append((table, file_name, rows))
+        return project_data
+
+    def close(self):
+        """
+        End the snapshot transaction and remove the connection.
+        """
+        for query in self.queries.values():
+            query.finish()
+        self.queries.clear()
+
+        db = QSqlDatabase.database(self.connection_name, False)
+        if db.isOpen():
+            db.rollback()  # Nothing was written, ending the read transaction is enough
+            db.close()
+        del db
+        QSqlDatabase.removeDatabase(self.connection_name)
@@ -0,0 +1,60 @@
+# This Python file uses the following encoding: utf-8
+# DataSource/statement_cache.py
+
+from PySide6.QtSql import QSqlQuery
+
+class StatementCache:
+    """
+    Cache of prepared queries shared by all the models.
+
+    Preparing a statement makes SQLite parse and plan the SQL text again. This class keeps one prepared QSqlQuery per SQL text on the default connection and hands it out again on every request, so the hot paths of importing and editing only bind new values and execute.
+
+    The cached queries belong to the default connection, so they are only used from the main thread; worker threads open their own connections. There is a single query per SQL text, so the cache is not reentrant: a query must not be requested again while its previous result is still being read. Callers release the result set of a query with ``finish()`` once they have read it, so no read cursor stays open on the shared connection between two calls.
+
+    Attributes
+    ----------
+    _queries : dict
+        Prepared queries indexed by their SQL text.
+
+    Methods
+    -------
+    """
+
+    _queries = {}  # Class attribute shared by all the models
+
+    @classmethod
+    def get_query(cls, sql):
+        """
+        Return a prepared query for the given SQL text, preparing it on first use.
+
+        The returned query is reset before being handed out: any active result set is released and the positional bind values are overwritten by the next calls to ``addBindValue``.
+
+        Parameters
+        ----------
+        sql : str
+            The SQL text of the statement, which is also the cache key.
+
+        Returns
+        -------
+        QSqlQuery or None
+            The prepared query, or None if the statement could not be prepared.
+        """
+        query = cls._queries.get(sql)
+        if query is None:
+            query = QSqlQuery()
+            query.setForwardOnly(True)
+            if not query.prepare(sql):
+                return None
+            cls._queries[sql] = query
+        else:
+            query.finish()
+        return query
+
+    @classmethod
+    def clear(cls):
+        """
+        Release all the cached queries.
+        """
+        for query in cls._queries.values():
+            query.finish()
+        cls._queries.clear()
@@ -0,0 +1,168 @@
+# This Python file uses the following encoding: utf-8
+# Estimation/effort_simulator.py
+
+import config
+import numpy as np
+
+class EffortSimulator:
+    """
+    Monte Carlo simulation of the estimated effort of a project.
+
+    The point estimate of ``Estimator`` assumes a fixed CF, fixed factor influences and a correct complexity for every use case. This class samples those inputs from configurable distributions and evaluates all the trials at once as NumPy array operations, which gives the percentiles of the effort instead of a single value.
+
+    The simulation uses the following inputs:
+
+    - ``parameters``: dictionary with the keys of an exported project (``cf``, ``<activity>_percentage``, ``actors_<complexity>_weight`` and ``use_cases_<complexity>_weight``).
+    - ``actors_count`` and ``use_cases_count``: number of actors and use cases per complexity.
+    - ``technical_factors`` and ``environmental_factors``: lists of dictionaries with ``weight`` and ``influence`` keys.
+
+    Methods
+    -------
+    """
+
+    @staticmethod
+    def simulate(inputs, settings=None, trials=config.SIMULATION_TRIALS, percentiles=config.SIMULATION_PERCENTILES, seed=None):
+        """
+        Run the simulation and summarize the effort of the trials.
+
+        Parameters
+        ----------
+        inputs : dict
+            The project inputs, as described in the class documentation.
+        settings : dict, optional
+            Distributions of the sampled inputs, with the keys of config.SIMULATION_SETTINGS. Missing keys take their default value.
+        trials : int, optional
+            Number of trials.
+        percentiles : tuple, optional
+            Percentiles to report.
+        seed : int, optional
+            Seed of the random generator, to reproduce a simulation.
+
+        Returns
+        -------
+        dict
+            Number of trials, and the given percentiles of E, of the person-hours of each activity and of the total hours.
+        """
+        settings = {**config.SIMULATION_SETTINGS, **(settings or {})}
+        rng = np.random.default_rng(seed)
+        parameters = inputs['parameters']
+
+        # Conversion factor
+        cf = parameters['cf']
+        CF = rng.triangular(cf * settings['cf']['low'], cf, cf * settings['cf']['high'], size=trials)
+
+        # Unadjusted use case points
+        actors_weights = np.array([parameters[f"actors_{complexity.lower()}_weight"] for complexity in config.COMPLEXITIES])
+        actors_count = np.array([inputs['actors_count'][complexity] for complexity in config.COMPLEXITIES])
+        UAW = float(actors_count @ actors_weights)
+        use_cases_weights = np.array([parameters[f"use_cases_{complexity.lower()}_weight"] for complexity in config.COMPLEXITIES])
+        use_cases_count = EffortSimulator._sample_complexities(
+            rng, inputs['use_cases_count'], settings['misclassification'], trials
+        )
+        UUCP = UAW + use_cases_count @ use_cases_weights
+
+        # Complexity factors
+        TFactor = EffortSimulator._sample_factor(rng, inputs['technical_factors'], settings['influence_shift'], trials)
+        EFactor = EffortSimulator._sample_factor(rng, inputs['environmental_factors'], settings['influence_shift'], trials)
+        TCF = 0.6 + (0.01 * TFactor)
+        ECF = 1.4 + (-0.03 * EFactor)
+
+        E = UUCP * TCF * ECF * CF
+
+        summary = {
+            'trials': trials,
+            'E': EffortSimulator._percentiles(E, percentiles),
+            'person_hours': {}
+        }
+        programming_percentage = parameters['programming_percentage']
+        total_hours = np.zeros(trials)
+        for activity in config.ACTIVITIES:
+            if programming_percentage != 0:
+                hours = E * parameters[f"{activity}_percentage"] / programming_percentage
+            else:
+                hours = np.zeros(trials)
+            summary['person_hours'][activity] = EffortSimulator._percentiles(hours, percentiles)
+            total_hours += hours
+        summary['total_hours'] = EffortSimulator._percentiles(total_hours, percentiles)
+        return summary
+
+    @staticmethod
+    def _sample_complexities(rng, counts, probability, trials):
+        """
+        Sample the number of use cases per complexity when some of them belong to an adjacent complexity.
+
+        Simple and complex use cases may actually be average ones, and average use cases may actually be simple or complex ones with the same probability.
+
+        Parameters
+        ----------
+        rng : Generator
+            The random generator.
+        counts : dict
+            Number of use cases per complexity.
+        probability : float
+            Probability of a use case being misclassified.
+        trials : int
+            Number of trials.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (trials, 3) with the number of use cases per complexity of each trial.
+        """
+        simple_to_average = rng.binomial(counts['Simple'], probability, size=trials)
+        complex_to_average = rng.binomial(counts['Complex'], probability, size=trials)
+        average = rng.multinomial(counts['Average'], [probability / 2, 1 - probability, probability / 2], size=trials)
+
+        sampled = np.empty((trials, 3))
+        sampled[:, 0] = counts['Simple'] - simple_to_average + average[:, 0]
+        sampled[:, 1] = simple_to_average + average[:, 1] + complex_to_average
+        sampled[:, 2] = counts['Complex'] - complex_to_average + average[:, 2]
+        return sampled
+
+    @staticmethod
+    def _sample_factor(rng, factors, influence_shift, trials):
+        """
+        Sample the total of a group of factors when their influences may shift.
+
+        Parameters
+        ----------
+        rng : Generator
+            The random generator.
+        factors : list of dict
+            Factors, each one with 'weight' and 'influence' keys.
+        influence_shift : dict
+            Probability of each change of the influence.
+        trials : int
+            Number of trials.
+
+        Returns
+        -------
+        ndarray
+            The total factor (TFactor or EFactor) of each trial.
+        """
+        if not factors:
+            return np.zeros(trials)
+        weights = np.array([factor['weight'] for factor in factors], dtype=float)
+        influences = np.array([factor['influence'] for factor in factors])
+        shifts = rng.choice(list(influence_shift.keys()), p=list(influence_shift.values()), size=(trials, len(factors)))
+        sampled = np.clip(influences + shifts, 0, 5)
+        return sampled @ weights
+
+    @staticmethod
+    def _percentiles(values, percentiles):
+        """
+        Compute the percentiles of the trials.
+
+        Parameters
+        ----------
+        values : ndarray
+            The value of each trial.
+        percentiles : tuple
+            Percentiles to compute.
+
+        Returns
+        -------
+        dict
+            The value of each percentile, rounded to four decimals.
+        """
+        return {percentile: round(float(value), 4) for percentile, value in zip(percentiles, np.percentile(values, percentiles))}
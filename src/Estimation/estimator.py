@@ -0,0 +1,338 @@
+# This Python file uses the following encoding: utf-8
+# Estimation/estimator.py
+
+import config
+
+class Estimator:
+    """
+    Qt-free engine for the Use Case Points estimation.
+
+    This class holds every calculation of the method and works on plain Python data, so it can be used by batch jobs and servers without starting a QApplication or importing PySide6. The results are rounded at each step exactly like the dashboard shows them.
+
+    A project is described by a dictionary with the following keys:
+
+    - ``actors`` and ``use_cases``: lists of dictionaries with at least a ``complexity`` key.
+    - ``technical_factors`` and ``environmental_factors``: lists of dictionaries with ``factor``, ``weight`` and ``influence`` keys.
+    - ``parameters``: dictionary with the keys of an exported project (``cf``, ``<activity>_percentage``, ``actors_<complexity>_weight`` and ``use_cases_<complexity>_weight``).
+
+    Methods
+    -------
+    """
+
+    @staticmethod
+    def count_complexities(items):
+        """
+        Count the items of each complexity.
+
+        Parameters
+        ----------
+        items : iterable of dict
+            Actors or use cases, each one with a 'complexity' key.
+
+        Returns
+        -------
+        dict
+            Number of items per complexity.
+        """
+        counts = dict.fromkeys(config.COMPLEXITIES, 0)
+        for item in items:
+            counts[item['complexity']] += 1
+        return counts
+
+    @staticmethod
+    def calculate_weight(counts, weights):
+        """
+        Calculate the unadjusted weight per complexity and its total (UAW for actors, UUCW for use cases).
+
+        Parameters
+        ----------
+        counts : dict
+            Number of items per complexity.
+        weights : dict
+            Weight per complexity.
+
+        Returns
+        -------
+        tuple
+            Dictionary with the weight per complexity, and the total weight.
+        """
+        results = {complexity: round(counts[complexity] * weights[complexity], 4) for complexity in config.COMPLEXITIES}
+        return results, round(sum(results.values()), 4)
+
+    @staticmethod
+    def categorize_influence(influence):
+        """
+        Categorize the influence based on its value.
+
+        Parameters
+        ----------
+        influence : int
+            The influence value to categorize.
+
+        Returns
+        -------
+        str
+            The category of the influence: 'irrelevant', 'medium', 'essential', or 'undefined'.
+        """
+        if 0 <= influence <= 2:
+            return 'irrelevant'
+        elif 3 <= influence <= 4:
+            return 'medium'
+        elif influence == 5:
+            return 'essential'
+        return 'undefined'
+
+    @staticmethod
+    def calculate_factor(factors):
+        """
+        Calculate the result of each factor, their total (TFactor or EFactor) and the influence categories.
+
+        Parameters
+        ----------
+        factors : iterable of dict
+            Factors, each one with 'factor', 'weight' and 'influence' keys.
+
+        Returns
+        -------
+        tuple
+            Dictionary with the result per factor, the total factor, and the number of factors per influence category.
+        """
+        factor_results = {}
+        factor_counts = {'irrelevant': 0, 'medium': 0, 'essential': 0}
+        for factor in factors:
+            factor_results[factor['factor']] = round(factor['weight'] * factor['influence'], 4)
+            category = Estimator.categorize_influence(factor['influence'])
+            if category in factor_counts:
+                factor_counts[category] += 1
+        return factor_results, sum(factor_results.values()), factor_counts
+
+    @staticmethod
+    def calculate_UUCP(UAW, UUCW):
+        """
+        Calculate the Unadjusted Use Case Points (UUCP).
+
+        Parameters
+        ----------
+        UAW : float
+            Unadjusted Actor Weight.
+        UUCW : float
+            Unadjusted Use Case Weight.
+
+        Returns
+        -------
+        float
+            The calculated UUCP.
+        """
+        return round(UAW + UUCW, 4)
+
+    @staticmethod
+    def calculate_TCF(TFactor):
+        """
+        Calculate the Technical Complexity Factor (TCF).
+
+        Parameters
+        ----------
+        TFactor : float
+            Technical Factor.
+
+        Returns
+        -------
+        float
+            The calculated TCF.
+        """
+        return round(0.6 + (0.01 * TFactor), 4)
+
+    @staticmethod
+    def calculate_ECF(EFactor):
+        """
+        Calculate the Environmental Complexity Factor (ECF).
+
+        Parameters
+        ----------
+        EFactor : float
+            Environmental Factor.
+
+        Returns
+        -------
+        float
+            The calculated ECF.
+        """
+        return round(1.4 + (-0.03 * EFactor), 4)
+
+    @staticmethod
+    def calculate_UCP(UUCP, TCF, ECF):
+        """
+        Calculate the Adjusted Use Case Points (UCP).
+
+        Parameters
+        ----------
+        UUCP : float
+            Unadjusted Use Case Points.
+        TCF : float
+            Technical Complexity Factor.
+        ECF : float
+            Environmental Complexity Factor.
+
+        Returns
+        -------
+        float
+            The calculated UCP.
+        """
+        return round(UUCP * ECF * TCF, 4)
+
+    @staticmethod
+    def calculate_E(UCP, CF):
+        """
+        Calculate the Estimated Effort (E).
+
+        Parameters
+        ----------
+        UCP : float
+            Adjusted Use Case Points.
+        CF : float
+            Conversion Factor, in person-hours per use case point.
+
+        Returns
+        -------
+        float
+            The calculated Estimated Effort.
+        """
+        return round(UCP * CF, 4)
+
+    @staticmethod
+    def calculate_effort(E, percentages):
+        """
+        Calculate the effort distribution based on the percentages and estimated effort.
+
+        The estimated effort corresponds to the programming activity, and the other activities are scaled from it.
+
+        Parameters
+        ----------
+        E : float
+            Estimated Effort.
+        percentages : dict
+            Percentage of the effort per activity.
+
+        Returns
+        -------
+        tuple
+            Dictionary of person-hours per activity and total_hours
+        """
+        total_hours = 0.0
+        programming_percentage = percentages.get('programming', 0)
+        person_hours = {}
+        for activity, percentage in percentages.items():
+            if programming_percentage != 0:
+                hours = round((E * percentage) / programming_percentage, 4)
+                person_hours[activity] = hours
+                total_hours += hours
+            else:
+                person_hours[activity] = 0.0
+
+        return person_hours, round(total_hours, 4)
+
+    @staticmethod
+    def estimate_from_counts(actors_count, use_cases_count, TFactor, EFactor, parameters):
+        """
+        Calculate the metrics of a project from its aggregates, without its actors, use cases and factors.
+
+        Parameters
+        ----------
+        actors_count : dict
+            Number of actors per complexity.
+        use_cases_count : dict
+            Number of use cases per complexity.
+        TFactor : float
+            Technical Factor.
+        EFactor : float
+            Environmental Factor.
+        parameters : dict
+            The project parameters, as described in the class documentation.
+
+        Returns
+        -------
+        dict
+            Dictionary with the weights, UAW, UUCW, UUCP, TFactor, TCF, EFactor, ECF, UCP, CF, E, person_hours and total_hours of the project.
+        """
+        actors_weights = {complexity: parameters[f"actors_{complexity.lower()}_weight"] for complexity in config.COMPLEXITIES}
+        use_cases_weights = {complexity: parameters[f"use_cases_{complexity.lower()}_weight"] for complexity in config.COMPLEXITIES}
+        percentages = {activity: parameters[f"{activity}_percentage"] for activity in config.ACTIVITIES}
+
+        actors_UAW, UAW = Estimator.calculate_weight(actors_count, actors_weights)
+        use_cases_UUCW, UUCW = Estimator.calculate_weight(use_cases_count, use_cases_weights)
+        UUCP = Estimator.calculate_UUCP(UAW, UUCW)
+        TCF = Estimator.calculate_TCF(TFactor)
+        ECF = Estimator.calculate_ECF(EFactor)
+        UCP = Estimator.calculate_UCP(UUCP, TCF, ECF)
+        E = Estimator.calculate_E(UCP, parameters['cf'])
+        person_hours, total_hours = Estimator.calculate_effort(E, percentages)
+
+        return {
+            'actors_UAW': actors_UAW,
+            'use_cases_UUCW': use_cases_UUCW,
+            'UAW': UAW,
+            'UUCW': UUCW,
+            'UUCP': UUCP,
+            'TFactor': TFactor,
+            'TCF': TCF,
+            'EFactor': EFactor,
+            'ECF': ECF,
+            'UCP': UCP,
+            'CF': parameters['cf'],
+            'E': E,
+            'person_hours': person_hours,
+            'total_hours': total_hours
+        }
+
+    @staticmethod
+    def estimate_from_metrics(metrics):
+        """
+        Calculate the metrics of a project from a row of the project_estimate_inputs view.
+
+        Parameters
+        ----------
+        metrics : dict
+            The aggregates of the project ('actors_<complexity>', 'use_cases_<complexity>', 'tfactor' and 'efactor' keys) together with its parameters.
+
+        Returns
+        -------
+        dict
+            Dictionary with the counts, weights, UAW, UUCW, UUCP, TFactor, TCF, EFactor, ECF, UCP, CF, E, person_hours and total_hours of the project.
+        """
+        actors_count = {complexity: metrics[f"actors_{complexity.lower()}"] for complexity in config.COMPLEXITIES}
+        use_cases_count = {complexity: metrics[f"use_cases_{complexity.lower()}"] for complexity in config.COMPLEXITIES}
+
+        estimate = {'actors_count': actors_count, 'use_cases_count': use_cases_count}
+        estimate.update(Estimator.estimate_from_counts(actors_count, use_cases_count, metrics['tfactor'], metrics['efactor'], metrics))
+        return estimate
+
+    @staticmethod
+    def estimate(project):
+        """
+        Calculate every metric of a project.
+
+        Parameters
+        ----------
+        project : dict
+            The project data, as described in the class documentation.
+
+        Returns
+        -------
+        dict
+            Dictionary with the counts, weights, factors, UAW, UUCW, UUCP, TFactor, TCF, EFactor, ECF, UCP, CF, E, person_hours and total_hours of the project.
+        """
+        actors_count = Estimator.count_complexities(project.get('actors', []))
+        use_cases_count = Estimator.count_complexities(project.get('use_cases', []))
+        TF_results, TFactor, TF_counts = Estimator.calculate_factor(project.get('technical_factors', []))
+        EF_results, EFactor, EF_counts = Estimator.calculate_factor(project.get('environmental_factors', []))
+
+        estimate = {
+            'actors_count': actors_count,
+            'use_cases_count': use_cases_count,
+            'TF_results': TF_results,
+            'TF_counts': TF_counts,
+            'EF_results': EF_results,
+            'EF_counts': EF_counts
+        }
+        estimate.update(Estimator.estimate_from_counts(actors_count, use_cases_count, TFactor, EFactor, project['parameters']))
+        return estimate
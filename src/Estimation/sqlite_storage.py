@@ -0,0 +1,124 @@
+# This Python file uses the following encoding: utf-8
+# Estimation/sqlite_storage.py
+
+import sqlite3
+from Estimation.storage_adapter import StorageAdapter
+
+class SQLiteStorage(StorageAdapter):
+    """
+    Storage adapter reading the projects from a QuickEst database with the standard sqlite3 module.
+
+    The database is opened read-only, so it can be used while the application has it open.
+
+    Attributes
+    ----------
+    connection : sqlite3.Connection
+        The read-only connection to the database.
+
+    Methods
+    -------
+    """
+
+    def __init__(self, db_path):
+        """
+        Open the database.
+
+        Parameters
+        ----------
+        db_path : str
+            Path of the QuickEst database file.
+        """
+        self.connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self.connection.row_factory = sqlite3.Row
+
+    def get_project_ids(self):
+        """
+        Get the IDs of all the stored projects.
+
+        Returns
+        -------
+        list
+            The project IDs.
+        """
+        return [row[0] for row in self.connection.execute("SELECT id FROM projects ORDER BY id")]
+
+    def load_project(self, project_id):
+        """
+        Load the data of a project.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        dict or None
+            The project data, or None if the project does not exist.
+        """
+        parameters = self.connection.execute(
+            """
+            SELECT cf, analysis_percentage, design_percentage, programming_percentage,
+            testing_percentage, overloading_percentage, actors_simple_weight,
+            actors_average_weight, actors_complex_weight, useCases_simple_weight AS use_cases_simple_weight,
+            useCases_average_weight AS use_cases_average_weight, useCases_complex_weight AS use_cases_complex_weight
+            FROM parameters WHERE project_id = ?
+            """,
+            (project_id,)
+        ).fetchone()
+        if parameters is None:
+            return None
+
+        return {
+            'parameters': dict(parameters),
+            'actors': self._fetch_all("SELECT code, complexity FROM actors WHERE project_id = ? ORDER BY id", project_id),
+            'use_cases': self._fetch_all("SELECT code, complexity FROM use_cases WHERE project_id = ? ORDER BY id", project_id),
+            'technical_factors': self._fetch_all(
+                "SELECT factor, weight, influence FROM technical_factors WHERE project_id = ? ORDER BY id", project_id
+            ),
+            'environmental_factors': self._fetch_all(
+                "SELECT factor, weight, influence FROM environmental_factors WHERE project_id = ? ORDER BY id", project_id
+            )
+        }
+
+    def load_portfolio(self):
+        """
+        Load the aggregates and parameters of every project with a single query.
+
+        Returns
+        -------
+        list
+            One dictionary per project, including its 'name'.
+        """
+        rows = self.connection.execute(
+            """
+            SELECT pr.name, i.* FROM project_estimate_inputs i
+            JOIN projects pr ON pr.id = i.project_id
+            ORDER BY i.project_id
+            """
+        )
+        return [dict(row) for row in rows]
+
+    def close(self):
+        """
+        Close the connection to the database.
+        """
+        self.connection.close()
+
+    def _fetch_all(self, sql, project_id):
+        """
+        Run a query bound to a project and return its rows as dictionaries.
+
+        Parameters
+        ----------
+        sql : str
+            The SQL text of the query.
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        list
+            The rows of the result.
+        """
+        return [dict(row) for row in self.connection.execute(sql, (project_id,))]
@@ -0,0 +1,55 @@
+# This Python file uses the following encoding: utf-8
+# Estimation/storage_adapter.py
+
+class StorageAdapter:
+    """
+    Interface between the estimation engine and the place where the projects are stored.
+
+    Subclasses return the projects as plain Python data in the format expected by ``Estimator.estimate``, so the engine never depends on Qt or on a particular database driver.
+
+    Methods
+    -------
+    """
+
+    def get_project_ids(self):
+        """
+        Get the IDs of all the stored projects.
+
+        Returns
+        -------
+        list
+            The project IDs.
+        """
+        raise NotImplementedError
+
+    def load_project(self, project_id):
+        """
+        Load the data of a project.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        dict or None
+            The project data, or None if the project does not exist.
+        """
+        raise NotImplementedError
+
+    def load_portfolio(self):
+        """
+        Load the aggregates and parameters of every project, as the rows of the project_estimate_inputs view.
+
+        Returns
+        -------
+        list
+            One dictionary per project, including its 'name'.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release the resources held by the adapter.
+        """
@@ -8,7 +8,7 @@ It initializes the GUI, sets up the MVC architecture, and handles user interacti
 import config
 import os
 
-from Utils.widget_config import WidgetConfig
+from Utils.comment_delegate import CommentDelegate
 from Utils.pdf_viewer import PDFViewer
 from PySide6.QtWidgets import QApplication, QMainWindow, QMenu
 from PySide6.QtGui import QFontDatabase, QFont
@@ -70,6 +70,7 @@ class MainWindow(QMainWindow):
         self.ui = Ui_Main()
         self.ui.setupUi(self)
         self.setWindowTitle("QuickEst")
+        self.ui.comment_tableWidget.setItemDelegate(CommentDelegate(config.COMMENT_IMG_YELLOW, parent=self.ui.comment_tableWidget))
         self.load_fonts()
         self.set_app_menus()
         self.setup_navigation()
@@ -105,6 +106,10 @@ class MainWindow(QMainWindow):
         self.menuFile.addAction("Delete project").triggered.connect(self.delete_project)
         self.menuFile.addSeparator()
         self.menuFile.addAction("Close project").triggered.connect(self.close_project)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction("Export changed projects").triggered.connect(self.export_changed_projects)
+        self.menuFile.addAction("Merge exports").triggered.connect(self.merge_exports)
+        self.menuFile.addAction("Portfolio report").triggered.connect(self.generate_portfolio_report)
         self.ui.file_ToolButton.setMenu(self.menuFile)
 
         self.menuHelp = QMenu()
@@ -140,6 +145,18 @@ class MainWindow(QMainWindow):
         """Close the current project."""
         self.projects_controller.close_project()
 
+    def export_changed_projects(self):
+        """Export the projects changed since a previous export."""
+        self.projects_controller.export_changed_projects()
+
+    def merge_exports(self):
+        """Merge a full export with an export of the changed projects."""
+        self.projects_controller.merge_exports()
+
+    def generate_portfolio_report(self):
+        """Generate a report with the estimate of every project."""
+        self.projects_controller.generate_portfolio_report()
+
     def show_contents(self):
         """Show the contents help dialog."""
         self.pdf_viewer = PDFViewer()
@@ -177,12 +194,8 @@ class MainWindow(QMainWindow):
         """
         self.current_project_data = project_data
         self.ui.projectName_Label.setText("Project Name: " + self.current_project_data['name'])
-        if self.current_project_data['description'] != '':
-            WidgetConfig.create_comment(self.current_project_data['description'], 0, self.ui.comment_tableWidget, config.COMMENT_IMG_YELLOW)
-            self.ui.comment_tableWidget.setVisible(True)
-        else:
-            self.ui.comment_tableWidget.removeCellWidget(0, 0)
-            self.ui.comment_tableWidget.setVisible(False)
+        self.ui.comment_tableWidget.item(0, 0).setToolTip(self.current_project_data['description'])
+        self.ui.comment_tableWidget.setVisible(self.current_project_data['description'] != '')
 
     def setup_navigation(self):
         """Set up the navigation for the application."""
@@ -265,11 +278,11 @@ class MainWindow(QMainWindow):
         project_data : dict
             The data of the project being opened.
         """
-        self.dashboard_controller.load_dashboard(project_data),
         self.actors_controller.load_actors(project_data),
         self.useCases_controller.load_use_cases(project_data),
         self.technicalFactors_controller.load_technical_factors(project_data),
         self.environmentalFactors_controller.load_environmental_factors(project_data)
+        self.dashboard_controller.load_dashboard(project_data)  # Last, its metrics replace the ones scheduled by the tables
 
         self.save_project_data(project_data)
         if project_data['change_view']:
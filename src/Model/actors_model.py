@@ -2,8 +2,10 @@
 # model/actors_model.py
 
 import config
+from collections import Counter
 import pandas as pd
-from PySide6.QtSql import QSqlQuery
+import DataSource.database as db
+from DataSource.statement_cache import StatementCache
 
 class ActorsModel:
     """
@@ -45,8 +47,8 @@ class ActorsModel:
         complexity = actor_data.get('complexity')
         comment = actor_data.get('comment')
 
-        q_insert = QSqlQuery()
-        if not q_insert.prepare("INSERT INTO actors (code, name, complexity, comment, project_id) VALUES (?,?,?,?,?)"):
+        q_insert = StatementCache.get_query("INSERT INTO actors (code, name, complexity, comment, project_id) VALUES (?,?,?,?,?)")
+        if q_insert is None:
             return config.FAILURE, None
         q_insert.addBindValue(code)
         q_insert.addBindValue(name)
@@ -65,6 +67,45 @@ class ActorsModel:
             else:
                 return config.FAILURE, None
 
+    def create_actors(self, actors_data, project_id):
+        """
+        Create several actors in the database with a single batch execution.
+
+        Unlike create_actor, the in-memory counters are not modified; they are rebuilt when the project is loaded.
+
+        Parameters
+        ----------
+        actors_data : list of dict
+            List of dictionaries containing the actors data.
+        project_id : int
+            The ID of the project to which the actors belong.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        if not actors_data:
+            return config.SUCCESS
+
+        q_insert = StatementCache.get_query("INSERT INTO actors (code, name, complexity, comment, project_id) VALUES (?,?,?,?,?)")
+        if q_insert is None:
+            return config.FAILURE
+        q_insert.addBindValue([actor.get('code') for actor in actors_data])
+        q_insert.addBindValue([actor.get('name') for actor in actors_data])
+        q_insert.addBindValue([actor.get('complexity') for actor in actors_data])
+        q_insert.addBindValue([actor.get('comment') for actor in actors_data])
+        q_insert.addBindValue([project_id] * len(actors_data))
+
+        if q_insert.execBatch():
+            return config.SUCCESS
+        else:
+            lastError = q_insert.lastError().text().lower()
+            if "unique constraint" in lastError or "duplicate" in lastError:
+                return config.ALREADY_EXIST
+            else:
+                return config.FAILURE
+
     def update_actor(self, old_data, new_data):
         """
         Update an existing actor in the database.
@@ -88,8 +129,8 @@ class ActorsModel:
         new_complexity = new_data.get('complexity')
         comment = new_data.get('comment')
 
-        q_update = QSqlQuery()
-        if not q_update.prepare("UPDATE actors SET code = ?, name = ?, complexity = ?, comment = ? WHERE id = ?"):
+        q_update = StatementCache.get_query("UPDATE actors SET code = ?, name = ?, complexity = ?, comment = ? WHERE id = ?")
+        if q_update is None:
             return config.FAILURE
         q_update.addBindValue(code)
         q_update.addBindValue(name)
@@ -128,32 +169,47 @@ class ActorsModel:
         tuple
             Status code indicating the result of the operation, and a list of missing IDs if any.
         """
-        missing_ids = []
-        successful_ids = []
+        # Deleted in chunks with a fixed number of placeholders, padded with NULLs, so a single prepared statement is reused
+        chunk_size = config.SQL_VARIABLE_LIMIT
+        sql = f"DELETE FROM actors WHERE id IN ({', '.join('?' * chunk_size)}) RETURNING id, complexity"
+        requested_ids = {int(actor_id): actor_id for actor_id in actors_data}
+        ids = list(requested_ids)
+        deleted = {}
+
+        # Every chunk is deleted in one transaction, so a failure leaves the rows and the counters untouched
+        database = db.DataBase.get_instance()
+        if not database.transaction():
+            return config.FAILURE, None
 
-        for actor_id, details in actors_data.items():
-            complexity = details['complexity']
-            query = QSqlQuery()
-            if not query.prepare("DELETE FROM actors WHERE id = ?"):
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            query = StatementCache.get_query(sql)
+            if query is None:
+                database.rollback()
                 return config.FAILURE, None
-            query.addBindValue(actor_id)
+            for actor_id in chunk + [None] * (chunk_size - len(chunk)):
+                query.addBindValue(actor_id)
 
             if not query.exec():
+                database.rollback()
                 return config.FAILURE, None
 
-            if query.numRowsAffected() == 0:
-                missing_ids.append(actor_id)
+            while query.next():
+                deleted[query.value(0)] = query.value(1)
+            query.finish()
+
+        if not database.commit():
+            database.rollback()
+            return config.FAILURE, None
 
-            if query.numRowsAffected() > 0:
-                successful_ids.append(actor_id)
-                self.update_counts_and_UAW(complexity, increment=False)
+        for complexity, count in Counter(deleted.values()).items():
+            self.update_counts_and_UAW(complexity, increment=False, count=count)
 
+        missing_ids = [actor_id for key, actor_id in requested_ids.items() if key not in deleted]
         if missing_ids:
             return config.NOT_EXIST, missing_ids
-        elif len(successful_ids) == len(actors_data):
-            return config.SUCCESS, None
         else:
-            return config.FAILURE, None
+            return config.SUCCESS, None
 
     def update_actors_weights(self, weights, project_id):
         """
@@ -178,8 +234,8 @@ class ActorsModel:
         set_clauses = ["actors_simple_weight = ?", "actors_average_weight = ?", "actors_complex_weight = ?"]
         values = [simple_weight, average_weight, complex_weight, project_id]
         query_str = "UPDATE parameters SET " + ", ".join(set_clauses) + " WHERE project_id = ?"
-        q_update = QSqlQuery()
-        if not q_update.prepare(query_str):
+        q_update = StatementCache.get_query(query_str)
+        if q_update is None:
             return config.FAILURE
         for value in values:
             q_update.addBindValue(value)
@@ -194,7 +250,7 @@ class ActorsModel:
         else:
             return config.FAILURE
 
-    def update_counts_and_UAW(self, complexity, increment=True):
+    def update_counts_and_UAW(self, complexity, increment=True, count=1):
         """
         Update the actor counts and unadjusted actor weights (UAW).
 
@@ -204,11 +260,13 @@ class ActorsModel:
             The complexity of the actor.
         increment : bool, optional
             Value to increment or decrement the count, by default True.
+        count : int, optional
+            Number of actors to add or remove, by default 1.
         """
         if increment:
-            self.actors_count[complexity] += 1
+            self.actors_count[complexity] += count
         else:
-            self.actors_count[complexity] -= 1
+            self.actors_count[complexity] -= count
         self.actors_UAW[complexity] = round(self.actors_count[complexity] * self.actors_weights[complexity],4)
 
     def get_summary_data(self):
@@ -242,9 +300,9 @@ class ActorsModel:
         if return_value == config.FAILURE:
             return config.FAILURE
 
-        q = QSqlQuery()
-        query = "SELECT id, code, name, complexity, comment FROM actors WHERE project_id = ?"
-        if not q.prepare(query):
+        query = "SELECT id, code, name, complexity, comment FROM actors WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
 
@@ -266,6 +324,7 @@ class ActorsModel:
             }
             self.actors.append(actor_data)
             self.update_counts_and_UAW(actor_data['complexity'])
+        q.finish()
         return config.SUCCESS
 
     def load_actors_weights(self, project_id):
@@ -282,8 +341,8 @@ class ActorsModel:
         int
             Status code indicating the result of the operation.
         """
-        q = QSqlQuery()
-        if not q.prepare("SELECT actors_simple_weight, actors_average_weight, actors_complex_weight FROM parameters WHERE project_id = ?"):
+        q = StatementCache.get_query("SELECT actors_simple_weight, actors_average_weight, actors_complex_weight FROM parameters WHERE project_id = ?")
+        if q is None:
             return config.FAILURE
 
         q.addBindValue(project_id)
@@ -294,6 +353,7 @@ class ActorsModel:
             self.actors_weights['Simple'] = q.value(0)
             self.actors_weights['Average'] = q.value(1)
             self.actors_weights['Complex'] = q.value(2)
+            q.finish()
             return config.SUCCESS
         else:
             return config.FAILURE
@@ -312,9 +372,9 @@ class ActorsModel:
         dict or int
             Dictionary containing actors data and actors summary or failure code.
         """
-        query = QSqlQuery()
-        sql = "SELECT code, name, complexity, comment FROM actors WHERE project_id = ?"
-        if not query.prepare(sql):
+        sql = "SELECT code, name, complexity, comment FROM actors WHERE project_id = ? ORDER BY id"
+        query = StatementCache.get_query(sql)
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -329,6 +389,7 @@ class ActorsModel:
                 'Complexity': query.value(2),
                 'Comment': query.value(3)
             })
+        query.finish()
 
         if results:
             data = pd.DataFrame(results)
@@ -387,9 +448,9 @@ class ActorsModel:
             List of actors data or failure code.
         """
         data = []
-        query = "SELECT * FROM actors WHERE project_id = ?"
-        q = QSqlQuery()
-        if not q.prepare(query):
+        query = "SELECT * FROM actors WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
 
@@ -399,6 +460,7 @@ class ActorsModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
 
         return data
 
@@ -3,7 +3,8 @@
 
 import config
 import pandas as pd
-from PySide6.QtSql import QSqlQuery
+from DataSource.statement_cache import StatementCache
+from Estimation.estimator import Estimator
 
 class DashboardModel:
     """
@@ -60,8 +61,8 @@ class DashboardModel:
         programming_percentage = ?, testing_percentage = ?, overloading_percentage = ?
         WHERE project_id = ?
         """
-        q_update = QSqlQuery()
-        if not q_update.prepare(query_str):
+        q_update = StatementCache.get_query(query_str)
+        if q_update is None:
             return config.FAILURE
         q_update.addBindValue(analysis)
         q_update.addBindValue(design)
@@ -99,8 +100,8 @@ class DashboardModel:
             Status code indicating the result of the operation.
         """
         query_str = "UPDATE parameters SET cf = ? WHERE project_id = ?"
-        q_update = QSqlQuery()
-        if not q_update.prepare(query_str):
+        q_update = StatementCache.get_query(query_str)
+        if q_update is None:
             return config.FAILURE
         q_update.addBindValue(cf)
         q_update.addBindValue(project_id)
@@ -115,6 +116,8 @@ class DashboardModel:
         """
         Load the dashboard data for the given project.
 
+        The parameters are read from the parameters table, and the metrics from the one-row estimate of get_project_estimate, so the rows of the project are not needed.
+
         Parameters
         ----------
         project_id : int
@@ -125,12 +128,12 @@ class DashboardModel:
         int
             Status code indicating the result of the operation.
         """
-        q = QSqlQuery()
         query_str = """
         SELECT cf, analysis_percentage, design_percentage, programming_percentage,
         testing_percentage, overloading_percentage FROM parameters WHERE project_id = ?
         """
-        if not q.prepare(query_str):
+        q = StatementCache.get_query(query_str)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
         if not q.exec():
@@ -145,12 +148,126 @@ class DashboardModel:
                 'testing': q.value(4),
                 'overloading': q.value(5)
             }
+            q.finish()
             self.percentages = percentages
             self.CF = cf
-            return config.SUCCESS
         else:
             return config.FAILURE
 
+        # The metrics come from the aggregates kept by the triggers, not from the rows of the project
+        result, estimate = self.get_project_estimate(project_id)
+        if result != config.SUCCESS:
+            return config.FAILURE
+        self.UAW = estimate['UAW']
+        self.UUCW = estimate['UUCW']
+        self.UUCP = estimate['UUCP']
+        self.TFactor = estimate['TFactor']
+        self.TCF = estimate['TCF']
+        self.EFactor = estimate['EFactor']
+        self.ECF = estimate['ECF']
+        self.UCP = estimate['UCP']
+        self.E = estimate['E']
+        self.person_hours = estimate['person_hours']
+        self.total_hours = estimate['total_hours']
+        return config.SUCCESS
+
+    def get_metrics(self):
+        """
+        Get the current metrics of the project.
+
+        Returns
+        -------
+        dict
+            Dictionary with the UUCP, TCF, ECF, UCP, E, person_hours and total_hours of the project.
+        """
+        return {
+            'UUCP': self.UUCP,
+            'TCF': self.TCF,
+            'ECF': self.ECF,
+            'UCP': self.UCP,
+            'E': self.E,
+            'person_hours': self.person_hours,
+            'total_hours': self.total_hours
+        }
+
+    def get_project_estimate(self, project_id):
+        """
+        Get the full estimate of a project from its trigger-maintained metrics, without loading its rows.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and a dictionary with the estimate if successful, None otherwise.
+        """
+        q = StatementCache.get_query("SELECT * FROM project_estimate_inputs WHERE project_id = ?")
+        if q is None:
+            return config.FAILURE, None
+        q.addBindValue(project_id)
+        if not q.exec():
+            return config.FAILURE, None
+
+        if not q.next():
+            return config.NOT_EXIST, None
+
+        record = q.record()
+        metrics = {record.fieldName(i): q.value(i) for i in range(record.count())}
+        q.finish()
+        return config.SUCCESS, Estimator.estimate_from_metrics(metrics)
+
+    def get_simulation_inputs(self, project_id):
+        """
+        Get the inputs of the effort simulation of a project.
+
+        The inputs are plain data, so the simulation can run outside of the main thread.
+
+        Parameters
+        ----------
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and a dictionary with the simulation inputs if successful, None otherwise.
+        """
+        q = StatementCache.get_query("SELECT * FROM project_estimate_inputs WHERE project_id = ?")
+        if q is None:
+            return config.FAILURE, None
+        q.addBindValue(project_id)
+        if not q.exec():
+            return config.FAILURE, None
+        if not q.next():
+            return config.NOT_EXIST, None
+
+        record = q.record()
+        metrics = {record.fieldName(i): q.value(i) for i in range(record.count())}
+        q.finish()
+
+        inputs = {
+            'parameters': metrics,
+            'actors_count': {complexity: metrics[f"actors_{complexity.lower()}"] for complexity in config.COMPLEXITIES},
+            'use_cases_count': {complexity: metrics[f"use_cases_{complexity.lower()}"] for complexity in config.COMPLEXITIES}
+        }
+        for table in ['technical_factors', 'environmental_factors']:
+            q_factors = StatementCache.get_query(f"SELECT weight, influence FROM {table} WHERE project_id = ?")
+            if q_factors is None:
+                return config.FAILURE, None
+            q_factors.addBindValue(project_id)
+            if not q_factors.exec():
+                return config.FAILURE, None
+
+            inputs[table] = []
+            while q_factors.next():
+                inputs[table].append({'weight': q_factors.value(0), 'influence': q_factors.value(1)})
+            q_factors.finish()
+
+        return config.SUCCESS, inputs
+
     def calculate_UUCP(self, UAW, UUCW):
         """
         Calculate the Unadjusted Use Case Points (UUCP).
@@ -169,7 +286,7 @@ class DashboardModel:
         """
         self.UAW = UAW
         self.UUCW = UUCW
-        self.UUCP = round(UAW + UUCW, 4)
+        self.UUCP = Estimator.calculate_UUCP(UAW, UUCW)
         return self.UUCP
 
     def calculate_TCF(self, TFactor):
@@ -187,7 +304,7 @@ class DashboardModel:
             The calculated TCF.
         """
         self.TFactor = TFactor
-        self.TCF = round(0.6 + (0.01 * TFactor), 4)
+        self.TCF = Estimator.calculate_TCF(TFactor)
         return self.TCF
 
     def calculate_ECF(self, EFactor):
@@ -205,7 +322,7 @@ class DashboardModel:
             The calculated ECF.
         """
         self.EFactor = EFactor
-        self.ECF = round(1.4 + (-0.03 * EFactor), 4)
+        self.ECF = Estimator.calculate_ECF(EFactor)
         return self.ECF
 
     def calculate_UCP(self):
@@ -217,7 +334,7 @@ class DashboardModel:
         float
             The calculated UCP.
         """
-        self.UCP = round(self.UUCP * self.ECF * self.TCF, 4)
+        self.UCP = Estimator.calculate_UCP(self.UUCP, self.TCF, self.ECF)
         return self.UCP
 
     def calculate_E(self):
@@ -229,7 +346,7 @@ class DashboardModel:
         float
             The calculated Estimated Effort.
         """
-        self.E = round(self.UCP * self.CF, 4)
+        self.E = Estimator.calculate_E(self.UCP, self.CF)
         return self.E
 
     def calculate_effort(self):
@@ -241,18 +358,8 @@ class DashboardModel:
         tuple
             Dictionary of person-hours per activity and total_hours
         """
-        self.total_hours = 0.0
-        programming_percentage = self.percentages.get('programming', 0)
-        person_hours = {}
-        for activity, percentage in self.percentages.items():
-            if programming_percentage != 0:
-                hours = round((self.E * percentage) / programming_percentage, 4)
-                person_hours[activity] = hours
-                self.total_hours += hours
-            else:
-                person_hours[activity] = 0.0
-
-        total_hours = round(self.total_hours, 4)
+        person_hours, total_hours = Estimator.calculate_effort(self.E, self.percentages)
+        self.total_hours = total_hours
         self.person_hours = person_hours
 
         return person_hours, total_hours
@@ -3,7 +3,8 @@
 
 import config
 import pandas as pd
-from PySide6.QtSql import QSqlQuery
+from DataSource.statement_cache import StatementCache
+from Estimation.estimator import Estimator
 
 class EnvironmentalFactorsModel:
     """
@@ -11,15 +12,22 @@ class EnvironmentalFactorsModel:
 
     This class handles all database operations related to environmental factors, including updating and retrieving environmental factor data. It calculates and maintains the influence and results of some operations of this factors.
 
+    Attributes
+    ----------
+    FACTORS : tuple of str
+        The codes of the environmental factors of every project.
+
     Methods
     -------
     """
 
+    FACTORS = tuple(f"E{i}" for i in range(1, 9))
+
     def __init__(self):
         """
         Initialize the EnvironmentalFactorsModel.
         """
-        self.factor_results = {f"E{i}": 0 for i in range(1, 9)}
+        self.factor_results = dict.fromkeys(self.FACTORS, 0)
         self.factor_counts = {'irrelevant': 0, 'medium': 0, 'essential': 0}
         self.environmentalFactors = []
 
@@ -43,24 +51,27 @@ class EnvironmentalFactorsModel:
         weight = factor_data.get('weight')
         influence = factor_data.get('influence')
         comment = factor_data.get('comment')
-        q_select = QSqlQuery()
-        q_select.prepare("SELECT influence FROM environmental_factors WHERE factor = ? AND project_id = ?")
+        q_select = StatementCache.get_query("SELECT influence FROM environmental_factors WHERE factor = ? AND project_id = ?")
+        if q_select is None:
+            return config.FAILURE
         q_select.addBindValue(factor)
         q_select.addBindValue(project_id)
         old_influence = None
         if q_select.exec() and q_select.first():
             old_influence = q_select.value(0)
+            q_select.finish()
         else:
             return config.FAILURE
 
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE environmental_factors
             SET weight = ?, influence = ?, comment = ?
             WHERE factor = ? AND project_id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(weight)
         q_update.addBindValue(influence)
         q_update.addBindValue(comment)
@@ -86,6 +97,68 @@ class EnvironmentalFactorsModel:
         else:
             return config.FAILURE
 
+    def update_environmental_factors(self, factors_data, project_id):
+        """
+        Update several environmental factors in the database with a single batch execution.
+
+        Unlike update_environmental_factor, the current influences are not queried and the in-memory counters and results are not modified; they are rebuilt when the project is loaded. Unknown factor codes, and factors missing from the project, are reported as NOT_EXIST.
+
+        Parameters
+        ----------
+        factors_data : list of dict
+            List of dictionaries containing environmental factor data.
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        if not factors_data:
+            return config.SUCCESS
+
+        factors = [factor_data.get('factor') for factor_data in factors_data]
+        if any(factor not in self.FACTORS for factor in factors):
+            return config.NOT_EXIST
+
+        # The batch only reports the rows changed by its last statement, so the factors are looked up first
+        q_count = StatementCache.get_query(
+            f"SELECT COUNT(DISTINCT factor) FROM environmental_factors WHERE project_id = ? AND factor IN ({', '.join('?' * len(self.FACTORS))})"
+        )
+        if q_count is None:
+            return config.FAILURE
+        q_count.addBindValue(project_id)
+        unique_factors = set(factors)
+        for factor in list(unique_factors) + [None] * (len(self.FACTORS) - len(unique_factors)):
+            q_count.addBindValue(factor)
+        if not q_count.exec() or not q_count.next():
+            return config.FAILURE
+        factor_count = q_count.value(0)
+        q_count.finish()
+        if factor_count != len(unique_factors):
+            return config.NOT_EXIST
+
+        q_update = StatementCache.get_query(
+            """
+            UPDATE environmental_factors
+            SET weight = ?, influence = ?, comment = ?
+            WHERE factor = ? AND project_id = ?
+            """
+        )
+        if q_update is None:
+            return config.FAILURE
+        q_update.addBindValue([factor_data.get('weight') for factor_data in factors_data])
+        q_update.addBindValue([factor_data.get('influence') for factor_data in factors_data])
+        q_update.addBindValue([factor_data.get('comment') for factor_data in factors_data])
+        q_update.addBindValue(factors)
+        q_update.addBindValue([project_id] * len(factors_data))
+
+        if q_update.execBatch():
+            return config.SUCCESS
+        else:
+            return config.FAILURE
+
     def categorize_influence(self, influence):
         """
         Categorize the influence value into 'irrelevant', 'medium', or 'essential'.
@@ -100,13 +173,7 @@ class EnvironmentalFactorsModel:
         str
             The category of the influence value.
         """
-        if 0 <= influence <= 2:
-            return 'irrelevant'
-        elif 3 <= influence <= 4:
-            return 'medium'
-        elif influence == 5:
-            return 'essential'
-        return 'undefined'
+        return Estimator.categorize_influence(influence)
 
     def get_EF_results(self):
         """
@@ -134,12 +201,13 @@ class EnvironmentalFactorsModel:
         int
             Status code indicating the result of the operation.
         """
-        self.factor_results = {f"E{i}": 0 for i in range(1, 9)}
+        self.factor_results = dict.fromkeys(self.FACTORS, 0)
         self.factor_counts = {'irrelevant': 0, 'medium': 0, 'essential': 0}
 
-        q = QSqlQuery()
-        query = "SELECT factor, description, weight, influence, comment FROM environmental_factors WHERE project_id = ?"
-        q.prepare(query)
+        query = "SELECT factor, description, weight, influence, comment FROM environmental_factors WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
+            return config.FAILURE
         q.addBindValue(project_id)
 
         if not q.exec():
@@ -158,6 +226,7 @@ class EnvironmentalFactorsModel:
             category = self.categorize_influence(environmentalFactor_data['influence'])
             self.factor_counts[category] += 1
             self.factor_results[environmentalFactor_data['factor']] = round(environmentalFactor_data['weight'] * environmentalFactor_data['influence'],4)
+        q.finish()
         return config.SUCCESS
 
     def get_data(self, project_id):
@@ -174,9 +243,9 @@ class EnvironmentalFactorsModel:
         dict or int
             Dictionary containing environmental factors data and summary, or failure code.
         """
-        query = QSqlQuery()
-        sql = "SELECT factor, description, weight, influence, comment FROM environmental_factors WHERE project_id = ?"
-        if not query.prepare(sql):
+        sql = "SELECT factor, description, weight, influence, comment FROM environmental_factors WHERE project_id = ? ORDER BY id"
+        query = StatementCache.get_query(sql)
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -194,6 +263,7 @@ class EnvironmentalFactorsModel:
                 'Result': result,
                 'Comment': query.value(4)
             })
+        query.finish()
 
         data = pd.DataFrame(results)
         total_result = data['Result'].sum()
@@ -255,17 +325,15 @@ class EnvironmentalFactorsModel:
             ('E7','Part time workers',-1.0,0,''),
             ('E8','Programming language difficulty',-1.0,0,'')
         ]
-        query = QSqlQuery()
-        for factor in factors:
-            sql = "INSERT INTO environmental_factors (factor, description, weight, influence, comment, project_id) VALUES (?, ?, ?, ?, ?, ?)"
-            query.prepare(sql)
-            if not query.prepare(sql):
-                return config.FAILURE
-            for value in factor:
-                query.addBindValue(value)
-            query.addBindValue(project_id)
-            if not query.exec():
-                return config.FAILURE
+        sql = "INSERT INTO environmental_factors (factor, description, weight, influence, comment, project_id) VALUES (?, ?, ?, ?, ?, ?)"
+        query = StatementCache.get_query(sql)
+        if query is None:
+            return config.FAILURE
+        for column in zip(*factors):
+            query.addBindValue(list(column))
+        query.addBindValue([project_id] * len(factors))
+        if not query.execBatch():
+            return config.FAILURE
         return config.SUCCESS
 
     def export_environmental_factors_data(self, project_id):
@@ -283,9 +351,9 @@ class EnvironmentalFactorsModel:
             List of environmental factors data or failure code.
         """
         data = []
-        query = "SELECT * FROM environmental_factors WHERE project_id = ?"
-        q = QSqlQuery()
-        if not q.prepare(query):
+        query = "SELECT * FROM environmental_factors WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
 
@@ -295,6 +363,7 @@ class EnvironmentalFactorsModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
 
         return data
 
@@ -2,11 +2,19 @@
 # model/projects_model.py
 
 import config
+import hashlib
+import os
+import zipfile
 import pandas as pd
 import DataSource.database as db
+from DataSource.export_archive import ExportArchive
+from DataSource.project_package import ProjectPackage
+from DataSource.qck_decoder import QckDecoder
+from DataSource.statement_cache import StatementCache
+from Estimation.portfolio_estimator import PortfolioEstimator
 from datetime import datetime
-from PySide6.QtCore import QDir, QFile, QDataStream, QIODevice, QCryptographicHash, QFileInfo, QJsonDocument, QTextStream
 from PySide6.QtSql import QSqlQuery
+from PySide6.QtCore import QByteArray, QDir, QFile, QDataStream, QIODevice, QFileInfo, QJsonDocument
 
 class ProjectsModel:
     """
@@ -57,6 +65,55 @@ class ProjectsModel:
         """
         return self.db_instance.rollback()
 
+    def savepoint(self, name):
+        """
+        Set a savepoint inside the current transaction.
+
+        Parameters
+        ----------
+        name : str
+            The name of the savepoint.
+
+        Returns
+        -------
+        bool
+            True if the savepoint was set, False otherwise.
+        """
+        return QSqlQuery(self.db_instance).exec(f"SAVEPOINT {name}")
+
+    def release_savepoint(self, name):
+        """
+        Keep the changes made since a savepoint and remove it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the savepoint.
+
+        Returns
+        -------
+        bool
+            True if the savepoint was released, False otherwise.
+        """
+        return QSqlQuery(self.db_instance).exec(f"RELEASE SAVEPOINT {name}")
+
+    def rollback_to_savepoint(self, name):
+        """
+        Undo the changes made since a savepoint and remove it, keeping the rest of the transaction.
+
+        Parameters
+        ----------
+        name : str
+            The name of the savepoint.
+
+        Returns
+        -------
+        bool
+            True if the changes were undone, False otherwise.
+        """
+        query = QSqlQuery(self.db_instance)
+        return query.exec(f"ROLLBACK TO SAVEPOINT {name}") and query.exec(f"RELEASE SAVEPOINT {name}")
+
     def add_project(self, project_data):
         """
         Add a new project to the database.
@@ -73,14 +130,16 @@ class ProjectsModel:
         """
 
         # Check the number of existing projects
-        q_count = QSqlQuery()
-        q_count.prepare("SELECT COUNT(*) FROM projects")
+        q_count = StatementCache.get_query("SELECT COUNT(*) FROM projects")
+        if q_count is None:
+            return config.FAILURE, None
 
         if not q_count.exec():
             return config.FAILURE, None
 
         q_count.next()
         project_count = q_count.value(0)
+        q_count.finish()
 
         if project_count >= config.PROJECT_LIMIT:
             return config.TOO_MANY_PROJECTS, None
@@ -90,13 +149,14 @@ class ProjectsModel:
         description = project_data.get('description')
         created_at = project_data.get('created_at')
         last_access = project_data.get('last_access')
-        q_insert = QSqlQuery()
-        q_insert.prepare(
+        q_insert = StatementCache.get_query(
             """
             INSERT INTO projects (favorite, name, description, created_at, last_access)
             VALUES (?,?,?,?,?)
             """
         )
+        if q_insert is None:
+            return config.FAILURE, None
         q_insert.addBindValue(favorite)
         q_insert.addBindValue(name)
         q_insert.addBindValue(description)
@@ -127,8 +187,9 @@ class ProjectsModel:
         int
             Status code indicating the result of the operation.
         """
-        q_delete = QSqlQuery()
-        q_delete.prepare("DELETE FROM projects WHERE id = ?")
+        q_delete = StatementCache.get_query("DELETE FROM projects WHERE id = ?")
+        if q_delete is None:
+            return config.FAILURE
         q_delete.addBindValue(project_id)
 
         if q_delete.exec():
@@ -155,14 +216,15 @@ class ProjectsModel:
         int
             Status code indicating the result of the operation.
         """
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE projects
             SET favorite = ?
             WHERE id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(favorite)
         q_update.addBindValue(project_id)
 
@@ -190,14 +252,15 @@ class ProjectsModel:
         int
             Status code indicating the result of the operation.
         """
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE projects
             SET last_access = ?
             WHERE id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(last_access)
         q_update.addBindValue(project_id)
 
@@ -227,14 +290,15 @@ class ProjectsModel:
         """
         name = project_data.get('name')
         description = project_data.get('description')
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE projects
             SET name = ?, description = ?
             WHERE id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(name)
         q_update.addBindValue(description)
         q_update.addBindValue(project_id)
@@ -265,8 +329,8 @@ class ProjectsModel:
         int
             Status code indicating the result of the operation.
         """
-        query = QSqlQuery()
-        if not query.prepare("INSERT INTO parameters (project_id) VALUES (?)"):
+        query = StatementCache.get_query("INSERT INTO parameters (project_id) VALUES (?)")
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -275,6 +339,49 @@ class ProjectsModel:
             return config.FAILURE
         return config.SUCCESS
 
+    def update_parameters(self, parameters_data, project_id):
+        """
+        Update all the parameters of a project with a single statement.
+
+        Parameters
+        ----------
+        parameters_data : dict
+            Dictionary containing the parameters data, as read from an exported project.
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        q_update = StatementCache.get_query(
+            """
+            UPDATE parameters
+            SET cf = ?, analysis_percentage = ?, design_percentage = ?, programming_percentage = ?,
+            testing_percentage = ?, overloading_percentage = ?, actors_simple_weight = ?,
+            actors_average_weight = ?, actors_complex_weight = ?, useCases_simple_weight = ?,
+            useCases_average_weight = ?, useCases_complex_weight = ?
+            WHERE project_id = ?
+            """
+        )
+        if q_update is None:
+            return config.FAILURE
+        for key in ['cf', 'analysis_percentage', 'design_percentage', 'programming_percentage',
+                    'testing_percentage', 'overloading_percentage', 'actors_simple_weight',
+                    'actors_average_weight', 'actors_complex_weight', 'use_cases_simple_weight',
+                    'use_cases_average_weight', 'use_cases_complex_weight']:
+            q_update.addBindValue(parameters_data.get(key))
+        q_update.addBindValue(project_id)
+
+        if q_update.exec():
+            if q_update.numRowsAffected() > 0:
+                return config.SUCCESS
+            else:
+                return config.NOT_EXIST
+        else:
+            return config.FAILURE
+
     def find_manifest(self, directory):
         """
         Find the project manifest file in the specified directory.
@@ -355,13 +462,10 @@ class ProjectsModel:
                 return config.FAILURE
             try:
                 expected_hash = info["hash"]
-                actual_hash = self.calculate_file_hash(file_path)
-                if expected_hash != actual_hash:
-                    return config.FAILURE
             except KeyError:
                 return config.FAILURE
 
-            return_value = self.read_data_from_binary_file(file_path)
+            return_value = self.read_data_from_binary_file(file_path, expected_hash)
             if return_value == config.FAILURE:
                 return config.FAILURE
             else:
@@ -377,39 +481,95 @@ class ProjectsModel:
 
         return loaded_data
 
-    def calculate_file_hash(self, file_path):
+    def load_package(self, file_path):
         """
-        Calculate the SHA-256 hash of a file.
+        Load the project data of a single-file project package.
 
         Parameters
         ----------
         file_path : str
-            The path to the file.
+            The path to the package.
 
         Returns
         -------
-        str or None
-            The SHA-256 hash of the file, None otherwise.
+        dict or int
+            Dictionary containing the loaded project data if successful, or failure code.
         """
-        file = QFile(file_path)
-        if file.open(QFile.ReadOnly):
-            hash = QCryptographicHash(QCryptographicHash.Sha256)
-            while not file.atEnd():
-                line = file.read(4096)
-                hash.addData(line)
-            file.close()
-            return hash.result().toHex().data().decode("utf-8")
-        else:
-            return None
+        return ProjectPackage.read(file_path)
 
-    def read_data_from_binary_file(self, file_path):
+    def read_archive(self, zip_file_path):
+        """
+        Read and verify every project of a ZIP archive without extracting it. Does not use the database, so it can run outside of the main thread.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive.
+
+        Returns
+        -------
+        list of tuple
+            The name of each project and its loaded data, or failure code if its files are missing or corrupted.
+        """
+        return QckDecoder.read_archive(zip_file_path, config.IMPORT_WORKERS)
+
+    def read_export_index(self, zip_file_path):
+        """
+        Read the index of the revisions of the projects of an export archive.
+
+        Parameters
+        ----------
+        zip_file_path : str
+            The path of the archive.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and the index if successful, None otherwise.
+        """
+        try:
+            index = ExportArchive.read_index(zip_file_path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return config.FAILURE, None
+        if index is None:
+            return config.NOT_EXIST, None
+        return config.SUCCESS, index
+
+    def merge_exports(self, base_file_path, changes_file_path, zip_file_path):
+        """
+        Merge a full export archive and an archive of the projects changed since it.
+
+        Parameters
+        ----------
+        base_file_path : str
+            The path of the full archive.
+        changes_file_path : str
+            The path of the archive of the changed projects.
+        zip_file_path : str
+            The path of the merged archive.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and the number of merged projects if successful, None otherwise.
+        """
+        try:
+            return config.SUCCESS, ExportArchive.merge(base_file_path, changes_file_path, zip_file_path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return config.FAILURE, None
+
+    def read_data_from_binary_file(self, file_path, expected_hash=None):
         """
         Read data from a binary file.
 
+        The file is read once into memory; its SHA-256 hash is checked on that content before it is decoded.
+
         Parameters
         ----------
         file_path : str
             The path to the binary file.
+        expected_hash : str, optional
+            The SHA-256 hash the content must match, as a hexadecimal string.
 
         Returns
         -------
@@ -423,8 +583,13 @@ class ProjectsModel:
         file = QFile(file_path)
         if not file.open(QIODevice.ReadOnly):
             return config.FAILURE
+        content = file.readAll()
+        file.close()
+
+        if expected_hash is not None and hashlib.sha256(content.data()).hexdigest() != expected_hash:
+            return config.FAILURE
 
-        stream = QDataStream(file)
+        stream = QDataStream(content)
 
         while not stream.atEnd():
             if file_type == "project":
@@ -439,7 +604,6 @@ class ProjectsModel:
                 data.append(self.read_factor(stream))
             else:
                 return config.FAILURE
-        file.close()
         return data
 
     def determine_file_type(self, file_path):
@@ -606,8 +770,8 @@ class ProjectsModel:
         tuple
             Status code and a list of projects.
         """
-        q = QSqlQuery()
-        if not q.exec("SELECT * FROM projects"):
+        q = StatementCache.get_query("SELECT * FROM projects")
+        if q is None or not q.exec():
             return config.FAILURE, []
 
         projects = []
@@ -616,14 +780,121 @@ class ProjectsModel:
                 'id': q.value(0),
                 'favorite': q.value(1),
                 'name': q.value(2),
-                'description': q.value(3),
+                'description': q.value(3) or '',
                 'created_at': q.value(4),
                 'last_access': q.value(5)
             }
             projects.append(project_data)
+        q.finish()
 
         return config.SUCCESS, projects
 
+    def get_portfolio_estimates(self):
+        """
+        Get the estimate of every project in the database without opening them.
+
+        The aggregates of all the projects are read with a single query and the metrics are calculated in one vectorized pass.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and a DataFrame with one row per project if successful, None otherwise.
+        """
+        q = StatementCache.get_query(
+            """
+            SELECT pr.name, i.* FROM project_estimate_inputs i
+            JOIN projects pr ON pr.id = i.project_id
+            ORDER BY i.project_id
+            """
+        )
+        if q is None or not q.exec():
+            return config.FAILURE, None
+
+        record = q.record()
+        columns = [record.fieldName(i) for i in range(record.count())]
+        rows = []
+        while q.next():
+            rows.append([q.value(i) for i in range(len(columns))])
+        q.finish()
+
+        return config.SUCCESS, PortfolioEstimator.estimate(pd.DataFrame(rows, columns=columns))
+
+    def get_portfolio_summary(self):
+        """
+        Get the estimate of every project, with the column names of the reports and a final row with the totals.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and a DataFrame with one row per project followed by the totals if successful, None otherwise.
+        """
+        result, estimates = self.get_portfolio_estimates()
+        if result != config.SUCCESS:
+            return result, None
+
+        columns = {
+            'project_id': "ID", 'name': "Project Name", 'UAW': "UAW", 'UUCW': "UUCW", 'UUCP': "UUCP", 'TFactor': "TFactor", 'TCF': "TCF",
+            'EFactor': "EFactor", 'ECF': "ECF", 'UCP': "UCP", 'CF': "CF", 'E': "Estimated Effort [E]"
+        }
+        for activity in config.ACTIVITIES:
+            columns[f"{activity}_hours"] = f"{activity.capitalize()} Hours"
+        columns['total_hours'] = "Total Hours"
+
+        summary = estimates[list(columns)].rename(columns=columns)
+        totals = {column: "" for column in summary.columns}
+        totals["Project Name"] = "Total"
+        for column in ['E'] + [f"{activity}_hours" for activity in config.ACTIVITIES] + ['total_hours']:
+            totals[columns[column]] = round(float(estimates[column].sum()), 4)
+        summary = pd.concat([summary.astype(object), pd.DataFrame([totals])], ignore_index=True)
+        return config.SUCCESS, summary
+
+    def get_portfolio_details(self):
+        """
+        Get the actors, use cases and factors of every project, reading each table with a single query.
+
+        The rows of each project are in the same order as in the report of the project.
+
+        Returns
+        -------
+        tuple
+            Status code indicating the result of the operation, and a dictionary with a DataFrame per table, with a 'project_id' column, if successful, None otherwise.
+        """
+        queries = {
+            'actors': (
+                "SELECT project_id, code, name, complexity, comment FROM actors ORDER BY project_id, id",
+                ['project_id', 'Code', 'Name', 'Complexity', 'Comment']
+            ),
+            'use_cases': (
+                "SELECT project_id, code, name, complexity, transactions, comment FROM use_cases ORDER BY project_id, id",
+                ['project_id', 'Code', 'Name', 'Complexity', 'Transactions', 'Comment']
+            ),
+            'technical_factors': (
+                "SELECT project_id, factor, description, weight, influence, comment FROM technical_factors ORDER BY project_id, id",
+                ['project_id', 'Factor', 'Description', 'Weight', 'Influence', 'Comment']
+            ),
+            'environmental_factors': (
+                "SELECT project_id, factor, description, weight, influence, comment FROM environmental_factors ORDER BY project_id, id",
+                ['project_id', 'Factor', 'Description', 'Weight', 'Influence', 'Comment']
+            )
+        }
+
+        details = {}
+        for table, (sql, columns) in queries.items():
+            q = StatementCache.get_query(sql)
+            if q is None or not q.exec():
+                return config.FAILURE, None
+
+            rows = []
+            while q.next():
+                rows.append([q.value(i) for i in range(len(columns))])
+            q.finish()
+
+            data = pd.DataFrame(rows, columns=columns)
+            if 'Weight' in columns:
+                data.insert(5, 'Result', [round(weight * influence, 4) for weight, influence in zip(data['Weight'], data['Influence'])])
+            details[table] = data
+        return config.SUCCESS, details
+
     def get_project_data(self, project_id):
         """
         Get data for a specific project.
@@ -638,9 +909,9 @@ class ProjectsModel:
         dict or int
             Dictionary containing project data and report date if successful, or failure code.
         """
-        query = QSqlQuery()
         sql = "SELECT name, description FROM projects WHERE id = ?"
-        if not query.prepare(sql):
+        query = StatementCache.get_query(sql)
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -653,6 +924,7 @@ class ProjectsModel:
                 'Project Name': query.value(0),
                 'Project Description': query.value(1)
             })
+        query.finish()
 
         data = pd.DataFrame(results)
         now = datetime.now()
@@ -678,8 +950,8 @@ class ProjectsModel:
         """
         data = []
         query = "SELECT * FROM parameters WHERE project_id = ?"
-        q = QSqlQuery()
-        if not q.prepare(query):
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
         if not q.exec():
@@ -687,6 +959,7 @@ class ProjectsModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
         return data
 
     def export_project_data(self, project_id):
@@ -705,8 +978,8 @@ class ProjectsModel:
         """
         data = []
         query = "SELECT * FROM projects WHERE id = ?"
-        q = QSqlQuery()
-        if not q.prepare(query):
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
         if not q.exec():
@@ -714,29 +987,25 @@ class ProjectsModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
         return data
 
-    def write_data_to_binary_file(self, data, destination_file):
+    def serialize_data(self, data):
         """
-        Write data to a binary file.
+        Serialize table data to the binary format of the exported files.
 
         Parameters
         ----------
         data : list
-            The data to write.
-        destination_file : str
-            The path to the destination file.
+            The rows to serialize.
 
         Returns
         -------
-        int
-            Status code indicating the result of the operation.
+        bytes
+            The serialized data.
         """
-        file = QFile(destination_file)
-        if not file.open(QIODevice.WriteOnly):
-            return config.FAILURE
-
-        stream = QDataStream(file)
+        byte_array = QByteArray()
+        stream = QDataStream(byte_array, QIODevice.WriteOnly)
         for row in data:
             for value in row:
                 if isinstance(value, int):
@@ -747,35 +1016,90 @@ class ProjectsModel:
                     stream.writeString(value)
                 else:
                     stream.writeString(str(value))
-        file.close()
-        return config.SUCCESS
+        return byte_array.data()
 
-    def write_project_manifest(self, file_path, project_directory, project_manifest):
+    def serialize_manifest(self, project_manifest):
         """
-        Write the project manifest to a file.
+        Serialize a project manifest to JSON, with the line endings of a text file of the platform.
 
         Parameters
         ----------
-        file_path : str
-            The path to the manifest file.
-        project_directory : str
-            The directory containing the project files.
         project_manifest : dict
             The project manifest data.
 
+        Returns
+        -------
+        bytes
+            The serialized manifest.
+        """
+        data = QJsonDocument(project_manifest).toJson().data()
+        if os.linesep != "\n":
+            data = data.replace(b"\n", os.linesep.encode())
+        return data
+
+    def serialize_project(self, project_data, project_name):
+        """
+        Serialize the files of an exported project, hashing each one as it is produced.
+
+        The table files come first and the manifest last, once all the hashes are known. This method only works on the given rows, so it can run outside of the main thread.
+
+        Parameters
+        ----------
+        project_data : list of tuple
+            The table name, the file name and the rows of each exported table.
+        project_name : str
+            The name of the project.
+
+        Returns
+        -------
+        list of tuple
+            The file name and its content as bytes.
+        """
+        files = []
+        project_manifest = {}
+        for table, file_name, rows in project_data:
+            data = self.serialize_data(rows)
+            project_manifest[table] = {"file_name": file_name, "hash": hashlib.sha256(data).hexdigest()}
+            files.append((file_name, data))
+
+        files.append((f"{project_name}{config.PROJECT_FILE_EXTENSION}", self.serialize_manifest(project_manifest)))
+        return files
+
+    def serialize_package(self, project_data):
+        """
+        Serialize an exported project to a single-file project package.
+
+        Parameters
+        ----------
+        project_data : list of tuple
+            The table name, the file name and the rows of each exported table.
+
+        Returns
+        -------
+        bytes
+            The content of the package.
+        """
+        return ProjectPackage.serialize(project_data)
+
+    def write_file(self, file_path, data):
+        """
+        Write serialized data to a file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the file.
+        data : bytes
+            The data to write.
+
         Returns
         -------
         int
             Status code indicating the result of the operation.
         """
-        manifest_file_path = QDir(project_directory).filePath(file_path)
-        json_document = QJsonDocument(project_manifest)
-        file = QFile(manifest_file_path)
-        if file.open(QFile.WriteOnly | QFile.Text):
-            stream = QTextStream(file)
-            stream << json_document.toJson()
-            file.close()
-            return config.SUCCESS
-        else:
+        file = QFile(file_path)
+        if not file.open(QIODevice.WriteOnly):
             return config.FAILURE
-
+        written = file.write(data)
+        file.close()
+        return config.SUCCESS if written == len(data) else config.FAILURE
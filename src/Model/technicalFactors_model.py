@@ -3,8 +3,8 @@
 
 import config
 import pandas as pd
-
-from PySide6.QtSql import QSqlQuery
+from DataSource.statement_cache import StatementCache
+from Estimation.estimator import Estimator
 
 class TechnicalFactorsModel:
     """
@@ -12,15 +12,22 @@ class TechnicalFactorsModel:
 
     This class handles all database operations related to technical factors, including updating and retrieving technical factor data. It calculates and maintains the influence and results of some operations of this factors.
 
+    Attributes
+    ----------
+    FACTORS : tuple of str
+        The codes of the technical factors of every project.
+
     Methods
     -------
     """
 
+    FACTORS = tuple(f"T{i:02}" for i in range(1, 14))
+
     def __init__(self):
         """
         Initialize the TechnicalFactorsModel with default values.
         """
-        self.factor_results = {f"T{i:02}": 0 for i in range(1, 14)}
+        self.factor_results = dict.fromkeys(self.FACTORS, 0)
         self.factor_counts = {'irrelevant': 0, 'medium': 0, 'essential': 0}
         self.technicalFactors = []
 
@@ -45,25 +52,28 @@ class TechnicalFactorsModel:
         influence = factor_data.get('influence')
         comment = factor_data.get('comment')
         # Consultar la influencia anterior antes de la actualización
-        q_select = QSqlQuery()
-        q_select.prepare("SELECT influence FROM technical_factors WHERE factor = ? AND project_id = ?")
+        q_select = StatementCache.get_query("SELECT influence FROM technical_factors WHERE factor = ? AND project_id = ?")
+        if q_select is None:
+            return config.FAILURE
         q_select.addBindValue(factor)
         q_select.addBindValue(project_id)
         old_influence = None
         if q_select.exec() and q_select.first():
             old_influence = q_select.value(0)
+            q_select.finish()
         else:
             return config.FAILURE
 
         # Preparar y ejecutar la actualización después de obtener la influencia anterior
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE technical_factors
             SET weight = ?, influence = ?, comment = ?
             WHERE factor = ? AND project_id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(weight)
         q_update.addBindValue(influence)
         q_update.addBindValue(comment)
@@ -96,6 +106,68 @@ class TechnicalFactorsModel:
         else:
             return config.FAILURE
 
+    def update_technical_factors(self, factors_data, project_id):
+        """
+        Update several technical factors in the database with a single batch execution.
+
+        Unlike update_technical_factor, the current influences are not queried and the in-memory counters and results are not modified; they are rebuilt when the project is loaded. Unknown factor codes, and factors missing from the project, are reported as NOT_EXIST.
+
+        Parameters
+        ----------
+        factors_data : list of dict
+            List of dictionaries containing technical factor data.
+        project_id : int
+            The ID of the project.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        if not factors_data:
+            return config.SUCCESS
+
+        factors = [factor_data.get('factor') for factor_data in factors_data]
+        if any(factor not in self.FACTORS for factor in factors):
+            return config.NOT_EXIST
+
+        # The batch only reports the rows changed by its last statement, so the factors are looked up first
+        q_count = StatementCache.get_query(
+            f"SELECT COUNT(DISTINCT factor) FROM technical_factors WHERE project_id = ? AND factor IN ({', '.join('?' * len(self.FACTORS))})"
+        )
+        if q_count is None:
+            return config.FAILURE
+        q_count.addBindValue(project_id)
+        unique_factors = set(factors)
+        for factor in list(unique_factors) + [None] * (len(self.FACTORS) - len(unique_factors)):
+            q_count.addBindValue(factor)
+        if not q_count.exec() or not q_count.next():
+            return config.FAILURE
+        factor_count = q_count.value(0)
+        q_count.finish()
+        if factor_count != len(unique_factors):
+            return config.NOT_EXIST
+
+        q_update = StatementCache.get_query(
+            """
+            UPDATE technical_factors
+            SET weight = ?, influence = ?, comment = ?
+            WHERE factor = ? AND project_id = ?
+            """
+        )
+        if q_update is None:
+            return config.FAILURE
+        q_update.addBindValue([factor_data.get('weight') for factor_data in factors_data])
+        q_update.addBindValue([factor_data.get('influence') for factor_data in factors_data])
+        q_update.addBindValue([factor_data.get('comment') for factor_data in factors_data])
+        q_update.addBindValue(factors)
+        q_update.addBindValue([project_id] * len(factors_data))
+
+        if q_update.execBatch():
+            return config.SUCCESS
+        else:
+            return config.FAILURE
+
     def categorize_influence(self, influence):
         """
         Categorize the influence based on its value.
@@ -110,13 +182,7 @@ class TechnicalFactorsModel:
         str
             The category of the influence: 'irrelevant', 'medium', 'essential', or 'undefined'.
         """
-        if 0 <= influence <= 2:
-            return 'irrelevant'
-        elif 3 <= influence <= 4:
-            return 'medium'
-        elif influence == 5:
-            return 'essential'
-        return 'undefined'  # Si el valor está fuera de rango
+        return Estimator.categorize_influence(influence)
 
     def get_TF_results(self):
         """
@@ -145,13 +211,14 @@ class TechnicalFactorsModel:
             Status code indicating the result of the operation.
         """
         # Resetear contadores y resultados antes de cargar nuevos datos
-        self.factor_results = {f"T{i:02}": 0 for i in range(1, 14)}
+        self.factor_results = dict.fromkeys(self.FACTORS, 0)
         self.factor_counts = {'irrelevant': 0, 'medium': 0, 'essential': 0}
 
         # Obtener factores técnicos de la base de datos
-        q = QSqlQuery()
-        query = "SELECT factor, description, weight, influence, comment FROM technical_factors WHERE project_id = ?"
-        q.prepare(query)
+        query = "SELECT factor, description, weight, influence, comment FROM technical_factors WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
+            return config.FAILURE
         q.addBindValue(project_id)
 
         if not q.exec():
@@ -171,6 +238,7 @@ class TechnicalFactorsModel:
             category = self.categorize_influence(technicalFactor_data['influence'])
             self.factor_counts[category] += 1
             self.factor_results[technicalFactor_data['factor']] = round(technicalFactor_data['weight'] * technicalFactor_data['influence'],4)
+        q.finish()
         return config.SUCCESS
 
     def get_data(self, project_id):
@@ -187,9 +255,9 @@ class TechnicalFactorsModel:
         dict or int
             Dictionary containing technical factors data and summary, or failure code.
         """
-        query = QSqlQuery()
-        sql = "SELECT factor, description, weight, influence, comment FROM technical_factors WHERE project_id = ?"
-        if not query.prepare(sql):
+        sql = "SELECT factor, description, weight, influence, comment FROM technical_factors WHERE project_id = ? ORDER BY id"
+        query = StatementCache.get_query(sql)
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -207,6 +275,7 @@ class TechnicalFactorsModel:
                 'Result': result,
                 'Comment': query.value(4)
             })
+        query.finish()
         data = pd.DataFrame(results)
         total_result = data['Result'].sum()
         TFactor_row = pd.DataFrame([{
@@ -272,17 +341,15 @@ class TechnicalFactorsModel:
             ('T12','Provides direct access to third parties',1.0, 0, ''),
             ('T13','Special user training required',1.0, 0, '')
         ]
-        query = QSqlQuery()
-        for factor in factors:
-            sql = "INSERT INTO technical_factors (factor, description, weight, influence, comment, project_id) VALUES (?, ?, ?, ?, ?, ?)"
-            query.prepare(sql)
-            if not query.prepare(sql):
-                return config.FAILURE
-            for value in factor:
-                query.addBindValue(value)
-            query.addBindValue(project_id)
-            if not query.exec():
-                return config.FAILURE
+        sql = "INSERT INTO technical_factors (factor, description, weight, influence, comment, project_id) VALUES (?, ?, ?, ?, ?, ?)"
+        query = StatementCache.get_query(sql)
+        if query is None:
+            return config.FAILURE
+        for column in zip(*factors):
+            query.addBindValue(list(column))
+        query.addBindValue([project_id] * len(factors))
+        if not query.execBatch():
+            return config.FAILURE
         return config.SUCCESS
 
     def export_technical_factors_data(self, project_id):
@@ -300,10 +367,10 @@ class TechnicalFactorsModel:
             List of technical factors data, or failure code.
         """
         data = []
-        query = "SELECT * FROM technical_factors WHERE project_id = ?"
+        query = "SELECT * FROM technical_factors WHERE project_id = ? ORDER BY id"
 
-        q = QSqlQuery()
-        if not q.prepare(query):
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
 
@@ -313,6 +380,7 @@ class TechnicalFactorsModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
 
         return data
 
@@ -2,8 +2,10 @@
 # model/useCases_model.py
 
 import config
+from collections import Counter
 import pandas as pd
-from PySide6.QtSql import QSqlQuery
+import DataSource.database as db
+from DataSource.statement_cache import StatementCache
 
 class UseCasesModel:
     """
@@ -46,13 +48,14 @@ class UseCasesModel:
         transactions = use_case_data.get('transactions')
         comment = use_case_data.get('comment')
 
-        q_insert = QSqlQuery()
-        q_insert.prepare(
+        q_insert = StatementCache.get_query(
             """
             INSERT INTO use_cases (code, name, complexity, transactions, comment, project_id)
             VALUES (?,?,?,?,?,?)
             """
         )
+        if q_insert is None:
+            return config.FAILURE, None
         q_insert.addBindValue(code)
         q_insert.addBindValue(name)
         q_insert.addBindValue(complexity)
@@ -71,6 +74,51 @@ class UseCasesModel:
             else:
                 return config.FAILURE, None
 
+    def create_use_cases(self, use_cases_data, project_id):
+        """
+        Create several use cases in the database with a single batch execution.
+
+        Unlike create_use_case, the in-memory counters are not modified; they are rebuilt when the project is loaded.
+
+        Parameters
+        ----------
+        use_cases_data : list of dict
+            List of dictionaries containing the use cases data.
+        project_id : int
+            The ID of the project to which the use cases belong.
+
+        Returns
+        -------
+        int
+            Status code indicating the result of the operation.
+        """
+        if not use_cases_data:
+            return config.SUCCESS
+
+        q_insert = StatementCache.get_query(
+            """
+            INSERT INTO use_cases (code, name, complexity, transactions, comment, project_id)
+            VALUES (?,?,?,?,?,?)
+            """
+        )
+        if q_insert is None:
+            return config.FAILURE
+        q_insert.addBindValue([use_case.get('code') for use_case in use_cases_data])
+        q_insert.addBindValue([use_case.get('name') for use_case in use_cases_data])
+        q_insert.addBindValue([use_case.get('complexity') for use_case in use_cases_data])
+        q_insert.addBindValue([use_case.get('transactions') for use_case in use_cases_data])
+        q_insert.addBindValue([use_case.get('comment') for use_case in use_cases_data])
+        q_insert.addBindValue([project_id] * len(use_cases_data))
+
+        if q_insert.execBatch():
+            return config.SUCCESS
+        else:
+            lastError = q_insert.lastError().text().lower()
+            if "unique constraint" in lastError or "duplicate" in lastError:
+                return config.ALREADY_EXIST
+            else:
+                return config.FAILURE
+
     def update_use_case(self, old_data, new_data):
         """
         Updates an existing use case in the database.
@@ -95,14 +143,15 @@ class UseCasesModel:
         transactions = new_data.get('transactions')
         comment = new_data.get('comment')
 
-        q_update = QSqlQuery()
-        q_update.prepare(
+        q_update = StatementCache.get_query(
             """
             UPDATE use_cases
             SET code = ?, name = ?, complexity = ?, transactions = ?, comment = ?
             WHERE id = ?
             """
         )
+        if q_update is None:
+            return config.FAILURE
         q_update.addBindValue(code)
         q_update.addBindValue(name)
         q_update.addBindValue(new_complexity)
@@ -141,31 +190,47 @@ class UseCasesModel:
         tuple
             A tuple containing a status code indicating the result of the operation, and a list of missing IDs or None.
         """
-        missing_ids = []
-        successful_ids = []
+        # Deleted in chunks with a fixed number of placeholders, padded with NULLs, so a single prepared statement is reused
+        chunk_size = config.SQL_VARIABLE_LIMIT
+        sql = f"DELETE FROM use_cases WHERE id IN ({', '.join('?' * chunk_size)}) RETURNING id, complexity"
+        requested_ids = {int(useCase_id): useCase_id for useCase_id in use_cases_data}
+        ids = list(requested_ids)
+        deleted = {}
+
+        # Every chunk is deleted in one transaction, so a failure leaves the rows and the counters untouched
+        database = db.DataBase.get_instance()
+        if not database.transaction():
+            return config.FAILURE, None
 
-        for useCase_id, details in use_cases_data.items():
-            complexity = details['complexity']
-            query = QSqlQuery()
-            query.prepare("DELETE FROM use_cases WHERE id = ?")
-            query.addBindValue(useCase_id)
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            query = StatementCache.get_query(sql)
+            if query is None:
+                database.rollback()
+                return config.FAILURE, None
+            for useCase_id in chunk + [None] * (chunk_size - len(chunk)):
+                query.addBindValue(useCase_id)
 
             if not query.exec():
+                database.rollback()
                 return config.FAILURE, None
 
-            if query.numRowsAffected() == 0:
-                missing_ids.append(useCase_id)
+            while query.next():
+                deleted[query.value(0)] = query.value(1)
+            query.finish()
 
-            if query.numRowsAffected() > 0:
-                successful_ids.append(useCase_id)
-                self.update_counts_and_UUCW(complexity, increment=False)
+        if not database.commit():
+            database.rollback()
+            return config.FAILURE, None
 
+        for complexity, count in Counter(deleted.values()).items():
+            self.update_counts_and_UUCW(complexity, increment=False, count=count)
+
+        missing_ids = [useCase_id for key, useCase_id in requested_ids.items() if key not in deleted]
         if missing_ids:
             return config.NOT_EXIST, missing_ids
-        elif len(successful_ids) == len(use_cases_data):
-            return config.SUCCESS, None
         else:
-            return config.FAILURE, None
+            return config.SUCCESS, None
 
     def update_use_cases_weights(self, weights, project_id):
         """
@@ -189,9 +254,8 @@ class UseCasesModel:
         set_clauses = ["useCases_simple_weight = ?", "useCases_average_weight = ?", "useCases_complex_weight = ?"]
         values = [simple_weight, average_weight, complex_weight, project_id]
         query_str = "UPDATE parameters SET " + ", ".join(set_clauses) + " WHERE project_id = ?"
-        q_update = QSqlQuery()
-
-        if not q_update.prepare(query_str):
+        q_update = StatementCache.get_query(query_str)
+        if q_update is None:
             return config.FAILURE
 
         for value in values:
@@ -207,7 +271,7 @@ class UseCasesModel:
         else:
             return config.FAILURE
 
-    def update_counts_and_UUCW(self, complexity, increment=True):
+    def update_counts_and_UUCW(self, complexity, increment=True, count=1):
         """
         Updates the counts and UUCW based on the complexity.
 
@@ -217,11 +281,13 @@ class UseCasesModel:
             The complexity of the use case (Simple, Average, Complex).
         increment : bool, optional
             Whether to increment or decrement the count (default is True).
+        count : int, optional
+            Number of use cases to add or remove (default is 1).
         """
         if increment:
-            self.useCases_count[complexity] += 1
+            self.useCases_count[complexity] += count
         else:
-            self.useCases_count[complexity] -= 1
+            self.useCases_count[complexity] -= count
 
         self.useCases_UUCW[complexity] = round(self.useCases_count[complexity] * self.useCases_weights[complexity],4)
 
@@ -256,9 +322,10 @@ class UseCasesModel:
         if return_value == config.FAILURE:
             return config.FAILURE
 
-        q = QSqlQuery()
-        query = "SELECT id, code, name, complexity, transactions, comment FROM use_cases WHERE project_id = ?"
-        q.prepare(query)
+        query = "SELECT id, code, name, complexity, transactions, comment FROM use_cases WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
+            return config.FAILURE
         q.addBindValue(project_id)
 
         if not q.exec():
@@ -280,6 +347,7 @@ class UseCasesModel:
             }
             self.useCases.append(useCases_data)
             self.update_counts_and_UUCW(useCases_data['complexity'])
+        q.finish()
         return config.SUCCESS
 
     def load_use_cases_weights(self, project_id):
@@ -296,8 +364,8 @@ class UseCasesModel:
         int
             Status code indicating the result of the operation.
         """
-        q = QSqlQuery()
-        if not q.prepare("SELECT useCases_simple_weight, useCases_average_weight, useCases_complex_weight FROM parameters WHERE project_id = ?"):
+        q = StatementCache.get_query("SELECT useCases_simple_weight, useCases_average_weight, useCases_complex_weight FROM parameters WHERE project_id = ?")
+        if q is None:
             return config.FAILURE
 
         q.addBindValue(project_id)
@@ -308,6 +376,7 @@ class UseCasesModel:
             self.useCases_weights['Simple'] = q.value(0)
             self.useCases_weights['Average'] = q.value(1)
             self.useCases_weights['Complex'] = q.value(2)
+            q.finish()
             return config.SUCCESS
         else:
             return config.FAILURE
@@ -326,9 +395,9 @@ class UseCasesModel:
         dict or int
             A dictionary containing the use cases data and summary or failure code.
         """
-        query = QSqlQuery()
-        sql = "SELECT code, name, complexity, transactions, comment FROM use_cases WHERE project_id = ?"
-        if not query.prepare(sql):
+        sql = "SELECT code, name, complexity, transactions, comment FROM use_cases WHERE project_id = ? ORDER BY id"
+        query = StatementCache.get_query(sql)
+        if query is None:
             return config.FAILURE
 
         query.addBindValue(project_id)
@@ -344,6 +413,7 @@ class UseCasesModel:
                 'Transactions': query.value(3),
                 'Comment': query.value(4)
             })
+        query.finish()
 
         if results:
             data = pd.DataFrame(results)
@@ -403,9 +473,9 @@ class UseCasesModel:
             A list of use case data or failure code.
         """
         data = []
-        query = "SELECT * FROM use_cases WHERE project_id = ?"
-        q = QSqlQuery()
-        if not q.prepare(query):
+        query = "SELECT * FROM use_cases WHERE project_id = ? ORDER BY id"
+        q = StatementCache.get_query(query)
+        if q is None:
             return config.FAILURE
         q.addBindValue(project_id)
 
@@ -415,6 +485,7 @@ class UseCasesModel:
         while q.next():
             row = [q.value(i) for i in range(q.record().count())]
             data.append(row)
+        q.finish()
 
         return data
 
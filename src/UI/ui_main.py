@@ -20,8 +20,8 @@ from PySide6.QtWidgets import (QAbstractItemView, QAbstractScrollArea, QApplicat
     QHBoxLayout, QHeaderView, QLabel, QLayout,
     QLineEdit, QMainWindow, QPlainTextEdit, QPushButton,
     QRadioButton, QSizePolicy, QSpacerItem, QStackedWidget,
-    QTableWidget, QTableWidgetItem, QToolButton, QVBoxLayout,
-    QWidget)
+    QTableView, QTableWidget, QTableWidgetItem, QToolButton,
+    QVBoxLayout, QWidget)
 
 class Ui_Main(object):
     def setupUi(self, Main):
@@ -186,6 +186,14 @@ class Ui_Main(object):
 "QHeaderView::up-arrow {\n"
 "	image: url(:/resources/images/whiteUpArrow.png);\n"
 "}\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
+"}\n"
 "\n"
 "QScrollBar:vertical {\n"
 "	border: none;\n"
@@ -197,7 +205,8 @@ class Ui_Main(object):
 "QScrollBar::handle:vertical {\n"
 "	background: #9FF0FF;\n"
 "     min-height: 20px;\n"
-"     border-radius: 7px;\n"
+"     border-radius"
+                        ": 7px;\n"
 "}\n"
 "QScrollBar::add-line:vertical {\n"
 "	background: none;\n"
@@ -208,8 +217,7 @@ class Ui_Main(object):
 "	height: 0px;\n"
 "}\n"
 "\n"
-""
-                        "QScrollBar:horizontal {\n"
+"QScrollBar:horizontal {\n"
 "	border: none;\n"
 "	background: #3B4252;\n"
 "     height: 20px;\n"
@@ -596,8 +604,18 @@ class Ui_Main(object):
         self.comment_tableWidget.setFont(font)
         self.comment_tableWidget.viewport().setProperty("cursor", QCursor(Qt.CursorShape.PointingHandCursor))
         self.comment_tableWidget.setFocusPolicy(Qt.NoFocus)
-        self.comment_tableWidget.setStyleSheet(u"background-color:#22577A;\n"
-"border: none;")
+        self.comment_tableWidget.setStyleSheet(u"QTableWidget {\n"
+"    background-color:#22577A;\n"
+"    border: none;\n"
+"}\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
+"}")
         self.comment_tableWidget.setFrameShape(QFrame.NoFrame)
         self.comment_tableWidget.setLineWidth(0)
         self.comment_tableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -1057,20 +1075,41 @@ class Ui_Main(object):
 
         self.horizontalLayout_18.addItem(self.horizontalSpacer_6)
 
-        self.generateReport_PushButton = QPushButton(self.dashboard_Page)
-        self.generateReport_PushButton.setObjectName(u"generateReport_PushButton")
+        self.simulateEffort_PushButton = QPushButton(self.dashboard_Page)
+        self.simulateEffort_PushButton.setObjectName(u"simulateEffort_PushButton")
         sizePolicy8 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         sizePolicy8.setHorizontalStretch(0)
         sizePolicy8.setVerticalStretch(0)
+        sizePolicy8.setHeightForWidth(self.simulateEffort_PushButton.sizePolicy().hasHeightForWidth())
+        self.simulateEffort_PushButton.setSizePolicy(sizePolicy8)
+        self.simulateEffort_PushButton.setMinimumSize(QSize(0, 0))
+        self.simulateEffort_PushButton.setMaximumSize(QSize(16777215, 35))
+        self.simulateEffort_PushButton.setBaseSize(QSize(0, 0))
+        font15 = QFont()
+        font15.setFamilies([u"Arial"])
+        font15.setPointSize(14)
+        font15.setBold(False)
+        self.simulateEffort_PushButton.setFont(font15)
+        self.simulateEffort_PushButton.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.simulateEffort_PushButton.setFocusPolicy(Qt.NoFocus)
+        self.simulateEffort_PushButton.setStyleSheet(u"background-color:#27FFE5;\n"
+"color:#094646;\n"
+"padding: 6px 0px 6px 6px;\n"
+"")
+        icon16 = QIcon()
+        icon16.addFile(u":/resources/images/estimatedEffort.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.simulateEffort_PushButton.setIcon(icon16)
+        self.simulateEffort_PushButton.setIconSize(QSize(28, 28))
+
+        self.horizontalLayout_18.addWidget(self.simulateEffort_PushButton)
+
+        self.generateReport_PushButton = QPushButton(self.dashboard_Page)
+        self.generateReport_PushButton.setObjectName(u"generateReport_PushButton")
         sizePolicy8.setHeightForWidth(self.generateReport_PushButton.sizePolicy().hasHeightForWidth())
         self.generateReport_PushButton.setSizePolicy(sizePolicy8)
         self.generateReport_PushButton.setMinimumSize(QSize(0, 0))
         self.generateReport_PushButton.setMaximumSize(QSize(16777215, 35))
         self.generateReport_PushButton.setBaseSize(QSize(0, 0))
-        font15 = QFont()
-        font15.setFamilies([u"Arial"])
-        font15.setPointSize(14)
-        font15.setBold(False)
         self.generateReport_PushButton.setFont(font15)
         self.generateReport_PushButton.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.generateReport_PushButton.setFocusPolicy(Qt.NoFocus)
@@ -1078,9 +1117,9 @@ class Ui_Main(object):
 "color:#094646;\n"
 "padding: 6px 0px 6px 6px;\n"
 "")
-        icon16 = QIcon()
-        icon16.addFile(u":/resources/images/report.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
-        self.generateReport_PushButton.setIcon(icon16)
+        icon17 = QIcon()
+        icon17.addFile(u":/resources/images/report.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.generateReport_PushButton.setIcon(icon17)
         self.generateReport_PushButton.setIconSize(QSize(28, 28))
 
         self.horizontalLayout_18.addWidget(self.generateReport_PushButton)
@@ -1754,9 +1793,9 @@ class Ui_Main(object):
         self.editCF_Button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.editCF_Button.setFocusPolicy(Qt.NoFocus)
         self.editCF_Button.setStyleSheet(u"border: None;")
-        icon17 = QIcon()
-        icon17.addFile(u":/resources/images/edit.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
-        self.editCF_Button.setIcon(icon17)
+        icon18 = QIcon()
+        icon18.addFile(u":/resources/images/edit.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.editCF_Button.setIcon(icon18)
         self.editCF_Button.setIconSize(QSize(25, 25))
 
         self.gridLayout_15.addWidget(self.editCF_Button, 0, 3, 1, 1)
@@ -2095,9 +2134,7 @@ class Ui_Main(object):
         self.E_Button.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
         self.E_Button.setFocusPolicy(Qt.NoFocus)
         self.E_Button.setStyleSheet(u"border: None;")
-        icon18 = QIcon()
-        icon18.addFile(u":/resources/images/estimatedEffort.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
-        self.E_Button.setIcon(icon18)
+        self.E_Button.setIcon(icon16)
         self.E_Button.setIconSize(QSize(28, 28))
 
         self.gridLayout_14.addWidget(self.E_Button, 0, 0, 1, 1)
@@ -2453,34 +2490,15 @@ class Ui_Main(object):
         self.gridLayout_27.setHorizontalSpacing(0)
         self.gridLayout_27.setVerticalSpacing(12)
         self.gridLayout_27.setContentsMargins(20, 20, 20, 20)
-        self.actors_TableWidget = QTableWidget(self.widget_23)
-        if (self.actors_TableWidget.columnCount() < 6):
-            self.actors_TableWidget.setColumnCount(6)
-        __qtablewidgetitem33 = QTableWidgetItem()
-        self.actors_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem33)
-        __qtablewidgetitem34 = QTableWidgetItem()
-        __qtablewidgetitem34.setFont(font4);
-        self.actors_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem34)
-        __qtablewidgetitem35 = QTableWidgetItem()
-        __qtablewidgetitem35.setFont(font4);
-        self.actors_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem35)
-        __qtablewidgetitem36 = QTableWidgetItem()
-        __qtablewidgetitem36.setFont(font4);
-        self.actors_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem36)
-        __qtablewidgetitem37 = QTableWidgetItem()
-        __qtablewidgetitem37.setFont(font4);
-        self.actors_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem37)
-        __qtablewidgetitem38 = QTableWidgetItem()
-        __qtablewidgetitem38.setFont(font4);
-        self.actors_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem38)
-        self.actors_TableWidget.setObjectName(u"actors_TableWidget")
-        sizePolicy.setHeightForWidth(self.actors_TableWidget.sizePolicy().hasHeightForWidth())
-        self.actors_TableWidget.setSizePolicy(sizePolicy)
-        self.actors_TableWidget.setFont(font7)
-        self.actors_TableWidget.setMouseTracking(False)
-        self.actors_TableWidget.setFocusPolicy(Qt.NoFocus)
-        self.actors_TableWidget.setLayoutDirection(Qt.LeftToRight)
-        self.actors_TableWidget.setStyleSheet(u"QTableWidget{\n"
+        self.actors_TableView = QTableView(self.widget_23)
+        self.actors_TableView.setObjectName(u"actors_TableView")
+        sizePolicy.setHeightForWidth(self.actors_TableView.sizePolicy().hasHeightForWidth())
+        self.actors_TableView.setSizePolicy(sizePolicy)
+        self.actors_TableView.setFont(font7)
+        self.actors_TableView.setMouseTracking(False)
+        self.actors_TableView.setFocusPolicy(Qt.NoFocus)
+        self.actors_TableView.setLayoutDirection(Qt.LeftToRight)
+        self.actors_TableView.setStyleSheet(u"QTableView{\n"
 "    border:none;\n"
 "}\n"
 "\n"
@@ -2490,11 +2508,11 @@ class Ui_Main(object):
 "    height: 36px;\n"
 "}\n"
 "\n"
-"QTableWidget::Item{\n"
+"QTableView::item{\n"
 "    color: white;\n"
 "}\n"
 "\n"
-"QTableWidget::item:selected {\n"
+"QTableView::item:selected {\n"
 "    background-color: rgba(0,0,0,0.25);\n"
 "}\n"
 "\n"
@@ -2529,8 +2547,8 @@ class Ui_Main(object):
 "QScrollBar::handle:horizontal {\n"
 "	background: white;\n"
 "     min-width: 20px;\n"
-"  "
-                        "   border-radius: 7px;\n"
+"     bor"
+                        "der-radius: 7px;\n"
 "}\n"
 "QScrollBar::add-line:horizontal {\n"
 "	background: none;\n"
@@ -2539,42 +2557,50 @@ class Ui_Main(object):
 "QScrollBar::sub-line:horizontal {\n"
 "	background: none;\n"
 "	width: 0px;\n"
+"}\n"
+"\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
 "}")
-        self.actors_TableWidget.setFrameShape(QFrame.NoFrame)
-        self.actors_TableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.actors_TableWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.actors_TableWidget.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
-        self.actors_TableWidget.setAutoScroll(True)
-        self.actors_TableWidget.setAutoScrollMargin(0)
-        self.actors_TableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.actors_TableWidget.setTabKeyNavigation(True)
-        self.actors_TableWidget.setProperty("showDropIndicator", False)
-        self.actors_TableWidget.setDragEnabled(False)
-        self.actors_TableWidget.setDragDropOverwriteMode(False)
-        self.actors_TableWidget.setAlternatingRowColors(False)
-        self.actors_TableWidget.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.actors_TableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.actors_TableWidget.setTextElideMode(Qt.ElideRight)
-        self.actors_TableWidget.setShowGrid(False)
-        self.actors_TableWidget.setGridStyle(Qt.SolidLine)
-        self.actors_TableWidget.setSortingEnabled(True)
-        self.actors_TableWidget.setWordWrap(True)
-        self.actors_TableWidget.setCornerButtonEnabled(False)
-        self.actors_TableWidget.setRowCount(0)
-        self.actors_TableWidget.horizontalHeader().setCascadingSectionResizes(False)
-        self.actors_TableWidget.horizontalHeader().setMinimumSectionSize(100)
-        self.actors_TableWidget.horizontalHeader().setDefaultSectionSize(100)
-        self.actors_TableWidget.horizontalHeader().setHighlightSections(True)
-        self.actors_TableWidget.horizontalHeader().setProperty("showSortIndicator", True)
-        self.actors_TableWidget.horizontalHeader().setStretchLastSection(False)
-        self.actors_TableWidget.verticalHeader().setVisible(False)
-        self.actors_TableWidget.verticalHeader().setCascadingSectionResizes(False)
-        self.actors_TableWidget.verticalHeader().setMinimumSectionSize(0)
-        self.actors_TableWidget.verticalHeader().setDefaultSectionSize(45)
-        self.actors_TableWidget.verticalHeader().setHighlightSections(True)
-        self.actors_TableWidget.verticalHeader().setStretchLastSection(False)
-
-        self.gridLayout_27.addWidget(self.actors_TableWidget, 1, 0, 1, 1)
+        self.actors_TableView.setFrameShape(QFrame.NoFrame)
+        self.actors_TableView.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.actors_TableView.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.actors_TableView.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.actors_TableView.setAutoScroll(True)
+        self.actors_TableView.setAutoScrollMargin(0)
+        self.actors_TableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.actors_TableView.setTabKeyNavigation(True)
+        self.actors_TableView.setProperty("showDropIndicator", False)
+        self.actors_TableView.setDragEnabled(False)
+        self.actors_TableView.setDragDropOverwriteMode(False)
+        self.actors_TableView.setAlternatingRowColors(False)
+        self.actors_TableView.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.actors_TableView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.actors_TableView.setTextElideMode(Qt.ElideRight)
+        self.actors_TableView.setShowGrid(False)
+        self.actors_TableView.setGridStyle(Qt.SolidLine)
+        self.actors_TableView.setSortingEnabled(True)
+        self.actors_TableView.setWordWrap(True)
+        self.actors_TableView.setCornerButtonEnabled(False)
+        self.actors_TableView.horizontalHeader().setCascadingSectionResizes(False)
+        self.actors_TableView.horizontalHeader().setMinimumSectionSize(100)
+        self.actors_TableView.horizontalHeader().setDefaultSectionSize(100)
+        self.actors_TableView.horizontalHeader().setHighlightSections(True)
+        self.actors_TableView.horizontalHeader().setProperty("showSortIndicator", True)
+        self.actors_TableView.horizontalHeader().setStretchLastSection(False)
+        self.actors_TableView.verticalHeader().setVisible(False)
+        self.actors_TableView.verticalHeader().setCascadingSectionResizes(False)
+        self.actors_TableView.verticalHeader().setMinimumSectionSize(0)
+        self.actors_TableView.verticalHeader().setDefaultSectionSize(45)
+        self.actors_TableView.verticalHeader().setHighlightSections(True)
+        self.actors_TableView.verticalHeader().setStretchLastSection(False)
+
+        self.gridLayout_27.addWidget(self.actors_TableView, 1, 0, 1, 1)
 
         self.actorsSearch_LineEdit = QLineEdit(self.widget_23)
         self.actorsSearch_LineEdit.setObjectName(u"actorsSearch_LineEdit")
@@ -2692,7 +2718,7 @@ class Ui_Main(object):
 "color:#22577A;\n"
 "padding: 6px 0px 6px 6px;\n"
 "")
-        self.editActor_Button.setIcon(icon17)
+        self.editActor_Button.setIcon(icon18)
         self.editActor_Button.setIconSize(QSize(30, 30))
 
         self.verticalLayout_6.addWidget(self.editActor_Button)
@@ -2749,54 +2775,54 @@ class Ui_Main(object):
         self.actorsSummary_TableWidget = QTableWidget(self.widget_8)
         if (self.actorsSummary_TableWidget.columnCount() < 5):
             self.actorsSummary_TableWidget.setColumnCount(5)
-        __qtablewidgetitem39 = QTableWidgetItem()
-        __qtablewidgetitem39.setFont(font4);
-        __qtablewidgetitem39.setBackground(QColor(216, 216, 216));
-        self.actorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem39)
-        __qtablewidgetitem40 = QTableWidgetItem()
-        __qtablewidgetitem40.setFont(font4);
-        __qtablewidgetitem40.setBackground(QColor(217, 217, 217));
-        self.actorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem40)
-        __qtablewidgetitem41 = QTableWidgetItem()
-        __qtablewidgetitem41.setFont(font24);
-        __qtablewidgetitem41.setBackground(QColor(217, 217, 217));
-        __qtablewidgetitem41.setIcon(icon19);
-        self.actorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem41)
-        __qtablewidgetitem42 = QTableWidgetItem()
-        __qtablewidgetitem42.setFont(font4);
-        __qtablewidgetitem42.setBackground(QColor(217, 217, 217));
-        self.actorsSummary_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem42)
-        __qtablewidgetitem43 = QTableWidgetItem()
-        __qtablewidgetitem43.setFont(font4);
-        __qtablewidgetitem43.setBackground(QColor(217, 217, 217));
-        self.actorsSummary_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem43)
+        __qtablewidgetitem33 = QTableWidgetItem()
+        __qtablewidgetitem33.setFont(font4);
+        __qtablewidgetitem33.setBackground(QColor(216, 216, 216));
+        self.actorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem33)
+        __qtablewidgetitem34 = QTableWidgetItem()
+        __qtablewidgetitem34.setFont(font4);
+        __qtablewidgetitem34.setBackground(QColor(217, 217, 217));
+        self.actorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem34)
+        __qtablewidgetitem35 = QTableWidgetItem()
+        __qtablewidgetitem35.setFont(font24);
+        __qtablewidgetitem35.setBackground(QColor(217, 217, 217));
+        __qtablewidgetitem35.setIcon(icon19);
+        self.actorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem35)
+        __qtablewidgetitem36 = QTableWidgetItem()
+        __qtablewidgetitem36.setFont(font4);
+        __qtablewidgetitem36.setBackground(QColor(217, 217, 217));
+        self.actorsSummary_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem36)
+        __qtablewidgetitem37 = QTableWidgetItem()
+        __qtablewidgetitem37.setFont(font4);
+        __qtablewidgetitem37.setBackground(QColor(217, 217, 217));
+        self.actorsSummary_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem37)
         if (self.actorsSummary_TableWidget.rowCount() < 4):
             self.actorsSummary_TableWidget.setRowCount(4)
         brush10 = QBrush(QColor(0, 0, 0, 255))
         brush10.setStyle(Qt.NoBrush)
-        __qtablewidgetitem44 = QTableWidgetItem()
-        __qtablewidgetitem44.setBackground(QColor(0, 0, 0));
-        __qtablewidgetitem44.setForeground(brush10);
-        self.actorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem44)
+        __qtablewidgetitem38 = QTableWidgetItem()
+        __qtablewidgetitem38.setBackground(QColor(0, 0, 0));
+        __qtablewidgetitem38.setForeground(brush10);
+        self.actorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem38)
         brush11 = QBrush(QColor(0, 0, 0, 255))
         brush11.setStyle(Qt.NoBrush)
-        __qtablewidgetitem45 = QTableWidgetItem()
-        __qtablewidgetitem45.setForeground(brush11);
-        self.actorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem45)
-        __qtablewidgetitem46 = QTableWidgetItem()
-        self.actorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem46)
-        __qtablewidgetitem47 = QTableWidgetItem()
-        self.actorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem47)
+        __qtablewidgetitem39 = QTableWidgetItem()
+        __qtablewidgetitem39.setForeground(brush11);
+        self.actorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem39)
+        __qtablewidgetitem40 = QTableWidgetItem()
+        self.actorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem40)
+        __qtablewidgetitem41 = QTableWidgetItem()
+        self.actorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem41)
         brush12 = QBrush(QColor(0, 0, 0, 255))
         brush12.setStyle(Qt.NoBrush)
         brush13 = QBrush(QColor(152, 250, 197, 255))
         brush13.setStyle(Qt.SolidPattern)
-        __qtablewidgetitem48 = QTableWidgetItem()
-        __qtablewidgetitem48.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem48.setFont(font4);
-        __qtablewidgetitem48.setBackground(brush13);
-        __qtablewidgetitem48.setForeground(brush12);
-        self.actorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem48)
+        __qtablewidgetitem42 = QTableWidgetItem()
+        __qtablewidgetitem42.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem42.setFont(font4);
+        __qtablewidgetitem42.setBackground(brush13);
+        __qtablewidgetitem42.setForeground(brush12);
+        self.actorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem42)
         brush14 = QBrush(QColor(0, 0, 0, 255))
         brush14.setStyle(Qt.NoBrush)
         brush15 = QBrush(QColor(210, 255, 230, 255))
@@ -2808,105 +2834,105 @@ class Ui_Main(object):
         font28.setItalic(False)
         font28.setStrikeOut(False)
         font28.setKerning(True)
+        __qtablewidgetitem43 = QTableWidgetItem()
+        __qtablewidgetitem43.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem43.setFont(font28);
+        __qtablewidgetitem43.setBackground(brush15);
+        __qtablewidgetitem43.setForeground(brush14);
+        self.actorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem43)
+        __qtablewidgetitem44 = QTableWidgetItem()
+        __qtablewidgetitem44.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem44.setFont(font4);
+        __qtablewidgetitem44.setBackground(brush15);
+        self.actorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem44)
+        __qtablewidgetitem45 = QTableWidgetItem()
+        __qtablewidgetitem45.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem45.setFont(font4);
+        __qtablewidgetitem45.setBackground(brush15);
+        self.actorsSummary_TableWidget.setItem(0, 3, __qtablewidgetitem45)
+        __qtablewidgetitem46 = QTableWidgetItem()
+        __qtablewidgetitem46.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem46.setFont(font4);
+        __qtablewidgetitem46.setBackground(brush15);
+        self.actorsSummary_TableWidget.setItem(0, 4, __qtablewidgetitem46)
+        brush16 = QBrush(QColor(0, 0, 0, 255))
+        brush16.setStyle(Qt.NoBrush)
+        __qtablewidgetitem47 = QTableWidgetItem()
+        __qtablewidgetitem47.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem47.setFont(font25);
+        __qtablewidgetitem47.setBackground(brush5);
+        __qtablewidgetitem47.setForeground(brush16);
+        self.actorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem47)
+        brush17 = QBrush(QColor(0, 0, 0, 255))
+        brush17.setStyle(Qt.NoBrush)
+        brush18 = QBrush(QColor(255, 233, 191, 255))
+        brush18.setStyle(Qt.SolidPattern)
+        __qtablewidgetitem48 = QTableWidgetItem()
+        __qtablewidgetitem48.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem48.setFont(font9);
+        __qtablewidgetitem48.setBackground(brush18);
+        __qtablewidgetitem48.setForeground(brush17);
+        self.actorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem48)
         __qtablewidgetitem49 = QTableWidgetItem()
         __qtablewidgetitem49.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem49.setFont(font28);
-        __qtablewidgetitem49.setBackground(brush15);
-        __qtablewidgetitem49.setForeground(brush14);
-        self.actorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem49)
+        __qtablewidgetitem49.setFont(font4);
+        __qtablewidgetitem49.setBackground(brush18);
+        self.actorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem49)
         __qtablewidgetitem50 = QTableWidgetItem()
         __qtablewidgetitem50.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem50.setFont(font4);
-        __qtablewidgetitem50.setBackground(brush15);
-        self.actorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem50)
+        __qtablewidgetitem50.setBackground(brush18);
+        self.actorsSummary_TableWidget.setItem(1, 3, __qtablewidgetitem50)
         __qtablewidgetitem51 = QTableWidgetItem()
         __qtablewidgetitem51.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem51.setFont(font4);
-        __qtablewidgetitem51.setBackground(brush15);
-        self.actorsSummary_TableWidget.setItem(0, 3, __qtablewidgetitem51)
+        __qtablewidgetitem51.setBackground(brush18);
+        self.actorsSummary_TableWidget.setItem(1, 4, __qtablewidgetitem51)
+        brush19 = QBrush(QColor(243, 147, 147, 255))
+        brush19.setStyle(Qt.SolidPattern)
         __qtablewidgetitem52 = QTableWidgetItem()
         __qtablewidgetitem52.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem52.setFont(font4);
-        __qtablewidgetitem52.setBackground(brush15);
-        self.actorsSummary_TableWidget.setItem(0, 4, __qtablewidgetitem52)
-        brush16 = QBrush(QColor(0, 0, 0, 255))
-        brush16.setStyle(Qt.NoBrush)
+        __qtablewidgetitem52.setBackground(brush19);
+        self.actorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem52)
+        brush20 = QBrush(QColor(255, 201, 201, 255))
+        brush20.setStyle(Qt.SolidPattern)
         __qtablewidgetitem53 = QTableWidgetItem()
         __qtablewidgetitem53.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem53.setFont(font25);
-        __qtablewidgetitem53.setBackground(brush5);
-        __qtablewidgetitem53.setForeground(brush16);
-        self.actorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem53)
-        brush17 = QBrush(QColor(0, 0, 0, 255))
-        brush17.setStyle(Qt.NoBrush)
-        brush18 = QBrush(QColor(255, 233, 191, 255))
-        brush18.setStyle(Qt.SolidPattern)
+        __qtablewidgetitem53.setFont(font9);
+        __qtablewidgetitem53.setBackground(brush20);
+        self.actorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem53)
         __qtablewidgetitem54 = QTableWidgetItem()
         __qtablewidgetitem54.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem54.setFont(font9);
-        __qtablewidgetitem54.setBackground(brush18);
-        __qtablewidgetitem54.setForeground(brush17);
-        self.actorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem54)
+        __qtablewidgetitem54.setFont(font4);
+        __qtablewidgetitem54.setBackground(brush20);
+        self.actorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem54)
         __qtablewidgetitem55 = QTableWidgetItem()
         __qtablewidgetitem55.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem55.setFont(font4);
-        __qtablewidgetitem55.setBackground(brush18);
-        self.actorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem55)
+        __qtablewidgetitem55.setBackground(brush20);
+        self.actorsSummary_TableWidget.setItem(2, 3, __qtablewidgetitem55)
         __qtablewidgetitem56 = QTableWidgetItem()
         __qtablewidgetitem56.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem56.setFont(font4);
-        __qtablewidgetitem56.setBackground(brush18);
-        self.actorsSummary_TableWidget.setItem(1, 3, __qtablewidgetitem56)
+        __qtablewidgetitem56.setBackground(brush20);
+        self.actorsSummary_TableWidget.setItem(2, 4, __qtablewidgetitem56)
         __qtablewidgetitem57 = QTableWidgetItem()
         __qtablewidgetitem57.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem57.setFont(font4);
-        __qtablewidgetitem57.setBackground(brush18);
-        self.actorsSummary_TableWidget.setItem(1, 4, __qtablewidgetitem57)
-        brush19 = QBrush(QColor(243, 147, 147, 255))
-        brush19.setStyle(Qt.SolidPattern)
+        __qtablewidgetitem57.setFont(font6);
+        self.actorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem57)
         __qtablewidgetitem58 = QTableWidgetItem()
         __qtablewidgetitem58.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem58.setFont(font4);
-        __qtablewidgetitem58.setBackground(brush19);
-        self.actorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem58)
-        brush20 = QBrush(QColor(255, 201, 201, 255))
-        brush20.setStyle(Qt.SolidPattern)
+        __qtablewidgetitem58.setFont(font6);
+        self.actorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem58)
         __qtablewidgetitem59 = QTableWidgetItem()
-        __qtablewidgetitem59.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem59.setFont(font9);
-        __qtablewidgetitem59.setBackground(brush20);
-        self.actorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem59)
+        self.actorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem59)
         __qtablewidgetitem60 = QTableWidgetItem()
         __qtablewidgetitem60.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem60.setFont(font4);
-        __qtablewidgetitem60.setBackground(brush20);
-        self.actorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem60)
+        self.actorsSummary_TableWidget.setItem(3, 3, __qtablewidgetitem60)
         __qtablewidgetitem61 = QTableWidgetItem()
         __qtablewidgetitem61.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem61.setFont(font4);
-        __qtablewidgetitem61.setBackground(brush20);
-        self.actorsSummary_TableWidget.setItem(2, 3, __qtablewidgetitem61)
-        __qtablewidgetitem62 = QTableWidgetItem()
-        __qtablewidgetitem62.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem62.setFont(font4);
-        __qtablewidgetitem62.setBackground(brush20);
-        self.actorsSummary_TableWidget.setItem(2, 4, __qtablewidgetitem62)
-        __qtablewidgetitem63 = QTableWidgetItem()
-        __qtablewidgetitem63.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem63.setFont(font6);
-        self.actorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem63)
-        __qtablewidgetitem64 = QTableWidgetItem()
-        __qtablewidgetitem64.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem64.setFont(font6);
-        self.actorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem64)
-        __qtablewidgetitem65 = QTableWidgetItem()
-        self.actorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem65)
-        __qtablewidgetitem66 = QTableWidgetItem()
-        __qtablewidgetitem66.setTextAlignment(Qt.AlignCenter);
-        self.actorsSummary_TableWidget.setItem(3, 3, __qtablewidgetitem66)
-        __qtablewidgetitem67 = QTableWidgetItem()
-        __qtablewidgetitem67.setTextAlignment(Qt.AlignCenter);
-        self.actorsSummary_TableWidget.setItem(3, 4, __qtablewidgetitem67)
+        self.actorsSummary_TableWidget.setItem(3, 4, __qtablewidgetitem61)
         self.actorsSummary_TableWidget.setObjectName(u"actorsSummary_TableWidget")
         sizePolicy4.setHeightForWidth(self.actorsSummary_TableWidget.sizePolicy().hasHeightForWidth())
         self.actorsSummary_TableWidget.setSizePolicy(sizePolicy4)
@@ -3083,34 +3109,12 @@ class Ui_Main(object):
 
         self.gridLayout_41.addWidget(self.useCasesSearch_LineEdit, 0, 0, 1, 1)
 
-        self.useCases_TableWidget = QTableWidget(self.widget_10)
-        if (self.useCases_TableWidget.columnCount() < 7):
-            self.useCases_TableWidget.setColumnCount(7)
-        __qtablewidgetitem68 = QTableWidgetItem()
-        self.useCases_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem68)
-        __qtablewidgetitem69 = QTableWidgetItem()
-        __qtablewidgetitem69.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem69)
-        __qtablewidgetitem70 = QTableWidgetItem()
-        __qtablewidgetitem70.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem70)
-        __qtablewidgetitem71 = QTableWidgetItem()
-        __qtablewidgetitem71.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem71)
-        __qtablewidgetitem72 = QTableWidgetItem()
-        __qtablewidgetitem72.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem72)
-        __qtablewidgetitem73 = QTableWidgetItem()
-        __qtablewidgetitem73.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem73)
-        __qtablewidgetitem74 = QTableWidgetItem()
-        __qtablewidgetitem74.setFont(font4);
-        self.useCases_TableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem74)
-        self.useCases_TableWidget.setObjectName(u"useCases_TableWidget")
-        self.useCases_TableWidget.setMaximumSize(QSize(16777215, 16777215))
-        self.useCases_TableWidget.setFont(font7)
-        self.useCases_TableWidget.setFocusPolicy(Qt.NoFocus)
-        self.useCases_TableWidget.setStyleSheet(u"QTableWidget{\n"
+        self.useCases_TableView = QTableView(self.widget_10)
+        self.useCases_TableView.setObjectName(u"useCases_TableView")
+        self.useCases_TableView.setMaximumSize(QSize(16777215, 16777215))
+        self.useCases_TableView.setFont(font7)
+        self.useCases_TableView.setFocusPolicy(Qt.NoFocus)
+        self.useCases_TableView.setStyleSheet(u"QTableView{\n"
 "    border:none;\n"
 "}\n"
 "\n"
@@ -3120,11 +3124,11 @@ class Ui_Main(object):
 "    height: 35px;\n"
 "}\n"
 "\n"
-"QTableWidget::Item{\n"
+"QTableView::item{\n"
 "    color: white;\n"
 "}\n"
 "\n"
-"QTableWidget::item:selected {\n"
+"QTableView::item:selected {\n"
 "    background-color: rgba(0,0,0,0.25);\n"
 "}\n"
 "\n"
@@ -3159,8 +3163,8 @@ class Ui_Main(object):
 "QScrollBar::handle:horizontal {\n"
 "	background: white;\n"
 "     min-width: 20px;\n"
-"  "
-                        "   border-radius: 7px;\n"
+"     bor"
+                        "der-radius: 7px;\n"
 "}\n"
 "QScrollBar::add-line:horizontal {\n"
 "	background: none;\n"
@@ -3169,37 +3173,46 @@ class Ui_Main(object):
 "QScrollBar::sub-line:horizontal {\n"
 "	background: none;\n"
 "	width: 0px;\n"
+"}\n"
+"\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
 "}")
-        self.useCases_TableWidget.setFrameShape(QFrame.NoFrame)
-        self.useCases_TableWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.useCases_TableWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.useCases_TableWidget.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
-        self.useCases_TableWidget.setAutoScroll(True)
-        self.useCases_TableWidget.setAutoScrollMargin(0)
-        self.useCases_TableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.useCases_TableWidget.setTabKeyNavigation(True)
-        self.useCases_TableWidget.setProperty("showDropIndicator", False)
-        self.useCases_TableWidget.setDragEnabled(False)
-        self.useCases_TableWidget.setDragDropOverwriteMode(False)
-        self.useCases_TableWidget.setAlternatingRowColors(False)
-        self.useCases_TableWidget.setSelectionMode(QAbstractItemView.MultiSelection)
-        self.useCases_TableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.useCases_TableWidget.setTextElideMode(Qt.ElideRight)
-        self.useCases_TableWidget.setShowGrid(False)
-        self.useCases_TableWidget.setSortingEnabled(True)
-        self.useCases_TableWidget.setWordWrap(True)
-        self.useCases_TableWidget.setCornerButtonEnabled(False)
-        self.useCases_TableWidget.horizontalHeader().setMinimumSectionSize(100)
-        self.useCases_TableWidget.horizontalHeader().setDefaultSectionSize(100)
-        self.useCases_TableWidget.horizontalHeader().setHighlightSections(True)
-        self.useCases_TableWidget.horizontalHeader().setProperty("showSortIndicator", True)
-        self.useCases_TableWidget.horizontalHeader().setStretchLastSection(False)
-        self.useCases_TableWidget.verticalHeader().setVisible(False)
-        self.useCases_TableWidget.verticalHeader().setMinimumSectionSize(0)
-        self.useCases_TableWidget.verticalHeader().setDefaultSectionSize(45)
-        self.useCases_TableWidget.verticalHeader().setHighlightSections(True)
-
-        self.gridLayout_41.addWidget(self.useCases_TableWidget, 1, 0, 1, 1)
+        self.useCases_TableView.setFrameShape(QFrame.NoFrame)
+        self.useCases_TableView.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.useCases_TableView.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.useCases_TableView.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.useCases_TableView.setAutoScroll(True)
+        self.useCases_TableView.setAutoScrollMargin(0)
+        self.useCases_TableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.useCases_TableView.setTabKeyNavigation(True)
+        self.useCases_TableView.setProperty("showDropIndicator", False)
+        self.useCases_TableView.setDragEnabled(False)
+        self.useCases_TableView.setDragDropOverwriteMode(False)
+        self.useCases_TableView.setAlternatingRowColors(False)
+        self.useCases_TableView.setSelectionMode(QAbstractItemView.MultiSelection)
+        self.useCases_TableView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.useCases_TableView.setTextElideMode(Qt.ElideRight)
+        self.useCases_TableView.setShowGrid(False)
+        self.useCases_TableView.setSortingEnabled(True)
+        self.useCases_TableView.setWordWrap(True)
+        self.useCases_TableView.setCornerButtonEnabled(False)
+        self.useCases_TableView.horizontalHeader().setMinimumSectionSize(100)
+        self.useCases_TableView.horizontalHeader().setDefaultSectionSize(100)
+        self.useCases_TableView.horizontalHeader().setHighlightSections(True)
+        self.useCases_TableView.horizontalHeader().setProperty("showSortIndicator", True)
+        self.useCases_TableView.horizontalHeader().setStretchLastSection(False)
+        self.useCases_TableView.verticalHeader().setVisible(False)
+        self.useCases_TableView.verticalHeader().setMinimumSectionSize(0)
+        self.useCases_TableView.verticalHeader().setDefaultSectionSize(45)
+        self.useCases_TableView.verticalHeader().setHighlightSections(True)
+
+        self.gridLayout_41.addWidget(self.useCases_TableView, 1, 0, 1, 1)
 
 
         self.gridLayout_42.addWidget(self.widget_10, 1, 0, 1, 1)
@@ -3291,7 +3304,7 @@ class Ui_Main(object):
 "color:#22577A;\n"
 "padding: 6px 0px 6px 6px;\n"
 "")
-        self.editUseCase_Button.setIcon(icon17)
+        self.editUseCase_Button.setIcon(icon18)
         self.editUseCase_Button.setIconSize(QSize(30, 30))
 
         self.verticalLayout_7.addWidget(self.editUseCase_Button)
@@ -3386,147 +3399,147 @@ class Ui_Main(object):
         self.useCasesSummary_TableWidget = QTableWidget(self.widget_9)
         if (self.useCasesSummary_TableWidget.columnCount() < 5):
             self.useCasesSummary_TableWidget.setColumnCount(5)
+        __qtablewidgetitem62 = QTableWidgetItem()
+        __qtablewidgetitem62.setFont(font4);
+        __qtablewidgetitem62.setBackground(QColor(216, 216, 216));
+        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem62)
+        __qtablewidgetitem63 = QTableWidgetItem()
+        __qtablewidgetitem63.setFont(font4);
+        __qtablewidgetitem63.setBackground(QColor(217, 217, 217));
+        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem63)
+        __qtablewidgetitem64 = QTableWidgetItem()
+        __qtablewidgetitem64.setFont(font24);
+        __qtablewidgetitem64.setBackground(QColor(217, 217, 217));
+        __qtablewidgetitem64.setIcon(icon19);
+        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem64)
+        __qtablewidgetitem65 = QTableWidgetItem()
+        __qtablewidgetitem65.setFont(font4);
+        __qtablewidgetitem65.setBackground(QColor(217, 217, 217));
+        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem65)
+        __qtablewidgetitem66 = QTableWidgetItem()
+        __qtablewidgetitem66.setFont(font4);
+        __qtablewidgetitem66.setBackground(QColor(217, 217, 217));
+        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem66)
+        if (self.useCasesSummary_TableWidget.rowCount() < 4):
+            self.useCasesSummary_TableWidget.setRowCount(4)
+        brush21 = QBrush(QColor(0, 0, 0, 255))
+        brush21.setStyle(Qt.NoBrush)
+        __qtablewidgetitem67 = QTableWidgetItem()
+        __qtablewidgetitem67.setBackground(QColor(0, 0, 0));
+        __qtablewidgetitem67.setForeground(brush21);
+        self.useCasesSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem67)
+        brush22 = QBrush(QColor(0, 0, 0, 255))
+        brush22.setStyle(Qt.NoBrush)
+        __qtablewidgetitem68 = QTableWidgetItem()
+        __qtablewidgetitem68.setForeground(brush22);
+        self.useCasesSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem68)
+        __qtablewidgetitem69 = QTableWidgetItem()
+        self.useCasesSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem69)
+        __qtablewidgetitem70 = QTableWidgetItem()
+        self.useCasesSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem70)
+        brush23 = QBrush(QColor(0, 0, 0, 255))
+        brush23.setStyle(Qt.NoBrush)
+        __qtablewidgetitem71 = QTableWidgetItem()
+        __qtablewidgetitem71.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem71.setFont(font4);
+        __qtablewidgetitem71.setBackground(brush13);
+        __qtablewidgetitem71.setForeground(brush23);
+        self.useCasesSummary_TableWidget.setItem(0, 0, __qtablewidgetitem71)
+        brush24 = QBrush(QColor(0, 0, 0, 255))
+        brush24.setStyle(Qt.NoBrush)
+        __qtablewidgetitem72 = QTableWidgetItem()
+        __qtablewidgetitem72.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem72.setFont(font28);
+        __qtablewidgetitem72.setBackground(brush15);
+        __qtablewidgetitem72.setForeground(brush24);
+        self.useCasesSummary_TableWidget.setItem(0, 1, __qtablewidgetitem72)
+        __qtablewidgetitem73 = QTableWidgetItem()
+        __qtablewidgetitem73.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem73.setFont(font4);
+        __qtablewidgetitem73.setBackground(brush15);
+        self.useCasesSummary_TableWidget.setItem(0, 2, __qtablewidgetitem73)
+        __qtablewidgetitem74 = QTableWidgetItem()
+        __qtablewidgetitem74.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem74.setFont(font4);
+        __qtablewidgetitem74.setBackground(brush15);
+        self.useCasesSummary_TableWidget.setItem(0, 3, __qtablewidgetitem74)
         __qtablewidgetitem75 = QTableWidgetItem()
+        __qtablewidgetitem75.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem75.setFont(font4);
-        __qtablewidgetitem75.setBackground(QColor(216, 216, 216));
-        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem75)
+        __qtablewidgetitem75.setBackground(brush15);
+        self.useCasesSummary_TableWidget.setItem(0, 4, __qtablewidgetitem75)
+        brush25 = QBrush(QColor(0, 0, 0, 255))
+        brush25.setStyle(Qt.NoBrush)
         __qtablewidgetitem76 = QTableWidgetItem()
-        __qtablewidgetitem76.setFont(font4);
-        __qtablewidgetitem76.setBackground(QColor(217, 217, 217));
-        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem76)
+        __qtablewidgetitem76.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem76.setFont(font25);
+        __qtablewidgetitem76.setBackground(brush5);
+        __qtablewidgetitem76.setForeground(brush25);
+        self.useCasesSummary_TableWidget.setItem(1, 0, __qtablewidgetitem76)
+        brush26 = QBrush(QColor(0, 0, 0, 255))
+        brush26.setStyle(Qt.NoBrush)
         __qtablewidgetitem77 = QTableWidgetItem()
-        __qtablewidgetitem77.setFont(font24);
-        __qtablewidgetitem77.setBackground(QColor(217, 217, 217));
-        __qtablewidgetitem77.setIcon(icon19);
-        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem77)
+        __qtablewidgetitem77.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem77.setFont(font9);
+        __qtablewidgetitem77.setBackground(brush18);
+        __qtablewidgetitem77.setForeground(brush26);
+        self.useCasesSummary_TableWidget.setItem(1, 1, __qtablewidgetitem77)
         __qtablewidgetitem78 = QTableWidgetItem()
+        __qtablewidgetitem78.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem78.setFont(font4);
-        __qtablewidgetitem78.setBackground(QColor(217, 217, 217));
-        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem78)
+        __qtablewidgetitem78.setBackground(brush18);
+        self.useCasesSummary_TableWidget.setItem(1, 2, __qtablewidgetitem78)
         __qtablewidgetitem79 = QTableWidgetItem()
+        __qtablewidgetitem79.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem79.setFont(font4);
-        __qtablewidgetitem79.setBackground(QColor(217, 217, 217));
-        self.useCasesSummary_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem79)
-        if (self.useCasesSummary_TableWidget.rowCount() < 4):
-            self.useCasesSummary_TableWidget.setRowCount(4)
-        brush21 = QBrush(QColor(0, 0, 0, 255))
-        brush21.setStyle(Qt.NoBrush)
+        __qtablewidgetitem79.setBackground(brush18);
+        self.useCasesSummary_TableWidget.setItem(1, 3, __qtablewidgetitem79)
         __qtablewidgetitem80 = QTableWidgetItem()
-        __qtablewidgetitem80.setBackground(QColor(0, 0, 0));
-        __qtablewidgetitem80.setForeground(brush21);
-        self.useCasesSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem80)
-        brush22 = QBrush(QColor(0, 0, 0, 255))
-        brush22.setStyle(Qt.NoBrush)
+        __qtablewidgetitem80.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem80.setFont(font4);
+        __qtablewidgetitem80.setBackground(brush18);
+        self.useCasesSummary_TableWidget.setItem(1, 4, __qtablewidgetitem80)
         __qtablewidgetitem81 = QTableWidgetItem()
-        __qtablewidgetitem81.setForeground(brush22);
-        self.useCasesSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem81)
+        __qtablewidgetitem81.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem81.setFont(font4);
+        __qtablewidgetitem81.setBackground(brush19);
+        self.useCasesSummary_TableWidget.setItem(2, 0, __qtablewidgetitem81)
         __qtablewidgetitem82 = QTableWidgetItem()
-        self.useCasesSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem82)
+        __qtablewidgetitem82.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem82.setFont(font9);
+        __qtablewidgetitem82.setBackground(brush20);
+        self.useCasesSummary_TableWidget.setItem(2, 1, __qtablewidgetitem82)
         __qtablewidgetitem83 = QTableWidgetItem()
-        self.useCasesSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem83)
-        brush23 = QBrush(QColor(0, 0, 0, 255))
-        brush23.setStyle(Qt.NoBrush)
+        __qtablewidgetitem83.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem83.setFont(font4);
+        __qtablewidgetitem83.setBackground(brush20);
+        self.useCasesSummary_TableWidget.setItem(2, 2, __qtablewidgetitem83)
         __qtablewidgetitem84 = QTableWidgetItem()
         __qtablewidgetitem84.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem84.setFont(font4);
-        __qtablewidgetitem84.setBackground(brush13);
-        __qtablewidgetitem84.setForeground(brush23);
-        self.useCasesSummary_TableWidget.setItem(0, 0, __qtablewidgetitem84)
-        brush24 = QBrush(QColor(0, 0, 0, 255))
-        brush24.setStyle(Qt.NoBrush)
+        __qtablewidgetitem84.setBackground(brush20);
+        self.useCasesSummary_TableWidget.setItem(2, 3, __qtablewidgetitem84)
         __qtablewidgetitem85 = QTableWidgetItem()
         __qtablewidgetitem85.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem85.setFont(font28);
-        __qtablewidgetitem85.setBackground(brush15);
-        __qtablewidgetitem85.setForeground(brush24);
-        self.useCasesSummary_TableWidget.setItem(0, 1, __qtablewidgetitem85)
+        __qtablewidgetitem85.setFont(font4);
+        __qtablewidgetitem85.setBackground(brush20);
+        self.useCasesSummary_TableWidget.setItem(2, 4, __qtablewidgetitem85)
         __qtablewidgetitem86 = QTableWidgetItem()
         __qtablewidgetitem86.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem86.setFont(font4);
-        __qtablewidgetitem86.setBackground(brush15);
-        self.useCasesSummary_TableWidget.setItem(0, 2, __qtablewidgetitem86)
+        __qtablewidgetitem86.setFont(font6);
+        self.useCasesSummary_TableWidget.setItem(3, 0, __qtablewidgetitem86)
         __qtablewidgetitem87 = QTableWidgetItem()
         __qtablewidgetitem87.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem87.setFont(font4);
-        __qtablewidgetitem87.setBackground(brush15);
-        self.useCasesSummary_TableWidget.setItem(0, 3, __qtablewidgetitem87)
+        __qtablewidgetitem87.setFont(font6);
+        self.useCasesSummary_TableWidget.setItem(3, 1, __qtablewidgetitem87)
         __qtablewidgetitem88 = QTableWidgetItem()
-        __qtablewidgetitem88.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem88.setFont(font4);
-        __qtablewidgetitem88.setBackground(brush15);
-        self.useCasesSummary_TableWidget.setItem(0, 4, __qtablewidgetitem88)
-        brush25 = QBrush(QColor(0, 0, 0, 255))
-        brush25.setStyle(Qt.NoBrush)
+        self.useCasesSummary_TableWidget.setItem(3, 2, __qtablewidgetitem88)
         __qtablewidgetitem89 = QTableWidgetItem()
         __qtablewidgetitem89.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem89.setFont(font25);
-        __qtablewidgetitem89.setBackground(brush5);
-        __qtablewidgetitem89.setForeground(brush25);
-        self.useCasesSummary_TableWidget.setItem(1, 0, __qtablewidgetitem89)
-        brush26 = QBrush(QColor(0, 0, 0, 255))
-        brush26.setStyle(Qt.NoBrush)
+        self.useCasesSummary_TableWidget.setItem(3, 3, __qtablewidgetitem89)
         __qtablewidgetitem90 = QTableWidgetItem()
         __qtablewidgetitem90.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem90.setFont(font9);
-        __qtablewidgetitem90.setBackground(brush18);
-        __qtablewidgetitem90.setForeground(brush26);
-        self.useCasesSummary_TableWidget.setItem(1, 1, __qtablewidgetitem90)
-        __qtablewidgetitem91 = QTableWidgetItem()
-        __qtablewidgetitem91.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem91.setFont(font4);
-        __qtablewidgetitem91.setBackground(brush18);
-        self.useCasesSummary_TableWidget.setItem(1, 2, __qtablewidgetitem91)
-        __qtablewidgetitem92 = QTableWidgetItem()
-        __qtablewidgetitem92.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem92.setFont(font4);
-        __qtablewidgetitem92.setBackground(brush18);
-        self.useCasesSummary_TableWidget.setItem(1, 3, __qtablewidgetitem92)
-        __qtablewidgetitem93 = QTableWidgetItem()
-        __qtablewidgetitem93.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem93.setFont(font4);
-        __qtablewidgetitem93.setBackground(brush18);
-        self.useCasesSummary_TableWidget.setItem(1, 4, __qtablewidgetitem93)
-        __qtablewidgetitem94 = QTableWidgetItem()
-        __qtablewidgetitem94.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem94.setFont(font4);
-        __qtablewidgetitem94.setBackground(brush19);
-        self.useCasesSummary_TableWidget.setItem(2, 0, __qtablewidgetitem94)
-        __qtablewidgetitem95 = QTableWidgetItem()
-        __qtablewidgetitem95.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem95.setFont(font9);
-        __qtablewidgetitem95.setBackground(brush20);
-        self.useCasesSummary_TableWidget.setItem(2, 1, __qtablewidgetitem95)
-        __qtablewidgetitem96 = QTableWidgetItem()
-        __qtablewidgetitem96.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem96.setFont(font4);
-        __qtablewidgetitem96.setBackground(brush20);
-        self.useCasesSummary_TableWidget.setItem(2, 2, __qtablewidgetitem96)
-        __qtablewidgetitem97 = QTableWidgetItem()
-        __qtablewidgetitem97.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem97.setFont(font4);
-        __qtablewidgetitem97.setBackground(brush20);
-        self.useCasesSummary_TableWidget.setItem(2, 3, __qtablewidgetitem97)
-        __qtablewidgetitem98 = QTableWidgetItem()
-        __qtablewidgetitem98.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem98.setFont(font4);
-        __qtablewidgetitem98.setBackground(brush20);
-        self.useCasesSummary_TableWidget.setItem(2, 4, __qtablewidgetitem98)
-        __qtablewidgetitem99 = QTableWidgetItem()
-        __qtablewidgetitem99.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem99.setFont(font6);
-        self.useCasesSummary_TableWidget.setItem(3, 0, __qtablewidgetitem99)
-        __qtablewidgetitem100 = QTableWidgetItem()
-        __qtablewidgetitem100.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem100.setFont(font6);
-        self.useCasesSummary_TableWidget.setItem(3, 1, __qtablewidgetitem100)
-        __qtablewidgetitem101 = QTableWidgetItem()
-        self.useCasesSummary_TableWidget.setItem(3, 2, __qtablewidgetitem101)
-        __qtablewidgetitem102 = QTableWidgetItem()
-        __qtablewidgetitem102.setTextAlignment(Qt.AlignCenter);
-        self.useCasesSummary_TableWidget.setItem(3, 3, __qtablewidgetitem102)
-        __qtablewidgetitem103 = QTableWidgetItem()
-        __qtablewidgetitem103.setTextAlignment(Qt.AlignCenter);
-        self.useCasesSummary_TableWidget.setItem(3, 4, __qtablewidgetitem103)
+        self.useCasesSummary_TableWidget.setItem(3, 4, __qtablewidgetitem90)
         self.useCasesSummary_TableWidget.setObjectName(u"useCasesSummary_TableWidget")
         sizePolicy7.setHeightForWidth(self.useCasesSummary_TableWidget.sizePolicy().hasHeightForWidth())
         self.useCasesSummary_TableWidget.setSizePolicy(sizePolicy7)
@@ -3658,380 +3671,380 @@ class Ui_Main(object):
         self.technicalFactors_TableWidget = QTableWidget(self.widget_26)
         if (self.technicalFactors_TableWidget.columnCount() < 7):
             self.technicalFactors_TableWidget.setColumnCount(7)
+        __qtablewidgetitem91 = QTableWidgetItem()
+        __qtablewidgetitem91.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem91)
+        __qtablewidgetitem92 = QTableWidgetItem()
+        __qtablewidgetitem92.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem92)
+        __qtablewidgetitem93 = QTableWidgetItem()
+        __qtablewidgetitem93.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem93)
+        __qtablewidgetitem94 = QTableWidgetItem()
+        __qtablewidgetitem94.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem94)
+        __qtablewidgetitem95 = QTableWidgetItem()
+        __qtablewidgetitem95.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem95)
+        __qtablewidgetitem96 = QTableWidgetItem()
+        __qtablewidgetitem96.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem96)
+        __qtablewidgetitem97 = QTableWidgetItem()
+        __qtablewidgetitem97.setFont(font9);
+        self.technicalFactors_TableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem97)
+        if (self.technicalFactors_TableWidget.rowCount() < 14):
+            self.technicalFactors_TableWidget.setRowCount(14)
+        __qtablewidgetitem98 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem98)
+        __qtablewidgetitem99 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem99)
+        __qtablewidgetitem100 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem100)
+        __qtablewidgetitem101 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem101)
+        __qtablewidgetitem102 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(4, __qtablewidgetitem102)
+        __qtablewidgetitem103 = QTableWidgetItem()
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(5, __qtablewidgetitem103)
         __qtablewidgetitem104 = QTableWidgetItem()
-        __qtablewidgetitem104.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem104)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(6, __qtablewidgetitem104)
         __qtablewidgetitem105 = QTableWidgetItem()
-        __qtablewidgetitem105.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem105)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(7, __qtablewidgetitem105)
         __qtablewidgetitem106 = QTableWidgetItem()
-        __qtablewidgetitem106.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem106)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(8, __qtablewidgetitem106)
         __qtablewidgetitem107 = QTableWidgetItem()
-        __qtablewidgetitem107.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem107)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(9, __qtablewidgetitem107)
         __qtablewidgetitem108 = QTableWidgetItem()
-        __qtablewidgetitem108.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem108)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(10, __qtablewidgetitem108)
         __qtablewidgetitem109 = QTableWidgetItem()
-        __qtablewidgetitem109.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem109)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(11, __qtablewidgetitem109)
         __qtablewidgetitem110 = QTableWidgetItem()
-        __qtablewidgetitem110.setFont(font9);
-        self.technicalFactors_TableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem110)
-        if (self.technicalFactors_TableWidget.rowCount() < 14):
-            self.technicalFactors_TableWidget.setRowCount(14)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(12, __qtablewidgetitem110)
         __qtablewidgetitem111 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem111)
+        self.technicalFactors_TableWidget.setVerticalHeaderItem(13, __qtablewidgetitem111)
+        brush27 = QBrush(QColor(0, 0, 0, 255))
+        brush27.setStyle(Qt.NoBrush)
+        brush28 = QBrush(QColor(222, 255, 250, 255))
+        brush28.setStyle(Qt.SolidPattern)
         __qtablewidgetitem112 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem112)
+        __qtablewidgetitem112.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem112.setBackground(brush28);
+        __qtablewidgetitem112.setForeground(brush27);
+        self.technicalFactors_TableWidget.setItem(0, 1, __qtablewidgetitem112)
         __qtablewidgetitem113 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem113)
+        __qtablewidgetitem113.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem113.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(0, 2, __qtablewidgetitem113)
         __qtablewidgetitem114 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem114)
+        __qtablewidgetitem114.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem114.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(0, 3, __qtablewidgetitem114)
         __qtablewidgetitem115 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(4, __qtablewidgetitem115)
+        __qtablewidgetitem115.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem115.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(0, 4, __qtablewidgetitem115)
         __qtablewidgetitem116 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(5, __qtablewidgetitem116)
+        __qtablewidgetitem116.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem116.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(0, 5, __qtablewidgetitem116)
         __qtablewidgetitem117 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(6, __qtablewidgetitem117)
+        __qtablewidgetitem117.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem117.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(0, 6, __qtablewidgetitem117)
         __qtablewidgetitem118 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(7, __qtablewidgetitem118)
+        __qtablewidgetitem118.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem118.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 1, __qtablewidgetitem118)
         __qtablewidgetitem119 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(8, __qtablewidgetitem119)
+        __qtablewidgetitem119.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem119.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 2, __qtablewidgetitem119)
         __qtablewidgetitem120 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(9, __qtablewidgetitem120)
+        __qtablewidgetitem120.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem120.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 3, __qtablewidgetitem120)
         __qtablewidgetitem121 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(10, __qtablewidgetitem121)
+        __qtablewidgetitem121.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem121.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 4, __qtablewidgetitem121)
         __qtablewidgetitem122 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(11, __qtablewidgetitem122)
+        __qtablewidgetitem122.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem122.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 5, __qtablewidgetitem122)
         __qtablewidgetitem123 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(12, __qtablewidgetitem123)
+        __qtablewidgetitem123.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem123.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(1, 6, __qtablewidgetitem123)
         __qtablewidgetitem124 = QTableWidgetItem()
-        self.technicalFactors_TableWidget.setVerticalHeaderItem(13, __qtablewidgetitem124)
-        brush27 = QBrush(QColor(0, 0, 0, 255))
-        brush27.setStyle(Qt.NoBrush)
-        brush28 = QBrush(QColor(222, 255, 250, 255))
-        brush28.setStyle(Qt.SolidPattern)
+        __qtablewidgetitem124.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem124.setBackground(brush28);
+        self.technicalFactors_TableWidget.setItem(2, 1, __qtablewidgetitem124)
         __qtablewidgetitem125 = QTableWidgetItem()
         __qtablewidgetitem125.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem125.setBackground(brush28);
-        __qtablewidgetitem125.setForeground(brush27);
-        self.technicalFactors_TableWidget.setItem(0, 1, __qtablewidgetitem125)
+        self.technicalFactors_TableWidget.setItem(2, 2, __qtablewidgetitem125)
         __qtablewidgetitem126 = QTableWidgetItem()
         __qtablewidgetitem126.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem126.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(0, 2, __qtablewidgetitem126)
+        self.technicalFactors_TableWidget.setItem(2, 3, __qtablewidgetitem126)
         __qtablewidgetitem127 = QTableWidgetItem()
         __qtablewidgetitem127.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem127.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(0, 3, __qtablewidgetitem127)
+        self.technicalFactors_TableWidget.setItem(2, 4, __qtablewidgetitem127)
         __qtablewidgetitem128 = QTableWidgetItem()
         __qtablewidgetitem128.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem128.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(0, 4, __qtablewidgetitem128)
+        self.technicalFactors_TableWidget.setItem(2, 5, __qtablewidgetitem128)
         __qtablewidgetitem129 = QTableWidgetItem()
         __qtablewidgetitem129.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem129.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(0, 5, __qtablewidgetitem129)
+        self.technicalFactors_TableWidget.setItem(2, 6, __qtablewidgetitem129)
         __qtablewidgetitem130 = QTableWidgetItem()
         __qtablewidgetitem130.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem130.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(0, 6, __qtablewidgetitem130)
+        self.technicalFactors_TableWidget.setItem(3, 1, __qtablewidgetitem130)
         __qtablewidgetitem131 = QTableWidgetItem()
         __qtablewidgetitem131.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem131.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 1, __qtablewidgetitem131)
+        self.technicalFactors_TableWidget.setItem(3, 2, __qtablewidgetitem131)
         __qtablewidgetitem132 = QTableWidgetItem()
         __qtablewidgetitem132.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem132.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 2, __qtablewidgetitem132)
+        self.technicalFactors_TableWidget.setItem(3, 3, __qtablewidgetitem132)
         __qtablewidgetitem133 = QTableWidgetItem()
         __qtablewidgetitem133.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem133.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 3, __qtablewidgetitem133)
+        self.technicalFactors_TableWidget.setItem(3, 4, __qtablewidgetitem133)
         __qtablewidgetitem134 = QTableWidgetItem()
         __qtablewidgetitem134.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem134.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 4, __qtablewidgetitem134)
+        self.technicalFactors_TableWidget.setItem(3, 5, __qtablewidgetitem134)
         __qtablewidgetitem135 = QTableWidgetItem()
         __qtablewidgetitem135.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem135.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 5, __qtablewidgetitem135)
+        self.technicalFactors_TableWidget.setItem(3, 6, __qtablewidgetitem135)
         __qtablewidgetitem136 = QTableWidgetItem()
         __qtablewidgetitem136.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem136.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(1, 6, __qtablewidgetitem136)
+        self.technicalFactors_TableWidget.setItem(4, 1, __qtablewidgetitem136)
         __qtablewidgetitem137 = QTableWidgetItem()
         __qtablewidgetitem137.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem137.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 1, __qtablewidgetitem137)
+        self.technicalFactors_TableWidget.setItem(4, 2, __qtablewidgetitem137)
         __qtablewidgetitem138 = QTableWidgetItem()
         __qtablewidgetitem138.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem138.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 2, __qtablewidgetitem138)
+        self.technicalFactors_TableWidget.setItem(4, 3, __qtablewidgetitem138)
         __qtablewidgetitem139 = QTableWidgetItem()
         __qtablewidgetitem139.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem139.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 3, __qtablewidgetitem139)
+        self.technicalFactors_TableWidget.setItem(4, 4, __qtablewidgetitem139)
         __qtablewidgetitem140 = QTableWidgetItem()
         __qtablewidgetitem140.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem140.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 4, __qtablewidgetitem140)
+        self.technicalFactors_TableWidget.setItem(4, 5, __qtablewidgetitem140)
         __qtablewidgetitem141 = QTableWidgetItem()
         __qtablewidgetitem141.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem141.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 5, __qtablewidgetitem141)
+        self.technicalFactors_TableWidget.setItem(4, 6, __qtablewidgetitem141)
         __qtablewidgetitem142 = QTableWidgetItem()
         __qtablewidgetitem142.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem142.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(2, 6, __qtablewidgetitem142)
+        self.technicalFactors_TableWidget.setItem(5, 1, __qtablewidgetitem142)
         __qtablewidgetitem143 = QTableWidgetItem()
         __qtablewidgetitem143.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem143.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 1, __qtablewidgetitem143)
+        self.technicalFactors_TableWidget.setItem(5, 2, __qtablewidgetitem143)
         __qtablewidgetitem144 = QTableWidgetItem()
         __qtablewidgetitem144.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem144.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 2, __qtablewidgetitem144)
+        self.technicalFactors_TableWidget.setItem(5, 3, __qtablewidgetitem144)
         __qtablewidgetitem145 = QTableWidgetItem()
         __qtablewidgetitem145.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem145.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 3, __qtablewidgetitem145)
+        self.technicalFactors_TableWidget.setItem(5, 4, __qtablewidgetitem145)
         __qtablewidgetitem146 = QTableWidgetItem()
         __qtablewidgetitem146.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem146.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 4, __qtablewidgetitem146)
+        self.technicalFactors_TableWidget.setItem(5, 5, __qtablewidgetitem146)
         __qtablewidgetitem147 = QTableWidgetItem()
         __qtablewidgetitem147.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem147.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 5, __qtablewidgetitem147)
+        self.technicalFactors_TableWidget.setItem(5, 6, __qtablewidgetitem147)
         __qtablewidgetitem148 = QTableWidgetItem()
         __qtablewidgetitem148.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem148.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(3, 6, __qtablewidgetitem148)
+        self.technicalFactors_TableWidget.setItem(6, 1, __qtablewidgetitem148)
         __qtablewidgetitem149 = QTableWidgetItem()
         __qtablewidgetitem149.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem149.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 1, __qtablewidgetitem149)
+        self.technicalFactors_TableWidget.setItem(6, 2, __qtablewidgetitem149)
         __qtablewidgetitem150 = QTableWidgetItem()
         __qtablewidgetitem150.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem150.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 2, __qtablewidgetitem150)
+        self.technicalFactors_TableWidget.setItem(6, 3, __qtablewidgetitem150)
         __qtablewidgetitem151 = QTableWidgetItem()
         __qtablewidgetitem151.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem151.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 3, __qtablewidgetitem151)
+        self.technicalFactors_TableWidget.setItem(6, 4, __qtablewidgetitem151)
         __qtablewidgetitem152 = QTableWidgetItem()
         __qtablewidgetitem152.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem152.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 4, __qtablewidgetitem152)
+        self.technicalFactors_TableWidget.setItem(6, 5, __qtablewidgetitem152)
         __qtablewidgetitem153 = QTableWidgetItem()
         __qtablewidgetitem153.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem153.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 5, __qtablewidgetitem153)
+        self.technicalFactors_TableWidget.setItem(6, 6, __qtablewidgetitem153)
         __qtablewidgetitem154 = QTableWidgetItem()
         __qtablewidgetitem154.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem154.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(4, 6, __qtablewidgetitem154)
+        self.technicalFactors_TableWidget.setItem(7, 1, __qtablewidgetitem154)
         __qtablewidgetitem155 = QTableWidgetItem()
         __qtablewidgetitem155.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem155.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 1, __qtablewidgetitem155)
+        self.technicalFactors_TableWidget.setItem(7, 2, __qtablewidgetitem155)
         __qtablewidgetitem156 = QTableWidgetItem()
         __qtablewidgetitem156.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem156.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 2, __qtablewidgetitem156)
+        self.technicalFactors_TableWidget.setItem(7, 3, __qtablewidgetitem156)
         __qtablewidgetitem157 = QTableWidgetItem()
         __qtablewidgetitem157.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem157.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 3, __qtablewidgetitem157)
+        self.technicalFactors_TableWidget.setItem(7, 4, __qtablewidgetitem157)
         __qtablewidgetitem158 = QTableWidgetItem()
         __qtablewidgetitem158.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem158.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 4, __qtablewidgetitem158)
+        self.technicalFactors_TableWidget.setItem(7, 5, __qtablewidgetitem158)
         __qtablewidgetitem159 = QTableWidgetItem()
         __qtablewidgetitem159.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem159.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 5, __qtablewidgetitem159)
+        self.technicalFactors_TableWidget.setItem(7, 6, __qtablewidgetitem159)
         __qtablewidgetitem160 = QTableWidgetItem()
         __qtablewidgetitem160.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem160.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(5, 6, __qtablewidgetitem160)
+        self.technicalFactors_TableWidget.setItem(8, 1, __qtablewidgetitem160)
         __qtablewidgetitem161 = QTableWidgetItem()
         __qtablewidgetitem161.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem161.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 1, __qtablewidgetitem161)
+        self.technicalFactors_TableWidget.setItem(8, 2, __qtablewidgetitem161)
         __qtablewidgetitem162 = QTableWidgetItem()
         __qtablewidgetitem162.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem162.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 2, __qtablewidgetitem162)
+        self.technicalFactors_TableWidget.setItem(8, 3, __qtablewidgetitem162)
         __qtablewidgetitem163 = QTableWidgetItem()
         __qtablewidgetitem163.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem163.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 3, __qtablewidgetitem163)
+        self.technicalFactors_TableWidget.setItem(8, 4, __qtablewidgetitem163)
         __qtablewidgetitem164 = QTableWidgetItem()
         __qtablewidgetitem164.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem164.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 4, __qtablewidgetitem164)
+        self.technicalFactors_TableWidget.setItem(8, 5, __qtablewidgetitem164)
         __qtablewidgetitem165 = QTableWidgetItem()
         __qtablewidgetitem165.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem165.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 5, __qtablewidgetitem165)
+        self.technicalFactors_TableWidget.setItem(8, 6, __qtablewidgetitem165)
         __qtablewidgetitem166 = QTableWidgetItem()
         __qtablewidgetitem166.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem166.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(6, 6, __qtablewidgetitem166)
+        self.technicalFactors_TableWidget.setItem(9, 1, __qtablewidgetitem166)
         __qtablewidgetitem167 = QTableWidgetItem()
         __qtablewidgetitem167.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem167.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 1, __qtablewidgetitem167)
+        self.technicalFactors_TableWidget.setItem(9, 2, __qtablewidgetitem167)
         __qtablewidgetitem168 = QTableWidgetItem()
         __qtablewidgetitem168.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem168.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 2, __qtablewidgetitem168)
+        self.technicalFactors_TableWidget.setItem(9, 3, __qtablewidgetitem168)
         __qtablewidgetitem169 = QTableWidgetItem()
         __qtablewidgetitem169.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem169.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 3, __qtablewidgetitem169)
+        self.technicalFactors_TableWidget.setItem(9, 4, __qtablewidgetitem169)
         __qtablewidgetitem170 = QTableWidgetItem()
         __qtablewidgetitem170.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem170.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 4, __qtablewidgetitem170)
+        self.technicalFactors_TableWidget.setItem(9, 5, __qtablewidgetitem170)
         __qtablewidgetitem171 = QTableWidgetItem()
         __qtablewidgetitem171.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem171.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 5, __qtablewidgetitem171)
+        self.technicalFactors_TableWidget.setItem(9, 6, __qtablewidgetitem171)
         __qtablewidgetitem172 = QTableWidgetItem()
         __qtablewidgetitem172.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem172.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(7, 6, __qtablewidgetitem172)
+        self.technicalFactors_TableWidget.setItem(10, 1, __qtablewidgetitem172)
         __qtablewidgetitem173 = QTableWidgetItem()
         __qtablewidgetitem173.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem173.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 1, __qtablewidgetitem173)
+        self.technicalFactors_TableWidget.setItem(10, 2, __qtablewidgetitem173)
         __qtablewidgetitem174 = QTableWidgetItem()
         __qtablewidgetitem174.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem174.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 2, __qtablewidgetitem174)
+        self.technicalFactors_TableWidget.setItem(10, 3, __qtablewidgetitem174)
         __qtablewidgetitem175 = QTableWidgetItem()
         __qtablewidgetitem175.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem175.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 3, __qtablewidgetitem175)
+        self.technicalFactors_TableWidget.setItem(10, 4, __qtablewidgetitem175)
         __qtablewidgetitem176 = QTableWidgetItem()
         __qtablewidgetitem176.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem176.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 4, __qtablewidgetitem176)
+        self.technicalFactors_TableWidget.setItem(10, 5, __qtablewidgetitem176)
         __qtablewidgetitem177 = QTableWidgetItem()
         __qtablewidgetitem177.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem177.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 5, __qtablewidgetitem177)
+        self.technicalFactors_TableWidget.setItem(10, 6, __qtablewidgetitem177)
         __qtablewidgetitem178 = QTableWidgetItem()
         __qtablewidgetitem178.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem178.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(8, 6, __qtablewidgetitem178)
+        self.technicalFactors_TableWidget.setItem(11, 1, __qtablewidgetitem178)
         __qtablewidgetitem179 = QTableWidgetItem()
         __qtablewidgetitem179.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem179.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 1, __qtablewidgetitem179)
+        self.technicalFactors_TableWidget.setItem(11, 2, __qtablewidgetitem179)
         __qtablewidgetitem180 = QTableWidgetItem()
         __qtablewidgetitem180.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem180.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 2, __qtablewidgetitem180)
+        self.technicalFactors_TableWidget.setItem(11, 3, __qtablewidgetitem180)
         __qtablewidgetitem181 = QTableWidgetItem()
         __qtablewidgetitem181.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem181.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 3, __qtablewidgetitem181)
+        self.technicalFactors_TableWidget.setItem(11, 4, __qtablewidgetitem181)
         __qtablewidgetitem182 = QTableWidgetItem()
         __qtablewidgetitem182.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem182.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 4, __qtablewidgetitem182)
+        self.technicalFactors_TableWidget.setItem(11, 5, __qtablewidgetitem182)
         __qtablewidgetitem183 = QTableWidgetItem()
         __qtablewidgetitem183.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem183.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 5, __qtablewidgetitem183)
+        self.technicalFactors_TableWidget.setItem(11, 6, __qtablewidgetitem183)
         __qtablewidgetitem184 = QTableWidgetItem()
         __qtablewidgetitem184.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem184.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(9, 6, __qtablewidgetitem184)
+        self.technicalFactors_TableWidget.setItem(12, 1, __qtablewidgetitem184)
         __qtablewidgetitem185 = QTableWidgetItem()
         __qtablewidgetitem185.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem185.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 1, __qtablewidgetitem185)
+        self.technicalFactors_TableWidget.setItem(12, 2, __qtablewidgetitem185)
         __qtablewidgetitem186 = QTableWidgetItem()
         __qtablewidgetitem186.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem186.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 2, __qtablewidgetitem186)
+        self.technicalFactors_TableWidget.setItem(12, 3, __qtablewidgetitem186)
         __qtablewidgetitem187 = QTableWidgetItem()
         __qtablewidgetitem187.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem187.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 3, __qtablewidgetitem187)
+        self.technicalFactors_TableWidget.setItem(12, 4, __qtablewidgetitem187)
         __qtablewidgetitem188 = QTableWidgetItem()
         __qtablewidgetitem188.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem188.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 4, __qtablewidgetitem188)
+        self.technicalFactors_TableWidget.setItem(12, 5, __qtablewidgetitem188)
         __qtablewidgetitem189 = QTableWidgetItem()
         __qtablewidgetitem189.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem189.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 5, __qtablewidgetitem189)
-        __qtablewidgetitem190 = QTableWidgetItem()
-        __qtablewidgetitem190.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem190.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(10, 6, __qtablewidgetitem190)
-        __qtablewidgetitem191 = QTableWidgetItem()
-        __qtablewidgetitem191.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem191.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 1, __qtablewidgetitem191)
-        __qtablewidgetitem192 = QTableWidgetItem()
-        __qtablewidgetitem192.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem192.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 2, __qtablewidgetitem192)
-        __qtablewidgetitem193 = QTableWidgetItem()
-        __qtablewidgetitem193.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem193.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 3, __qtablewidgetitem193)
-        __qtablewidgetitem194 = QTableWidgetItem()
-        __qtablewidgetitem194.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem194.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 4, __qtablewidgetitem194)
-        __qtablewidgetitem195 = QTableWidgetItem()
-        __qtablewidgetitem195.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem195.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 5, __qtablewidgetitem195)
-        __qtablewidgetitem196 = QTableWidgetItem()
-        __qtablewidgetitem196.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem196.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(11, 6, __qtablewidgetitem196)
-        __qtablewidgetitem197 = QTableWidgetItem()
-        __qtablewidgetitem197.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem197.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 1, __qtablewidgetitem197)
-        __qtablewidgetitem198 = QTableWidgetItem()
-        __qtablewidgetitem198.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem198.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 2, __qtablewidgetitem198)
-        __qtablewidgetitem199 = QTableWidgetItem()
-        __qtablewidgetitem199.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem199.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 3, __qtablewidgetitem199)
-        __qtablewidgetitem200 = QTableWidgetItem()
-        __qtablewidgetitem200.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem200.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 4, __qtablewidgetitem200)
-        __qtablewidgetitem201 = QTableWidgetItem()
-        __qtablewidgetitem201.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem201.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 5, __qtablewidgetitem201)
-        __qtablewidgetitem202 = QTableWidgetItem()
-        __qtablewidgetitem202.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem202.setBackground(brush28);
-        self.technicalFactors_TableWidget.setItem(12, 6, __qtablewidgetitem202)
+        self.technicalFactors_TableWidget.setItem(12, 6, __qtablewidgetitem189)
         brush29 = QBrush(QColor(35, 202, 178, 255))
         brush29.setStyle(Qt.SolidPattern)
-        __qtablewidgetitem203 = QTableWidgetItem()
-        __qtablewidgetitem203.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem203.setBackground(brush29);
-        self.technicalFactors_TableWidget.setItem(13, 0, __qtablewidgetitem203)
+        __qtablewidgetitem190 = QTableWidgetItem()
+        __qtablewidgetitem190.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem190.setBackground(brush29);
+        self.technicalFactors_TableWidget.setItem(13, 0, __qtablewidgetitem190)
         self.technicalFactors_TableWidget.setObjectName(u"technicalFactors_TableWidget")
         sizePolicy.setHeightForWidth(self.technicalFactors_TableWidget.sizePolicy().hasHeightForWidth())
         self.technicalFactors_TableWidget.setSizePolicy(sizePolicy)
@@ -4066,6 +4079,14 @@ class Ui_Main(object):
 "QHeaderView::up-arrow {\n"
 "	image: url(:/resources/images/blackUpArrow.png);\n"
 "}\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
+"}\n"
 "\n"
 "QScrollBar:vertical {\n"
 "	border: none;\n"
@@ -4083,7 +4104,8 @@ class Ui_Main(object):
 "	background: none;\n"
 "	height: 0px;\n"
 "}\n"
-"QScrollBar::sub-line:vertical {\n"
+"QScrollBar::sub-line:ver"
+                        "tical {\n"
 "	background: none;\n"
 "	height: 0px;\n"
 "}\n"
@@ -4092,8 +4114,7 @@ class Ui_Main(object):
 "	border: none;\n"
 "	background: #3B4252;\n"
 "     height: 20px;\n"
-"     margin: 3px 0px 3px 0"
-                        "px;\n"
+"     margin: 3px 0px 3px 0px;\n"
 "     border-radius: 7px;\n"
 "}\n"
 "QScrollBar::handle:horizontal {\n"
@@ -4545,104 +4566,104 @@ class Ui_Main(object):
         self.technicalFactorsSummary_TableWidget = QTableWidget(self.widget_30)
         if (self.technicalFactorsSummary_TableWidget.columnCount() < 3):
             self.technicalFactorsSummary_TableWidget.setColumnCount(3)
-        __qtablewidgetitem204 = QTableWidgetItem()
-        __qtablewidgetitem204.setFont(font4);
-        __qtablewidgetitem204.setBackground(QColor(216, 216, 216));
-        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem204)
-        __qtablewidgetitem205 = QTableWidgetItem()
-        __qtablewidgetitem205.setFont(font4);
-        __qtablewidgetitem205.setBackground(QColor(217, 217, 217));
-        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem205)
-        __qtablewidgetitem206 = QTableWidgetItem()
-        __qtablewidgetitem206.setFont(font4);
-        __qtablewidgetitem206.setBackground(QColor(217, 217, 217));
-        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem206)
+        __qtablewidgetitem191 = QTableWidgetItem()
+        __qtablewidgetitem191.setFont(font4);
+        __qtablewidgetitem191.setBackground(QColor(216, 216, 216));
+        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem191)
+        __qtablewidgetitem192 = QTableWidgetItem()
+        __qtablewidgetitem192.setFont(font4);
+        __qtablewidgetitem192.setBackground(QColor(217, 217, 217));
+        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem192)
+        __qtablewidgetitem193 = QTableWidgetItem()
+        __qtablewidgetitem193.setFont(font4);
+        __qtablewidgetitem193.setBackground(QColor(217, 217, 217));
+        self.technicalFactorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem193)
         if (self.technicalFactorsSummary_TableWidget.rowCount() < 4):
             self.technicalFactorsSummary_TableWidget.setRowCount(4)
         brush30 = QBrush(QColor(0, 0, 0, 255))
         brush30.setStyle(Qt.NoBrush)
-        __qtablewidgetitem207 = QTableWidgetItem()
-        __qtablewidgetitem207.setBackground(QColor(0, 0, 0));
-        __qtablewidgetitem207.setForeground(brush30);
-        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem207)
+        __qtablewidgetitem194 = QTableWidgetItem()
+        __qtablewidgetitem194.setBackground(QColor(0, 0, 0));
+        __qtablewidgetitem194.setForeground(brush30);
+        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem194)
         brush31 = QBrush(QColor(0, 0, 0, 255))
         brush31.setStyle(Qt.NoBrush)
-        __qtablewidgetitem208 = QTableWidgetItem()
-        __qtablewidgetitem208.setForeground(brush31);
-        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem208)
-        __qtablewidgetitem209 = QTableWidgetItem()
-        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem209)
-        __qtablewidgetitem210 = QTableWidgetItem()
-        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem210)
+        __qtablewidgetitem195 = QTableWidgetItem()
+        __qtablewidgetitem195.setForeground(brush31);
+        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem195)
+        __qtablewidgetitem196 = QTableWidgetItem()
+        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem196)
+        __qtablewidgetitem197 = QTableWidgetItem()
+        self.technicalFactorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem197)
         brush32 = QBrush(QColor(0, 0, 0, 255))
         brush32.setStyle(Qt.NoBrush)
-        __qtablewidgetitem211 = QTableWidgetItem()
-        __qtablewidgetitem211.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem211.setFont(font4);
-        __qtablewidgetitem211.setBackground(brush13);
-        __qtablewidgetitem211.setForeground(brush32);
-        self.technicalFactorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem211)
+        __qtablewidgetitem198 = QTableWidgetItem()
+        __qtablewidgetitem198.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem198.setFont(font4);
+        __qtablewidgetitem198.setBackground(brush13);
+        __qtablewidgetitem198.setForeground(brush32);
+        self.technicalFactorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem198)
         brush33 = QBrush(QColor(0, 0, 0, 255))
         brush33.setStyle(Qt.NoBrush)
-        __qtablewidgetitem212 = QTableWidgetItem()
-        __qtablewidgetitem212.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem212.setFont(font28);
-        __qtablewidgetitem212.setBackground(brush15);
-        __qtablewidgetitem212.setForeground(brush33);
-        self.technicalFactorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem212)
-        __qtablewidgetitem213 = QTableWidgetItem()
-        __qtablewidgetitem213.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem213.setFont(font4);
-        __qtablewidgetitem213.setBackground(brush15);
-        self.technicalFactorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem213)
+        __qtablewidgetitem199 = QTableWidgetItem()
+        __qtablewidgetitem199.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem199.setFont(font28);
+        __qtablewidgetitem199.setBackground(brush15);
+        __qtablewidgetitem199.setForeground(brush33);
+        self.technicalFactorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem199)
+        __qtablewidgetitem200 = QTableWidgetItem()
+        __qtablewidgetitem200.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem200.setFont(font4);
+        __qtablewidgetitem200.setBackground(brush15);
+        self.technicalFactorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem200)
         brush34 = QBrush(QColor(0, 0, 0, 255))
         brush34.setStyle(Qt.NoBrush)
-        __qtablewidgetitem214 = QTableWidgetItem()
-        __qtablewidgetitem214.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem214.setFont(font25);
-        __qtablewidgetitem214.setBackground(brush5);
-        __qtablewidgetitem214.setForeground(brush34);
-        self.technicalFactorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem214)
+        __qtablewidgetitem201 = QTableWidgetItem()
+        __qtablewidgetitem201.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem201.setFont(font25);
+        __qtablewidgetitem201.setBackground(brush5);
+        __qtablewidgetitem201.setForeground(brush34);
+        self.technicalFactorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem201)
         brush35 = QBrush(QColor(0, 0, 0, 255))
         brush35.setStyle(Qt.NoBrush)
-        __qtablewidgetitem215 = QTableWidgetItem()
-        __qtablewidgetitem215.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem215.setFont(font9);
-        __qtablewidgetitem215.setBackground(brush18);
-        __qtablewidgetitem215.setForeground(brush35);
-        self.technicalFactorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem215)
-        __qtablewidgetitem216 = QTableWidgetItem()
-        __qtablewidgetitem216.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem216.setFont(font4);
-        __qtablewidgetitem216.setBackground(brush18);
-        self.technicalFactorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem216)
-        __qtablewidgetitem217 = QTableWidgetItem()
-        __qtablewidgetitem217.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem217.setFont(font4);
-        __qtablewidgetitem217.setBackground(brush19);
-        self.technicalFactorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem217)
-        __qtablewidgetitem218 = QTableWidgetItem()
-        __qtablewidgetitem218.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem218.setFont(font9);
-        __qtablewidgetitem218.setBackground(brush20);
-        self.technicalFactorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem218)
-        __qtablewidgetitem219 = QTableWidgetItem()
-        __qtablewidgetitem219.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem219.setFont(font4);
-        __qtablewidgetitem219.setBackground(brush20);
-        self.technicalFactorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem219)
-        __qtablewidgetitem220 = QTableWidgetItem()
-        __qtablewidgetitem220.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem220.setFont(font6);
-        self.technicalFactorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem220)
-        __qtablewidgetitem221 = QTableWidgetItem()
-        __qtablewidgetitem221.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem221.setFont(font6);
-        self.technicalFactorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem221)
-        __qtablewidgetitem222 = QTableWidgetItem()
-        __qtablewidgetitem222.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem222.setFont(font4);
-        self.technicalFactorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem222)
+        __qtablewidgetitem202 = QTableWidgetItem()
+        __qtablewidgetitem202.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem202.setFont(font9);
+        __qtablewidgetitem202.setBackground(brush18);
+        __qtablewidgetitem202.setForeground(brush35);
+        self.technicalFactorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem202)
+        __qtablewidgetitem203 = QTableWidgetItem()
+        __qtablewidgetitem203.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem203.setFont(font4);
+        __qtablewidgetitem203.setBackground(brush18);
+        self.technicalFactorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem203)
+        __qtablewidgetitem204 = QTableWidgetItem()
+        __qtablewidgetitem204.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem204.setFont(font4);
+        __qtablewidgetitem204.setBackground(brush19);
+        self.technicalFactorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem204)
+        __qtablewidgetitem205 = QTableWidgetItem()
+        __qtablewidgetitem205.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem205.setFont(font9);
+        __qtablewidgetitem205.setBackground(brush20);
+        self.technicalFactorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem205)
+        __qtablewidgetitem206 = QTableWidgetItem()
+        __qtablewidgetitem206.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem206.setFont(font4);
+        __qtablewidgetitem206.setBackground(brush20);
+        self.technicalFactorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem206)
+        __qtablewidgetitem207 = QTableWidgetItem()
+        __qtablewidgetitem207.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem207.setFont(font6);
+        self.technicalFactorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem207)
+        __qtablewidgetitem208 = QTableWidgetItem()
+        __qtablewidgetitem208.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem208.setFont(font6);
+        self.technicalFactorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem208)
+        __qtablewidgetitem209 = QTableWidgetItem()
+        __qtablewidgetitem209.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem209.setFont(font4);
+        self.technicalFactorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem209)
         self.technicalFactorsSummary_TableWidget.setObjectName(u"technicalFactorsSummary_TableWidget")
         sizePolicy15 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.MinimumExpanding)
         sizePolicy15.setHorizontalStretch(0)
@@ -4812,104 +4833,104 @@ class Ui_Main(object):
         self.environmentalFactorsSummary_TableWidget = QTableWidget(self.widget_29)
         if (self.environmentalFactorsSummary_TableWidget.columnCount() < 3):
             self.environmentalFactorsSummary_TableWidget.setColumnCount(3)
-        __qtablewidgetitem223 = QTableWidgetItem()
-        __qtablewidgetitem223.setFont(font4);
-        __qtablewidgetitem223.setBackground(QColor(216, 216, 216));
-        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem223)
-        __qtablewidgetitem224 = QTableWidgetItem()
-        __qtablewidgetitem224.setFont(font4);
-        __qtablewidgetitem224.setBackground(QColor(217, 217, 217));
-        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem224)
-        __qtablewidgetitem225 = QTableWidgetItem()
-        __qtablewidgetitem225.setFont(font4);
-        __qtablewidgetitem225.setBackground(QColor(217, 217, 217));
-        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem225)
+        __qtablewidgetitem210 = QTableWidgetItem()
+        __qtablewidgetitem210.setFont(font4);
+        __qtablewidgetitem210.setBackground(QColor(216, 216, 216));
+        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem210)
+        __qtablewidgetitem211 = QTableWidgetItem()
+        __qtablewidgetitem211.setFont(font4);
+        __qtablewidgetitem211.setBackground(QColor(217, 217, 217));
+        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem211)
+        __qtablewidgetitem212 = QTableWidgetItem()
+        __qtablewidgetitem212.setFont(font4);
+        __qtablewidgetitem212.setBackground(QColor(217, 217, 217));
+        self.environmentalFactorsSummary_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem212)
         if (self.environmentalFactorsSummary_TableWidget.rowCount() < 4):
             self.environmentalFactorsSummary_TableWidget.setRowCount(4)
         brush36 = QBrush(QColor(0, 0, 0, 255))
         brush36.setStyle(Qt.NoBrush)
-        __qtablewidgetitem226 = QTableWidgetItem()
-        __qtablewidgetitem226.setBackground(QColor(0, 0, 0));
-        __qtablewidgetitem226.setForeground(brush36);
-        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem226)
+        __qtablewidgetitem213 = QTableWidgetItem()
+        __qtablewidgetitem213.setBackground(QColor(0, 0, 0));
+        __qtablewidgetitem213.setForeground(brush36);
+        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem213)
         brush37 = QBrush(QColor(0, 0, 0, 255))
         brush37.setStyle(Qt.NoBrush)
-        __qtablewidgetitem227 = QTableWidgetItem()
-        __qtablewidgetitem227.setForeground(brush37);
-        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem227)
-        __qtablewidgetitem228 = QTableWidgetItem()
-        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem228)
-        __qtablewidgetitem229 = QTableWidgetItem()
-        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem229)
+        __qtablewidgetitem214 = QTableWidgetItem()
+        __qtablewidgetitem214.setForeground(brush37);
+        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem214)
+        __qtablewidgetitem215 = QTableWidgetItem()
+        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem215)
+        __qtablewidgetitem216 = QTableWidgetItem()
+        self.environmentalFactorsSummary_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem216)
         brush38 = QBrush(QColor(0, 0, 0, 255))
         brush38.setStyle(Qt.NoBrush)
-        __qtablewidgetitem230 = QTableWidgetItem()
-        __qtablewidgetitem230.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem230.setFont(font4);
-        __qtablewidgetitem230.setBackground(brush13);
-        __qtablewidgetitem230.setForeground(brush38);
-        self.environmentalFactorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem230)
+        __qtablewidgetitem217 = QTableWidgetItem()
+        __qtablewidgetitem217.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem217.setFont(font4);
+        __qtablewidgetitem217.setBackground(brush13);
+        __qtablewidgetitem217.setForeground(brush38);
+        self.environmentalFactorsSummary_TableWidget.setItem(0, 0, __qtablewidgetitem217)
         brush39 = QBrush(QColor(0, 0, 0, 255))
         brush39.setStyle(Qt.NoBrush)
-        __qtablewidgetitem231 = QTableWidgetItem()
-        __qtablewidgetitem231.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem231.setFont(font28);
-        __qtablewidgetitem231.setBackground(brush15);
-        __qtablewidgetitem231.setForeground(brush39);
-        self.environmentalFactorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem231)
-        __qtablewidgetitem232 = QTableWidgetItem()
-        __qtablewidgetitem232.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem232.setFont(font4);
-        __qtablewidgetitem232.setBackground(brush15);
-        self.environmentalFactorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem232)
+        __qtablewidgetitem218 = QTableWidgetItem()
+        __qtablewidgetitem218.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem218.setFont(font28);
+        __qtablewidgetitem218.setBackground(brush15);
+        __qtablewidgetitem218.setForeground(brush39);
+        self.environmentalFactorsSummary_TableWidget.setItem(0, 1, __qtablewidgetitem218)
+        __qtablewidgetitem219 = QTableWidgetItem()
+        __qtablewidgetitem219.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem219.setFont(font4);
+        __qtablewidgetitem219.setBackground(brush15);
+        self.environmentalFactorsSummary_TableWidget.setItem(0, 2, __qtablewidgetitem219)
         brush40 = QBrush(QColor(0, 0, 0, 255))
         brush40.setStyle(Qt.NoBrush)
-        __qtablewidgetitem233 = QTableWidgetItem()
-        __qtablewidgetitem233.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem233.setFont(font25);
-        __qtablewidgetitem233.setBackground(brush5);
-        __qtablewidgetitem233.setForeground(brush40);
-        self.environmentalFactorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem233)
+        __qtablewidgetitem220 = QTableWidgetItem()
+        __qtablewidgetitem220.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem220.setFont(font25);
+        __qtablewidgetitem220.setBackground(brush5);
+        __qtablewidgetitem220.setForeground(brush40);
+        self.environmentalFactorsSummary_TableWidget.setItem(1, 0, __qtablewidgetitem220)
         brush41 = QBrush(QColor(0, 0, 0, 255))
         brush41.setStyle(Qt.NoBrush)
-        __qtablewidgetitem234 = QTableWidgetItem()
-        __qtablewidgetitem234.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem234.setFont(font9);
-        __qtablewidgetitem234.setBackground(brush18);
-        __qtablewidgetitem234.setForeground(brush41);
-        self.environmentalFactorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem234)
-        __qtablewidgetitem235 = QTableWidgetItem()
-        __qtablewidgetitem235.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem235.setFont(font4);
-        __qtablewidgetitem235.setBackground(brush18);
-        self.environmentalFactorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem235)
-        __qtablewidgetitem236 = QTableWidgetItem()
-        __qtablewidgetitem236.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem236.setFont(font4);
-        __qtablewidgetitem236.setBackground(brush19);
-        self.environmentalFactorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem236)
-        __qtablewidgetitem237 = QTableWidgetItem()
-        __qtablewidgetitem237.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem237.setFont(font9);
-        __qtablewidgetitem237.setBackground(brush20);
-        self.environmentalFactorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem237)
-        __qtablewidgetitem238 = QTableWidgetItem()
-        __qtablewidgetitem238.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem238.setFont(font4);
-        __qtablewidgetitem238.setBackground(brush20);
-        self.environmentalFactorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem238)
-        __qtablewidgetitem239 = QTableWidgetItem()
-        __qtablewidgetitem239.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem239.setFont(font6);
-        self.environmentalFactorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem239)
-        __qtablewidgetitem240 = QTableWidgetItem()
-        __qtablewidgetitem240.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem240.setFont(font6);
-        self.environmentalFactorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem240)
-        __qtablewidgetitem241 = QTableWidgetItem()
-        __qtablewidgetitem241.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem241.setFont(font4);
-        self.environmentalFactorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem241)
+        __qtablewidgetitem221 = QTableWidgetItem()
+        __qtablewidgetitem221.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem221.setFont(font9);
+        __qtablewidgetitem221.setBackground(brush18);
+        __qtablewidgetitem221.setForeground(brush41);
+        self.environmentalFactorsSummary_TableWidget.setItem(1, 1, __qtablewidgetitem221)
+        __qtablewidgetitem222 = QTableWidgetItem()
+        __qtablewidgetitem222.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem222.setFont(font4);
+        __qtablewidgetitem222.setBackground(brush18);
+        self.environmentalFactorsSummary_TableWidget.setItem(1, 2, __qtablewidgetitem222)
+        __qtablewidgetitem223 = QTableWidgetItem()
+        __qtablewidgetitem223.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem223.setFont(font4);
+        __qtablewidgetitem223.setBackground(brush19);
+        self.environmentalFactorsSummary_TableWidget.setItem(2, 0, __qtablewidgetitem223)
+        __qtablewidgetitem224 = QTableWidgetItem()
+        __qtablewidgetitem224.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem224.setFont(font9);
+        __qtablewidgetitem224.setBackground(brush20);
+        self.environmentalFactorsSummary_TableWidget.setItem(2, 1, __qtablewidgetitem224)
+        __qtablewidgetitem225 = QTableWidgetItem()
+        __qtablewidgetitem225.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem225.setFont(font4);
+        __qtablewidgetitem225.setBackground(brush20);
+        self.environmentalFactorsSummary_TableWidget.setItem(2, 2, __qtablewidgetitem225)
+        __qtablewidgetitem226 = QTableWidgetItem()
+        __qtablewidgetitem226.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem226.setFont(font6);
+        self.environmentalFactorsSummary_TableWidget.setItem(3, 0, __qtablewidgetitem226)
+        __qtablewidgetitem227 = QTableWidgetItem()
+        __qtablewidgetitem227.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem227.setFont(font6);
+        self.environmentalFactorsSummary_TableWidget.setItem(3, 1, __qtablewidgetitem227)
+        __qtablewidgetitem228 = QTableWidgetItem()
+        __qtablewidgetitem228.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem228.setFont(font4);
+        self.environmentalFactorsSummary_TableWidget.setItem(3, 2, __qtablewidgetitem228)
         self.environmentalFactorsSummary_TableWidget.setObjectName(u"environmentalFactorsSummary_TableWidget")
         sizePolicy15.setHeightForWidth(self.environmentalFactorsSummary_TableWidget.sizePolicy().hasHeightForWidth())
         self.environmentalFactorsSummary_TableWidget.setSizePolicy(sizePolicy15)
@@ -5067,243 +5088,243 @@ class Ui_Main(object):
         self.environmentalFactors_TableWidget = QTableWidget(self.widget_27)
         if (self.environmentalFactors_TableWidget.columnCount() < 7):
             self.environmentalFactors_TableWidget.setColumnCount(7)
+        __qtablewidgetitem229 = QTableWidgetItem()
+        __qtablewidgetitem229.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem229)
+        __qtablewidgetitem230 = QTableWidgetItem()
+        __qtablewidgetitem230.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem230)
+        __qtablewidgetitem231 = QTableWidgetItem()
+        __qtablewidgetitem231.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem231)
+        __qtablewidgetitem232 = QTableWidgetItem()
+        __qtablewidgetitem232.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem232)
+        __qtablewidgetitem233 = QTableWidgetItem()
+        __qtablewidgetitem233.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem233)
+        __qtablewidgetitem234 = QTableWidgetItem()
+        __qtablewidgetitem234.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem234)
+        __qtablewidgetitem235 = QTableWidgetItem()
+        __qtablewidgetitem235.setFont(font9);
+        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem235)
+        if (self.environmentalFactors_TableWidget.rowCount() < 9):
+            self.environmentalFactors_TableWidget.setRowCount(9)
+        __qtablewidgetitem236 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem236)
+        __qtablewidgetitem237 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem237)
+        __qtablewidgetitem238 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem238)
+        __qtablewidgetitem239 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem239)
+        __qtablewidgetitem240 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(4, __qtablewidgetitem240)
+        __qtablewidgetitem241 = QTableWidgetItem()
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(5, __qtablewidgetitem241)
         __qtablewidgetitem242 = QTableWidgetItem()
-        __qtablewidgetitem242.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem242)
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(6, __qtablewidgetitem242)
         __qtablewidgetitem243 = QTableWidgetItem()
-        __qtablewidgetitem243.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem243)
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(7, __qtablewidgetitem243)
         __qtablewidgetitem244 = QTableWidgetItem()
-        __qtablewidgetitem244.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem244)
+        self.environmentalFactors_TableWidget.setVerticalHeaderItem(8, __qtablewidgetitem244)
         __qtablewidgetitem245 = QTableWidgetItem()
-        __qtablewidgetitem245.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem245)
+        __qtablewidgetitem245.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem245.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 1, __qtablewidgetitem245)
         __qtablewidgetitem246 = QTableWidgetItem()
-        __qtablewidgetitem246.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem246)
+        __qtablewidgetitem246.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem246.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 2, __qtablewidgetitem246)
         __qtablewidgetitem247 = QTableWidgetItem()
-        __qtablewidgetitem247.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem247)
+        __qtablewidgetitem247.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem247.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 3, __qtablewidgetitem247)
         __qtablewidgetitem248 = QTableWidgetItem()
-        __qtablewidgetitem248.setFont(font9);
-        self.environmentalFactors_TableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem248)
-        if (self.environmentalFactors_TableWidget.rowCount() < 9):
-            self.environmentalFactors_TableWidget.setRowCount(9)
+        __qtablewidgetitem248.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem248.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 4, __qtablewidgetitem248)
         __qtablewidgetitem249 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(0, __qtablewidgetitem249)
+        __qtablewidgetitem249.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem249.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 5, __qtablewidgetitem249)
         __qtablewidgetitem250 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(1, __qtablewidgetitem250)
+        __qtablewidgetitem250.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem250.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(0, 6, __qtablewidgetitem250)
         __qtablewidgetitem251 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(2, __qtablewidgetitem251)
+        __qtablewidgetitem251.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem251.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 1, __qtablewidgetitem251)
         __qtablewidgetitem252 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(3, __qtablewidgetitem252)
+        __qtablewidgetitem252.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem252.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 2, __qtablewidgetitem252)
         __qtablewidgetitem253 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(4, __qtablewidgetitem253)
+        __qtablewidgetitem253.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem253.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 3, __qtablewidgetitem253)
         __qtablewidgetitem254 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(5, __qtablewidgetitem254)
+        __qtablewidgetitem254.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem254.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 4, __qtablewidgetitem254)
         __qtablewidgetitem255 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(6, __qtablewidgetitem255)
+        __qtablewidgetitem255.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem255.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 5, __qtablewidgetitem255)
         __qtablewidgetitem256 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(7, __qtablewidgetitem256)
+        __qtablewidgetitem256.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem256.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(1, 6, __qtablewidgetitem256)
         __qtablewidgetitem257 = QTableWidgetItem()
-        self.environmentalFactors_TableWidget.setVerticalHeaderItem(8, __qtablewidgetitem257)
+        __qtablewidgetitem257.setTextAlignment(Qt.AlignCenter);
+        __qtablewidgetitem257.setBackground(brush28);
+        self.environmentalFactors_TableWidget.setItem(2, 1, __qtablewidgetitem257)
         __qtablewidgetitem258 = QTableWidgetItem()
         __qtablewidgetitem258.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem258.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 1, __qtablewidgetitem258)
+        self.environmentalFactors_TableWidget.setItem(2, 2, __qtablewidgetitem258)
         __qtablewidgetitem259 = QTableWidgetItem()
         __qtablewidgetitem259.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem259.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 2, __qtablewidgetitem259)
+        self.environmentalFactors_TableWidget.setItem(2, 3, __qtablewidgetitem259)
         __qtablewidgetitem260 = QTableWidgetItem()
         __qtablewidgetitem260.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem260.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 3, __qtablewidgetitem260)
+        self.environmentalFactors_TableWidget.setItem(2, 4, __qtablewidgetitem260)
         __qtablewidgetitem261 = QTableWidgetItem()
         __qtablewidgetitem261.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem261.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 4, __qtablewidgetitem261)
+        self.environmentalFactors_TableWidget.setItem(2, 5, __qtablewidgetitem261)
         __qtablewidgetitem262 = QTableWidgetItem()
         __qtablewidgetitem262.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem262.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 5, __qtablewidgetitem262)
+        self.environmentalFactors_TableWidget.setItem(2, 6, __qtablewidgetitem262)
         __qtablewidgetitem263 = QTableWidgetItem()
         __qtablewidgetitem263.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem263.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(0, 6, __qtablewidgetitem263)
+        self.environmentalFactors_TableWidget.setItem(3, 1, __qtablewidgetitem263)
         __qtablewidgetitem264 = QTableWidgetItem()
         __qtablewidgetitem264.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem264.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 1, __qtablewidgetitem264)
+        self.environmentalFactors_TableWidget.setItem(3, 2, __qtablewidgetitem264)
         __qtablewidgetitem265 = QTableWidgetItem()
         __qtablewidgetitem265.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem265.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 2, __qtablewidgetitem265)
+        self.environmentalFactors_TableWidget.setItem(3, 3, __qtablewidgetitem265)
         __qtablewidgetitem266 = QTableWidgetItem()
         __qtablewidgetitem266.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem266.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 3, __qtablewidgetitem266)
+        self.environmentalFactors_TableWidget.setItem(3, 4, __qtablewidgetitem266)
         __qtablewidgetitem267 = QTableWidgetItem()
         __qtablewidgetitem267.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem267.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 4, __qtablewidgetitem267)
+        self.environmentalFactors_TableWidget.setItem(3, 5, __qtablewidgetitem267)
         __qtablewidgetitem268 = QTableWidgetItem()
         __qtablewidgetitem268.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem268.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 5, __qtablewidgetitem268)
+        self.environmentalFactors_TableWidget.setItem(3, 6, __qtablewidgetitem268)
         __qtablewidgetitem269 = QTableWidgetItem()
         __qtablewidgetitem269.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem269.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(1, 6, __qtablewidgetitem269)
+        self.environmentalFactors_TableWidget.setItem(4, 1, __qtablewidgetitem269)
         __qtablewidgetitem270 = QTableWidgetItem()
         __qtablewidgetitem270.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem270.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 1, __qtablewidgetitem270)
+        self.environmentalFactors_TableWidget.setItem(4, 2, __qtablewidgetitem270)
         __qtablewidgetitem271 = QTableWidgetItem()
         __qtablewidgetitem271.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem271.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 2, __qtablewidgetitem271)
+        self.environmentalFactors_TableWidget.setItem(4, 3, __qtablewidgetitem271)
         __qtablewidgetitem272 = QTableWidgetItem()
         __qtablewidgetitem272.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem272.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 3, __qtablewidgetitem272)
+        self.environmentalFactors_TableWidget.setItem(4, 4, __qtablewidgetitem272)
         __qtablewidgetitem273 = QTableWidgetItem()
         __qtablewidgetitem273.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem273.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 4, __qtablewidgetitem273)
+        self.environmentalFactors_TableWidget.setItem(4, 5, __qtablewidgetitem273)
         __qtablewidgetitem274 = QTableWidgetItem()
         __qtablewidgetitem274.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem274.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 5, __qtablewidgetitem274)
+        self.environmentalFactors_TableWidget.setItem(4, 6, __qtablewidgetitem274)
         __qtablewidgetitem275 = QTableWidgetItem()
         __qtablewidgetitem275.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem275.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(2, 6, __qtablewidgetitem275)
+        self.environmentalFactors_TableWidget.setItem(5, 1, __qtablewidgetitem275)
         __qtablewidgetitem276 = QTableWidgetItem()
         __qtablewidgetitem276.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem276.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 1, __qtablewidgetitem276)
+        self.environmentalFactors_TableWidget.setItem(5, 2, __qtablewidgetitem276)
         __qtablewidgetitem277 = QTableWidgetItem()
         __qtablewidgetitem277.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem277.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 2, __qtablewidgetitem277)
+        self.environmentalFactors_TableWidget.setItem(5, 3, __qtablewidgetitem277)
         __qtablewidgetitem278 = QTableWidgetItem()
         __qtablewidgetitem278.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem278.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 3, __qtablewidgetitem278)
+        self.environmentalFactors_TableWidget.setItem(5, 4, __qtablewidgetitem278)
         __qtablewidgetitem279 = QTableWidgetItem()
         __qtablewidgetitem279.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem279.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 4, __qtablewidgetitem279)
+        self.environmentalFactors_TableWidget.setItem(5, 5, __qtablewidgetitem279)
         __qtablewidgetitem280 = QTableWidgetItem()
         __qtablewidgetitem280.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem280.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 5, __qtablewidgetitem280)
+        self.environmentalFactors_TableWidget.setItem(5, 6, __qtablewidgetitem280)
         __qtablewidgetitem281 = QTableWidgetItem()
         __qtablewidgetitem281.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem281.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(3, 6, __qtablewidgetitem281)
+        self.environmentalFactors_TableWidget.setItem(6, 1, __qtablewidgetitem281)
         __qtablewidgetitem282 = QTableWidgetItem()
         __qtablewidgetitem282.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem282.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 1, __qtablewidgetitem282)
+        self.environmentalFactors_TableWidget.setItem(6, 2, __qtablewidgetitem282)
         __qtablewidgetitem283 = QTableWidgetItem()
         __qtablewidgetitem283.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem283.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 2, __qtablewidgetitem283)
+        self.environmentalFactors_TableWidget.setItem(6, 3, __qtablewidgetitem283)
         __qtablewidgetitem284 = QTableWidgetItem()
         __qtablewidgetitem284.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem284.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 3, __qtablewidgetitem284)
+        self.environmentalFactors_TableWidget.setItem(6, 4, __qtablewidgetitem284)
         __qtablewidgetitem285 = QTableWidgetItem()
         __qtablewidgetitem285.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem285.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 4, __qtablewidgetitem285)
+        self.environmentalFactors_TableWidget.setItem(6, 5, __qtablewidgetitem285)
         __qtablewidgetitem286 = QTableWidgetItem()
         __qtablewidgetitem286.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem286.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 5, __qtablewidgetitem286)
+        self.environmentalFactors_TableWidget.setItem(6, 6, __qtablewidgetitem286)
         __qtablewidgetitem287 = QTableWidgetItem()
         __qtablewidgetitem287.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem287.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(4, 6, __qtablewidgetitem287)
+        self.environmentalFactors_TableWidget.setItem(7, 1, __qtablewidgetitem287)
         __qtablewidgetitem288 = QTableWidgetItem()
         __qtablewidgetitem288.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem288.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 1, __qtablewidgetitem288)
+        self.environmentalFactors_TableWidget.setItem(7, 2, __qtablewidgetitem288)
         __qtablewidgetitem289 = QTableWidgetItem()
         __qtablewidgetitem289.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem289.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 2, __qtablewidgetitem289)
+        self.environmentalFactors_TableWidget.setItem(7, 3, __qtablewidgetitem289)
         __qtablewidgetitem290 = QTableWidgetItem()
         __qtablewidgetitem290.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem290.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 3, __qtablewidgetitem290)
+        self.environmentalFactors_TableWidget.setItem(7, 4, __qtablewidgetitem290)
         __qtablewidgetitem291 = QTableWidgetItem()
         __qtablewidgetitem291.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem291.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 4, __qtablewidgetitem291)
+        self.environmentalFactors_TableWidget.setItem(7, 5, __qtablewidgetitem291)
         __qtablewidgetitem292 = QTableWidgetItem()
         __qtablewidgetitem292.setTextAlignment(Qt.AlignCenter);
         __qtablewidgetitem292.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 5, __qtablewidgetitem292)
+        self.environmentalFactors_TableWidget.setItem(7, 6, __qtablewidgetitem292)
         __qtablewidgetitem293 = QTableWidgetItem()
         __qtablewidgetitem293.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem293.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(5, 6, __qtablewidgetitem293)
-        __qtablewidgetitem294 = QTableWidgetItem()
-        __qtablewidgetitem294.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem294.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 1, __qtablewidgetitem294)
-        __qtablewidgetitem295 = QTableWidgetItem()
-        __qtablewidgetitem295.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem295.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 2, __qtablewidgetitem295)
-        __qtablewidgetitem296 = QTableWidgetItem()
-        __qtablewidgetitem296.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem296.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 3, __qtablewidgetitem296)
-        __qtablewidgetitem297 = QTableWidgetItem()
-        __qtablewidgetitem297.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem297.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 4, __qtablewidgetitem297)
-        __qtablewidgetitem298 = QTableWidgetItem()
-        __qtablewidgetitem298.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem298.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 5, __qtablewidgetitem298)
-        __qtablewidgetitem299 = QTableWidgetItem()
-        __qtablewidgetitem299.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem299.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(6, 6, __qtablewidgetitem299)
-        __qtablewidgetitem300 = QTableWidgetItem()
-        __qtablewidgetitem300.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem300.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 1, __qtablewidgetitem300)
-        __qtablewidgetitem301 = QTableWidgetItem()
-        __qtablewidgetitem301.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem301.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 2, __qtablewidgetitem301)
-        __qtablewidgetitem302 = QTableWidgetItem()
-        __qtablewidgetitem302.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem302.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 3, __qtablewidgetitem302)
-        __qtablewidgetitem303 = QTableWidgetItem()
-        __qtablewidgetitem303.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem303.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 4, __qtablewidgetitem303)
-        __qtablewidgetitem304 = QTableWidgetItem()
-        __qtablewidgetitem304.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem304.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 5, __qtablewidgetitem304)
-        __qtablewidgetitem305 = QTableWidgetItem()
-        __qtablewidgetitem305.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem305.setBackground(brush28);
-        self.environmentalFactors_TableWidget.setItem(7, 6, __qtablewidgetitem305)
-        __qtablewidgetitem306 = QTableWidgetItem()
-        __qtablewidgetitem306.setTextAlignment(Qt.AlignCenter);
-        __qtablewidgetitem306.setBackground(brush29);
-        self.environmentalFactors_TableWidget.setItem(8, 0, __qtablewidgetitem306)
+        __qtablewidgetitem293.setBackground(brush29);
+        self.environmentalFactors_TableWidget.setItem(8, 0, __qtablewidgetitem293)
         self.environmentalFactors_TableWidget.setObjectName(u"environmentalFactors_TableWidget")
         self.environmentalFactors_TableWidget.setFont(font30)
         self.environmentalFactors_TableWidget.setFocusPolicy(Qt.NoFocus)
@@ -5327,6 +5348,14 @@ class Ui_Main(object):
 "QHeaderView::up-arrow {\n"
 "	image: url(:/resources/images/blackUpArrow.png);\n"
 "}\n"
+"QToolTip {\n"
+"    background-color: white;\n"
+"    color: black;\n"
+"    font-family: 'Arial';\n"
+"    font-size: 12px;\n"
+"    padding: 2px;\n"
+"    border: 2px solid black;\n"
+"}\n"
 "\n"
 "QScrollBar:vertical {\n"
 "	border: none;\n"
@@ -5344,7 +5373,8 @@ class Ui_Main(object):
 "	background: none;\n"
 "	height: 0px;\n"
 "}\n"
-"QScrollBar::sub-line:vertical {\n"
+"QScrollBar::sub-l"
+                        "ine:vertical {\n"
 "	background: none;\n"
 "	height: 0px;\n"
 "}\n"
@@ -5353,8 +5383,7 @@ class Ui_Main(object):
 "	border: none;\n"
 "	background: #3B4252;\n"
 "     height: 20px;\n"
-"     margin: 3px 0p"
-                        "x 3px 0px;\n"
+"     margin: 3px 0px 3px 0px;\n"
 "     border-radius: 7px;\n"
 "}\n"
 "QScrollBar::handle:horizontal {\n"
@@ -5878,6 +5907,7 @@ class Ui_Main(object):
 "  Factors ", None))
         self.close_Button_2.setText(QCoreApplication.translate("Main", u"   Close Project", None))
         self.label.setText(QCoreApplication.translate("Main", u"Dashboard", None))
+        self.simulateEffort_PushButton.setText(QCoreApplication.translate("Main", u"  Simulate Effort    ", None))
         self.generateReport_PushButton.setText(QCoreApplication.translate("Main", u"  Generate Report    ", None))
         self.totalActors_Label.setText(QCoreApplication.translate("Main", u"0", None))
         self.label_129.setText(QCoreApplication.translate("Main", u"Actors", None))
@@ -5987,95 +6017,69 @@ class Ui_Main(object):
         self.label_29.setText("")
         self.label_30.setText(QCoreApplication.translate("Main", u"Effort Distribution", None))
         self.label_2.setText(QCoreApplication.translate("Main", u"Actors", None))
-        ___qtablewidgetitem25 = self.actors_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem25.setText(QCoreApplication.translate("Main", u"ACTOR_ID", None));
-        ___qtablewidgetitem26 = self.actors_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem26.setText(QCoreApplication.translate("Main", u"#", None));
-        ___qtablewidgetitem27 = self.actors_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem27.setText(QCoreApplication.translate("Main", u"Code", None));
-        ___qtablewidgetitem28 = self.actors_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem28.setText(QCoreApplication.translate("Main", u"Name", None));
-        ___qtablewidgetitem29 = self.actors_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem29.setText(QCoreApplication.translate("Main", u"Complexity", None));
-        ___qtablewidgetitem30 = self.actors_TableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem30.setText(QCoreApplication.translate("Main", u"Comment", None));
         self.actorsSearch_LineEdit.setPlaceholderText(QCoreApplication.translate("Main", u" Search...", None))
         self.label_76.setText("")
         self.label_77.setText(QCoreApplication.translate("Main", u"Options", None))
         self.newActor_Button.setText(QCoreApplication.translate("Main", u"    New Actor", None))
         self.editActor_Button.setText(QCoreApplication.translate("Main", u"    Edit Actor", None))
         self.deleteActor_Button.setText(QCoreApplication.translate("Main", u"    Delete Actors", None))
-        ___qtablewidgetitem31 = self.actorsSummary_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem31.setText(QCoreApplication.translate("Main", u"Actor Type", None));
-        ___qtablewidgetitem32 = self.actorsSummary_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem32.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem33 = self.actorsSummary_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem33.setText(QCoreApplication.translate("Main", u"Weight Factor", None));
-        ___qtablewidgetitem34 = self.actorsSummary_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem34.setText(QCoreApplication.translate("Main", u"Actors", None));
-        ___qtablewidgetitem35 = self.actorsSummary_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem35.setText(QCoreApplication.translate("Main", u"UAW", None));
+        ___qtablewidgetitem25 = self.actorsSummary_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem25.setText(QCoreApplication.translate("Main", u"Actor Type", None));
+        ___qtablewidgetitem26 = self.actorsSummary_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem26.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem27 = self.actorsSummary_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem27.setText(QCoreApplication.translate("Main", u"Weight Factor", None));
+        ___qtablewidgetitem28 = self.actorsSummary_TableWidget.horizontalHeaderItem(3)
+        ___qtablewidgetitem28.setText(QCoreApplication.translate("Main", u"Actors", None));
+        ___qtablewidgetitem29 = self.actorsSummary_TableWidget.horizontalHeaderItem(4)
+        ___qtablewidgetitem29.setText(QCoreApplication.translate("Main", u"UAW", None));
 
         __sortingEnabled2 = self.actorsSummary_TableWidget.isSortingEnabled()
         self.actorsSummary_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem36 = self.actorsSummary_TableWidget.item(0, 0)
-        ___qtablewidgetitem36.setText(QCoreApplication.translate("Main", u"Simple", None));
-        ___qtablewidgetitem37 = self.actorsSummary_TableWidget.item(0, 1)
-        ___qtablewidgetitem37.setText(QCoreApplication.translate("Main", u"Another system that interacts with the system to be developed through\n"
+        ___qtablewidgetitem30 = self.actorsSummary_TableWidget.item(0, 0)
+        ___qtablewidgetitem30.setText(QCoreApplication.translate("Main", u"Simple", None));
+        ___qtablewidgetitem31 = self.actorsSummary_TableWidget.item(0, 1)
+        ___qtablewidgetitem31.setText(QCoreApplication.translate("Main", u"Another system that interacts with the system to be developed through\n"
 "an application programming interface (API)", None));
-        ___qtablewidgetitem38 = self.actorsSummary_TableWidget.item(0, 2)
-        ___qtablewidgetitem38.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem39 = self.actorsSummary_TableWidget.item(0, 3)
-        ___qtablewidgetitem39.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem40 = self.actorsSummary_TableWidget.item(0, 4)
-        ___qtablewidgetitem40.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem41 = self.actorsSummary_TableWidget.item(1, 0)
-        ___qtablewidgetitem41.setText(QCoreApplication.translate("Main", u"Average", None));
-        ___qtablewidgetitem42 = self.actorsSummary_TableWidget.item(1, 1)
-        ___qtablewidgetitem42.setText(QCoreApplication.translate("Main", u"Another system interacting through a protocol (e.g. TCP/IP) or\n"
+        ___qtablewidgetitem32 = self.actorsSummary_TableWidget.item(0, 2)
+        ___qtablewidgetitem32.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem33 = self.actorsSummary_TableWidget.item(0, 3)
+        ___qtablewidgetitem33.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem34 = self.actorsSummary_TableWidget.item(0, 4)
+        ___qtablewidgetitem34.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem35 = self.actorsSummary_TableWidget.item(1, 0)
+        ___qtablewidgetitem35.setText(QCoreApplication.translate("Main", u"Average", None));
+        ___qtablewidgetitem36 = self.actorsSummary_TableWidget.item(1, 1)
+        ___qtablewidgetitem36.setText(QCoreApplication.translate("Main", u"Another system interacting through a protocol (e.g. TCP/IP) or\n"
 "a person interacting through a text-mode interface.", None));
-        ___qtablewidgetitem43 = self.actorsSummary_TableWidget.item(1, 2)
-        ___qtablewidgetitem43.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem44 = self.actorsSummary_TableWidget.item(1, 3)
-        ___qtablewidgetitem44.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem45 = self.actorsSummary_TableWidget.item(1, 4)
-        ___qtablewidgetitem45.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem46 = self.actorsSummary_TableWidget.item(2, 0)
-        ___qtablewidgetitem46.setText(QCoreApplication.translate("Main", u"Complex", None));
-        ___qtablewidgetitem47 = self.actorsSummary_TableWidget.item(2, 1)
-        ___qtablewidgetitem47.setText(QCoreApplication.translate("Main", u"A person who interacts with the system through an interface\n"
+        ___qtablewidgetitem37 = self.actorsSummary_TableWidget.item(1, 2)
+        ___qtablewidgetitem37.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem38 = self.actorsSummary_TableWidget.item(1, 3)
+        ___qtablewidgetitem38.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem39 = self.actorsSummary_TableWidget.item(1, 4)
+        ___qtablewidgetitem39.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem40 = self.actorsSummary_TableWidget.item(2, 0)
+        ___qtablewidgetitem40.setText(QCoreApplication.translate("Main", u"Complex", None));
+        ___qtablewidgetitem41 = self.actorsSummary_TableWidget.item(2, 1)
+        ___qtablewidgetitem41.setText(QCoreApplication.translate("Main", u"A person who interacts with the system through an interface\n"
 "graphics (GUI)", None));
-        ___qtablewidgetitem48 = self.actorsSummary_TableWidget.item(2, 2)
-        ___qtablewidgetitem48.setText(QCoreApplication.translate("Main", u"3", None));
-        ___qtablewidgetitem49 = self.actorsSummary_TableWidget.item(2, 3)
-        ___qtablewidgetitem49.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem50 = self.actorsSummary_TableWidget.item(2, 4)
-        ___qtablewidgetitem50.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem51 = self.actorsSummary_TableWidget.item(3, 0)
-        ___qtablewidgetitem51.setText(QCoreApplication.translate("Main", u"TOTAL", None));
-        ___qtablewidgetitem52 = self.actorsSummary_TableWidget.item(3, 3)
-        ___qtablewidgetitem52.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem53 = self.actorsSummary_TableWidget.item(3, 4)
-        ___qtablewidgetitem53.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem42 = self.actorsSummary_TableWidget.item(2, 2)
+        ___qtablewidgetitem42.setText(QCoreApplication.translate("Main", u"3", None));
+        ___qtablewidgetitem43 = self.actorsSummary_TableWidget.item(2, 3)
+        ___qtablewidgetitem43.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem44 = self.actorsSummary_TableWidget.item(2, 4)
+        ___qtablewidgetitem44.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem45 = self.actorsSummary_TableWidget.item(3, 0)
+        ___qtablewidgetitem45.setText(QCoreApplication.translate("Main", u"TOTAL", None));
+        ___qtablewidgetitem46 = self.actorsSummary_TableWidget.item(3, 3)
+        ___qtablewidgetitem46.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem47 = self.actorsSummary_TableWidget.item(3, 4)
+        ___qtablewidgetitem47.setText(QCoreApplication.translate("Main", u"0", None));
         self.actorsSummary_TableWidget.setSortingEnabled(__sortingEnabled2)
 
         self.label_39.setText("")
         self.label_40.setText(QCoreApplication.translate("Main", u"Summary", None))
         self.useCasesSearch_LineEdit.setPlaceholderText(QCoreApplication.translate("Main", u" Search...", None))
-        ___qtablewidgetitem54 = self.useCases_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem54.setText(QCoreApplication.translate("Main", u"UC_ID", None));
-        ___qtablewidgetitem55 = self.useCases_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem55.setText(QCoreApplication.translate("Main", u"#", None));
-        ___qtablewidgetitem56 = self.useCases_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem56.setText(QCoreApplication.translate("Main", u"Code", None));
-        ___qtablewidgetitem57 = self.useCases_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem57.setText(QCoreApplication.translate("Main", u"Name", None));
-        ___qtablewidgetitem58 = self.useCases_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem58.setText(QCoreApplication.translate("Main", u"Complexity", None));
-        ___qtablewidgetitem59 = self.useCases_TableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem59.setText(QCoreApplication.translate("Main", u"Transactions", None));
-        ___qtablewidgetitem60 = self.useCases_TableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem60.setText(QCoreApplication.translate("Main", u"Comment", None));
         self.label_61.setText("")
         self.label_62.setText(QCoreApplication.translate("Main", u"Options", None))
         self.newUseCase_Button.setText(QCoreApplication.translate("Main", u"    New Use Case", None))
@@ -6084,207 +6088,207 @@ class Ui_Main(object):
         self.label_5.setText(QCoreApplication.translate("Main", u"Use Cases", None))
         self.label_41.setText("")
         self.label_42.setText(QCoreApplication.translate("Main", u"Summary", None))
-        ___qtablewidgetitem61 = self.useCasesSummary_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem61.setText(QCoreApplication.translate("Main", u"Use Case Type", None));
-        ___qtablewidgetitem62 = self.useCasesSummary_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem62.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem63 = self.useCasesSummary_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem63.setText(QCoreApplication.translate("Main", u"Weight Factor", None));
-        ___qtablewidgetitem64 = self.useCasesSummary_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem64.setText(QCoreApplication.translate("Main", u"Use Cases", None));
-        ___qtablewidgetitem65 = self.useCasesSummary_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem65.setText(QCoreApplication.translate("Main", u"UUCW", None));
+        ___qtablewidgetitem48 = self.useCasesSummary_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem48.setText(QCoreApplication.translate("Main", u"Use Case Type", None));
+        ___qtablewidgetitem49 = self.useCasesSummary_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem49.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem50 = self.useCasesSummary_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem50.setText(QCoreApplication.translate("Main", u"Weight Factor", None));
+        ___qtablewidgetitem51 = self.useCasesSummary_TableWidget.horizontalHeaderItem(3)
+        ___qtablewidgetitem51.setText(QCoreApplication.translate("Main", u"Use Cases", None));
+        ___qtablewidgetitem52 = self.useCasesSummary_TableWidget.horizontalHeaderItem(4)
+        ___qtablewidgetitem52.setText(QCoreApplication.translate("Main", u"UUCW", None));
 
         __sortingEnabled3 = self.useCasesSummary_TableWidget.isSortingEnabled()
         self.useCasesSummary_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem66 = self.useCasesSummary_TableWidget.item(0, 0)
-        ___qtablewidgetitem66.setText(QCoreApplication.translate("Main", u"Simple", None));
-        ___qtablewidgetitem67 = self.useCasesSummary_TableWidget.item(0, 1)
-        ___qtablewidgetitem67.setText(QCoreApplication.translate("Main", u"Number of Transactions: from 1 to 3", None));
-        ___qtablewidgetitem68 = self.useCasesSummary_TableWidget.item(0, 2)
-        ___qtablewidgetitem68.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem69 = self.useCasesSummary_TableWidget.item(0, 3)
+        ___qtablewidgetitem53 = self.useCasesSummary_TableWidget.item(0, 0)
+        ___qtablewidgetitem53.setText(QCoreApplication.translate("Main", u"Simple", None));
+        ___qtablewidgetitem54 = self.useCasesSummary_TableWidget.item(0, 1)
+        ___qtablewidgetitem54.setText(QCoreApplication.translate("Main", u"Number of Transactions: from 1 to 3", None));
+        ___qtablewidgetitem55 = self.useCasesSummary_TableWidget.item(0, 2)
+        ___qtablewidgetitem55.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem56 = self.useCasesSummary_TableWidget.item(0, 3)
+        ___qtablewidgetitem56.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem57 = self.useCasesSummary_TableWidget.item(0, 4)
+        ___qtablewidgetitem57.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem58 = self.useCasesSummary_TableWidget.item(1, 0)
+        ___qtablewidgetitem58.setText(QCoreApplication.translate("Main", u"Average", None));
+        ___qtablewidgetitem59 = self.useCasesSummary_TableWidget.item(1, 1)
+        ___qtablewidgetitem59.setText(QCoreApplication.translate("Main", u"Number of Transactions: from 4 to 7", None));
+        ___qtablewidgetitem60 = self.useCasesSummary_TableWidget.item(1, 2)
+        ___qtablewidgetitem60.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem61 = self.useCasesSummary_TableWidget.item(1, 3)
+        ___qtablewidgetitem61.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem62 = self.useCasesSummary_TableWidget.item(1, 4)
+        ___qtablewidgetitem62.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem63 = self.useCasesSummary_TableWidget.item(2, 0)
+        ___qtablewidgetitem63.setText(QCoreApplication.translate("Main", u"Complex", None));
+        ___qtablewidgetitem64 = self.useCasesSummary_TableWidget.item(2, 1)
+        ___qtablewidgetitem64.setText(QCoreApplication.translate("Main", u"Numer of Transactions: more than 7", None));
+        ___qtablewidgetitem65 = self.useCasesSummary_TableWidget.item(2, 2)
+        ___qtablewidgetitem65.setText(QCoreApplication.translate("Main", u"3", None));
+        ___qtablewidgetitem66 = self.useCasesSummary_TableWidget.item(2, 3)
+        ___qtablewidgetitem66.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem67 = self.useCasesSummary_TableWidget.item(2, 4)
+        ___qtablewidgetitem67.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem68 = self.useCasesSummary_TableWidget.item(3, 0)
+        ___qtablewidgetitem68.setText(QCoreApplication.translate("Main", u"TOTAL", None));
+        ___qtablewidgetitem69 = self.useCasesSummary_TableWidget.item(3, 3)
         ___qtablewidgetitem69.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem70 = self.useCasesSummary_TableWidget.item(0, 4)
+        ___qtablewidgetitem70 = self.useCasesSummary_TableWidget.item(3, 4)
         ___qtablewidgetitem70.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem71 = self.useCasesSummary_TableWidget.item(1, 0)
-        ___qtablewidgetitem71.setText(QCoreApplication.translate("Main", u"Average", None));
-        ___qtablewidgetitem72 = self.useCasesSummary_TableWidget.item(1, 1)
-        ___qtablewidgetitem72.setText(QCoreApplication.translate("Main", u"Number of Transactions: from 4 to 7", None));
-        ___qtablewidgetitem73 = self.useCasesSummary_TableWidget.item(1, 2)
-        ___qtablewidgetitem73.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem74 = self.useCasesSummary_TableWidget.item(1, 3)
-        ___qtablewidgetitem74.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem75 = self.useCasesSummary_TableWidget.item(1, 4)
-        ___qtablewidgetitem75.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem76 = self.useCasesSummary_TableWidget.item(2, 0)
-        ___qtablewidgetitem76.setText(QCoreApplication.translate("Main", u"Complex", None));
-        ___qtablewidgetitem77 = self.useCasesSummary_TableWidget.item(2, 1)
-        ___qtablewidgetitem77.setText(QCoreApplication.translate("Main", u"Numer of Transactions: more than 7", None));
-        ___qtablewidgetitem78 = self.useCasesSummary_TableWidget.item(2, 2)
-        ___qtablewidgetitem78.setText(QCoreApplication.translate("Main", u"3", None));
-        ___qtablewidgetitem79 = self.useCasesSummary_TableWidget.item(2, 3)
-        ___qtablewidgetitem79.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem80 = self.useCasesSummary_TableWidget.item(2, 4)
-        ___qtablewidgetitem80.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem81 = self.useCasesSummary_TableWidget.item(3, 0)
-        ___qtablewidgetitem81.setText(QCoreApplication.translate("Main", u"TOTAL", None));
-        ___qtablewidgetitem82 = self.useCasesSummary_TableWidget.item(3, 3)
-        ___qtablewidgetitem82.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem83 = self.useCasesSummary_TableWidget.item(3, 4)
-        ___qtablewidgetitem83.setText(QCoreApplication.translate("Main", u"0", None));
         self.useCasesSummary_TableWidget.setSortingEnabled(__sortingEnabled3)
 
         self.label_4.setText(QCoreApplication.translate("Main", u"Technical Factors", None))
-        ___qtablewidgetitem84 = self.technicalFactors_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem84.setText(QCoreApplication.translate("Main", u"Total", None));
-        ___qtablewidgetitem85 = self.technicalFactors_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem85.setText(QCoreApplication.translate("Main", u"Factor", None));
-        ___qtablewidgetitem86 = self.technicalFactors_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem86.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem87 = self.technicalFactors_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem87.setText(QCoreApplication.translate("Main", u"Weight", None));
-        ___qtablewidgetitem88 = self.technicalFactors_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem88.setText(QCoreApplication.translate("Main", u"Influence", None));
-        ___qtablewidgetitem89 = self.technicalFactors_TableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem89.setText(QCoreApplication.translate("Main", u"Result", None));
-        ___qtablewidgetitem90 = self.technicalFactors_TableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem90.setText(QCoreApplication.translate("Main", u"Comment", None));
+        ___qtablewidgetitem71 = self.technicalFactors_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem71.setText(QCoreApplication.translate("Main", u"Total", None));
+        ___qtablewidgetitem72 = self.technicalFactors_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem72.setText(QCoreApplication.translate("Main", u"Factor", None));
+        ___qtablewidgetitem73 = self.technicalFactors_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem73.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem74 = self.technicalFactors_TableWidget.horizontalHeaderItem(3)
+        ___qtablewidgetitem74.setText(QCoreApplication.translate("Main", u"Weight", None));
+        ___qtablewidgetitem75 = self.technicalFactors_TableWidget.horizontalHeaderItem(4)
+        ___qtablewidgetitem75.setText(QCoreApplication.translate("Main", u"Influence", None));
+        ___qtablewidgetitem76 = self.technicalFactors_TableWidget.horizontalHeaderItem(5)
+        ___qtablewidgetitem76.setText(QCoreApplication.translate("Main", u"Result", None));
+        ___qtablewidgetitem77 = self.technicalFactors_TableWidget.horizontalHeaderItem(6)
+        ___qtablewidgetitem77.setText(QCoreApplication.translate("Main", u"Comment", None));
 
         __sortingEnabled4 = self.technicalFactors_TableWidget.isSortingEnabled()
         self.technicalFactors_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem91 = self.technicalFactors_TableWidget.item(0, 1)
-        ___qtablewidgetitem91.setText(QCoreApplication.translate("Main", u"T01", None));
-        ___qtablewidgetitem92 = self.technicalFactors_TableWidget.item(0, 2)
-        ___qtablewidgetitem92.setText(QCoreApplication.translate("Main", u"Distributed system", None));
-        ___qtablewidgetitem93 = self.technicalFactors_TableWidget.item(0, 3)
-        ___qtablewidgetitem93.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem94 = self.technicalFactors_TableWidget.item(0, 4)
-        ___qtablewidgetitem94.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem95 = self.technicalFactors_TableWidget.item(0, 5)
-        ___qtablewidgetitem95.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem96 = self.technicalFactors_TableWidget.item(1, 1)
-        ___qtablewidgetitem96.setText(QCoreApplication.translate("Main", u"T02", None));
-        ___qtablewidgetitem97 = self.technicalFactors_TableWidget.item(1, 2)
-        ___qtablewidgetitem97.setText(QCoreApplication.translate("Main", u"Performance or response time", None));
-        ___qtablewidgetitem98 = self.technicalFactors_TableWidget.item(1, 3)
-        ___qtablewidgetitem98.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem99 = self.technicalFactors_TableWidget.item(1, 4)
-        ___qtablewidgetitem99.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem100 = self.technicalFactors_TableWidget.item(1, 5)
-        ___qtablewidgetitem100.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem101 = self.technicalFactors_TableWidget.item(2, 1)
-        ___qtablewidgetitem101.setText(QCoreApplication.translate("Main", u"T03", None));
-        ___qtablewidgetitem102 = self.technicalFactors_TableWidget.item(2, 2)
-        ___qtablewidgetitem102.setText(QCoreApplication.translate("Main", u"End user efficiency", None));
-        ___qtablewidgetitem103 = self.technicalFactors_TableWidget.item(2, 3)
-        ___qtablewidgetitem103.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem104 = self.technicalFactors_TableWidget.item(2, 4)
-        ___qtablewidgetitem104.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem105 = self.technicalFactors_TableWidget.item(2, 5)
-        ___qtablewidgetitem105.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem106 = self.technicalFactors_TableWidget.item(3, 1)
-        ___qtablewidgetitem106.setText(QCoreApplication.translate("Main", u"T04", None));
-        ___qtablewidgetitem107 = self.technicalFactors_TableWidget.item(3, 2)
-        ___qtablewidgetitem107.setText(QCoreApplication.translate("Main", u"Complex internal processing", None));
-        ___qtablewidgetitem108 = self.technicalFactors_TableWidget.item(3, 3)
-        ___qtablewidgetitem108.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem109 = self.technicalFactors_TableWidget.item(3, 4)
-        ___qtablewidgetitem109.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem110 = self.technicalFactors_TableWidget.item(3, 5)
-        ___qtablewidgetitem110.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem111 = self.technicalFactors_TableWidget.item(4, 1)
-        ___qtablewidgetitem111.setText(QCoreApplication.translate("Main", u"T05", None));
-        ___qtablewidgetitem112 = self.technicalFactors_TableWidget.item(4, 2)
-        ___qtablewidgetitem112.setText(QCoreApplication.translate("Main", u"The code must be reusable (reusability)", None));
-        ___qtablewidgetitem113 = self.technicalFactors_TableWidget.item(4, 3)
-        ___qtablewidgetitem113.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem114 = self.technicalFactors_TableWidget.item(4, 4)
-        ___qtablewidgetitem114.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem115 = self.technicalFactors_TableWidget.item(4, 5)
-        ___qtablewidgetitem115.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem116 = self.technicalFactors_TableWidget.item(5, 1)
-        ___qtablewidgetitem116.setText(QCoreApplication.translate("Main", u"T06", None));
-        ___qtablewidgetitem117 = self.technicalFactors_TableWidget.item(5, 2)
-        ___qtablewidgetitem117.setText(QCoreApplication.translate("Main", u"Ease of installation", None));
-        ___qtablewidgetitem118 = self.technicalFactors_TableWidget.item(5, 3)
-        ___qtablewidgetitem118.setText(QCoreApplication.translate("Main", u"0.5", None));
-        ___qtablewidgetitem119 = self.technicalFactors_TableWidget.item(5, 4)
-        ___qtablewidgetitem119.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem120 = self.technicalFactors_TableWidget.item(5, 5)
-        ___qtablewidgetitem120.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem121 = self.technicalFactors_TableWidget.item(6, 1)
-        ___qtablewidgetitem121.setText(QCoreApplication.translate("Main", u"T07", None));
-        ___qtablewidgetitem122 = self.technicalFactors_TableWidget.item(6, 2)
-        ___qtablewidgetitem122.setText(QCoreApplication.translate("Main", u"Easy to use", None));
-        ___qtablewidgetitem123 = self.technicalFactors_TableWidget.item(6, 3)
-        ___qtablewidgetitem123.setText(QCoreApplication.translate("Main", u"0.5", None));
-        ___qtablewidgetitem124 = self.technicalFactors_TableWidget.item(6, 4)
-        ___qtablewidgetitem124.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem125 = self.technicalFactors_TableWidget.item(6, 5)
-        ___qtablewidgetitem125.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem126 = self.technicalFactors_TableWidget.item(7, 1)
-        ___qtablewidgetitem126.setText(QCoreApplication.translate("Main", u"T08", None));
-        ___qtablewidgetitem127 = self.technicalFactors_TableWidget.item(7, 2)
-        ___qtablewidgetitem127.setText(QCoreApplication.translate("Main", u"Portability", None));
-        ___qtablewidgetitem128 = self.technicalFactors_TableWidget.item(7, 3)
-        ___qtablewidgetitem128.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem129 = self.technicalFactors_TableWidget.item(7, 4)
-        ___qtablewidgetitem129.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem130 = self.technicalFactors_TableWidget.item(7, 5)
-        ___qtablewidgetitem130.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem131 = self.technicalFactors_TableWidget.item(8, 1)
-        ___qtablewidgetitem131.setText(QCoreApplication.translate("Main", u"T09", None));
-        ___qtablewidgetitem132 = self.technicalFactors_TableWidget.item(8, 2)
-        ___qtablewidgetitem132.setText(QCoreApplication.translate("Main", u"Ease of change", None));
-        ___qtablewidgetitem133 = self.technicalFactors_TableWidget.item(8, 3)
-        ___qtablewidgetitem133.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem134 = self.technicalFactors_TableWidget.item(8, 4)
-        ___qtablewidgetitem134.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem135 = self.technicalFactors_TableWidget.item(8, 5)
-        ___qtablewidgetitem135.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem136 = self.technicalFactors_TableWidget.item(9, 1)
-        ___qtablewidgetitem136.setText(QCoreApplication.translate("Main", u"T10", None));
-        ___qtablewidgetitem137 = self.technicalFactors_TableWidget.item(9, 2)
-        ___qtablewidgetitem137.setText(QCoreApplication.translate("Main", u"Concurrence", None));
-        ___qtablewidgetitem138 = self.technicalFactors_TableWidget.item(9, 3)
-        ___qtablewidgetitem138.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem139 = self.technicalFactors_TableWidget.item(9, 4)
-        ___qtablewidgetitem139.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem140 = self.technicalFactors_TableWidget.item(9, 5)
-        ___qtablewidgetitem140.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem141 = self.technicalFactors_TableWidget.item(10, 1)
-        ___qtablewidgetitem141.setText(QCoreApplication.translate("Main", u"T11", None));
-        ___qtablewidgetitem142 = self.technicalFactors_TableWidget.item(10, 2)
-        ___qtablewidgetitem142.setText(QCoreApplication.translate("Main", u"Special security features", None));
-        ___qtablewidgetitem143 = self.technicalFactors_TableWidget.item(10, 3)
-        ___qtablewidgetitem143.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem144 = self.technicalFactors_TableWidget.item(10, 4)
-        ___qtablewidgetitem144.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem145 = self.technicalFactors_TableWidget.item(10, 5)
-        ___qtablewidgetitem145.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem146 = self.technicalFactors_TableWidget.item(11, 1)
-        ___qtablewidgetitem146.setText(QCoreApplication.translate("Main", u"T12", None));
-        ___qtablewidgetitem147 = self.technicalFactors_TableWidget.item(11, 2)
-        ___qtablewidgetitem147.setText(QCoreApplication.translate("Main", u"Provides direct access to third parties", None));
-        ___qtablewidgetitem148 = self.technicalFactors_TableWidget.item(11, 3)
-        ___qtablewidgetitem148.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem149 = self.technicalFactors_TableWidget.item(11, 4)
-        ___qtablewidgetitem149.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem150 = self.technicalFactors_TableWidget.item(11, 5)
-        ___qtablewidgetitem150.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem151 = self.technicalFactors_TableWidget.item(12, 1)
-        ___qtablewidgetitem151.setText(QCoreApplication.translate("Main", u"T13", None));
-        ___qtablewidgetitem152 = self.technicalFactors_TableWidget.item(12, 2)
-        ___qtablewidgetitem152.setText(QCoreApplication.translate("Main", u"Special user training required", None));
-        ___qtablewidgetitem153 = self.technicalFactors_TableWidget.item(12, 3)
-        ___qtablewidgetitem153.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem154 = self.technicalFactors_TableWidget.item(12, 4)
-        ___qtablewidgetitem154.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem155 = self.technicalFactors_TableWidget.item(12, 5)
-        ___qtablewidgetitem155.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem156 = self.technicalFactors_TableWidget.item(13, 0)
-        ___qtablewidgetitem156.setText(QCoreApplication.translate("Main", u"TFactor: 0", None));
+        ___qtablewidgetitem78 = self.technicalFactors_TableWidget.item(0, 1)
+        ___qtablewidgetitem78.setText(QCoreApplication.translate("Main", u"T01", None));
+        ___qtablewidgetitem79 = self.technicalFactors_TableWidget.item(0, 2)
+        ___qtablewidgetitem79.setText(QCoreApplication.translate("Main", u"Distributed system", None));
+        ___qtablewidgetitem80 = self.technicalFactors_TableWidget.item(0, 3)
+        ___qtablewidgetitem80.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem81 = self.technicalFactors_TableWidget.item(0, 4)
+        ___qtablewidgetitem81.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem82 = self.technicalFactors_TableWidget.item(0, 5)
+        ___qtablewidgetitem82.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem83 = self.technicalFactors_TableWidget.item(1, 1)
+        ___qtablewidgetitem83.setText(QCoreApplication.translate("Main", u"T02", None));
+        ___qtablewidgetitem84 = self.technicalFactors_TableWidget.item(1, 2)
+        ___qtablewidgetitem84.setText(QCoreApplication.translate("Main", u"Performance or response time", None));
+        ___qtablewidgetitem85 = self.technicalFactors_TableWidget.item(1, 3)
+        ___qtablewidgetitem85.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem86 = self.technicalFactors_TableWidget.item(1, 4)
+        ___qtablewidgetitem86.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem87 = self.technicalFactors_TableWidget.item(1, 5)
+        ___qtablewidgetitem87.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem88 = self.technicalFactors_TableWidget.item(2, 1)
+        ___qtablewidgetitem88.setText(QCoreApplication.translate("Main", u"T03", None));
+        ___qtablewidgetitem89 = self.technicalFactors_TableWidget.item(2, 2)
+        ___qtablewidgetitem89.setText(QCoreApplication.translate("Main", u"End user efficiency", None));
+        ___qtablewidgetitem90 = self.technicalFactors_TableWidget.item(2, 3)
+        ___qtablewidgetitem90.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem91 = self.technicalFactors_TableWidget.item(2, 4)
+        ___qtablewidgetitem91.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem92 = self.technicalFactors_TableWidget.item(2, 5)
+        ___qtablewidgetitem92.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem93 = self.technicalFactors_TableWidget.item(3, 1)
+        ___qtablewidgetitem93.setText(QCoreApplication.translate("Main", u"T04", None));
+        ___qtablewidgetitem94 = self.technicalFactors_TableWidget.item(3, 2)
+        ___qtablewidgetitem94.setText(QCoreApplication.translate("Main", u"Complex internal processing", None));
+        ___qtablewidgetitem95 = self.technicalFactors_TableWidget.item(3, 3)
+        ___qtablewidgetitem95.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem96 = self.technicalFactors_TableWidget.item(3, 4)
+        ___qtablewidgetitem96.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem97 = self.technicalFactors_TableWidget.item(3, 5)
+        ___qtablewidgetitem97.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem98 = self.technicalFactors_TableWidget.item(4, 1)
+        ___qtablewidgetitem98.setText(QCoreApplication.translate("Main", u"T05", None));
+        ___qtablewidgetitem99 = self.technicalFactors_TableWidget.item(4, 2)
+        ___qtablewidgetitem99.setText(QCoreApplication.translate("Main", u"The code must be reusable (reusability)", None));
+        ___qtablewidgetitem100 = self.technicalFactors_TableWidget.item(4, 3)
+        ___qtablewidgetitem100.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem101 = self.technicalFactors_TableWidget.item(4, 4)
+        ___qtablewidgetitem101.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem102 = self.technicalFactors_TableWidget.item(4, 5)
+        ___qtablewidgetitem102.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem103 = self.technicalFactors_TableWidget.item(5, 1)
+        ___qtablewidgetitem103.setText(QCoreApplication.translate("Main", u"T06", None));
+        ___qtablewidgetitem104 = self.technicalFactors_TableWidget.item(5, 2)
+        ___qtablewidgetitem104.setText(QCoreApplication.translate("Main", u"Ease of installation", None));
+        ___qtablewidgetitem105 = self.technicalFactors_TableWidget.item(5, 3)
+        ___qtablewidgetitem105.setText(QCoreApplication.translate("Main", u"0.5", None));
+        ___qtablewidgetitem106 = self.technicalFactors_TableWidget.item(5, 4)
+        ___qtablewidgetitem106.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem107 = self.technicalFactors_TableWidget.item(5, 5)
+        ___qtablewidgetitem107.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem108 = self.technicalFactors_TableWidget.item(6, 1)
+        ___qtablewidgetitem108.setText(QCoreApplication.translate("Main", u"T07", None));
+        ___qtablewidgetitem109 = self.technicalFactors_TableWidget.item(6, 2)
+        ___qtablewidgetitem109.setText(QCoreApplication.translate("Main", u"Easy to use", None));
+        ___qtablewidgetitem110 = self.technicalFactors_TableWidget.item(6, 3)
+        ___qtablewidgetitem110.setText(QCoreApplication.translate("Main", u"0.5", None));
+        ___qtablewidgetitem111 = self.technicalFactors_TableWidget.item(6, 4)
+        ___qtablewidgetitem111.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem112 = self.technicalFactors_TableWidget.item(6, 5)
+        ___qtablewidgetitem112.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem113 = self.technicalFactors_TableWidget.item(7, 1)
+        ___qtablewidgetitem113.setText(QCoreApplication.translate("Main", u"T08", None));
+        ___qtablewidgetitem114 = self.technicalFactors_TableWidget.item(7, 2)
+        ___qtablewidgetitem114.setText(QCoreApplication.translate("Main", u"Portability", None));
+        ___qtablewidgetitem115 = self.technicalFactors_TableWidget.item(7, 3)
+        ___qtablewidgetitem115.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem116 = self.technicalFactors_TableWidget.item(7, 4)
+        ___qtablewidgetitem116.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem117 = self.technicalFactors_TableWidget.item(7, 5)
+        ___qtablewidgetitem117.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem118 = self.technicalFactors_TableWidget.item(8, 1)
+        ___qtablewidgetitem118.setText(QCoreApplication.translate("Main", u"T09", None));
+        ___qtablewidgetitem119 = self.technicalFactors_TableWidget.item(8, 2)
+        ___qtablewidgetitem119.setText(QCoreApplication.translate("Main", u"Ease of change", None));
+        ___qtablewidgetitem120 = self.technicalFactors_TableWidget.item(8, 3)
+        ___qtablewidgetitem120.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem121 = self.technicalFactors_TableWidget.item(8, 4)
+        ___qtablewidgetitem121.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem122 = self.technicalFactors_TableWidget.item(8, 5)
+        ___qtablewidgetitem122.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem123 = self.technicalFactors_TableWidget.item(9, 1)
+        ___qtablewidgetitem123.setText(QCoreApplication.translate("Main", u"T10", None));
+        ___qtablewidgetitem124 = self.technicalFactors_TableWidget.item(9, 2)
+        ___qtablewidgetitem124.setText(QCoreApplication.translate("Main", u"Concurrence", None));
+        ___qtablewidgetitem125 = self.technicalFactors_TableWidget.item(9, 3)
+        ___qtablewidgetitem125.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem126 = self.technicalFactors_TableWidget.item(9, 4)
+        ___qtablewidgetitem126.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem127 = self.technicalFactors_TableWidget.item(9, 5)
+        ___qtablewidgetitem127.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem128 = self.technicalFactors_TableWidget.item(10, 1)
+        ___qtablewidgetitem128.setText(QCoreApplication.translate("Main", u"T11", None));
+        ___qtablewidgetitem129 = self.technicalFactors_TableWidget.item(10, 2)
+        ___qtablewidgetitem129.setText(QCoreApplication.translate("Main", u"Special security features", None));
+        ___qtablewidgetitem130 = self.technicalFactors_TableWidget.item(10, 3)
+        ___qtablewidgetitem130.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem131 = self.technicalFactors_TableWidget.item(10, 4)
+        ___qtablewidgetitem131.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem132 = self.technicalFactors_TableWidget.item(10, 5)
+        ___qtablewidgetitem132.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem133 = self.technicalFactors_TableWidget.item(11, 1)
+        ___qtablewidgetitem133.setText(QCoreApplication.translate("Main", u"T12", None));
+        ___qtablewidgetitem134 = self.technicalFactors_TableWidget.item(11, 2)
+        ___qtablewidgetitem134.setText(QCoreApplication.translate("Main", u"Provides direct access to third parties", None));
+        ___qtablewidgetitem135 = self.technicalFactors_TableWidget.item(11, 3)
+        ___qtablewidgetitem135.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem136 = self.technicalFactors_TableWidget.item(11, 4)
+        ___qtablewidgetitem136.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem137 = self.technicalFactors_TableWidget.item(11, 5)
+        ___qtablewidgetitem137.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem138 = self.technicalFactors_TableWidget.item(12, 1)
+        ___qtablewidgetitem138.setText(QCoreApplication.translate("Main", u"T13", None));
+        ___qtablewidgetitem139 = self.technicalFactors_TableWidget.item(12, 2)
+        ___qtablewidgetitem139.setText(QCoreApplication.translate("Main", u"Special user training required", None));
+        ___qtablewidgetitem140 = self.technicalFactors_TableWidget.item(12, 3)
+        ___qtablewidgetitem140.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem141 = self.technicalFactors_TableWidget.item(12, 4)
+        ___qtablewidgetitem141.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem142 = self.technicalFactors_TableWidget.item(12, 5)
+        ___qtablewidgetitem142.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem143 = self.technicalFactors_TableWidget.item(13, 0)
+        ___qtablewidgetitem143.setText(QCoreApplication.translate("Main", u"TFactor: 0", None));
         self.technicalFactors_TableWidget.setSortingEnabled(__sortingEnabled4)
 
         self.cancelTechnicalFactor_Button.setText(QCoreApplication.translate("Main", u"  Cancel", None))
@@ -6325,175 +6329,175 @@ class Ui_Main(object):
         self.label_63.setText("")
         self.label_7.setText(QCoreApplication.translate("Main", u"Weight", None))
         self.warning_TF_label.setText("")
-        ___qtablewidgetitem157 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem157.setText(QCoreApplication.translate("Main", u"Factor Type", None));
-        ___qtablewidgetitem158 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem158.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem159 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem159.setText(QCoreApplication.translate("Main", u"Factors", None));
+        ___qtablewidgetitem144 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem144.setText(QCoreApplication.translate("Main", u"Factor Type", None));
+        ___qtablewidgetitem145 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem145.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem146 = self.technicalFactorsSummary_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem146.setText(QCoreApplication.translate("Main", u"Factors", None));
 
         __sortingEnabled5 = self.technicalFactorsSummary_TableWidget.isSortingEnabled()
         self.technicalFactorsSummary_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem160 = self.technicalFactorsSummary_TableWidget.item(0, 0)
-        ___qtablewidgetitem160.setText(QCoreApplication.translate("Main", u"Irrelevant", None));
-        ___qtablewidgetitem161 = self.technicalFactorsSummary_TableWidget.item(0, 1)
-        ___qtablewidgetitem161.setText(QCoreApplication.translate("Main", u"Influence: from 0 to 2", None));
-        ___qtablewidgetitem162 = self.technicalFactorsSummary_TableWidget.item(0, 2)
-        ___qtablewidgetitem162.setText(QCoreApplication.translate("Main", u"13", None));
-        ___qtablewidgetitem163 = self.technicalFactorsSummary_TableWidget.item(1, 0)
-        ___qtablewidgetitem163.setText(QCoreApplication.translate("Main", u"Medium", None));
-        ___qtablewidgetitem164 = self.technicalFactorsSummary_TableWidget.item(1, 1)
-        ___qtablewidgetitem164.setText(QCoreApplication.translate("Main", u"Influence: from 3 to 4", None));
-        ___qtablewidgetitem165 = self.technicalFactorsSummary_TableWidget.item(1, 2)
-        ___qtablewidgetitem165.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem166 = self.technicalFactorsSummary_TableWidget.item(2, 0)
-        ___qtablewidgetitem166.setText(QCoreApplication.translate("Main", u"Essential", None));
-        ___qtablewidgetitem167 = self.technicalFactorsSummary_TableWidget.item(2, 1)
-        ___qtablewidgetitem167.setText(QCoreApplication.translate("Main", u"Influence: 5", None));
-        ___qtablewidgetitem168 = self.technicalFactorsSummary_TableWidget.item(2, 2)
-        ___qtablewidgetitem168.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem169 = self.technicalFactorsSummary_TableWidget.item(3, 0)
-        ___qtablewidgetitem169.setText(QCoreApplication.translate("Main", u"TOTAL", None));
-        ___qtablewidgetitem170 = self.technicalFactorsSummary_TableWidget.item(3, 2)
-        ___qtablewidgetitem170.setText(QCoreApplication.translate("Main", u"13", None));
+        ___qtablewidgetitem147 = self.technicalFactorsSummary_TableWidget.item(0, 0)
+        ___qtablewidgetitem147.setText(QCoreApplication.translate("Main", u"Irrelevant", None));
+        ___qtablewidgetitem148 = self.technicalFactorsSummary_TableWidget.item(0, 1)
+        ___qtablewidgetitem148.setText(QCoreApplication.translate("Main", u"Influence: from 0 to 2", None));
+        ___qtablewidgetitem149 = self.technicalFactorsSummary_TableWidget.item(0, 2)
+        ___qtablewidgetitem149.setText(QCoreApplication.translate("Main", u"13", None));
+        ___qtablewidgetitem150 = self.technicalFactorsSummary_TableWidget.item(1, 0)
+        ___qtablewidgetitem150.setText(QCoreApplication.translate("Main", u"Medium", None));
+        ___qtablewidgetitem151 = self.technicalFactorsSummary_TableWidget.item(1, 1)
+        ___qtablewidgetitem151.setText(QCoreApplication.translate("Main", u"Influence: from 3 to 4", None));
+        ___qtablewidgetitem152 = self.technicalFactorsSummary_TableWidget.item(1, 2)
+        ___qtablewidgetitem152.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem153 = self.technicalFactorsSummary_TableWidget.item(2, 0)
+        ___qtablewidgetitem153.setText(QCoreApplication.translate("Main", u"Essential", None));
+        ___qtablewidgetitem154 = self.technicalFactorsSummary_TableWidget.item(2, 1)
+        ___qtablewidgetitem154.setText(QCoreApplication.translate("Main", u"Influence: 5", None));
+        ___qtablewidgetitem155 = self.technicalFactorsSummary_TableWidget.item(2, 2)
+        ___qtablewidgetitem155.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem156 = self.technicalFactorsSummary_TableWidget.item(3, 0)
+        ___qtablewidgetitem156.setText(QCoreApplication.translate("Main", u"TOTAL", None));
+        ___qtablewidgetitem157 = self.technicalFactorsSummary_TableWidget.item(3, 2)
+        ___qtablewidgetitem157.setText(QCoreApplication.translate("Main", u"13", None));
         self.technicalFactorsSummary_TableWidget.setSortingEnabled(__sortingEnabled5)
 
         self.label_65.setText(QCoreApplication.translate("Main", u"Summary", None))
         self.label_73.setText("")
-        ___qtablewidgetitem171 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem171.setText(QCoreApplication.translate("Main", u"Factor Type", None));
-        ___qtablewidgetitem172 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem172.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem173 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem173.setText(QCoreApplication.translate("Main", u"Factors", None));
+        ___qtablewidgetitem158 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem158.setText(QCoreApplication.translate("Main", u"Factor Type", None));
+        ___qtablewidgetitem159 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem159.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem160 = self.environmentalFactorsSummary_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem160.setText(QCoreApplication.translate("Main", u"Factors", None));
 
         __sortingEnabled6 = self.environmentalFactorsSummary_TableWidget.isSortingEnabled()
         self.environmentalFactorsSummary_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem174 = self.environmentalFactorsSummary_TableWidget.item(0, 0)
-        ___qtablewidgetitem174.setText(QCoreApplication.translate("Main", u"Irrelevant", None));
-        ___qtablewidgetitem175 = self.environmentalFactorsSummary_TableWidget.item(0, 1)
-        ___qtablewidgetitem175.setText(QCoreApplication.translate("Main", u"Influence: from 0 to 2", None));
-        ___qtablewidgetitem176 = self.environmentalFactorsSummary_TableWidget.item(0, 2)
-        ___qtablewidgetitem176.setText(QCoreApplication.translate("Main", u"8", None));
-        ___qtablewidgetitem177 = self.environmentalFactorsSummary_TableWidget.item(1, 0)
-        ___qtablewidgetitem177.setText(QCoreApplication.translate("Main", u"Medium", None));
-        ___qtablewidgetitem178 = self.environmentalFactorsSummary_TableWidget.item(1, 1)
-        ___qtablewidgetitem178.setText(QCoreApplication.translate("Main", u"Influence: from 3 to 4", None));
-        ___qtablewidgetitem179 = self.environmentalFactorsSummary_TableWidget.item(1, 2)
-        ___qtablewidgetitem179.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem180 = self.environmentalFactorsSummary_TableWidget.item(2, 0)
-        ___qtablewidgetitem180.setText(QCoreApplication.translate("Main", u"Essential", None));
-        ___qtablewidgetitem181 = self.environmentalFactorsSummary_TableWidget.item(2, 1)
-        ___qtablewidgetitem181.setText(QCoreApplication.translate("Main", u"Influence: 5", None));
-        ___qtablewidgetitem182 = self.environmentalFactorsSummary_TableWidget.item(2, 2)
-        ___qtablewidgetitem182.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem183 = self.environmentalFactorsSummary_TableWidget.item(3, 0)
-        ___qtablewidgetitem183.setText(QCoreApplication.translate("Main", u"TOTAL", None));
-        ___qtablewidgetitem184 = self.environmentalFactorsSummary_TableWidget.item(3, 2)
-        ___qtablewidgetitem184.setText(QCoreApplication.translate("Main", u"8", None));
+        ___qtablewidgetitem161 = self.environmentalFactorsSummary_TableWidget.item(0, 0)
+        ___qtablewidgetitem161.setText(QCoreApplication.translate("Main", u"Irrelevant", None));
+        ___qtablewidgetitem162 = self.environmentalFactorsSummary_TableWidget.item(0, 1)
+        ___qtablewidgetitem162.setText(QCoreApplication.translate("Main", u"Influence: from 0 to 2", None));
+        ___qtablewidgetitem163 = self.environmentalFactorsSummary_TableWidget.item(0, 2)
+        ___qtablewidgetitem163.setText(QCoreApplication.translate("Main", u"8", None));
+        ___qtablewidgetitem164 = self.environmentalFactorsSummary_TableWidget.item(1, 0)
+        ___qtablewidgetitem164.setText(QCoreApplication.translate("Main", u"Medium", None));
+        ___qtablewidgetitem165 = self.environmentalFactorsSummary_TableWidget.item(1, 1)
+        ___qtablewidgetitem165.setText(QCoreApplication.translate("Main", u"Influence: from 3 to 4", None));
+        ___qtablewidgetitem166 = self.environmentalFactorsSummary_TableWidget.item(1, 2)
+        ___qtablewidgetitem166.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem167 = self.environmentalFactorsSummary_TableWidget.item(2, 0)
+        ___qtablewidgetitem167.setText(QCoreApplication.translate("Main", u"Essential", None));
+        ___qtablewidgetitem168 = self.environmentalFactorsSummary_TableWidget.item(2, 1)
+        ___qtablewidgetitem168.setText(QCoreApplication.translate("Main", u"Influence: 5", None));
+        ___qtablewidgetitem169 = self.environmentalFactorsSummary_TableWidget.item(2, 2)
+        ___qtablewidgetitem169.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem170 = self.environmentalFactorsSummary_TableWidget.item(3, 0)
+        ___qtablewidgetitem170.setText(QCoreApplication.translate("Main", u"TOTAL", None));
+        ___qtablewidgetitem171 = self.environmentalFactorsSummary_TableWidget.item(3, 2)
+        ___qtablewidgetitem171.setText(QCoreApplication.translate("Main", u"8", None));
         self.environmentalFactorsSummary_TableWidget.setSortingEnabled(__sortingEnabled6)
 
         self.label_57.setText(QCoreApplication.translate("Main", u"Summary", None))
         self.label_58.setText("")
-        ___qtablewidgetitem185 = self.environmentalFactors_TableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem185.setText(QCoreApplication.translate("Main", u"Total", None));
-        ___qtablewidgetitem186 = self.environmentalFactors_TableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem186.setText(QCoreApplication.translate("Main", u"Factor", None));
-        ___qtablewidgetitem187 = self.environmentalFactors_TableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem187.setText(QCoreApplication.translate("Main", u"Description", None));
-        ___qtablewidgetitem188 = self.environmentalFactors_TableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem188.setText(QCoreApplication.translate("Main", u"Weight", None));
-        ___qtablewidgetitem189 = self.environmentalFactors_TableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem189.setText(QCoreApplication.translate("Main", u"Influence", None));
-        ___qtablewidgetitem190 = self.environmentalFactors_TableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem190.setText(QCoreApplication.translate("Main", u"Result", None));
-        ___qtablewidgetitem191 = self.environmentalFactors_TableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem191.setText(QCoreApplication.translate("Main", u"Comment", None));
+        ___qtablewidgetitem172 = self.environmentalFactors_TableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem172.setText(QCoreApplication.translate("Main", u"Total", None));
+        ___qtablewidgetitem173 = self.environmentalFactors_TableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem173.setText(QCoreApplication.translate("Main", u"Factor", None));
+        ___qtablewidgetitem174 = self.environmentalFactors_TableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem174.setText(QCoreApplication.translate("Main", u"Description", None));
+        ___qtablewidgetitem175 = self.environmentalFactors_TableWidget.horizontalHeaderItem(3)
+        ___qtablewidgetitem175.setText(QCoreApplication.translate("Main", u"Weight", None));
+        ___qtablewidgetitem176 = self.environmentalFactors_TableWidget.horizontalHeaderItem(4)
+        ___qtablewidgetitem176.setText(QCoreApplication.translate("Main", u"Influence", None));
+        ___qtablewidgetitem177 = self.environmentalFactors_TableWidget.horizontalHeaderItem(5)
+        ___qtablewidgetitem177.setText(QCoreApplication.translate("Main", u"Result", None));
+        ___qtablewidgetitem178 = self.environmentalFactors_TableWidget.horizontalHeaderItem(6)
+        ___qtablewidgetitem178.setText(QCoreApplication.translate("Main", u"Comment", None));
 
         __sortingEnabled7 = self.environmentalFactors_TableWidget.isSortingEnabled()
         self.environmentalFactors_TableWidget.setSortingEnabled(False)
-        ___qtablewidgetitem192 = self.environmentalFactors_TableWidget.item(0, 1)
-        ___qtablewidgetitem192.setText(QCoreApplication.translate("Main", u"E1", None));
-        ___qtablewidgetitem193 = self.environmentalFactors_TableWidget.item(0, 2)
-        ___qtablewidgetitem193.setText(QCoreApplication.translate("Main", u"Familiarity with UML", None));
-        ___qtablewidgetitem194 = self.environmentalFactors_TableWidget.item(0, 3)
-        ___qtablewidgetitem194.setText(QCoreApplication.translate("Main", u"1.5", None));
-        ___qtablewidgetitem195 = self.environmentalFactors_TableWidget.item(0, 4)
-        ___qtablewidgetitem195.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem196 = self.environmentalFactors_TableWidget.item(0, 5)
-        ___qtablewidgetitem196.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem197 = self.environmentalFactors_TableWidget.item(1, 1)
-        ___qtablewidgetitem197.setText(QCoreApplication.translate("Main", u"E2", None));
-        ___qtablewidgetitem198 = self.environmentalFactors_TableWidget.item(1, 2)
-        ___qtablewidgetitem198.setText(QCoreApplication.translate("Main", u"Application experience", None));
-        ___qtablewidgetitem199 = self.environmentalFactors_TableWidget.item(1, 3)
-        ___qtablewidgetitem199.setText(QCoreApplication.translate("Main", u"0.5", None));
-        ___qtablewidgetitem200 = self.environmentalFactors_TableWidget.item(1, 4)
-        ___qtablewidgetitem200.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem201 = self.environmentalFactors_TableWidget.item(1, 5)
-        ___qtablewidgetitem201.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem202 = self.environmentalFactors_TableWidget.item(2, 1)
-        ___qtablewidgetitem202.setText(QCoreApplication.translate("Main", u"E3", None));
-        ___qtablewidgetitem203 = self.environmentalFactors_TableWidget.item(2, 2)
-        ___qtablewidgetitem203.setText(QCoreApplication.translate("Main", u"Experience in Object Orientation", None));
-        ___qtablewidgetitem204 = self.environmentalFactors_TableWidget.item(2, 3)
-        ___qtablewidgetitem204.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem205 = self.environmentalFactors_TableWidget.item(2, 4)
-        ___qtablewidgetitem205.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem206 = self.environmentalFactors_TableWidget.item(2, 5)
-        ___qtablewidgetitem206.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem207 = self.environmentalFactors_TableWidget.item(3, 1)
-        ___qtablewidgetitem207.setText(QCoreApplication.translate("Main", u"E4", None));
-        ___qtablewidgetitem208 = self.environmentalFactors_TableWidget.item(3, 2)
-        ___qtablewidgetitem208.setText(QCoreApplication.translate("Main", u"Lead Analyst Capability", None));
-        ___qtablewidgetitem209 = self.environmentalFactors_TableWidget.item(3, 3)
-        ___qtablewidgetitem209.setText(QCoreApplication.translate("Main", u"0.5", None));
-        ___qtablewidgetitem210 = self.environmentalFactors_TableWidget.item(3, 4)
-        ___qtablewidgetitem210.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem211 = self.environmentalFactors_TableWidget.item(3, 5)
-        ___qtablewidgetitem211.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem212 = self.environmentalFactors_TableWidget.item(4, 1)
-        ___qtablewidgetitem212.setText(QCoreApplication.translate("Main", u"E5", None));
-        ___qtablewidgetitem213 = self.environmentalFactors_TableWidget.item(4, 2)
-        ___qtablewidgetitem213.setText(QCoreApplication.translate("Main", u"Motivation", None));
-        ___qtablewidgetitem214 = self.environmentalFactors_TableWidget.item(4, 3)
-        ___qtablewidgetitem214.setText(QCoreApplication.translate("Main", u"1", None));
-        ___qtablewidgetitem215 = self.environmentalFactors_TableWidget.item(4, 4)
-        ___qtablewidgetitem215.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem216 = self.environmentalFactors_TableWidget.item(4, 5)
-        ___qtablewidgetitem216.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem217 = self.environmentalFactors_TableWidget.item(5, 1)
-        ___qtablewidgetitem217.setText(QCoreApplication.translate("Main", u"E6", None));
-        ___qtablewidgetitem218 = self.environmentalFactors_TableWidget.item(5, 2)
-        ___qtablewidgetitem218.setText(QCoreApplication.translate("Main", u"Stability of requirements", None));
-        ___qtablewidgetitem219 = self.environmentalFactors_TableWidget.item(5, 3)
-        ___qtablewidgetitem219.setText(QCoreApplication.translate("Main", u"2", None));
-        ___qtablewidgetitem220 = self.environmentalFactors_TableWidget.item(5, 4)
-        ___qtablewidgetitem220.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem221 = self.environmentalFactors_TableWidget.item(5, 5)
-        ___qtablewidgetitem221.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem222 = self.environmentalFactors_TableWidget.item(6, 1)
-        ___qtablewidgetitem222.setText(QCoreApplication.translate("Main", u"E7", None));
-        ___qtablewidgetitem223 = self.environmentalFactors_TableWidget.item(6, 2)
-        ___qtablewidgetitem223.setText(QCoreApplication.translate("Main", u"Part-time workers", None));
-        ___qtablewidgetitem224 = self.environmentalFactors_TableWidget.item(6, 3)
-        ___qtablewidgetitem224.setText(QCoreApplication.translate("Main", u"-1", None));
-        ___qtablewidgetitem225 = self.environmentalFactors_TableWidget.item(6, 4)
-        ___qtablewidgetitem225.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem226 = self.environmentalFactors_TableWidget.item(6, 5)
-        ___qtablewidgetitem226.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem227 = self.environmentalFactors_TableWidget.item(7, 1)
-        ___qtablewidgetitem227.setText(QCoreApplication.translate("Main", u"E8", None));
-        ___qtablewidgetitem228 = self.environmentalFactors_TableWidget.item(7, 2)
-        ___qtablewidgetitem228.setText(QCoreApplication.translate("Main", u"Programming language difficulty", None));
-        ___qtablewidgetitem229 = self.environmentalFactors_TableWidget.item(7, 3)
-        ___qtablewidgetitem229.setText(QCoreApplication.translate("Main", u"-1", None));
-        ___qtablewidgetitem230 = self.environmentalFactors_TableWidget.item(7, 4)
-        ___qtablewidgetitem230.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem231 = self.environmentalFactors_TableWidget.item(7, 5)
-        ___qtablewidgetitem231.setText(QCoreApplication.translate("Main", u"0", None));
-        ___qtablewidgetitem232 = self.environmentalFactors_TableWidget.item(8, 0)
-        ___qtablewidgetitem232.setText(QCoreApplication.translate("Main", u"EFactor: 0", None));
+        ___qtablewidgetitem179 = self.environmentalFactors_TableWidget.item(0, 1)
+        ___qtablewidgetitem179.setText(QCoreApplication.translate("Main", u"E1", None));
+        ___qtablewidgetitem180 = self.environmentalFactors_TableWidget.item(0, 2)
+        ___qtablewidgetitem180.setText(QCoreApplication.translate("Main", u"Familiarity with UML", None));
+        ___qtablewidgetitem181 = self.environmentalFactors_TableWidget.item(0, 3)
+        ___qtablewidgetitem181.setText(QCoreApplication.translate("Main", u"1.5", None));
+        ___qtablewidgetitem182 = self.environmentalFactors_TableWidget.item(0, 4)
+        ___qtablewidgetitem182.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem183 = self.environmentalFactors_TableWidget.item(0, 5)
+        ___qtablewidgetitem183.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem184 = self.environmentalFactors_TableWidget.item(1, 1)
+        ___qtablewidgetitem184.setText(QCoreApplication.translate("Main", u"E2", None));
+        ___qtablewidgetitem185 = self.environmentalFactors_TableWidget.item(1, 2)
+        ___qtablewidgetitem185.setText(QCoreApplication.translate("Main", u"Application experience", None));
+        ___qtablewidgetitem186 = self.environmentalFactors_TableWidget.item(1, 3)
+        ___qtablewidgetitem186.setText(QCoreApplication.translate("Main", u"0.5", None));
+        ___qtablewidgetitem187 = self.environmentalFactors_TableWidget.item(1, 4)
+        ___qtablewidgetitem187.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem188 = self.environmentalFactors_TableWidget.item(1, 5)
+        ___qtablewidgetitem188.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem189 = self.environmentalFactors_TableWidget.item(2, 1)
+        ___qtablewidgetitem189.setText(QCoreApplication.translate("Main", u"E3", None));
+        ___qtablewidgetitem190 = self.environmentalFactors_TableWidget.item(2, 2)
+        ___qtablewidgetitem190.setText(QCoreApplication.translate("Main", u"Experience in Object Orientation", None));
+        ___qtablewidgetitem191 = self.environmentalFactors_TableWidget.item(2, 3)
+        ___qtablewidgetitem191.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem192 = self.environmentalFactors_TableWidget.item(2, 4)
+        ___qtablewidgetitem192.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem193 = self.environmentalFactors_TableWidget.item(2, 5)
+        ___qtablewidgetitem193.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem194 = self.environmentalFactors_TableWidget.item(3, 1)
+        ___qtablewidgetitem194.setText(QCoreApplication.translate("Main", u"E4", None));
+        ___qtablewidgetitem195 = self.environmentalFactors_TableWidget.item(3, 2)
+        ___qtablewidgetitem195.setText(QCoreApplication.translate("Main", u"Lead Analyst Capability", None));
+        ___qtablewidgetitem196 = self.environmentalFactors_TableWidget.item(3, 3)
+        ___qtablewidgetitem196.setText(QCoreApplication.translate("Main", u"0.5", None));
+        ___qtablewidgetitem197 = self.environmentalFactors_TableWidget.item(3, 4)
+        ___qtablewidgetitem197.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem198 = self.environmentalFactors_TableWidget.item(3, 5)
+        ___qtablewidgetitem198.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem199 = self.environmentalFactors_TableWidget.item(4, 1)
+        ___qtablewidgetitem199.setText(QCoreApplication.translate("Main", u"E5", None));
+        ___qtablewidgetitem200 = self.environmentalFactors_TableWidget.item(4, 2)
+        ___qtablewidgetitem200.setText(QCoreApplication.translate("Main", u"Motivation", None));
+        ___qtablewidgetitem201 = self.environmentalFactors_TableWidget.item(4, 3)
+        ___qtablewidgetitem201.setText(QCoreApplication.translate("Main", u"1", None));
+        ___qtablewidgetitem202 = self.environmentalFactors_TableWidget.item(4, 4)
+        ___qtablewidgetitem202.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem203 = self.environmentalFactors_TableWidget.item(4, 5)
+        ___qtablewidgetitem203.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem204 = self.environmentalFactors_TableWidget.item(5, 1)
+        ___qtablewidgetitem204.setText(QCoreApplication.translate("Main", u"E6", None));
+        ___qtablewidgetitem205 = self.environmentalFactors_TableWidget.item(5, 2)
+        ___qtablewidgetitem205.setText(QCoreApplication.translate("Main", u"Stability of requirements", None));
+        ___qtablewidgetitem206 = self.environmentalFactors_TableWidget.item(5, 3)
+        ___qtablewidgetitem206.setText(QCoreApplication.translate("Main", u"2", None));
+        ___qtablewidgetitem207 = self.environmentalFactors_TableWidget.item(5, 4)
+        ___qtablewidgetitem207.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem208 = self.environmentalFactors_TableWidget.item(5, 5)
+        ___qtablewidgetitem208.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem209 = self.environmentalFactors_TableWidget.item(6, 1)
+        ___qtablewidgetitem209.setText(QCoreApplication.translate("Main", u"E7", None));
+        ___qtablewidgetitem210 = self.environmentalFactors_TableWidget.item(6, 2)
+        ___qtablewidgetitem210.setText(QCoreApplication.translate("Main", u"Part-time workers", None));
+        ___qtablewidgetitem211 = self.environmentalFactors_TableWidget.item(6, 3)
+        ___qtablewidgetitem211.setText(QCoreApplication.translate("Main", u"-1", None));
+        ___qtablewidgetitem212 = self.environmentalFactors_TableWidget.item(6, 4)
+        ___qtablewidgetitem212.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem213 = self.environmentalFactors_TableWidget.item(6, 5)
+        ___qtablewidgetitem213.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem214 = self.environmentalFactors_TableWidget.item(7, 1)
+        ___qtablewidgetitem214.setText(QCoreApplication.translate("Main", u"E8", None));
+        ___qtablewidgetitem215 = self.environmentalFactors_TableWidget.item(7, 2)
+        ___qtablewidgetitem215.setText(QCoreApplication.translate("Main", u"Programming language difficulty", None));
+        ___qtablewidgetitem216 = self.environmentalFactors_TableWidget.item(7, 3)
+        ___qtablewidgetitem216.setText(QCoreApplication.translate("Main", u"-1", None));
+        ___qtablewidgetitem217 = self.environmentalFactors_TableWidget.item(7, 4)
+        ___qtablewidgetitem217.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem218 = self.environmentalFactors_TableWidget.item(7, 5)
+        ___qtablewidgetitem218.setText(QCoreApplication.translate("Main", u"0", None));
+        ___qtablewidgetitem219 = self.environmentalFactors_TableWidget.item(8, 0)
+        ___qtablewidgetitem219.setText(QCoreApplication.translate("Main", u"EFactor: 0", None));
         self.environmentalFactors_TableWidget.setSortingEnabled(__sortingEnabled7)
 
         self.label_3.setText(QCoreApplication.translate("Main", u"Environmental Factors", None))
@@ -1,7 +1,7 @@
 # This Python file uses the following encoding: utf-8
 # Utils/border_bottom_delegate
 
-from PySide6.QtWidgets import QStyledItemDelegate
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
 from PySide6.QtGui import QPen
 from PySide6.QtCore import Qt
 
@@ -12,6 +12,22 @@ class BorderBottomDelegate(QStyledItemDelegate):
     Methods
     -------
     """
+    def initStyleOption(self, option, index):
+        """
+        Initializes the style options of an item, centering the icon of the items without text.
+
+        Parameters
+        ----------
+        option : QStyleOptionViewItem
+            The style options to initialize.
+        index : QModelIndex
+            The model index of the item.
+        """
+        super().initStyleOption(option, index)
+        if not option.text:
+            option.decorationPosition = QStyleOptionViewItem.Top
+            option.decorationAlignment = Qt.AlignCenter
+
     def paint(self, painter, option, index):
         """
         Paints the item with a custom bottom border.
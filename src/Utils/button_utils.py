@@ -25,8 +25,8 @@ class ButtonUtils(QObject):
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The table widget.
+        table_widget : QTableView
+            The table.
         edit_button : QPushButton
             The edit button.
         delete_button : QPushButton
@@ -52,11 +52,14 @@ class ButtonUtils(QObject):
         isEditEnabled = selectedRows == 1
         isDeleteEnabled = selectedRows >= 1
 
-        edit_button.setEnabled(isEditEnabled)
-        ButtonUtils.set_styles_button(edit_button, edit_enabled_color, edit_disabled_color, edit_icon, edit_disabled_icon, isEditEnabled)
+        # The stylesheets are only set again when the state of a button changes
+        if edit_button.isEnabled() != isEditEnabled:
+            edit_button.setEnabled(isEditEnabled)
+            ButtonUtils.set_styles_button(edit_button, edit_enabled_color, edit_disabled_color, edit_icon, edit_disabled_icon, isEditEnabled)
 
-        delete_button.setEnabled(isDeleteEnabled)
-        ButtonUtils.set_styles_button(delete_button, delete_enabled_color, delete_disabled_color, delete_icon, delete_disabled_icon, isDeleteEnabled)
+        if delete_button.isEnabled() != isDeleteEnabled:
+            delete_button.setEnabled(isDeleteEnabled)
+            ButtonUtils.set_styles_button(delete_button, delete_enabled_color, delete_disabled_color, delete_icon, delete_disabled_icon, isDeleteEnabled)
 
     @staticmethod
     def set_styles_button(button, background_color_enabled, color_enabled, image_enabled, image_disabled, is_enabled, padding='6px 0px 6px 6px', background_color_disabled='#545454', color_disabled='#9D9D9D', icon_size=30):
@@ -0,0 +1,46 @@
+# This Python file uses the following encoding: utf-8
+# Utils/comment_delegate.py
+
+from Utils.icon_delegate import IconDelegate
+from PySide6.QtCore import Qt
+
+class CommentDelegate(IconDelegate):
+    """
+    Delegate painting the comment icon in the cells that have a comment.
+
+    The comment is the ToolTipRole data of the cell, shown as a tooltip by the table. The cells without a comment are painted as normal items.
+
+    Methods
+    -------
+    """
+
+    def __init__(self, icon, icon_size=35, parent=None):
+        """
+        Initialize the CommentDelegate.
+
+        Parameters
+        ----------
+        icon : str
+            Path to the comment icon.
+        icon_size : int, optional
+            The width and height of the painted icon, by default 35.
+        parent : QObject, optional
+            Parent object, usually the table.
+        """
+        super().__init__(icon, icon_size, parent=parent)
+
+    def get_icon(self, index):
+        """
+        Get the comment icon if the cell has a comment.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of the cell.
+
+        Returns
+        -------
+        QIcon or None
+            The comment icon, or None if the cell has no comment.
+        """
+        return self.icon if index.data(Qt.ToolTipRole) else None
@@ -0,0 +1,305 @@
+# This Python file uses the following encoding: utf-8
+# Utils/excel_report_writer.py
+
+import numpy as np
+import re
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.utils import get_column_letter
+
+class ExcelReportWriter:
+    """
+    Streaming writer of the Excel reports.
+
+    The tables of every sheet are registered first and written when the report is saved, using a write-only workbook: each row is created from the DataFrames, written to the file and released, so the workbook is never held in memory and never read back.
+
+    A write-only sheet stores its column widths before its rows, so the widths are measured from the values of the DataFrames, the headers and the titles in a single pass before the rows are written. The titles and the values are styled as they are created.
+
+    Attributes
+    ----------
+    TITLE_FONT : Font
+        The font of the titles.
+    ALIGNMENT : Alignment
+        The alignment of every written cell.
+    INVALID_SHEET_CHARACTERS : Pattern
+        The characters that Excel does not allow in the name of a sheet.
+    MAX_SHEET_NAME_LENGTH : int
+        The maximum length of the name of a sheet.
+    file_path : str
+        The path of the report.
+    extra_width : int
+        Additional width added to the measured width of each column.
+    max_width : int
+        Maximum width of a column.
+    sheets : dict
+        The tables and merged cells of each sheet, in the order the sheets were added.
+
+    Methods
+    -------
+    """
+
+    TITLE_FONT = Font(bold=True, size=12)
+    ALIGNMENT = Alignment(horizontal="center", vertical="center", wrapText=True)
+    INVALID_SHEET_CHARACTERS = re.compile(r"[\[\]:*?/\\]")
+    MAX_SHEET_NAME_LENGTH = 31
+
+    def __init__(self, file_path, extra_width=4, max_width=50):
+        """
+        Initialize the ExcelReportWriter.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the report.
+        extra_width : int, optional
+            Additional width added to the measured width of each column, by default 4.
+        max_width : int, optional
+            Maximum width of a column, by default 50.
+        """
+        self.file_path = file_path
+        self.extra_width = extra_width
+        self.max_width = max_width
+        self.sheets = {}
+
+    def add_table(self, sheet_name, data, row, column, title=None, bg_color=None):
+        """
+        Add a table to a sheet, creating the sheet if needed.
+
+        Parameters
+        ----------
+        sheet_name : str
+            The name of the sheet.
+        data : DataFrame
+            The table. Its column names are written as the header.
+        row : int
+            The row of the header, starting at 1.
+        column : int
+            The first column of the table, starting at 1.
+        title : str, optional
+            A title written in the row above the header and merged across the columns of the table.
+        bg_color : str, optional
+            Background color of the title in hexadecimal format.
+        """
+        sheet = self.sheets.setdefault(sheet_name, {'tables': [], 'merged_cells': []})
+        sheet['tables'].append({'data': data, 'row': row, 'column': column, 'title': title, 'bg_color': bg_color})
+        end_column = column + data.shape[1] - 1
+        if title is not None and end_column > column:
+            self.merge_cells(sheet_name, row - 1, column, row - 1, end_column)
+
+    def merge_cells(self, sheet_name, start_row, start_column, end_row, end_column):
+        """
+        Merge a range of cells of a sheet.
+
+        Parameters
+        ----------
+        sheet_name : str
+            The name of the sheet.
+        start_row : int
+            The first row of the range.
+        start_column : int
+            The first column of the range.
+        end_row : int
+            The last row of the range.
+        end_column : int
+            The last column of the range.
+        """
+        sheet = self.sheets.setdefault(sheet_name, {'tables': [], 'merged_cells': []})
+        sheet['merged_cells'].append(f"{get_column_letter(start_column)}{start_row}:{get_column_letter(end_column)}{end_row}")
+
+    def get_sheet_name(self, name):
+        """
+        Get a valid sheet name from a free text, such as a project name, that is not used by another sheet.
+
+        Parameters
+        ----------
+        name : str
+            The text.
+
+        Returns
+        -------
+        str
+            The text without the characters Excel does not allow, shortened to the maximum length and followed by a number if another sheet already has that name.
+        """
+        base_name = self.INVALID_SHEET_CHARACTERS.sub("_", str(name)).strip("'")[:self.MAX_SHEET_NAME_LENGTH] or "Sheet"
+        used_names = {sheet_name.lower() for sheet_name in self.sheets}
+        sheet_name = base_name
+        number = 2
+        while sheet_name.lower() in used_names:
+            suffix = f" ({number})"
+            sheet_name = base_name[:self.MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+            number += 1
+        return sheet_name
+
+    def save(self, progress=None):
+        """
+        Write every sheet and save the report.
+
+        Parameters
+        ----------
+        progress : callable, optional
+            Function called with the number of written sheets and the total number of sheets after each sheet.
+        """
+        with open(self.file_path, "wb") as file:  # Fail before writing any sheet if the file cannot be created
+            workbook = Workbook(write_only=True)
+            for index, (sheet_name, sheet) in enumerate(self.sheets.items(), 1):
+                self.write_sheet(workbook.create_sheet(sheet_name), sheet['tables'], sheet['merged_cells'])
+                if progress is not None:
+                    progress(index, len(self.sheets))
+            workbook.save(file)
+
+    def write_sheet(self, worksheet, tables, merged_cells):
+        """
+        Set the column widths of a write-only sheet and stream its rows.
+
+        Parameters
+        ----------
+        worksheet : WriteOnlyWorksheet
+            The sheet to write.
+        tables : list of dict
+            The tables of the sheet.
+        merged_cells : list of str
+            The ranges of merged cells of the sheet.
+        """
+        tables_columns = [[self.convert_column(table['data'].iloc[:, offset]) for offset in range(table['data'].shape[1])] for table in tables]
+        widths = self.measure_columns(tables, tables_columns)
+        for column in range(1, max(widths, default=0) + 1):
+            worksheet.column_dimensions[get_column_letter(column)].width = min(widths.get(column, 0) + self.extra_width, self.max_width)
+        for cell_range in merged_cells:
+            worksheet.merged_cells.add(cell_range)
+
+        row_count = max((table['row'] + len(table['data']) for table in tables), default=0)
+        rows = [self.iter_rows(worksheet, table, columns) for table, columns in zip(tables, tables_columns)]
+        for row in range(1, row_count + 1):
+            cells = []
+            for table, table_rows in zip(tables, rows):
+                first_row = table['row'] - 1 if table['title'] is not None else table['row']
+                if first_row <= row <= table['row'] + len(table['data']):
+                    cells.extend(next(table_rows))
+            if not cells:
+                worksheet.append([])
+                continue
+            values = [None] * max(cell.column for cell in cells)
+            for cell in cells:
+                values[cell.column - 1] = cell
+            worksheet.append(values)
+
+    def iter_rows(self, worksheet, table, columns):
+        """
+        Create the styled cells of a table, one row at a time.
+
+        Parameters
+        ----------
+        worksheet : WriteOnlyWorksheet
+            The sheet of the table.
+        table : dict
+            The table.
+        columns : list of list
+            The converted values of each column of the table.
+
+        Yields
+        ------
+        list of WriteOnlyCell
+            The cells of the next row of the table: the title, the header, then the values. The cells of the values are only valid until the next row is requested.
+        """
+        column = table['column']
+        if table['title'] is not None:
+            cell = self.create_cell(worksheet, table['title'], column)
+            cell.font = self.TITLE_FONT
+            cell.fill = PatternFill(start_color=table['bg_color'], end_color=table['bg_color'], fill_type="solid")
+            yield [cell]
+
+        yield [self.create_cell(worksheet, name, column + offset) for offset, name in enumerate(table['data'].columns)]
+
+        # A row is written as soon as it is appended, so the same styled cells are reused for every row
+        cells = [self.create_cell(worksheet, None, column + offset) for offset in range(len(columns))]
+        for values in zip(*columns):
+            for cell, value in zip(cells, values):
+                cell.value = value
+            yield cells
+
+    def measure_columns(self, tables, tables_columns):
+        """
+        Measure the longest value of every column of a sheet.
+
+        Parameters
+        ----------
+        tables : list of dict
+            The tables of the sheet.
+        tables_columns : list of list
+            The converted values of each column of each table.
+
+        Returns
+        -------
+        dict
+            The length of the longest value of each column, limited to the maximum width. Empty values are ignored.
+        """
+        widths = {}
+        for table, columns in zip(tables, tables_columns):
+            column = table['column']
+            if table['title'] is not None:
+                widths[column] = max(widths.get(column, 0), self.measure_value(table['title']))
+            for offset, (name, values) in enumerate(zip(table['data'].columns, columns)):
+                length = max(self.measure_value(name), max(map(self.measure_value, values), default=0))
+                widths[column + offset] = max(widths.get(column + offset, 0), length)
+        return widths
+
+    def measure_value(self, value):
+        """
+        Measure the displayed length of a value.
+
+        Parameters
+        ----------
+        value : object
+            The value of a cell.
+
+        Returns
+        -------
+        int
+            The length of the value as text, limited to the maximum width, or 0 for an empty value.
+        """
+        return min(len(str(value)), self.max_width) if value else 0
+
+    def create_cell(self, worksheet, value, column):
+        """
+        Create a cell with the common alignment.
+
+        Parameters
+        ----------
+        worksheet : WriteOnlyWorksheet
+            The sheet of the cell.
+        value : object
+            The value of the cell.
+        column : int
+            The column of the cell, starting at 1.
+
+        Returns
+        -------
+        WriteOnlyCell
+            The cell.
+        """
+        cell = WriteOnlyCell(worksheet, value)
+        cell.column = column
+        cell.alignment = self.ALIGNMENT
+        return cell
+
+    @staticmethod
+    def convert_column(values):
+        """
+        Convert the values of a column of a DataFrame to the values of its cells, as pandas does when writing to Excel.
+
+        Parameters
+        ----------
+        values : Series
+            The column.
+
+        Returns
+        -------
+        list
+            The values as Python scalars, with an empty string for each missing value.
+        """
+        missing = values.isna().tolist()
+        return [
+            "" if is_missing else value.item() if isinstance(value, np.generic) else value
+            for value, is_missing in zip(values.tolist(), missing)
+        ]
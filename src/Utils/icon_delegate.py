@@ -0,0 +1,153 @@
+# This Python file uses the following encoding: utf-8
+# Utils/icon_delegate.py
+
+from PySide6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+from PySide6.QtGui import QColor, QIcon, QPainter
+from PySide6.QtCore import Qt, QEvent, QModelIndex, QRect, QSize, Signal
+
+class IconDelegate(QStyledItemDelegate):
+    """
+    Delegate painting an icon in the center of the cells of a column, in place of a button in every row.
+
+    A single delegate serves every row of its column: the icon is painted from the data of the cell, and a click on a clickable cell is reported by the clicked signal, so the table does not hold any widget, menu or stylesheet per row.
+
+    Attributes
+    ----------
+    clicked : Signal
+        Signal emitted with the index of a clickable cell when it is clicked.
+    HOVER_BACKGROUND : QColor
+        Background of the clickable cell under the mouse.
+    HOVER_BORDER : QColor
+        Border of the clickable cell under the mouse.
+    icon : QIcon
+        The icon of the cells.
+    checked_icon : QIcon or None
+        The icon of the cells whose UserRole data is True, such as a favorite project.
+    icon_size : QSize
+        The size of the painted icon.
+    clickable : bool
+        Whether the cells are clicked like a button.
+    margins : tuple of int
+        The horizontal and vertical margins of the hover frame of a clickable cell.
+
+    Methods
+    -------
+    """
+
+    clicked = Signal(QModelIndex)
+
+    HOVER_BACKGROUND = QColor("#341D64")
+    HOVER_BORDER = QColor("#7000FF")
+
+    def __init__(self, icon, icon_size, checked_icon=None, clickable=False, margins=(12, 7), parent=None):
+        """
+        Initialize the IconDelegate.
+
+        Parameters
+        ----------
+        icon : str
+            Path to the icon of the cells.
+        icon_size : int
+            The width and height of the painted icon.
+        checked_icon : str, optional
+            Path to the icon of the cells whose UserRole data is True.
+        clickable : bool, optional
+            Whether the cells are clicked like a button, by default False.
+        margins : tuple of int, optional
+            The horizontal and vertical margins of the hover frame, by default (12, 7).
+        parent : QObject, optional
+            Parent object, usually the table.
+        """
+        super().__init__(parent)
+        self.icon = QIcon(icon)
+        self.checked_icon = QIcon(checked_icon) if checked_icon else None
+        self.icon_size = QSize(icon_size, icon_size)
+        self.clickable = clickable
+        self.margins = margins
+
+    def get_icon(self, index):
+        """
+        Get the icon painted in a cell.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of the cell.
+
+        Returns
+        -------
+        QIcon or None
+            The icon of the cell, or None to paint the cell as a normal item.
+        """
+        if self.checked_icon is not None and index.data(Qt.UserRole):
+            return self.checked_icon
+        return self.icon
+
+    def paint(self, painter, option, index):
+        """
+        Paints the background of the cell, the hover frame of a clickable cell and the icon.
+
+        Parameters
+        ----------
+        painter : QPainter
+            The painter used to draw the cell.
+        option : QStyleOptionViewItem
+            The style options for the cell.
+        index : QModelIndex
+            The model index of the cell being painted.
+        """
+        icon = self.get_icon(index)
+        if icon is None:
+            super().paint(painter, option, index)
+            return
+
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        option.text = ""
+        option.icon = QIcon()
+        option.features &= ~QStyleOptionViewItem.HasDecoration
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        painter.save()
+        if self.clickable and option.state & QStyle.State_MouseOver:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self.HOVER_BORDER)
+            painter.setBrush(self.HOVER_BACKGROUND)
+            painter.drawRoundedRect(option.rect.adjusted(self.margins[0], self.margins[1], -self.margins[0], -self.margins[1]), 5, 5)
+        icon_rect = QRect(option.rect.topLeft(), self.icon_size)
+        icon_rect.moveCenter(option.rect.center())
+        icon.paint(painter, icon_rect, Qt.AlignCenter)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """
+        Emits the clicked signal when a clickable cell is clicked with the left button.
+
+        The release is consumed, so the click on the icon does not also trigger the click of the row.
+
+        Parameters
+        ----------
+        event : QEvent
+            The event on the cell.
+        model : QAbstractItemModel
+            The model of the table.
+        option : QStyleOptionViewItem
+            The style options for the cell.
+        index : QModelIndex
+            The model index of the cell.
+
+        Returns
+        -------
+        bool
+            True if the event was handled as a click, otherwise the result of the base delegate.
+        """
+        if (
+            self.clickable
+            and event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.position().toPoint())
+        ):
+            self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,230 @@
+# This Python file uses the following encoding: utf-8
+# Utils/project_exporter.py
+
+import config
+import os
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from DataSource.export_archive import ExportArchive
+from DataSource.snapshot_reader import SnapshotReader
+from Utils.worker import Worker
+from PySide6.QtCore import QObject, Signal, QThreadPool
+
+class ProjectExporter(QObject):
+    """
+    Background export of all the projects to a ZIP archive.
+
+    A coordinator task reads the projects from a consistent snapshot of the database, a pool of threads serializes and hashes them concurrently, and the coordinator appends their files to the archive in the original order. The main thread only receives the progress and the result through signals, so the interface stays responsive and the export can be cancelled.
+
+    The archive ends with an index of the revision of every project. When the index of a previous archive is given, only the projects changed since that archive are written, and ``ExportArchive.merge`` rebuilds the full archive from both.
+
+    Attributes
+    ----------
+    progress : Signal
+        Signal emitted with the number of exported projects and the total number of projects.
+    finished : Signal
+        Signal emitted with the path of the archive when the export completes.
+    failed : Signal
+        Signal emitted with the error message when the export fails.
+    cancelled : Signal
+        Signal emitted when the export stops after a cancellation request.
+    projects_model : ProjectsModel
+        The model used to serialize the projects.
+    database_path : str
+        The path of the database file.
+    zip_file_path : str
+        The path of the archive to create.
+    workers : int
+        The number of serialization threads.
+    base_index : dict or None
+        The index of the base archive of an incremental export, None for a full export.
+
+    Methods
+    -------
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(str)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, projects_model, database_path, zip_file_path, workers=config.EXPORT_WORKERS, base_index=None):
+        """
+        Initialize the ProjectExporter.
+
+        Parameters
+        ----------
+        projects_model : ProjectsModel
+            The model used to serialize the projects.
+        database_path : str
+            The path of the database file.
+        zip_file_path : str
+            The path of the archive to create.
+        workers : int, optional
+            The number of serialization threads, 0 for one per CPU core.
+        base_index : dict, optional
+            The index of a previous archive. Only the projects changed since that archive are exported.
+        """
+        super().__init__()
+        self.projects_model = projects_model
+        self.database_path = database_path
+        self.zip_file_path = zip_file_path
+        self.workers = workers or os.cpu_count() or 1
+        self.base_index = base_index
+        self.cancel_event = threading.Event()
+        self.worker = None
+
+    def start(self):
+        """
+        Start the export in the global thread pool.
+        """
+        self.worker = Worker(self.export)
+        self.worker.signals.finished.connect(self.handle_export_finished)
+        self.worker.signals.failed.connect(self.handle_export_failed)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def cancel(self):
+        """
+        Request the cancellation of the export. The archive is removed once the running tasks stop.
+        """
+        self.cancel_event.set()
+
+    def export(self):
+        """
+        Export the projects. Runs in a background thread.
+
+        Returns
+        -------
+        bool
+            True if all the projects were exported, False if the export was cancelled.
+
+        Raises
+        ------
+        Exception
+            If the snapshot could not be read or a project could not be serialized.
+        """
+        reader = SnapshotReader(self.database_path, f"export_{id(self)}")
+        try:
+            if reader.open() == config.FAILURE:
+                raise Exception("Failed to open the database snapshot")
+            all_projects = reader.get_projects()
+            if all_projects == config.FAILURE:
+                raise Exception("Failed to read the projects")
+
+            incremental = self.base_index is not None
+            projects = ExportArchive.get_changed_projects(all_projects, self.base_index) if incremental else all_projects
+            total = len(projects)
+            exported = 0
+            max_pending = self.workers * config.EXPORT_PENDING_PER_WORKER
+            with zipfile.ZipFile(self.zip_file_path, 'w') as zip_file, ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = deque()
+                for project in projects:
+                    if self.cancel_event.is_set():
+                        break
+                    project_data = reader.read_project(project['id'])
+                    if project_data == config.FAILURE:
+                        raise Exception(f"Failed to read project {project['name']}")
+                    future = pool.submit(self.projects_model.serialize_project, project_data, project['name'])
+                    pending.append((project['name'], future))
+
+                    # Write the projects that are ready, and wait for the oldest one when too many are pending
+                    while pending and (pending[0][1].done() or len(pending) > max_pending):
+                        exported += self.write_project(zip_file, *pending.popleft())
+                        self.progress.emit(exported, total)
+
+                while pending and not self.cancel_event.is_set():
+                    exported += self.write_project(zip_file, *pending.popleft())
+                    self.progress.emit(exported, total)
+
+                if self.cancel_event.is_set():
+                    for project_name, future in pending:
+                        future.cancel()
+                else:
+                    self.write_zip_entry(zip_file, ExportArchive.INDEX_FILE, ExportArchive.create_index(all_projects, incremental))
+        except Exception:
+            self.remove_archive()
+            raise
+        finally:
+            reader.close()
+
+        if self.cancel_event.is_set():
+            self.remove_archive()
+            return False
+        return True
+
+    def write_project(self, zip_file, project_name, future):
+        """
+        Append the serialized files of a project to the archive.
+
+        Parameters
+        ----------
+        zip_file : ZipFile
+            The archive open for writing.
+        project_name : str
+            The name of the project.
+        future : Future
+            The serialization task of the project.
+
+        Returns
+        -------
+        int
+            The number of exported projects, 1.
+        """
+        for file_name, data in future.result():
+            self.write_zip_entry(zip_file, f"{project_name}/{file_name}", data)
+        return 1
+
+    @staticmethod
+    def write_zip_entry(zip_file, entry_name, data):
+        """
+        Write serialized data as a file entry of a ZIP archive.
+
+        Parameters
+        ----------
+        zip_file : ZipFile
+            The archive open for writing.
+        entry_name : str
+            The path of the entry inside the archive.
+        data : bytes
+            The content of the entry.
+        """
+        zip_info = zipfile.ZipInfo(entry_name, date_time=time.localtime()[:6])
+        zip_info.external_attr = 0o100644 << 16  # Regular file with the permissions of a file written to disk
+        zip_file.writestr(zip_info, data)
+
+    def remove_archive(self):
+        """
+        Remove the partially written archive.
+        """
+        if os.path.exists(self.zip_file_path):
+            os.remove(self.zip_file_path)
+
+    def handle_export_finished(self, completed):
+        """
+        Emit the result of the export once the coordinator task ends.
+
+        Parameters
+        ----------
+        completed : bool
+            True if all the projects were exported, False if the export was cancelled.
+        """
+        self.worker = None
+        if completed:
+            self.finished.emit(self.zip_file_path)
+        else:
+            self.cancelled.emit()
+
+    def handle_export_failed(self, error):
+        """
+        Emit the error of the export once the coordinator task ends.
+
+        Parameters
+        ----------
+        error : str
+            The error message.
+        """
+        self.worker = None
+        self.failed.emit(error)
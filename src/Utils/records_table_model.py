@@ -0,0 +1,537 @@
+# This Python file uses the following encoding: utf-8
+# Utils/records_table_model.py
+
+from Utils.search_index import SearchIndex
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QIcon
+
+class RecordsTableModel(QAbstractTableModel):
+    """
+    Table model over a list of records, such as the actors or the use cases of a project.
+
+    Each record is a dictionary and each column shows one of its keys, so the rows are not copied into items: the view only asks for the cells it paints. A whole list is loaded with a single reset of the model. The row number column is computed from the position of the row, and the comment column shows an icon with the comment as its tooltip.
+
+    Once sorted, the model keeps its order: an added or updated record is placed at its position with a binary search, so the whole table is not sorted again after each change.
+
+    The searchable values of the records are kept in a SearchIndex, built by the first search and then updated with the records, so a search does not read the values of every row and loading a list does not index it.
+
+    The sort keys of a column, such as the numbers of the codes, are computed by the first sort by this column and then updated with the records. They are given as the SORT_ROLE data, and a sort only compares the cached keys.
+
+    Attributes
+    ----------
+    ROW_NUMBER : str
+        The key of the row number column.
+    FLAGS : Qt.ItemFlags
+        The flags of every cell.
+    SORT_ROLE : int
+        The role of the sort key of a cell.
+    headers : list of str
+        The header of each column.
+    keys : list of str
+        The key of the records shown in each column.
+    comment_key : str
+        The key of the column shown as a comment icon.
+    comment_icon : QIcon
+        The icon shown for the records with a comment.
+    sort_keys : dict
+        Functions returning the sort key of the values of some keys. The other values are sorted as they are.
+    search_keys : list of str
+        The keys of the values found by a search.
+    search_index : SearchIndex or None
+        The index of the searchable values of the records, or None until the first search.
+    sort_values : dict
+        The sort key of each record, by record identity, for each column the records were sorted by.
+    records : list of dict
+        The records, in the order of the rows.
+    backgrounds : dict
+        The background of the rows that have one, such as the highlighted row.
+    sort_column : int or None
+        The column the records are sorted by, or None if they are in the order they were loaded.
+    sort_order : Qt.SortOrder
+        The order of the sort.
+
+    Methods
+    -------
+    """
+
+    ROW_NUMBER = '#'
+    FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    SORT_ROLE = Qt.UserRole
+
+    def __init__(self, headers, keys, comment_icon, comment_key='comment', sort_keys=None, search_keys=None, parent=None):
+        """
+        Initialize the RecordsTableModel.
+
+        Parameters
+        ----------
+        headers : list of str
+            The header of each column.
+        keys : list of str
+            The key of the records shown in each column, or ROW_NUMBER for the row number column.
+        comment_icon : str
+            Path to the icon shown for the records with a comment.
+        comment_key : str, optional
+            The key of the column shown as a comment icon, by default 'comment'.
+        sort_keys : dict, optional
+            Functions returning the sort key of the values of some keys.
+        search_keys : list of str, optional
+            The keys of the values found by a search, by default none.
+        parent : QObject, optional
+            Parent object.
+        """
+        super().__init__(parent)
+        self.headers = headers
+        self.keys = keys
+        self.comment_key = comment_key
+        self.comment_icon = QIcon(comment_icon)
+        self.sort_keys = sort_keys or {}
+        self.search_keys = search_keys or []
+        self.search_index = None
+        self.sort_values = {}
+        self.records = []
+        self.backgrounds = {}
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Get the number of rows.
+
+        Parameters
+        ----------
+        parent : QModelIndex, optional
+            The parent index, invalid for a table.
+
+        Returns
+        -------
+        int
+            The number of records.
+        """
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Get the number of columns.
+
+        Parameters
+        ----------
+        parent : QModelIndex, optional
+            The parent index, invalid for a table.
+
+        Returns
+        -------
+        int
+            The number of columns.
+        """
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Get the data of a cell.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of the cell.
+        role : int, optional
+            The role of the data.
+
+        Returns
+        -------
+        object
+            The data of the cell for the role, or None.
+        """
+        if not index.isValid():
+            return None
+        key = self.keys[index.column()]
+        if role == Qt.DisplayRole:
+            if key == self.ROW_NUMBER:
+                return index.row() + 1
+            if key == self.comment_key:
+                return None
+            return str(self.records[index.row()][key])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole:
+            return self.backgrounds.get(index.row())
+        if role == self.SORT_ROLE and key != self.ROW_NUMBER:
+            return self.get_sort_values(index.column())[id(self.records[index.row()])]
+        if key == self.comment_key and self.records[index.row()][key]:
+            if role == Qt.DecorationRole:
+                return self.comment_icon
+            if role == Qt.ToolTipRole:
+                return self.records[index.row()][key]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """
+        Set the background of a row. The values of the records are not editable.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of a cell of the row.
+        value : QColor or None
+            The background, or None to remove it.
+        role : int, optional
+            The role of the data, only BackgroundRole is supported.
+
+        Returns
+        -------
+        bool
+            True if the background was set, otherwise False.
+        """
+        if not index.isValid() or role != Qt.BackgroundRole:
+            return False
+        if value is None or value == Qt.transparent:
+            self.backgrounds.pop(index.row(), None)
+        else:
+            self.backgrounds[index.row()] = value
+        self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+        return True
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Get the header of a column.
+
+        Parameters
+        ----------
+        section : int
+            The column, or the row for the vertical header.
+        orientation : Qt.Orientation
+            The orientation of the header.
+        role : int, optional
+            The role of the data.
+
+        Returns
+        -------
+        object
+            The header text of the column, the row number for the vertical header, or None.
+        """
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return section + 1
+
+    def flags(self, index):
+        """
+        Get the flags of a cell.
+
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of the cell.
+
+        Returns
+        -------
+        Qt.ItemFlags
+            The cells can be selected but not edited.
+        """
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.FLAGS
+
+    def set_records(self, records):
+        """
+        Show a new list of records, with a single reset of the model.
+
+        Parameters
+        ----------
+        records : list of dict
+            The records. The list is kept, not copied, so it follows the rows added, updated, removed and sorted in the table.
+        """
+        self.beginResetModel()
+        self.records = records
+        self.backgrounds.clear()
+        self.sort_column = None
+        self.search_index = None
+        self.sort_values.clear()
+        self.endResetModel()
+
+    def record(self, row):
+        """
+        Get the record of a row.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+
+        Returns
+        -------
+        dict
+            The record.
+        """
+        return self.records[row]
+
+    def add_record(self, record):
+        """
+        Add a record, at its position if the records are sorted, otherwise at the end of the table.
+
+        Parameters
+        ----------
+        record : dict
+            The record.
+
+        Returns
+        -------
+        int
+            The row of the record.
+        """
+        self.index_record(record)
+        row = self.find_sorted_row(record) if self.sort_column is not None else len(self.records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.records.insert(row, record)
+        self.endInsertRows()
+        return row
+
+    def update_record(self, row, values):
+        """
+        Update the values of the record of a row, moving it to its new position if the records are sorted.
+
+        Parameters
+        ----------
+        row : int
+            The row.
+        values : dict
+            The new values, the other keys of the record are kept.
+
+        Returns
+        -------
+        int
+            The row of the record after the update.
+        """
+        record = self.records[row]
+        record.update(values)
+        self.index_record(record)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.keys) - 1))
+        if self.sort_column is None:
+            return row
+
+        # The position is searched among the other records, then given to beginMoveRows as the row before which the record goes
+        del self.records[row]
+        new_row = self.find_sorted_row(record)
+        self.records.insert(row, record)
+        destination = new_row + 1 if new_row >= row else new_row
+        if destination in (row, row + 1) or not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination):
+            return row
+        del self.records[row]
+        self.records.insert(new_row, record)
+        self.backgrounds.clear()
+        self.endMoveRows()
+        return new_row
+
+    def find_sorted_row(self, record):
+        """
+        Find the row of a record in the sorted records, after the records with the same value.
+
+        Parameters
+        ----------
+        record : dict
+            The record, already indexed.
+
+        Returns
+        -------
+        int
+            The row where the record keeps the records sorted.
+        """
+        sort_values = self.get_sort_values(self.sort_column)
+        value = sort_values[id(record)]
+        descending = self.sort_order == Qt.DescendingOrder
+        low, high = 0, len(self.records)
+        while low < high:
+            middle = (low + high) // 2
+            middle_value = sort_values[id(self.records[middle])]
+            if (middle_value < value) if descending else (value < middle_value):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def get_sort_key(self, record, column):
+        """
+        Compute the sort key of the value of a column in a record.
+
+        Parameters
+        ----------
+        record : dict
+            The record.
+        column : int
+            The column.
+
+        Returns
+        -------
+        object
+            The sort key of the value.
+        """
+        key = self.keys[column]
+        sort_key = self.sort_keys.get(key)
+        return record[key] if sort_key is None else sort_key(record[key])
+
+    def get_sort_values(self, column):
+        """
+        Get the sort keys of a column, computing them if the records were not sorted by this column yet.
+
+        Parameters
+        ----------
+        column : int
+            The column.
+
+        Returns
+        -------
+        dict
+            The sort key of each record, by record identity.
+        """
+        sort_values = self.sort_values.get(column)
+        if sort_values is None:
+            sort_values = {id(record): self.get_sort_key(record, column) for record in self.records}
+            self.sort_values[column] = sort_values
+        return sort_values
+
+    def is_sorted_by(self, column, order):
+        """
+        Check whether the records are sorted by a column.
+
+        Parameters
+        ----------
+        column : int
+            The column.
+        order : Qt.SortOrder
+            The order of the sort.
+
+        Returns
+        -------
+        bool
+            True if the records are sorted by the column in that order, otherwise False.
+        """
+        return self.sort_column == column and self.sort_order == order
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        """
+        Remove a block of contiguous rows.
+
+        Parameters
+        ----------
+        row : int
+            The first row to remove.
+        count : int
+            The number of rows to remove.
+        parent : QModelIndex, optional
+            The parent index, invalid for a table.
+
+        Returns
+        -------
+        bool
+            True if the rows were removed, otherwise False.
+        """
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self.records):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for record in self.records[row:row + count]:
+            for sort_values in self.sort_values.values():
+                del sort_values[id(record)]
+            if self.search_index is not None:
+                self.search_index.remove(id(record))
+        del self.records[row:row + count]
+        self.backgrounds.clear()
+        self.endRemoveRows()
+        return True
+
+    def index_record(self, record):
+        """
+        Add or update the cached sort keys of a record, and its searchable values in the search index if it is built.
+
+        Parameters
+        ----------
+        record : dict
+            The record, indexed by its identity since its values can change.
+        """
+        for column, sort_values in self.sort_values.items():
+            sort_values[id(record)] = self.get_sort_key(record, column)
+        if self.search_index is not None:
+            self.search_index.add(id(record), (record.get(key) for key in self.search_keys))
+
+    def search(self, search_text):
+        """
+        Find the rows whose searchable values contain a text.
+
+        Parameters
+        ----------
+        search_text : str
+            The searched text, compared without case and accents.
+
+        Returns
+        -------
+        set of int
+            The matching rows, or every row if the text is empty.
+        """
+        if not search_text:
+            return set(range(len(self.records)))
+        if self.search_index is None:
+            self.search_index = SearchIndex()
+            for record in self.records:
+                self.index_record(record)
+        keys = self.search_index.search(search_text)
+        return {row for row, record in enumerate(self.records) if id(record) in keys}
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        Sort the records by the values of a column, keeping the selection and the other persistent indexes on their records.
+
+        Parameters
+        ----------
+        column : int
+            The column to sort by. The row number column is not sorted.
+        order : Qt.SortOrder, optional
+            The order of the sort.
+        """
+        if not 0 <= column < len(self.keys) or self.keys[column] == self.ROW_NUMBER:
+            return
+        sort_values = self.get_sort_values(column)
+        self.layoutAboutToBeChanged.emit()
+        # The rows are sorted by the list of their keys, so the sort does not call back into Python for each row
+        keys = [sort_values[id(record)] for record in self.records]
+        old_rows = sorted(range(len(keys)), key=keys.__getitem__, reverse=order == Qt.DescendingOrder)
+        self.records[:] = [self.records[row] for row in old_rows]
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(old_rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(new_rows[index.row()], index.column()) for index in old_indexes])
+        self.backgrounds.clear()
+        self.sort_column = column
+        self.sort_order = order
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def code_number(code):
+        """
+        Get the number of a code, to sort the codes in numeric order.
+
+        Parameters
+        ----------
+        code : str
+            The code, such as 'UC-12'.
+
+        Returns
+        -------
+        int
+            The number after the prefix of the code.
+        """
+        return int(code.split('-')[1])
+
+    @staticmethod
+    def has_no_comment(comment):
+        """
+        Get the sort key of a comment, to sort the records with a comment first.
+
+        Parameters
+        ----------
+        comment : str or None
+            The comment.
+
+        Returns
+        -------
+        bool
+            True if the comment is empty, otherwise False.
+        """
+        return not comment
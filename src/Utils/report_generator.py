@@ -0,0 +1,114 @@
+# This Python file uses the following encoding: utf-8
+# Utils/report_generator.py
+
+from collections import deque
+from Utils.worker import Worker
+from PySide6.QtCore import QObject, Signal, QThreadPool
+
+class ReportGenerator(QObject):
+    """
+    Queue of Excel reports written in the background.
+
+    Each job is an ExcelReportWriter holding a snapshot of the project data, captured by the main thread. The jobs are written one at a time by a task of the global thread pool, in the order they were queued, while the main thread only receives the progress and the result through signals.
+
+    Attributes
+    ----------
+    started : Signal
+        Signal emitted with the path of a report and the number of reports still queued when its job starts.
+    progress : Signal
+        Signal emitted with the number of written sheets and the total number of sheets of the running job.
+    finished : Signal
+        Signal emitted with the path of a report when its job completes.
+    failed : Signal
+        Signal emitted with the path of a report and the error message when its job fails.
+    jobs : deque
+        The queued writers, waiting for the running job to end.
+    writer : ExcelReportWriter or None
+        The writer of the running job, None when the queue is idle.
+    worker : Worker or None
+        The task of the running job.
+
+    Methods
+    -------
+    """
+
+    started = Signal(str, int)
+    progress = Signal(int, int)
+    finished = Signal(str)
+    failed = Signal(str, str)
+
+    def __init__(self):
+        """
+        Initialize the ReportGenerator.
+        """
+        super().__init__()
+        self.jobs = deque()
+        self.writer = None
+        self.worker = None
+
+    def add_job(self, writer):
+        """
+        Queue a report, starting it at once if no other report is being written.
+
+        Parameters
+        ----------
+        writer : ExcelReportWriter
+            The writer of the report, with all its tables added.
+        """
+        self.jobs.append(writer)
+        if self.writer is None:
+            self.start_next_job()
+
+    def is_busy(self):
+        """
+        Check whether a report is being written.
+
+        Returns
+        -------
+        bool
+            True if a job is running, False otherwise.
+        """
+        return self.writer is not None
+
+    def start_next_job(self):
+        """
+        Start the oldest queued job in the global thread pool.
+        """
+        if not self.jobs:
+            return
+        self.writer = self.jobs.popleft()
+        self.started.emit(self.writer.file_path, len(self.jobs))
+        self.worker = Worker(self.writer.save, progress=self.progress.emit)
+        self.worker.signals.finished.connect(self.handle_job_finished)
+        self.worker.signals.failed.connect(self.handle_job_failed)
+        QThreadPool.globalInstance().start(self.worker)
+
+    def handle_job_finished(self, result):
+        """
+        Start the next job and emit the path of the completed report.
+
+        Parameters
+        ----------
+        result : None
+            The result of the job.
+        """
+        file_path = self.writer.file_path
+        self.writer = None
+        self.worker = None
+        self.start_next_job()
+        self.finished.emit(file_path)
+
+    def handle_job_failed(self, error):
+        """
+        Start the next job and emit the error of the failed report.
+
+        Parameters
+        ----------
+        error : str
+            The error message.
+        """
+        file_path = self.writer.file_path
+        self.writer = None
+        self.worker = None
+        self.start_next_job()
+        self.failed.emit(file_path, error)
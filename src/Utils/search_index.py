@@ -0,0 +1,140 @@
+# This Python file uses the following encoding: utf-8
+# Utils/search_index.py
+
+import unicodedata
+
+class SearchIndex:
+    """
+    Normalized text index for the incremental search of a table.
+
+    The searchable values of each entry, such as a row, are normalized once when the entry is added: they are case folded and their accents are removed. The index keeps the trigrams of the normalized text, so a search only compares the entries that contain every trigram of the searched text instead of the cells of every row.
+
+    Attributes
+    ----------
+    SEPARATOR : str
+        The character joining the values of an entry, so a search never matches across two values.
+    texts : dict
+        The normalized text of each entry.
+    trigrams : dict
+        The keys of the entries containing each trigram.
+
+    Methods
+    -------
+    """
+
+    SEPARATOR = "\x1f"
+
+    def __init__(self):
+        """
+        Initialize the SearchIndex.
+        """
+        self.texts = {}
+        self.trigrams = {}
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        self.texts.clear()
+        self.trigrams.clear()
+
+    def add(self, key, values):
+        """
+        Add an entry, replacing the previous entry with the same key.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the entry.
+        values : iterable
+            The searchable values of the entry.
+        """
+        self.remove(key)
+        text = self.SEPARATOR.join(self.normalize(value) for value in values)
+        self.texts[key] = text
+        for trigram in self.get_trigrams(text):
+            self.trigrams.setdefault(trigram, set()).add(key)
+
+    def remove(self, key):
+        """
+        Remove an entry, if it exists.
+
+        Parameters
+        ----------
+        key : hashable
+            The key of the entry.
+        """
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for trigram in self.get_trigrams(text):
+            keys = self.trigrams[trigram]
+            keys.discard(key)
+            if not keys:
+                del self.trigrams[trigram]
+
+    def search(self, search_text):
+        """
+        Find the entries containing a text in one of their values.
+
+        Parameters
+        ----------
+        search_text : str
+            The searched text, compared without case and accents.
+
+        Returns
+        -------
+        set
+            The keys of the matching entries, or every key if the text is empty.
+        """
+        search_text = self.normalize(search_text)
+        if not search_text:
+            return set(self.texts)
+
+        trigrams = self.get_trigrams(search_text)
+        if not trigrams:  # Shorter than a trigram
+            return {key for key, text in self.texts.items() if search_text in text}
+
+        candidates = sorted((self.trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+        keys = set(candidates[0]).intersection(*candidates[1:])
+        return {key for key in keys if search_text in self.texts[key]}
+
+    @staticmethod
+    def normalize(value):
+        """
+        Normalize a value for the search.
+
+        Parameters
+        ----------
+        value : object
+            The value, converted to text. None is an empty text.
+
+        Returns
+        -------
+        str
+            The case folded text, without accents.
+        """
+        if value is None:
+            return ""
+        text = str(value).casefold()
+        if text.isascii():  # No accents to remove
+            return text
+        text = unicodedata.normalize("NFKD", text)
+        return "".join(character for character in text if not unicodedata.combining(character))
+
+    @staticmethod
+    def get_trigrams(text):
+        """
+        Get the trigrams of a normalized text.
+
+        Parameters
+        ----------
+        text : str
+            The normalized text.
+
+        Returns
+        -------
+        set of str
+            The substrings of three characters of the text.
+        """
+        return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -1,7 +1,7 @@
 # This Python file uses the following encoding: utf-8
 # Utils/table_utils.py
 
-from PySide6.QtWidgets import QTableWidgetItem, QPushButton, QCheckBox, QToolTip
+from PySide6.QtWidgets import QPushButton, QCheckBox, QToolTip
 from PySide6.QtGui import QColor, QMouseEvent
 from PySide6.QtCore import Qt, QEvent, QObject, QRect
 
@@ -13,10 +13,10 @@ class TableUtils(QObject):
     ----------
     currentRow : int
         The currently highlighted row.
-    currentTableWidget : QTableWidget
-        The currently highlighted table widget.
-    tables : list of QTableWidget
-        List of table widgets being managed.
+    currentTableWidget : QTableView
+        The currently highlighted table.
+    tables : list of QTableView
+        List of tables being managed, either QTableWidget or QTableView over a model.
 
     Methods
     -------
@@ -37,12 +37,12 @@ class TableUtils(QObject):
 
         Parameters
         ----------
-        table : QTableWidget
-            The table widget to add.
+        table : QTableView
+            The table to add.
         """
         self.__class__.tables.append(table)
         table.setMouseTracking(True)
-        table.cellEntered.connect(lambda row, column, table=table: self.on_cell_entered(table, row))
+        table.entered.connect(lambda index, table=table: self.on_cell_entered(table, index.row()))
         table.viewport().installEventFilter(self)
 
     def on_cell_entered(self, table_widget, row):
@@ -51,8 +51,8 @@ class TableUtils(QObject):
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The table widget.
+        table_widget : QTableView
+            The table.
         row : int
             The row index entered.
         """
@@ -68,19 +68,16 @@ class TableUtils(QObject):
 
         Parameters
         ----------
-        tableWidget : QTableWidget
-            The table widget.
+        tableWidget : QTableView
+            The table.
         row : int
             The row index to highlight.
         color : QColor
             The color to use for highlighting.
         """
-        for i in range(table_widget.columnCount()):
-            item = table_widget.item(row, i)
-            if item is None:
-                item = QTableWidgetItem()
-                table_widget.setItem(row, i, item)
-            item.setBackground(color)
+        model = table_widget.model()
+        for i in range(model.columnCount()):
+            model.setData(model.index(row, i), color, Qt.BackgroundRole)
 
     def eventFilter(self, source, event):
         """
@@ -125,21 +122,22 @@ class TableUtils(QObject):
 
         Parameters
         ----------
-        tableWidget : QTableWidget
-            The table widget.
+        tableWidget : QTableView
+            The table.
         row : int
             The row index to reset.
         """
         if row != -1 and table_widget is not None:
-            for column in range(table_widget.columnCount()):
-                item = table_widget.item(row, column)
-                if item:
-                    item.setBackground(Qt.transparent)
+            model = table_widget.model()
+            for column in range(model.columnCount()):
+                index = model.index(row, column)
+                if index.data(Qt.BackgroundRole) is not None:
+                    model.setData(index, Qt.transparent, Qt.BackgroundRole)
         self.__class__.currentRow = -1
         self.__class__.currentTableWidget = None
 
     @staticmethod
-    def on_header_clicked(logical_index, table_widget, not_sorting_index, update=False):
+    def on_header_clicked(logical_index, table_widget, not_sorting_index):
         """
         Handles table header click events for sorting.
 
@@ -147,49 +145,53 @@ class TableUtils(QObject):
         ----------
         logical_index : int
             The index of the clicked header.
-        table_widget : QTableWidget
-            The table widget.
+        table_widget : QTableView
+            The table.
         not_sorting_index : list of int
             List of column indices that should not be sorted.
-        update : bool, optional
-            Whether to update row numbers (default is False).
         """
-        if logical_index in not_sorting_index:
-            table_widget.setSortingEnabled(False)
-        else:
-            table_widget.setSortingEnabled(True)
-            if update:
-                TableUtils.update_row_numbers(table_widget, 0)
+        table_widget.setSortingEnabled(logical_index not in not_sorting_index)
 
     @staticmethod
-    def update_row_numbers(table_widget, starting_row=0, column=1):
+    def update_rows_visibility(table_widget, rows_to_show):
         """
-        Updates row numbers in a table.
+        Shows the rows of a search and hides the others, changing only the rows whose visibility changes.
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The table widget.
-        starting_row : int, optional
-            The starting row for updating (default is 0).
-        column : int, optional
-            The column index for row numbers (default is 1).
+        table_widget : QTableView
+            The table.
+        rows_to_show : set of int
+            The row indices to show.
         """
-        sort_column = table_widget.horizontalHeader().sortIndicatorSection()
-        if sort_column != column:
-            table_widget.setSortingEnabled(True)
-        else:
-            table_widget.setSortingEnabled(False)
-
-        for rowIndex in range(starting_row, table_widget.rowCount()):
-            currentRowNumberItem = table_widget.item(rowIndex, column)
-            if currentRowNumberItem:
-                currentRowNumberItem.setData(Qt.EditRole, rowIndex + 1)
-            else:
-                item = QTableWidgetItem()
-                item.setData(Qt.EditRole, rowIndex + 1)
-                table_widget.setItem(rowIndex, column, item)
-            table_widget.item(rowIndex, column).setTextAlignment(Qt.AlignCenter)
+        for row in range(table_widget.model().rowCount()):
+            hidden = row not in rows_to_show
+            if table_widget.isRowHidden(row) != hidden:
+                table_widget.setRowHidden(row, hidden)
+
+    @staticmethod
+    def remove_rows(table_widget, rows):
+        """
+        Removes several rows from a table, with one model call per block of contiguous rows.
+
+        Parameters
+        ----------
+        table_widget : QTableView
+            The table.
+        rows : list of int
+            The row indices to remove.
+        """
+        model = table_widget.model()
+        block_end = block_start = None
+        for row in sorted(set(rows), reverse=True):
+            if block_start is not None and row == block_start - 1:
+                block_start = row
+                continue
+            if block_start is not None:
+                model.removeRows(block_start, block_end - block_start + 1)
+            block_start = block_end = row
+        if block_start is not None:
+            model.removeRows(block_start, block_end - block_start + 1)
 
     @staticmethod
     def adjust_header_widget(header, widget, columns, x=None, y=None, w=None, h=None):
@@ -231,8 +233,8 @@ class TableUtils(QObject):
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The table widget.
+        table_widget : QTableView
+            The table.
         header : QHeaderView
             The header view of the table.
         columns_to_span : list of int
@@ -277,8 +279,8 @@ class TableUtils(QObject):
         ----------
         state : int
             The state of the checkbox (checked or unchecked).
-        table_widget : QTableWidget
-            The table widget.
+        table_widget : QTableView
+            The table.
         checkbox : QCheckBox
             The checkbox controlling the selection.
         """
@@ -290,12 +292,12 @@ class TableUtils(QObject):
     @staticmethod
     def check_column_visibility(table, widget, column=1):
         """
-        Checks if a specified column in a QTableWidget is visible and sets the visibility of a widget accordingly.
+        Checks if a specified column in a table is visible and sets the visibility of a widget accordingly.
 
         Parameters
         ----------
-        table : QTableWidget
-            The table widget containing the column to check.
+        table : QTableView
+            The table containing the column to check.
         widget : QWidget
             The widget whose visibility will be set based on the column's visibility.
         column : int, optional
@@ -1,9 +1,10 @@
 # This Python file uses the following encoding: utf-8
 # Utils/widget_config.py
 
-from PySide6.QtWidgets import QMessageBox, QPushButton
-from PySide6.QtGui import QPixmap, QIcon, QTextCursor
-from PySide6.QtCore import Qt, QSize, QObject
+import config
+from PySide6.QtWidgets import QMessageBox
+from PySide6.QtGui import QPixmap, QTextCursor
+from PySide6.QtCore import Qt, QObject, QTimer
 
 class WidgetConfig(QObject):
     """
@@ -46,52 +47,6 @@ class WidgetConfig(QObject):
                 rb.setAutoExclusive(True)
             comment_plain_text_edit.setPlainText("")
 
-    @staticmethod
-    def create_comment(comment, row, table_widget, comment_icon, column=None):
-        """
-        Creates a comment button in a table cell.
-
-        Parameters
-        ----------
-        comment : str
-            The comment text.
-        row : int
-            The row index.
-        table_widget : QTableWidget
-            The table widget.
-        comment_icon:
-            The comment icon
-        column : int, optional
-            The column index (default is the last column).
-        """
-        comment_button = QPushButton()
-        comment_button.setToolTip(comment)
-        comment_button.setFocusPolicy(Qt.NoFocus)
-
-        comment_button.setIcon(QIcon(comment_icon))
-        comment_button.setIconSize(QSize(35, 35))
-
-        comment_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: transparent;
-            }
-            QToolTip {
-                background-color: white;
-                color: black; font-family: 'Arial';
-                font-size: 12px;
-                padding: 2px;
-                border: 2px solid black;
-            }
-        """)
-
-        if column is None:
-            column = table_widget.columnCount() - 1
-        table_widget.setCellWidget(row, column, comment_button)
-
     @staticmethod
     def show_message_dialog(title, message, icon_path, dialog_type='simple_message', ok_callback=None):
         """
@@ -189,3 +144,26 @@ class WidgetConfig(QObject):
             cursor.movePosition(QTextCursor.End)
             comment_plain_text_edit.setTextCursor(cursor)
 
+    @staticmethod
+    def connect_search_bar(search_line_edit, search_function):
+        """
+        Connects a search bar to its search function, called once the text has not changed for SEARCH_DELAY milliseconds.
+
+        Parameters
+        ----------
+        search_line_edit : QLineEdit
+            The search bar.
+        search_function : callable
+            The function that filters the table with the text of the search bar.
+
+        Returns
+        -------
+        QTimer
+            The timer delaying the search, owned by the search bar.
+        """
+        search_timer = QTimer(search_line_edit)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(config.SEARCH_DELAY)
+        search_timer.timeout.connect(search_function)
+        search_line_edit.textChanged.connect(lambda: search_timer.start())
+        return search_timer
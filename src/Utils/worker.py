@@ -0,0 +1,56 @@
+# This Python file uses the following encoding: utf-8
+# Utils/worker.py
+
+from PySide6.QtCore import QRunnable
+from Utils.worker_signals import WorkerSignals
+
+class Worker(QRunnable):
+    """
+    Task that runs a function in the global thread pool and reports its result through signals.
+
+    The function must not use widgets or the database connection of the main thread; it receives plain data and returns plain data.
+
+    Attributes
+    ----------
+    function : callable
+        The function to run.
+    args : tuple
+        Positional arguments of the function.
+    kwargs : dict
+        Keyword arguments of the function.
+    signals : WorkerSignals
+        The signals used to report the progress and the result.
+
+    Methods
+    -------
+    """
+
+    def __init__(self, function, *args, **kwargs):
+        """
+        Initialize the Worker.
+
+        Parameters
+        ----------
+        function : callable
+            The function to run.
+        *args
+            Positional arguments of the function.
+        **kwargs
+            Keyword arguments of the function.
+        """
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Run the function and emit its result, or the error message if it fails.
+        """
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
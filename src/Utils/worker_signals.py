@@ -0,0 +1,27 @@
+# This Python file uses the following encoding: utf-8
+# Utils/worker_signals.py
+
+from PySide6.QtCore import QObject, Signal
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker while it runs in the thread pool.
+
+    QRunnable is not a QObject, so the worker owns an instance of this class to report back to the main thread.
+
+    Attributes
+    ----------
+    progress : Signal
+        Signal emitted with the number of completed steps and the total number of steps.
+    finished : Signal
+        Signal emitted with the result of the task when it completes.
+    failed : Signal
+        Signal emitted with the error message when the task raises an exception.
+
+    Methods
+    -------
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(object)
+    failed = Signal(str)
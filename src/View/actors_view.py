@@ -7,10 +7,10 @@ from Utils.table_utils import TableUtils
 from Utils.border_bottom_delegate import BorderBottomDelegate
 from Utils.button_utils import ButtonUtils
 from Utils.widget_config import WidgetConfig
-from Utils.numeric_table_item import NumericTableWidgetItem
+from Utils.records_table_model import RecordsTableModel
 
-from PySide6.QtWidgets import QHeaderView, QWidget, QTableWidgetItem, QAbstractItemView, QLineEdit
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QHeaderView, QWidget, QAbstractItemView, QLineEdit
+from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QAction, QIcon
 
 class ActorsView(QWidget):
@@ -29,6 +29,8 @@ class ActorsView(QWidget):
         Signal emitted when actor weights are updated.
     text_changed : Signal
         Signal emitted when the text in the actor search bar changes.
+    actors_model : RecordsTableModel
+        The model of the actors table, backed by the actors of the project.
 
     Methods
     -------
@@ -51,7 +53,16 @@ class ActorsView(QWidget):
         super().__init__(parent)
         self.main = parent  # Main as parent class
         self.ui = self.main.ui  # Use the UI initialized in Main
-        self.actors_table = self.ui.actors_TableWidget
+        self.actors_table = self.ui.actors_TableView
+        self.actors_model = RecordsTableModel(
+            ["ACTOR_ID", "#", "Code", "Name", "Complexity", "Comment"],
+            ['id', RecordsTableModel.ROW_NUMBER, 'code', 'name', 'complexity', 'comment'],
+            config.COMMENT_IMG_YELLOW,
+            sort_keys={'id': int, 'code': RecordsTableModel.code_number, 'comment': RecordsTableModel.has_no_comment},
+            search_keys=['code', 'name', 'complexity'],
+            parent=self
+        )
+        self.actors_table.setModel(self.actors_model)
         self.actors_summary_table = self.ui.actorsSummary_TableWidget
         self.tableUtils = TableUtils()
         self.setup_actors_ui()
@@ -74,17 +85,18 @@ class ActorsView(QWidget):
         self.tableUtils.add_table(self.actors_table)
         self.actors_table.setColumnHidden(0, True)
         actors_headerTable = self.actors_table.horizontalHeader()
-        actors_headerTable.sectionClicked.connect(lambda index: TableUtils.on_header_clicked(index, self.actors_table, [1], True))
+        actors_headerTable.sectionClicked.connect(lambda index: TableUtils.on_header_clicked(index, self.actors_table, [1]))
+        self.actors_table.setIconSize(QSize(35, 35))
         self.actors_table.setColumnWidth(1, 80)
         self.actors_table.setColumnWidth(5, 106)
-        for column in range(self.actors_table.columnCount()):
+        for column in range(self.actors_model.columnCount()):
             if column not in [1, 5]:
                 self.actors_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.Stretch)
             else:
                 self.actors_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.Fixed)
 
         actors_borderBottomDelegate = BorderBottomDelegate()
-        for column in range(self.actors_table.columnCount()):
+        for column in range(self.actors_model.columnCount()):
             self.actors_table.setItemDelegateForColumn(column, actors_borderBottomDelegate)
 
         actors_header = self.actors_table.horizontalHeader()
@@ -96,7 +108,7 @@ class ActorsView(QWidget):
         ButtonUtils.set_styles_button(self.ui.editActor_Button, '#48F4FF', '#22577A', config.EDIT_IMG, config.EDIT_DISABLED_IMG, False)
         self.ui.deleteActor_Button.setEnabled(False)
         ButtonUtils.set_styles_button(self.ui.deleteActor_Button, '#FF0000', '#FFFFFF', config.DELETE_IMG, config.DELETE_DISABLED_IMG, False)
-        self.actors_table.itemSelectionChanged.connect(lambda: ButtonUtils.check_selection(
+        self.actors_table.selectionModel().selectionChanged.connect(lambda: ButtonUtils.check_selection(
             self.actors_table,
             self.ui.editActor_Button,
             self.ui.deleteActor_Button,
@@ -111,16 +123,16 @@ class ActorsView(QWidget):
         search_action = QAction(QIcon(config.SEARCH_IMG), None, self)
         self.ui.actorsSearch_LineEdit.findChildren(QAction)[0].setIcon(QIcon(config.CLEAR_SEARCH_IMG))
         self.ui.actorsSearch_LineEdit.addAction(search_action, QLineEdit.LeadingPosition)
-        self.ui.actorsSearch_LineEdit.textChanged.connect(self.search_actor)
+        WidgetConfig.connect_search_bar(self.ui.actorsSearch_LineEdit, self.search_actor)
 
     def create_actor(self):
         """
         Emit a signal to create a new actor.
         """
         actor_codes = {
-            f"ACT-{item.text().split('-')[1]}": int(item.text().split("-")[1])
-            for row in range(self.actors_table.rowCount())
-            if (item := self.actors_table.item(row, 2)) is not None and item.text().startswith("ACT-")
+            actor['code']: RecordsTableModel.code_number(actor['code'])
+            for actor in self.actors_model.records
+            if actor['code'].startswith("ACT-")
         }
         self.actor_managed.emit("new", "actor", actor_codes, None)
 
@@ -156,30 +168,43 @@ class ActorsView(QWidget):
         """
         Edit the selected actor.
         """
-        selected_indexes = self.actors_table.selectedIndexes()
-        unique_rows = set(index.row() for index in selected_indexes)
-        if len(unique_rows) != 1:
+        selected_rows = self.actors_table.selectionModel().selectedRows()
+        if len(selected_rows) != 1:
             self.display_message("Failed Operation", "No row selected. Please, try again.", config.CRITICAL_IMG)
             return
-        selected_row = unique_rows.pop()
+        selected_row = selected_rows[0].row()
         actor_codes = {
-            f"ACT-{item.text().split('-')[1]}": int(item.text().split("-")[1])
-            for row in range(self.actors_table.rowCount())
-            if (item := self.actors_table.item(row, 2)) is not None and item.text().startswith("ACT-")
+            actor['code']: RecordsTableModel.code_number(actor['code'])
+            for actor in self.actors_model.records
+            if actor['code'].startswith("ACT-")
         }
+        actor = self.actors_model.record(selected_row)
         actor_data = {
-            'id': self.actors_table.item(selected_row, 0).text(),
-            'code': self.actors_table.item(selected_row, 2).text(),
-            'name': self.actors_table.item(selected_row, 3).text(),
-            'complexity': self.actors_table.item(selected_row, 4).text(),
-            'comment': self.actors_table.cellWidget(selected_row, 5).toolTip() if self.actors_table.cellWidget(selected_row, 5) else "",
+            'id': str(actor['id']),
+            'code': actor['code'],
+            'name': actor['name'],
+            'complexity': actor['complexity'],
+            'comment': actor['comment'] or "",
             'codes': actor_codes
         }
         actor_codes.pop(actor_data['code'])
         #self.actors_table.selectionModel().clearSelection()
         self.actor_managed.emit("edit", "actor", actor_data, selected_row)
 
-    def update_actors_table(self, data_saved, selected_row=None, update_rows=True):
+    def load_actors_table(self, actors):
+        """
+        Show the actors of a project in the actors table.
+
+        Parameters
+        ----------
+        actors : list of dict
+            The actors of the project, in the order of the rows.
+        """
+        self.actors_table.setSortingEnabled(False)
+        self.actors_model.set_records(actors)
+        self.update_table_state()
+
+    def update_actors_table(self, data_saved, selected_row=None):
         """
         Update the actors table with the provided data.
 
@@ -189,43 +214,28 @@ class ActorsView(QWidget):
             Saved actor data.
         selected_row : int, optional
             Selected row to update, default is None.
-        update_rows : bool, optional
-            Whether to update row numbers, default is True.
         """
-        self.actors_table.setSortingEnabled(False)
         if selected_row is None:
-            row = self.actors_table.rowCount()
-            self.actors_table.insertRow(row)
-            numbers_item = QTableWidgetItem()
-            numbers_item.setData(Qt.EditRole, row + 1)
-            self.actors_table.setItem(row, 0, QTableWidgetItem(str(data_saved['id'])))
-            self.actors_table.setItem(row, 1, numbers_item)
-            self.actors_table.item(row, 1).setTextAlignment(Qt.AlignCenter)
-        else:
-            row = selected_row
-        self.actors_table.setItem(row, 2, NumericTableWidgetItem(data_saved['code']))
-        self.actors_table.item(row, 2).setTextAlignment(Qt.AlignCenter)
-        self.actors_table.setItem(row, 3, QTableWidgetItem(data_saved['name']))
-        self.actors_table.item(row, 3).setTextAlignment(Qt.AlignCenter)
-        self.actors_table.setItem(row, 4, QTableWidgetItem(data_saved['complexity']))
-        self.actors_table.item(row, 4).setTextAlignment(Qt.AlignCenter)
-        if data_saved['comment'] != '':
-            WidgetConfig.create_comment(data_saved['comment'], row, self.actors_table, config.COMMENT_IMG_YELLOW)
-            self.actors_table.setItem(row, 5, QTableWidgetItem(""))
+            row = self.actors_model.add_record(data_saved)
         else:
-            self.actors_table.removeCellWidget(row, self.actors_table.columnCount() - 1)
-            self.actors_table.setItem(row, 5, QTableWidgetItem(" "))
+            row = self.actors_model.update_record(selected_row, data_saved)
 
-        if update_rows:
-            self.actors_table.selectRow(row)
-            TableUtils.update_row_numbers(self.actors_table)
-            self.actors_table.scrollToItem(self.actors_table.currentItem(), QAbstractItemView.PositionAtCenter)
-            self.actors_table.selectionModel().clearSelection()
+        self.actors_table.selectRow(row)
+        header = self.actors_table.horizontalHeader()
+        if not self.actors_model.is_sorted_by(header.sortIndicatorSection(), header.sortIndicatorOrder()):  # A sorted model already placed the row
+            TableUtils.on_header_clicked(header.sortIndicatorSection(), self.actors_table, [1])
+        self.actors_table.scrollTo(self.actors_table.currentIndex(), QAbstractItemView.PositionAtCenter)
+        self.actors_table.selectionModel().clearSelection()
+        self.update_table_state()
 
+    def update_table_state(self):
+        """
+        Update the header checkbox and the new actor button after the rows of the actors table change.
+        """
         self.table_checkbox.setCheckState(Qt.Unchecked)
-        self.table_checkbox.setVisible(self.actors_table.rowCount() > 0)
+        self.table_checkbox.setVisible(self.actors_model.rowCount() > 0)
 
-        if self.actors_table.rowCount() == config.ACTOR_LIMIT:
+        if self.actors_model.rowCount() >= config.ACTOR_LIMIT:
             self.ui.newActor_Button.setEnabled(False)
             ButtonUtils.set_styles_button(self.ui.newActor_Button, '#48F4FF', '#22577A', config.NEW_IMG, config.NEW_DISABLED_IMG, False)
             self.ui.newActor_Button.setEnabled(False)
@@ -263,11 +273,12 @@ class ActorsView(QWidget):
         if not selected_rows:
             self.display_message("Failed operation", "No actors selected. Please select at least one actor to delete.", config.WARNING_IMG)
             return
+        actors = [self.actors_model.record(row) for row in selected_rows]
         actors_data = {
-            self.actors_table.item(row, 0).text(): {
-                'code': self.actors_table.item(row, 2).text(),
-                'complexity': self.actors_table.item(row, 4).text()
-            } for row in selected_rows
+            str(actor['id']): {
+                'code': actor['code'],
+                'complexity': actor['complexity']
+            } for actor in actors
         }
         self.actors_deleted.emit(actors_data, selected_rows)
 
@@ -283,15 +294,13 @@ class ActorsView(QWidget):
             If True, deletes all rows in the table.
         """
         if clear_all:
-            self.actors_table.setRowCount(0)
-        else:
-            if rows is not None:
-                for row in sorted(rows, reverse=True):
-                    self.actors_table.removeRow(row)
-                    TableUtils.update_row_numbers(self.actors_table, row)
+            self.actors_model.set_records([])
+        elif rows:
+            self.actors_table.selectionModel().clearSelection()  # Otherwise the selection changes with every removed block of rows
+            TableUtils.remove_rows(self.actors_table, rows)
 
         self.table_checkbox.setCheckState(Qt.Unchecked)
-        self.table_checkbox.setVisible(self.actors_table.rowCount() > 0)
+        self.table_checkbox.setVisible(self.actors_model.rowCount() > 0)
 
         self.ui.newActor_Button.setEnabled(True)
         ButtonUtils.set_styles_button(self.ui.newActor_Button, '#5AFFA6', '#094646', config.NEW_IMG, config.NEW_DISABLED_IMG, True)
@@ -328,11 +337,7 @@ class ActorsView(QWidget):
         set
             Set of rows that match the search text.
         """
-        matching_items = self.actors_table.findItems(search_text, Qt.MatchContains)
-        matching_items = [item for item in matching_items if item is not None]
-        matching_items_in_columns = [item for item in matching_items if item.column() in [2, 3, 4]]
-        rows_to_show = set(item.row() for item in matching_items_in_columns)
-        return rows_to_show
+        return self.actors_model.search(search_text)
 
     def update_table_visibility(self, rows_to_show):
         """
@@ -343,5 +348,4 @@ class ActorsView(QWidget):
         rows_to_show : set
             Set of rows to show.
         """
-        for i in range(self.actors_table.rowCount()):
-            self.actors_table.setRowHidden(i, i not in rows_to_show)
+        TableUtils.update_rows_visibility(self.actors_table, rows_to_show)
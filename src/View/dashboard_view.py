@@ -28,6 +28,8 @@ class DashboardView(QWidget):
         Signal emitted to trigger report generation.
     cf_data : Signal
         Signal emitted with conversion factor data.
+    simulation_request : Signal
+        Signal emitted to start the effort simulation of the project.
 
     Methods
     -------
@@ -39,6 +41,7 @@ class DashboardView(QWidget):
     ECF_updated = Signal(float)
     report_generation = Signal()
     cf_data = Signal(float)
+    simulation_request = Signal()
 
     def __init__(self, parent=None):
         """
@@ -71,6 +74,9 @@ class DashboardView(QWidget):
         # Conversion Factor
         self.ui.editCF_Button.clicked.connect(self.edit_cf)
 
+        # Effort Simulation
+        self.ui.simulateEffort_PushButton.clicked.connect(self.simulate_effort)
+
         # Excel Report
         self.ui.generateReport_PushButton.clicked.connect(self.generate_report)
 
@@ -80,6 +86,48 @@ class DashboardView(QWidget):
         """
         self.report_generation.emit()
 
+    def simulate_effort(self):
+        """
+        Emit signal to simulate the effort of the project.
+        """
+        self.simulation_request.emit()
+
+    def set_simulation_running(self, running):
+        """
+        Enable or disable the simulation button while a simulation of the project runs.
+
+        Parameters
+        ----------
+        running : bool
+            True if a simulation of the project is running.
+        """
+        self.ui.simulateEffort_PushButton.setEnabled(not running)
+        self.ui.simulateEffort_PushButton.setText("  Simulating...    " if running else "  Simulate Effort    ")
+
+    def display_simulation(self, summary):
+        """
+        Display the percentiles of a completed effort simulation.
+
+        Parameters
+        ----------
+        summary : dict
+            Number of trials, and the percentiles of the person-hours of each activity and of the total hours.
+        """
+        percentiles = list(summary['total_hours'])
+        rows = [(activity.capitalize(), summary['person_hours'][activity]) for activity in config.ACTIVITIES]
+        rows.append(("Total Effort", summary['total_hours']))
+
+        header = "".join(f"<th align='right'>&nbsp;&nbsp;P{percentile}</th>" for percentile in percentiles)
+        body = "".join(
+            f"<tr><td>{name}</td>" + "".join(f"<td align='right'>&nbsp;&nbsp;{values[percentile]:,.2f}</td>" for percentile in percentiles) + "</tr>"
+            for name, values in rows
+        )
+        message = (
+            f"<p>Person-hours over {summary['trials']:,} trials:</p>"
+            f"<table><tr><th></th>{header}</tr>{body}</table>"
+        )
+        self.display_message("Effort Simulation", message, config.INFORMATION_IMG)
+
     def display_message(self, title, message, icon_path, dialog_type='simple_message'):
         """
         Display a message dialog.
@@ -315,6 +363,32 @@ class DashboardView(QWidget):
 
         self.ECF_updated.emit(EFactor)
 
+    def update_metrics(self, metrics):
+        """
+        Update the recomputed metrics in the UI with a single repaint.
+
+        Parameters
+        ----------
+        metrics : dict
+            Values to display. It may contain 'UUCP', 'TCF', 'ECF', 'UCP' and 'E', and 'person_hours' together with 'total_effort'.
+        """
+        setters = {
+            'UUCP': self.set_UUCP,
+            'TCF': self.set_TCF,
+            'ECF': self.set_ECF,
+            'UCP': self.set_UCP,
+            'E': self.set_E
+        }
+        self.setUpdatesEnabled(False)
+        try:
+            for key, setter in setters.items():
+                if key in metrics:
+                    setter(metrics[key])
+            if 'person_hours' in metrics:
+                self.update_effort_distribution(person_hours=metrics['person_hours'], total_effort=metrics.get('total_effort'))
+        finally:
+            self.setUpdatesEnabled(True)
+
     def set_UUCP(self, UUCP):
         """
         Set the UUCP value in the UI.
@@ -5,6 +5,7 @@ import config
 from Utils.table_utils import TableUtils
 from Utils.button_utils import ButtonUtils
 from Utils.widget_config import WidgetConfig
+from Utils.comment_delegate import CommentDelegate
 from PySide6.QtWidgets import QHeaderView, QWidget, QAbstractItemView, QTableWidgetItem
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QTextCursor
@@ -64,6 +65,7 @@ class EnvironmentalFactorsView(QWidget):
         self.environmentalFactors_table.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         self.environmentalFactors_table.setSpan(8, 0, 1, 7)
+        self.environmentalFactors_table.setItemDelegateForColumn(6, CommentDelegate(config.COMMENT_IMG_GREEN, parent=self.environmentalFactors_table))
 
         # Manage Environmental Factors
         self.ui.environmentalFactorsFactor_ComboBox.currentIndexChanged.connect(self.update_environmental_factors_tooltip)
@@ -196,7 +198,7 @@ class EnvironmentalFactorsView(QWidget):
                 if self.environmentalFactors_table.item(row, 1).text() == factor:
                     weight = float(self.environmentalFactors_table.item(row, 3).text())
                     influence = int(self.environmentalFactors_table.item(row, 4).text())
-                    comment = self.environmentalFactors_table.cellWidget(row, 6).toolTip() if self.environmentalFactors_table.cellWidget(row, 6) else ""
+                    comment = self.environmentalFactors_table.item(row, 6).toolTip()
                     self.ui.environmentalFactorsWeight_DoubleSpinBox.setValue(weight)
                     self.environmentalFactors_radioButtons[influence].setChecked(True)
                     self.ui.environmentalFactorsComment_PlainTextEdit.setPlainText(comment)
@@ -241,16 +243,10 @@ class EnvironmentalFactorsView(QWidget):
             item.setBackground(QColor(222, 255, 250))
             item.setTextAlignment(Qt.AlignCenter)
             self.environmentalFactors_table.setItem(row_index, 3 + i, item)
-        if data_saved['comment'] != '':
-            WidgetConfig.create_comment(data_saved['comment'], row_index, self.environmentalFactors_table, config.COMMENT_IMG_GREEN)
-            comment_item = QTableWidgetItem("")
-            comment_item.setBackground(QColor(222, 255, 250))
-            self.environmentalFactors_table.setItem(row_index, 6, comment_item)
-        else:
-            comment_item = QTableWidgetItem(" ")
-            comment_item.setBackground(QColor(222, 255, 250))
-            self.environmentalFactors_table.removeCellWidget(row_index, self.environmentalFactors_table.columnCount() - 1)
-            self.environmentalFactors_table.setItem(row_index, 6, comment_item)
+        comment_item = QTableWidgetItem("" if data_saved['comment'] != '' else " ")
+        comment_item.setToolTip(data_saved['comment'])
+        comment_item.setBackground(QColor(222, 255, 250))
+        self.environmentalFactors_table.setItem(row_index, 6, comment_item)
 
         self.ui.environmentalFactorsFactor_ComboBox.setCurrentIndex(-1)
         self.environmentalFactors_table.setSortingEnabled(True)
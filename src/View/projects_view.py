@@ -4,7 +4,10 @@
 import config
 from Utils.table_utils import TableUtils
 from Utils.widget_config import WidgetConfig
-from PySide6.QtWidgets import QHeaderView, QPushButton, QLineEdit, QTableWidgetItem, QAbstractItemView, QWidget, QMenu, QToolButton, QTableWidget
+from Utils.icon_delegate import IconDelegate
+from Utils.comment_delegate import CommentDelegate
+from Utils.search_index import SearchIndex
+from PySide6.QtWidgets import QHeaderView, QPushButton, QLineEdit, QTableWidgetItem, QAbstractItemView, QWidget, QMenu, QTableWidget
 from PySide6.QtGui import QIcon, QAction
 from PySide6.QtCore import Qt, QSize, Signal, QTimer
 
@@ -63,6 +66,7 @@ class ProjectsView(QWidget):
         self.ui = self.main.ui  # Use the UI initialized in Main
         self.projects_table = self.ui.projects_TableWidget
         self.tableUtils = TableUtils()
+        self.search_index = SearchIndex()  # Project names, by project ID
         self.setup_projects_ui()
 
     def setup_projects_ui(self):
@@ -86,9 +90,28 @@ class ProjectsView(QWidget):
         self.projects_table.setCornerWidget(QWidget())
         self.tableUtils.add_table(self.projects_table)
 
-        self.projects_table.cellClicked.connect(lambda row, _: self.open_project(row=row))
+        self.projects_table.cellClicked.connect(lambda row, column: self.open_project(row=row) if column not in (1, 6) else None)  # The favorite and options cells are handled by their delegates
         self.projects_table.setColumnHidden(0, True)
 
+        # The favorite, description and options cells are painted by shared delegates instead of a widget per row
+        self.favorite_delegate = IconDelegate(config.NOT_FAVORITE_IMG, 25, checked_icon=config.FAVORITE_IMG, clickable=True, parent=self.projects_table)
+        self.favorite_delegate.clicked.connect(lambda index: self.set_favorite(index.row()))
+        self.projects_table.setItemDelegateForColumn(1, self.favorite_delegate)
+        self.comment_delegate = CommentDelegate(config.COMMENT_IMG_BLUE, parent=self.projects_table)
+        self.projects_table.setItemDelegateForColumn(3, self.comment_delegate)
+        self.options_delegate = IconDelegate(config.PROJECT_OPTIONS_IMG, 30, clickable=True, parent=self.projects_table)
+        self.options_delegate.clicked.connect(self.show_project_options)
+        self.projects_table.setItemDelegateForColumn(6, self.options_delegate)
+
+        # A single options menu is shared by every project
+        self.options_row = None
+        self.projectOptions_Menu = QMenu(self.projects_table)
+        self.projectOptions_Menu.addAction(QIcon(config.DOWNLOAD_PROJECT_IMG), "Download project").triggered.connect(lambda: self.download_project(self.options_row))
+        self.projectOptions_Menu.addAction(QIcon(config.EXCEL_IMG), "Generate report").triggered.connect(lambda: self.generate_report(self.options_row))
+        self.projectOptions_Menu.addAction(QIcon(config.EDIT_PROJECT_IMG), "Edit project").triggered.connect(lambda: self.edit_project(self.options_row))
+        self.projectOptions_Menu.addAction(QIcon(config.DELETE_PROJECT_IMG), "Delete project").triggered.connect(lambda: self.delete_project(self.options_row))
+        self.projectOptions_Menu.setStyleSheet("QMenu::item:selected {background-color: #9FF0FF; color:black;}")
+
         self.projects_table.setSortingEnabled(False)
         projects_headerTable = self.projects_table.horizontalHeader()
         projects_headerTable.sectionClicked.connect(lambda index: TableUtils.on_header_clicked(index, self.projects_table, [self.projects_table.columnCount()-1]))
@@ -105,7 +128,7 @@ class ProjectsView(QWidget):
         search_action = QAction(QIcon(config.SEARCH_IMG), None, self)
         self.ui.projectsSearch_LineEdit.findChildren(QAction)[0].setIcon(QIcon(config.CLEAR_SEARCH_IMG))
         self.ui.projectsSearch_LineEdit.addAction(search_action, QLineEdit.LeadingPosition)
-        self.ui.projectsSearch_LineEdit.textChanged.connect(self.search_project)
+        WidgetConfig.connect_search_bar(self.ui.projectsSearch_LineEdit, self.search_project)
 
         self.projects_table.resizeEvent = self.on_table_resize
         self.projects_table.horizontalScrollBar().valueChanged.connect(lambda: TableUtils.check_column_visibility(self.projects_table, favoriteHeader_Button))
@@ -161,6 +184,14 @@ class ProjectsView(QWidget):
             QHeaderView::up-arrow {
                 image: url(:/resources/images/whiteUpArrow.png);
             }
+            QToolTip {
+                background-color: white;
+                color: black;
+                font-family: 'Arial';
+                font-size: 12px;
+                padding: 2px;
+                border: 2px solid black;
+            }
             QScrollBar:vertical {
                 border: none;
                 background: #3B4252;
@@ -261,11 +292,8 @@ class ProjectsView(QWidget):
         set
             Set of rows that match the search text.
         """
-        matching_items = self.projects_table.findItems(search_text, Qt.MatchContains)
-        matching_items = [item for item in matching_items if item is not None]
-        matching_items_in_columns = [item for item in matching_items if item.column() == 2]
-        rows_to_show = set(item.row() for item in matching_items_in_columns)
-        return rows_to_show
+        project_ids = self.search_index.search(search_text)
+        return {row for row in range(self.projects_table.rowCount()) if self.projects_table.item(row, 0).text() in project_ids}
 
     def update_table_visibility(self, rows_to_show):
         """
@@ -276,8 +304,7 @@ class ProjectsView(QWidget):
         rows_to_show : set
             Set of rows to show.
         """
-        for i in range(self.projects_table.rowCount()):
-            self.projects_table.setRowHidden(i, i not in rows_to_show)
+        TableUtils.update_rows_visibility(self.projects_table, rows_to_show)
 
     def display_message(self, title, message, icon_path, dialog_type='simple_message', ok_callback=None):
         """
@@ -335,132 +362,95 @@ class ProjectsView(QWidget):
             self.projects_table.insertRow(row_position)
             self.projects_table.setItem(row_position, 0, QTableWidgetItem(str(data['id'])))
             self.projects_table.setItem(row_position, 1, QTableWidgetItem(""))
-            self.add_favorite_button(self.projects_table, row_position, 1, data['favorite'])
+            self.set_favorite_item(row_position, data['favorite'])
             self.projects_table.setItem(row_position, 2, QTableWidgetItem("   " + data['name']))
             self.projects_table.setItem(row_position, 4, QTableWidgetItem("   " + data['created_at']))
             self.projects_table.setItem(row_position, 5, QTableWidgetItem("   " + data['last_access']))
-            self.add_options_button(self.projects_table, row_position, 6)
+            self.projects_table.setItem(row_position, 6, QTableWidgetItem(""))
         else:
             self.projects_table.setItem(row_position, 2, QTableWidgetItem("   " + data['name']))
+        self.search_index.add(self.projects_table.item(row_position, 0).text(), [data['name']])
 
         if data['description'] != '':
-            WidgetConfig.create_comment(data['description'],row_position, self.projects_table, config.COMMENT_IMG_BLUE, 3)
-            self.projects_table.setItem(row_position, 3, QTableWidgetItem(""))
+            description_item = QTableWidgetItem("")
+            description_item.setToolTip(data['description'])
         else:
-            self.projects_table.removeCellWidget(row_position, 3)
-            self.projects_table.setItem(row_position, 3, QTableWidgetItem("––"))
-            self.projects_table.item(row_position, 3).setTextAlignment(Qt.AlignCenter)
+            description_item = QTableWidgetItem("––")
+            description_item.setTextAlignment(Qt.AlignCenter)
+        self.projects_table.setItem(row_position, 3, description_item)
 
         self.projects_table.setSortingEnabled(True)
         self.projects_table.scrollToItem(self.projects_table.currentItem(), QAbstractItemView.PositionAtCenter)
 
-    def add_favorite_button(self, table_widget, row, column, favorite):
+    def set_favorite_item(self, row, favorite):
         """
-        Add a favorite button to the projects table.
+        Set the favorite status of a project in the projects table.
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The projects table widget.
         row : int
-            Row index to add the button.
-        column : int
-            Column index to add the button.
+            Row index of the project.
         favorite : bool
-            Initial favorite status.
+            Favorite status.
         """
-        favorite_Button = QPushButton()
-        favorite_Button.setFixedSize(table_widget.columnWidth(column), table_widget.rowHeight(row))
-        if favorite:
-            favorite_Button.setIcon(QIcon(config.FAVORITE_IMG))
-            table_widget.item(row, column).setText("  ")  # 2 spaces = favorite
-        else:
-            favorite_Button.setIcon(QIcon(config.NOT_FAVORITE_IMG))
-            table_widget.item(row, column).setText(" ")  # 1 space = not favorite
-        favorite_Button.setIconSize(QSize(25, 25))
-        favorite_Button.setFocusPolicy(Qt.NoFocus)
-        favorite_Button.isFavorite = favorite
-        favorite_Button.setStyleSheet("""
-            QPushButton{ background-color: transparent; margin:7px 12px 7px 12px; border-radius: 5px;}
-            QPushButton::hover{ background-color: #341D64; border: 1px solid #7000FF;}
-        """)
-
-        favorite_Button.setCursor(Qt.PointingHandCursor)
-        table_widget.setCellWidget(row, column, favorite_Button)
-        favorite_Button.clicked.connect(lambda: self.set_favorite(favorite_Button))
-
-    def set_favorite(self, favorite_button):
+        favorite_item = self.projects_table.item(row, 1)
+        favorite_item.setData(Qt.UserRole, bool(favorite))
+        favorite_item.setText("  " if favorite else " ")  # 2 spaces = favorite, 1 space = not favorite
+
+    def set_favorite(self, row):
         """
         Toggle the favorite status of a project.
 
         Parameters
         ----------
-        favorite_button : QPushButton
-            The favorite button to toggle.
+        row : int
+            Row index of the project.
         """
-        index = self.projects_table.indexAt(favorite_button.pos())
-        if index.isValid():
-            table_row = index.row()
-            project_id = self.projects_table.item(table_row, 0).text()
-            is_favorite = getattr(favorite_button, 'isFavorite', False)
-            self.project_favorite.emit(int(project_id), table_row, is_favorite)
+        project_id = self.projects_table.item(row, 0).text()
+        is_favorite = bool(self.projects_table.item(row, 1).data(Qt.UserRole))
+        self.project_favorite.emit(int(project_id), row, is_favorite)
 
-    def update_favorite_button(self, row, is_favorite):
+    def update_favorite(self, row, is_favorite):
         """
-        Update the favorite button in the projects table.
+        Update the favorite status of a project after it was toggled.
 
         Parameters
         ----------
         row : int
             Row index to update.
         is_favorite : bool
-            New favorite status.
+            Previous favorite status.
         """
-        favorite_button = self.projects_table.cellWidget(row, 1)
-        if is_favorite:
-            favorite_button.setIcon(QIcon(config.NOT_FAVORITE_IMG))
-            favorite_button.isFavorite = False
-            self.projects_table.item(row, 1).setText(" ")  # 1 space = not favorite
-        else:
-            favorite_button.setIcon(QIcon(config.FAVORITE_IMG))
-            favorite_button.isFavorite = True
-            self.projects_table.item(row, 1).setText("  ")  # 2 spaces = favorite
+        self.set_favorite_item(row, not is_favorite)
+
+    def show_project_options(self, index):
+        """
+        Show the options menu of a project under its options cell.
 
-    def add_options_button(self, table_widget, row, column):
+        Parameters
+        ----------
+        index : QModelIndex
+            The index of the options cell.
         """
-        Add an options button to the projects table.
+        self.options_row = index.row()
+        cell_rect = self.projects_table.visualRect(index)
+        self.projectOptions_Menu.popup(self.projects_table.viewport().mapToGlobal(cell_rect.bottomLeft()))
+
+    def get_project_description(self, row):
+        """
+        Get the description of a project from the projects table.
 
         Parameters
         ----------
-        table_widget : QTableWidget
-            The projects table widget.
         row : int
-            Row index to add the button.
-        column : int
-            Column index to add the button.
-        """
-        projectOptions_Menu = QMenu()
-        projectOptions_Menu.addAction(QIcon(config.DOWNLOAD_PROJECT_IMG), "Download project").triggered.connect(lambda: self.download_project(projectOptions_ToolButton))
-        projectOptions_Menu.addAction(QIcon(config.EXCEL_IMG), "Generate report").triggered.connect(lambda: self.generate_report(projectOptions_ToolButton))
-        projectOptions_Menu.addAction(QIcon(config.EDIT_PROJECT_IMG), "Edit project").triggered.connect(lambda: self.edit_project(projectOptions_ToolButton))
-        projectOptions_Menu.addAction(QIcon(config.DELETE_PROJECT_IMG), "Delete project").triggered.connect(lambda: self.delete_project(projectOptions_ToolButton))
-        projectOptions_Menu.setStyleSheet("QMenu::item:selected {background-color: #9FF0FF; color:black;}")
-
-        projectOptions_ToolButton = QToolButton()
-        projectOptions_ToolButton.menu = projectOptions_Menu
-        projectOptions_ToolButton.setMenu(projectOptions_Menu)
-        projectOptions_ToolButton.setPopupMode(QToolButton.InstantPopup)
-        projectOptions_ToolButton.setFixedSize(table_widget.columnWidth(6), table_widget.rowHeight(row))
-        projectOptions_ToolButton.setIcon(QIcon(config.PROJECT_OPTIONS_IMG))
-        projectOptions_ToolButton.setIconSize(QSize(30, 30))
-        projectOptions_ToolButton.setFocusPolicy(Qt.NoFocus)
-        projectOptions_ToolButton.setStyleSheet("""
-            QToolButton{background-color: transparent; margin:7px 12px 7px 12px; border-radius: 5px;}
-            QToolButton::menu-indicator {image: none;}
-            QToolButton::hover{background-color: #341D64; border: 1px solid #7000FF;}
-        """)
-        projectOptions_ToolButton.setCursor(Qt.PointingHandCursor)
-        table_widget.setCellWidget(row, column, projectOptions_ToolButton)
+            Row index of the project.
+
+        Returns
+        -------
+        str
+            The description, or an empty string.
+        """
+        return self.projects_table.item(row, 3).toolTip()
 
     def create_project(self):
         """
@@ -468,79 +458,66 @@ class ProjectsView(QWidget):
         """
         self.project_managed.emit("new", None, None)
 
-    def edit_project(self, button):
+    def edit_project(self, row):
         """
         Emit signal to edit an existing project.
 
         Parameters
         ----------
-        button : QToolButton
-            The button to trigger the edit.
-        """
-        index = self.projects_table.indexAt(button.pos())
-        if index.isValid():
-            row = index.row()
-            project_data = {
-                'id': self.projects_table.item(row, 0).text(),
-                'name': self.projects_table.item(row, 2).text().strip(),
-                'description': self.projects_table.cellWidget(row, 3).toolTip() if self.projects_table.cellWidget(row, 3) else ""
-            }
-            self.project_managed.emit("edit", project_data, row)
+        row : int
+            Row index of the project.
+        """
+        project_data = {
+            'id': self.projects_table.item(row, 0).text(),
+            'name': self.projects_table.item(row, 2).text().strip(),
+            'description': self.get_project_description(row)
+        }
+        self.project_managed.emit("edit", project_data, row)
 
-    def download_project(self, button):
+    def download_project(self, row):
         """
         Emit signal to download a project.
 
         Parameters
         ----------
-        button : QToolButton
-            The button to trigger the download.
+        row : int
+            Row index of the project.
         """
-        index = self.projects_table.indexAt(button.pos())
-        if index.isValid():
-            row = index.row()
-            project_id = self.projects_table.item(row, 0).text()
-            project_name = self.projects_table.item(row, 2).text().strip()
-            self.project_downloaded.emit(int(project_id), project_name)
+        project_id = self.projects_table.item(row, 0).text()
+        project_name = self.projects_table.item(row, 2).text().strip()
+        self.project_downloaded.emit(int(project_id), project_name)
 
-    def generate_report(self, button):
+    def generate_report(self, row):
         """
         Emit signal to generate a project report.
 
         Parameters
         ----------
-        button : QToolButton
-            The button to trigger the download of reports.
+        row : int
+            Row index of the project.
         """
-        index = self.projects_table.indexAt(button.pos())
-        if index.isValid():
-            row = index.row()
-            project_id = self.projects_table.item(row, 0).text()
-            project_name = self.projects_table.item(row, 2).text().strip()
-            project_description = self.projects_table.cellWidget(row, 3).toolTip() if self.projects_table.cellWidget(row, 3) else ""
-            project_data ={
-                'description': project_description,
-                'id': project_id,
-                'name': project_name,
-                'change_view': False
-            }
-            self.project_selected.emit(project_data, row)
-            QTimer.singleShot(0, lambda: self.report_request.emit(int(project_id)))
+        project_id = self.projects_table.item(row, 0).text()
+        project_name = self.projects_table.item(row, 2).text().strip()
+        project_data ={
+            'description': self.get_project_description(row),
+            'id': project_id,
+            'name': project_name,
+            'change_view': False
+        }
+        self.project_selected.emit(project_data, row)
+        QTimer.singleShot(0, lambda: self.report_request.emit(int(project_id)))
 
-    def delete_project(self, button):
+    def delete_project(self, row):
         """
         Emit signal to delete a project.
 
         Parameters
         ----------
-        button : QToolButton
-            The button to trigger the deletion.
+        row : int
+            Row index of the project.
         """
-        index = self.projects_table.indexAt(button.pos())
-        if index.isValid():
-            table_row = index.row()
-            project_id = self.projects_table.item(table_row, 0).text()
-            self.project_deleted.emit(int(project_id), table_row)
+        project_id = self.projects_table.item(row, 0).text()
+        self.project_deleted.emit(int(project_id), row)
 
     def remove_table_row(self, row):
         """
@@ -551,6 +528,7 @@ class ProjectsView(QWidget):
         row : int
             Row index to remove.
         """
+        self.search_index.remove(self.projects_table.item(row, 0).text())
         self.projects_table.removeRow(row)
         self.projects_table.selectionModel().clearSelection()
 
@@ -575,7 +553,7 @@ class ProjectsView(QWidget):
                     break
 
         project_name = self.projects_table.item(row, 2).text().strip()
-        project_description = self.projects_table.cellWidget(row, 3).toolTip() if self.projects_table.cellWidget(row, 3) else ""
+        project_description = self.get_project_description(row)
 
         project_data = {
             'id': project_id,
@@ -5,6 +5,7 @@ import config
 from Utils.table_utils import TableUtils
 from Utils.button_utils import ButtonUtils
 from Utils.widget_config import WidgetConfig
+from Utils.comment_delegate import CommentDelegate
 from PySide6.QtWidgets import QHeaderView, QWidget, QAbstractItemView, QTableWidgetItem
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor, QTextCursor
@@ -64,6 +65,7 @@ class TechnicalFactorsView(QWidget):
         self.technicalFactors_table.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         self.technicalFactors_table.setSpan(13, 0, 1, 7)
+        self.technicalFactors_table.setItemDelegateForColumn(6, CommentDelegate(config.COMMENT_IMG_GREEN, parent=self.technicalFactors_table))
 
         # Manage Technical Factors
         self.ui.technicalFactorsFactor_ComboBox.currentIndexChanged.connect(self.update_technical_factors_tooltip)
@@ -334,7 +336,7 @@ among others.\n
                 if self.technicalFactors_table.item(row, 1).text() == factor:
                     weight = float(self.technicalFactors_table.item(row, 3).text())
                     influence = int(self.technicalFactors_table.item(row, 4).text())
-                    comment = self.technicalFactors_table.cellWidget(row, 6).toolTip() if self.technicalFactors_table.cellWidget(row, 6) else ""
+                    comment = self.technicalFactors_table.item(row, 6).toolTip()
                     self.ui.technicalFactorsWeight_DoubleSpinBox.setValue(weight)
                     self.technicalFactors_radioButtons[influence].setChecked(True)
                     self.ui.technicalFactorsComment_PlainTextEdit.setPlainText(comment)
@@ -380,16 +382,10 @@ among others.\n
             item.setBackground(QColor(222, 255, 250))
             item.setTextAlignment(Qt.AlignCenter)
             self.technicalFactors_table.setItem(row_index, 3 + i, item)
-        if data_saved['comment'] != '':
-            comment_item = QTableWidgetItem("")
-            comment_item.setBackground(QColor(222, 255, 250))
-            WidgetConfig.create_comment(data_saved['comment'], row_index, self.technicalFactors_table, config.COMMENT_IMG_GREEN)
-            self.technicalFactors_table.setItem(row_index, 6, comment_item)
-        else:
-            comment_item = QTableWidgetItem(" ")
-            comment_item.setBackground(QColor(222, 255, 250))
-            self.technicalFactors_table.removeCellWidget(row_index, self.technicalFactors_table.columnCount() - 1)
-            self.technicalFactors_table.setItem(row_index, 6, comment_item)
+        comment_item = QTableWidgetItem("" if data_saved['comment'] != '' else " ")
+        comment_item.setToolTip(data_saved['comment'])
+        comment_item.setBackground(QColor(222, 255, 250))
+        self.technicalFactors_table.setItem(row_index, 6, comment_item)
 
         self.ui.technicalFactorsFactor_ComboBox.setCurrentIndex(-1)
         self.technicalFactors_table.setSortingEnabled(True)
@@ -6,9 +6,9 @@ from Utils.table_utils import TableUtils
 from Utils.border_bottom_delegate import BorderBottomDelegate
 from Utils.button_utils import ButtonUtils
 from Utils.widget_config import WidgetConfig
-from Utils.numeric_table_item import NumericTableWidgetItem
-from PySide6.QtWidgets import QHeaderView, QWidget, QTableWidgetItem, QLineEdit, QAbstractItemView
-from PySide6.QtCore import Qt, Signal
+from Utils.records_table_model import RecordsTableModel
+from PySide6.QtWidgets import QHeaderView, QWidget, QLineEdit, QAbstractItemView
+from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QAction, QIcon
 
 class UseCasesView(QWidget):
@@ -27,6 +27,8 @@ class UseCasesView(QWidget):
         Signal emitted when use cases weights are updated.
     text_changed : Signal
         Signal emitted when the search text changes.
+    useCases_model : RecordsTableModel
+        The model of the use cases table, backed by the use cases of the project.
 
     Methods
     -------
@@ -49,7 +51,16 @@ class UseCasesView(QWidget):
         super().__init__(parent)
         self.main = parent  # Main as parent class
         self.ui = self.main.ui  # Use the UI initialized in Main
-        self.useCases_table = self.ui.useCases_TableWidget
+        self.useCases_table = self.ui.useCases_TableView
+        self.useCases_model = RecordsTableModel(
+            ["UC_ID", "#", "Code", "Name", "Complexity", "Transactions", "Comment"],
+            ['id', RecordsTableModel.ROW_NUMBER, 'code', 'name', 'complexity', 'transactions', 'comment'],
+            config.COMMENT_IMG_YELLOW,
+            sort_keys={'id': int, 'code': RecordsTableModel.code_number, 'comment': RecordsTableModel.has_no_comment},
+            search_keys=['code', 'name', 'complexity', 'transactions'],
+            parent=self
+        )
+        self.useCases_table.setModel(self.useCases_model)
         self.useCases_summary_table = self.ui.useCasesSummary_TableWidget
         self.tableUtils = TableUtils()
         self.setup_use_cases_ui()
@@ -71,18 +82,19 @@ class UseCasesView(QWidget):
         self.tableUtils.add_table(self.useCases_table)
         self.useCases_table.setColumnHidden(0, True)
         useCases_headerTable = self.useCases_table.horizontalHeader()
-        useCases_headerTable.sectionClicked.connect(lambda index: TableUtils.on_header_clicked(index, self.useCases_table, [1], True))
+        useCases_headerTable.sectionClicked.connect(lambda index: TableUtils.on_header_clicked(index, self.useCases_table, [1]))
 
+        self.useCases_table.setIconSize(QSize(35, 35))
         self.useCases_table.setColumnWidth(1, 80)
         self.useCases_table.setColumnWidth(6, 106)
-        for column in range(self.useCases_table.columnCount()):
+        for column in range(self.useCases_model.columnCount()):
             if column not in [1, 6]:
                 self.useCases_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.Stretch)
             else:
                 self.useCases_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.Fixed)
 
         useCases_borderBottomDelegate = BorderBottomDelegate()
-        for column in range(self.useCases_table.columnCount()):
+        for column in range(self.useCases_model.columnCount()):
             self.useCases_table.setItemDelegateForColumn(column, useCases_borderBottomDelegate)
 
         useCases_header = self.useCases_table.horizontalHeader()
@@ -94,7 +106,7 @@ class UseCasesView(QWidget):
         ButtonUtils.set_styles_button(self.ui.editUseCase_Button, '#48F4FF', '#22577A', config.EDIT_IMG, config.EDIT_DISABLED_IMG, False)
         self.ui.deleteUseCase_Button.setEnabled(False)
         ButtonUtils.set_styles_button(self.ui.deleteUseCase_Button, '#FF0000', '#FFFFFF', config.DELETE_IMG, config.DELETE_DISABLED_IMG, False)
-        self.useCases_table.itemSelectionChanged.connect(lambda: ButtonUtils.check_selection(
+        self.useCases_table.selectionModel().selectionChanged.connect(lambda: ButtonUtils.check_selection(
             self.useCases_table,
             self.ui.editUseCase_Button,
             self.ui.deleteUseCase_Button,
@@ -112,16 +124,16 @@ class UseCasesView(QWidget):
         search_action = QAction(QIcon(config.SEARCH_IMG), None, self)
         self.ui.useCasesSearch_LineEdit.findChildren(QAction)[0].setIcon(QIcon(config.CLEAR_SEARCH_IMG))
         self.ui.useCasesSearch_LineEdit.addAction(search_action, QLineEdit.LeadingPosition)
-        self.ui.useCasesSearch_LineEdit.textChanged.connect(self.search_use_case)
+        WidgetConfig.connect_search_bar(self.ui.useCasesSearch_LineEdit, self.search_use_case)
 
     def create_use_case(self):
         """
         Emit signal to create a new use case.
         """
         useCases_codes = {
-            f"UC-{item.text().split('-')[1]}": int(item.text().split("-")[1])
-            for row in range(self.useCases_table.rowCount())
-            if (item := self.useCases_table.item(row, 2)) is not None and item.text().startswith("UC-")
+            useCase['code']: RecordsTableModel.code_number(useCase['code'])
+            for useCase in self.useCases_model.records
+            if useCase['code'].startswith("UC-")
         }
         self.useCase_managed.emit("new", "useCase", useCases_codes, None)
 
@@ -157,30 +169,43 @@ class UseCasesView(QWidget):
         """
         Emit signal to edit the selected use case.
         """
-        selected_indexes = self.useCases_table.selectedIndexes()
-        unique_rows = set(index.row() for index in selected_indexes)
-        if len(unique_rows) != 1:
+        selected_rows = self.useCases_table.selectionModel().selectedRows()
+        if len(selected_rows) != 1:
             self.display_message("Failed Operation", "No row selected. Please, try again.", config.CRITICAL_IMG)
             return
-        selected_row = unique_rows.pop()
+        selected_row = selected_rows[0].row()
         useCases_codes = {
-            f"UC-{item.text().split('-')[1]}": int(item.text().split("-")[1])
-            for row in range(self.useCases_table.rowCount())
-            if (item := self.useCases_table.item(row, 2)) is not None and item.text().startswith("UC-")
+            useCase['code']: RecordsTableModel.code_number(useCase['code'])
+            for useCase in self.useCases_model.records
+            if useCase['code'].startswith("UC-")
         }
+        useCase = self.useCases_model.record(selected_row)
         useCase_data = {
-            'id': self.useCases_table.item(selected_row, 0).text(),
-            'code': self.useCases_table.item(selected_row, 2).text(),
-            'name': self.useCases_table.item(selected_row, 3).text(),
-            'complexity': self.useCases_table.item(selected_row, 4).text(),
-            'transactions': self.useCases_table.item(selected_row, 5).text(),
-            'comment': self.useCases_table.cellWidget(selected_row, 6).toolTip() if self.useCases_table.cellWidget(selected_row, 6) else "",
+            'id': str(useCase['id']),
+            'code': useCase['code'],
+            'name': useCase['name'],
+            'complexity': useCase['complexity'],
+            'transactions': str(useCase['transactions']),
+            'comment': useCase['comment'] or "",
             'codes': useCases_codes
         }
         useCases_codes.pop(useCase_data['code'])
         self.useCase_managed.emit("edit", "useCase", useCase_data, selected_row)
 
-    def update_use_cases_table(self, data_saved, selected_row=None, update_rows=True):
+    def load_use_cases_table(self, useCases):
+        """
+        Show the use cases of a project in the use cases table.
+
+        Parameters
+        ----------
+        useCases : list of dict
+            The use cases of the project, in the order of the rows.
+        """
+        self.useCases_table.setSortingEnabled(False)
+        self.useCases_model.set_records(useCases)
+        self.update_table_state()
+
+    def update_use_cases_table(self, data_saved, selected_row=None):
         """
         Update the use cases table with the provided data.
 
@@ -190,49 +215,28 @@ class UseCasesView(QWidget):
             Dictionary containing the saved data for a use case.
         selected_row : int, optional
             Row index to update, by default None.
-        update_rows : bool, optional
-            Whether to update row numbers, default is True.
         """
-        self.useCases_table.setSortingEnabled(False)
-
         if selected_row is None:
-            row = self.useCases_table.rowCount()
-            self.useCases_table.insertRow(row)
-            numbers_item = QTableWidgetItem()
-            numbers_item.setData(Qt.EditRole, row + 1)
-            self.useCases_table.setItem(row, 0, QTableWidgetItem(str(data_saved['id'])))
-            self.useCases_table.setItem(row, 1, numbers_item)
-            self.useCases_table.item(row, 1).setTextAlignment(Qt.AlignCenter)
-        else:
-            row = selected_row
-
-        self.useCases_table.setItem(row, 2, NumericTableWidgetItem(data_saved['code']))
-        self.useCases_table.item(row, 2).setTextAlignment(Qt.AlignCenter)
-        self.useCases_table.setItem(row, 3, QTableWidgetItem(data_saved['name']))
-        self.useCases_table.item(row, 3).setTextAlignment(Qt.AlignCenter)
-        self.useCases_table.setItem(row, 4, QTableWidgetItem(data_saved['complexity']))
-        self.useCases_table.item(row, 4).setTextAlignment(Qt.AlignCenter)
-        transactions_item = QTableWidgetItem()
-        transactions_item.setData(Qt.EditRole, data_saved['transactions'])
-        self.useCases_table.setItem(row, 5, transactions_item)
-        self.useCases_table.item(row, 5).setTextAlignment(Qt.AlignCenter)
-        if data_saved['comment'] != '':
-            WidgetConfig.create_comment(data_saved['comment'], row, self.useCases_table, config.COMMENT_IMG_YELLOW)
-            self.useCases_table.setItem(row, 6, QTableWidgetItem(""))
+            row = self.useCases_model.add_record(data_saved)
         else:
-            self.useCases_table.removeCellWidget(row, self.useCases_table.columnCount() - 1)
-            self.useCases_table.setItem(row, 6, QTableWidgetItem(" "))
+            row = self.useCases_model.update_record(selected_row, data_saved)
 
-        if update_rows:
-            self.useCases_table.selectRow(row)
-            TableUtils.update_row_numbers(self.useCases_table)
-            self.useCases_table.scrollToItem(self.useCases_table.currentItem(), QAbstractItemView.PositionAtCenter)
-            self.useCases_table.selectionModel().clearSelection()
+        self.useCases_table.selectRow(row)
+        header = self.useCases_table.horizontalHeader()
+        if not self.useCases_model.is_sorted_by(header.sortIndicatorSection(), header.sortIndicatorOrder()):  # A sorted model already placed the row
+            TableUtils.on_header_clicked(header.sortIndicatorSection(), self.useCases_table, [1])
+        self.useCases_table.scrollTo(self.useCases_table.currentIndex(), QAbstractItemView.PositionAtCenter)
+        self.useCases_table.selectionModel().clearSelection()
+        self.update_table_state()
 
+    def update_table_state(self):
+        """
+        Update the header checkbox and the new use case button after the rows of the use cases table change.
+        """
         self.table_checkbox.setCheckState(Qt.Unchecked)
-        self.table_checkbox.setVisible(self.useCases_table.rowCount() > 0)
+        self.table_checkbox.setVisible(self.useCases_model.rowCount() > 0)
 
-        if self.useCases_table.rowCount() == config.USE_CASE_LIMIT:
+        if self.useCases_model.rowCount() >= config.USE_CASE_LIMIT:
             self.ui.newUseCase_Button.setEnabled(False)
             ButtonUtils.set_styles_button(self.ui.newUseCase_Button, '#48F4FF', '#22577A', config.NEW_IMG, config.NEW_DISABLED_IMG, False)
             self.ui.newUseCase_Button.setEnabled(False)
@@ -272,11 +276,12 @@ class UseCasesView(QWidget):
             self.display_message("Failed operation", "No use cases selected. Please select at least one use case to delete.", config.WARNING_IMG)
             return
 
+        useCases = [self.useCases_model.record(row) for row in selected_rows]
         useCases_data = {
-            self.useCases_table.item(row, 0).text(): {
-                'code': self.useCases_table.item(row, 2).text(),
-                'complexity': self.useCases_table.item(row, 4).text()
-            } for row in selected_rows
+            str(useCase['id']): {
+                'code': useCase['code'],
+                'complexity': useCase['complexity']
+            } for useCase in useCases
         }
         self.useCases_deleted.emit(useCases_data, selected_rows)
 
@@ -292,15 +297,13 @@ class UseCasesView(QWidget):
             If True, deletes all rows in the table.
         """
         if clear_all:
-            self.useCases_table.setRowCount(0)
-        else:
-            if rows is not None:
-                for row in sorted(rows, reverse=True):
-                    self.useCases_table.removeRow(row)
-                    TableUtils.update_row_numbers(self.useCases_table, row)
+            self.useCases_model.set_records([])
+        elif rows:
+            self.useCases_table.selectionModel().clearSelection()  # Otherwise the selection changes with every removed block of rows
+            TableUtils.remove_rows(self.useCases_table, rows)
 
         self.table_checkbox.setCheckState(Qt.Unchecked)
-        self.table_checkbox.setVisible(self.useCases_table.rowCount() > 0)
+        self.table_checkbox.setVisible(self.useCases_model.rowCount() > 0)
 
         self.ui.newUseCase_Button.setEnabled(True)
         ButtonUtils.set_styles_button(self.ui.newUseCase_Button, '#5AFFA6', '#094646', config.NEW_IMG, config.NEW_DISABLED_IMG, True)
@@ -341,11 +344,7 @@ class UseCasesView(QWidget):
         set of int
             Set of row indices that match the search text.
         """
-        matching_items = self.useCases_table.findItems(search_text, Qt.MatchContains)
-        matching_items = [item for item in matching_items if item is not None]
-        matching_items_in_columns = [item for item in matching_items if item.column() in [2, 3, 4, 5]]
-        rows_to_show = set(item.row() for item in matching_items_in_columns)
-        return rows_to_show
+        return self.useCases_model.search(search_text)
 
     def update_table_visibility(self, rows_to_show):
         """
@@ -356,5 +355,4 @@ class UseCasesView(QWidget):
         rows_to_show : set of int
             Set of row indices to show.
         """
-        for i in range(self.useCases_table.rowCount()):
-            self.useCases_table.setRowHidden(i, i not in rows_to_show)
+        TableUtils.update_rows_visibility(self.useCases_table, rows_to_show)
@@ -11,14 +11,65 @@ NOT_EXIST = 0
 SUCCESS = 1
 TOO_MANY_PROJECTS = -3
 
+# Database Profiles
+DB_PROFILE_ENV_VAR = "QUICKEST_DB_PROFILE"
+DB_PROFILE_SETTING = "database/profile"
+DEFAULT_DB_PROFILE = "safe"
+SETTINGS_FILE = "QuickEst.ini"
+
+DB_PROFILES = {
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,  # Negative values are KiB
+        "mmap_size": 0,
+        "temp_store": "DEFAULT"
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY"
+    }
+}
+
+# Estimation Constants
+ACTIVITIES = ("analysis", "design", "programming", "testing", "overloading")
+COMPLEXITIES = ("Simple", "Average", "Complex")
+
+# Simulation
+SIMULATION_PERCENTILES = (50, 80, 95)
+SIMULATION_TRIALS = 100000
+
+SIMULATION_SETTINGS = {
+    "cf": {"low": 0.8, "high": 1.3},  # Triangular distribution around the CF, as ratios of its value
+    "influence_shift": {-1: 0.2, 0: 0.6, 1: 0.2},  # Probability of each change of a factor influence
+    "misclassification": 0.1  # Probability of a use case belonging to an adjacent complexity
+}
+
 # Limits
 ACTOR_LIMIT = 200
 PROJECT_LIMIT = 500
 TOTAL_EFFORT = 20000
 USE_CASE_LIMIT = 1000
+SQL_VARIABLE_LIMIT = 999  # Maximum number of bound parameters in a SQLite statement
+
+# Export
+EXPORT_WORKERS = 0  # Number of threads serializing projects in parallel; 0 uses one per CPU core
+EXPORT_PENDING_PER_WORKER = 2  # Projects read ahead of the archive writer for each worker
+
+# Import
+IMPORT_BATCH_SIZE = 50  # Projects inserted per transaction by a bulk import
+IMPORT_REPORT_LIMIT = 15  # Conflicts listed in the report of a bulk import
+IMPORT_WORKERS = 0  # Number of threads verifying the projects of an archive; 0 uses one per CPU core
+
+# Search
+SEARCH_DELAY = 200  # Milliseconds without typing before the tables are filtered
 
 # File Constants
 FILE_EXTENSION = ".qck"
+PACKAGE_FILE_EXTENSION = ".qckpkg"
 PROJECT_FILE_EXTENSION = ".qckproj"
 
 ACTORS_FILE = f"actors{FILE_EXTENSION}"
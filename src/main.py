@@ -33,6 +33,8 @@ if __name__ == "__main__":
         WidgetConfig.show_message_dialog("Failed Operation", f"Error initializing database: {db_result}", config.CRITICAL_IMG)
         sys.exit()
 
+    app.aboutToQuit.connect(db.DataBase.close_instance)
+
     window = MainWindow()
     window.show()
 